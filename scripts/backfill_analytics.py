@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Build analytics rollups (data/user/analytics_rollups.json) from existing history.
+
+New history entries update the rollups as they are recorded; run this once
+after upgrading, or to rebuild rollups from user_history.json.
+
+Usage:
+    python scripts/backfill_analytics.py [--merge] [--base-dir data/user]
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.api.utils.history import HistoryManager  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Keep existing rollups and only add entries newer than the last recorded one",
+    )
+    parser.add_argument("--base-dir", default=None, help="History directory (default: data/user)")
+    args = parser.parse_args()
+
+    manager = HistoryManager(base_dir=args.base_dir)
+    history = manager._load_history()
+    applied = manager.analytics.backfill(history, merge=args.merge)
+
+    mode = "merged" if args.merge else "rebuilt"
+    print(f"Rollups {mode}: {applied} of {len(history)} history entries applied")
+    print(f"  -> {manager.analytics.rollup_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark load_config_with_main with and without the mtime-validated cache.
+
+Loads the project's real config/main.yaml + a module config repeatedly and
+reports the per-call cost of:
+  - uncached:  parse both YAML files and merge (the previous behaviour)
+  - cached:    stat both files, deep-copy the merged dict
+  - snapshot:  stat both files, return the shared read-only view
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_config_loader.py [--config solve_config.yaml] [--iterations 500]
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.services.config import loader  # noqa: E402
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--config", default="solve_config.yaml")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    paths = loader._main_config_paths(args.config, project_root)
+    print(f"Config: {', '.join(p.name for p in paths if p.exists())}")
+
+    uncached = _per_call_us(lambda: loader._read_config_files(paths), args.iterations)
+    loader.clear_config_cache()
+    cached = _per_call_us(
+        lambda: loader.load_config_with_main(args.config, project_root), args.iterations
+    )
+    snapshot = _per_call_us(
+        lambda: loader.get_config_snapshot(args.config, project_root), args.iterations
+    )
+
+    print(f"  uncached (parse + merge): {uncached:10.1f} us/call")
+    print(f"  cached (deep copy):       {cached:10.1f} us/call  ({uncached / cached:.0f}x)")
+    print(f"  snapshot (read-only):     {snapshot:10.1f} us/call  ({uncached / snapshot:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
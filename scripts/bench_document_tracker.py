@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark DocumentTracker.detect_changes on a synthetic knowledge base.
+
+Reports three scans of the same raw/ directory:
+  - full rehash: every file hashed sequentially (the previous behaviour)
+  - cold:        no stored fingerprints, files hashed in parallel
+  - unchanged:   fingerprints match, nothing is read
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_document_tracker.py [--files 2000] [--size-kb 512]
+"""
+
+import argparse
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.knowledge.document_tracker import DocumentStatus, DocumentTracker  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--size-kb", type=int, default=512)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = Path(tmp) / "kb"
+        raw = kb_dir / "raw"
+        raw.mkdir(parents=True)
+        payload = os.urandom(args.size_kb * 1024)
+        for i in range(args.files):
+            (raw / f"doc_{i:05d}.pdf").write_bytes(payload[:-8] + i.to_bytes(8, "little"))
+        total_mb = args.files * args.size_kb / 1024
+        print(f"KB: {args.files} files, {total_mb:.0f} MB")
+
+        tracker = DocumentTracker(kb_dir)
+        tracking = tracker._metadata[DocumentTracker.TRACKING_KEY]
+        for path in sorted(raw.iterdir()):
+            st = path.stat()
+            tracking[path.name] = {
+                "filename": path.name,
+                "file_hash": DocumentTracker.calculate_file_hash(path),
+                "file_size": st.st_size,
+                "last_modified": "",
+                "status": DocumentStatus.INDEXED.value,
+            }
+        tracker._save_metadata()
+
+        start = time.perf_counter()
+        for path in sorted(raw.iterdir()):
+            DocumentTracker.calculate_file_hash(path)
+        print(f"  full rehash (sequential): {(time.perf_counter() - start) * 1e3:9.1f} ms")
+
+        start = time.perf_counter()
+        changes = tracker.detect_changes()
+        print(f"  cold (parallel hashing):  {(time.perf_counter() - start) * 1e3:9.1f} ms")
+        assert set(changes.values()) == {DocumentStatus.UNCHANGED}
+
+        runs = []
+        for _ in range(5):
+            start = time.perf_counter()
+            changes = tracker.detect_changes()
+            runs.append((time.perf_counter() - start) * 1e3)
+        assert set(changes.values()) == {DocumentStatus.UNCHANGED}
+        print(f"  unchanged (fingerprints): {sorted(runs)[len(runs) // 2]:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Measure IdeaGenerationWorkflow.process with a simulated LLM.
+
+Every LLM call (explore, strict filter, statement) sleeps for a latency drawn
+around --latency, and intermediate JSON artifacts are written to a temporary
+directory as in a real run. --concurrency 1 reproduces the previous sequential
+per-point loop; higher values run knowledge points in parallel.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_ideagen_points.py [--points 8] [--latency 0.2] [--concurrency 1 4 8]
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.agents.ideagen.idea_generation_workflow import IdeaGenerationWorkflow  # noqa: E402
+from src.logging import get_logger  # noqa: E402
+
+PROMPTS = {
+    f"{stage}_{kind}": "{knowledge_point}" if kind == "user_template" else stage
+    for stage in ("explore_ideas", "strict_filter", "generate_statement")
+    for kind in ("system", "user_template")
+}
+
+
+def make_llm(args):
+    async def call_llm(user_prompt, system_prompt, **kwargs):
+        rng = random.Random(f"{args.seed}-{system_prompt}-{user_prompt}")
+        await asyncio.sleep(args.latency * rng.uniform(0.5, 1.5))
+        if system_prompt == "explore_ideas":
+            return json.dumps({"research_ideas": [f"{user_prompt} idea {i}" for i in range(6)]})
+        if system_prompt == "strict_filter":
+            return json.dumps(
+                {
+                    "kept_ideas": [f"{user_prompt} idea {i}" for i in range(2)],
+                    "rejected_ideas": [f"{user_prompt} idea {i}" for i in range(2, 6)],
+                }
+            )
+        return f"## {user_prompt}\n\nStatement."
+
+    return call_llm
+
+
+async def run(args, concurrency: int, output_dir: Path) -> tuple[float, int]:
+    workflow = IdeaGenerationWorkflow.__new__(IdeaGenerationWorkflow)
+    workflow.logger = get_logger("IdeaGenBench", level="WARNING")
+    workflow._prompts = PROMPTS
+    workflow.output_dir = output_dir
+    workflow.progress_callback = None
+    workflow.max_concurrent_points = concurrency
+    workflow.call_llm = make_llm(args)
+
+    async def keep_all(points):
+        return points
+
+    workflow.loose_filter = keep_all
+    points = [
+        {"knowledge_point": f"Point {i}", "description": f"Description {i}"}
+        for i in range(args.points)
+    ]
+    start = time.perf_counter()
+    markdown = await workflow.process(points)
+    return time.perf_counter() - start, markdown.count("## Point")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.2, help="Mean LLM latency (s)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    baseline = None
+    for concurrency in args.concurrency:
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed, statements = asyncio.run(run(args, concurrency, Path(tmp)))
+        baseline = baseline or elapsed
+        print(
+            f"concurrency {concurrency:>2}: {statements} statements in {elapsed:6.2f} s "
+            f"({baseline / elapsed:4.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
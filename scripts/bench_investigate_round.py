@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure InvestigateAgent round latency with mocked tools.
+
+Each tool is replaced by a stub that sleeps for a fixed delay (rag_naive 0.3s,
+rag_hybrid 0.8s, web_search 1.2s, query_item 0.05s by default, scaled by
+--scale). A round of --actions plans cycling through the tools is executed
+sequentially (one action at a time, as before) and with concurrent round
+execution.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_investigate_round.py [--actions 4] [--rounds 3] [--scale 0.25]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.agents.solve.analysis_loop.investigate_agent import (  # noqa: E402
+    InvestigateAgent,
+)
+from src.agents.solve.memory import CitationMemory  # noqa: E402
+
+TOOL_DELAYS = {"rag_naive": 0.3, "rag_hybrid": 0.8, "web_search": 1.2, "query_item": 0.05}
+
+
+def make_agent(scale: float) -> InvestigateAgent:
+    agent = InvestigateAgent(config={"system": {"language": "en"}}, api_key=None, base_url=None)
+
+    def stub(tool: str, answer_key: str):
+        async def call(*args, **kwargs):
+            await asyncio.sleep(TOOL_DELAYS[tool] * scale)
+            return {answer_key: f"{tool} result"}
+
+        return call
+
+    agent._call_rag_naive = stub("rag_naive", "answer")
+    agent._call_rag_hybrid = stub("rag_hybrid", "answer")
+    agent._call_web_search = stub("web_search", "results")
+    agent._call_query_item = stub("query_item", "content")
+    return agent
+
+
+async def run_round(agent, plans, output_dir, sequential: bool) -> float:
+    citations = CitationMemory(output_dir=output_dir)
+    start = time.perf_counter()
+    if sequential:
+        for plan in plans:
+            await agent._execute_actions([plan], "kb", output_dir, citations)
+    else:
+        await agent._execute_actions(plans, "kb", output_dir, citations)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--actions", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=0.25)
+    args = parser.parse_args()
+
+    tools = list(TOOL_DELAYS)
+    plans = [
+        {"tool": tools[i % len(tools)], "query": f"q{i}", "identifier": f"Theorem {i}"}
+        for i in range(args.actions)
+    ]
+    agent = make_agent(args.scale)
+    print(f"{args.actions} actions per round: {', '.join(p['tool'] for p in plans)}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, sequential in (("sequential", True), ("concurrent", False)):
+            total = sum(
+                asyncio.run(run_round(agent, plans, tmp, sequential)) for _ in range(args.rounds)
+            )
+            print(f"  {label:10s}: {total / args.rounds * 1000:8.1f} ms per round")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Measure knowledge base info/list cost with the statistics cache.
+
+Builds --kbs synthetic knowledge bases whose kv_store files hold --entities
+entries, then times a full json.load of the stores (the old get_info), a cold
+streaming count, and warm cached lookups.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_kb_stats.py [--kbs 5] [--entities 50000]
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.knowledge.kb_stats import RAG_COUNTERS, KBStatsCache  # noqa: E402
+from src.knowledge.manager import KnowledgeBaseManager  # noqa: E402
+
+
+def build(base_dir: Path, kbs: int, entities: int) -> KnowledgeBaseManager:
+    manager = KnowledgeBaseManager(base_dir=str(base_dir))
+    record = {"entity_name": "x" * 40, "content": "lorem ipsum, dolor [sit] amet " * 20}
+    for k in range(kbs):
+        kb_dir = base_dir / f"kb{k}"
+        for sub in ("raw", "images", "content_list", "rag_storage"):
+            (kb_dir / sub).mkdir(parents=True)
+        for i in range(20):
+            (kb_dir / "raw" / f"doc{i}.pdf").write_bytes(b"%PDF")
+        for filename in RAG_COUNTERS.values():
+            data = {f"ent-{i}": record for i in range(entities)}
+            (kb_dir / "rag_storage" / filename).write_text(json.dumps(data))
+        manager.register_knowledge_base(f"kb{k}")
+    return manager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kbs", type=int, default=5)
+    parser.add_argument("--entities", type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        manager = build(base_dir, args.kbs, args.entities)
+        names = manager.list_knowledge_bases()
+        size = sum(p.stat().st_size for p in base_dir.rglob("kv_store_*.json"))
+        print(f"{len(names)} KBs, {size / 1e6:.0f} MB of kv_store JSON")
+
+        start = time.perf_counter()
+        for name in names:
+            for filename in RAG_COUNTERS.values():
+                with open(base_dir / name / "rag_storage" / filename, encoding="utf-8") as f:
+                    len(json.load(f))
+        print(f"  json.load every store:  {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+        cache = KBStatsCache()
+        start = time.perf_counter()
+        for name in names:
+            cache.get_statistics(base_dir / name)
+        print(f"  cold (streaming count): {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+        rounds = 100
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for name in names:
+                manager.get_info(name)
+        elapsed = (time.perf_counter() - start) / rounds
+        print(f"  warm list (get_info):   {elapsed * 1000:9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-call overhead of MetricsService start/end tracking.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_metrics.py [--calls 200000] [--runs 5]
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.services.metrics.service import MetricsService  # noqa: E402
+
+TARGET_US = 5.0
+
+
+def bench(calls: int) -> float:
+    """Return mean microseconds per start_tracking + end_tracking pair."""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = MetricsService(save_dir=tmp, history_limit=1000)
+        agents = [f"agent_{i}" for i in range(8)]
+        start = time.perf_counter()
+        for i in range(calls):
+            metrics = service.start_tracking(agents[i & 7], "solve")
+            service.end_tracking(metrics)
+        elapsed = time.perf_counter() - start
+    return elapsed / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    bench(10_000)  # warm-up
+    results = sorted(bench(args.calls) for _ in range(args.runs))
+    median = results[len(results) // 2]
+
+    print(f"start_tracking + end_tracking ({args.calls} calls x {args.runs} runs)")
+    print(f"  best:   {results[0]:.2f} µs/call")
+    print(f"  median: {median:.2f} µs/call")
+    print(f"  target: < {TARGET_US:.1f} µs/call -> {'OK' if median < TARGET_US else 'OVER'}")
+    return 0 if median < TARGET_US else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
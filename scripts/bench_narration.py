@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Measure narration time-to-first-audio with a simulated LLM and TTS endpoint.
+
+Time-to-first-audio is the time from a narrate request until the first audio
+chunk of the script is available (script generation + first TTS chunk). Runs:
+
+    sequential  previous flow: script call, then the key-point call
+    concurrent  script and key-point calls at once (bindings without JSON mode)
+    structured  one JSON-mode call returning script and key points
+    cached      the same content and style again (script cache hit)
+
+The structured call is modelled as --structured-overhead times slower than a
+plain script call, since it also writes the key points.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_narration.py [--latency 1.0] [--tts-latency 0.3]
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.agents.co_writer import narrator_agent  # noqa: E402
+from src.agents.co_writer.narrator_agent import NarratorAgent  # noqa: E402
+from src.logging import get_logger  # noqa: E402
+from src.services.tts import TTSAudioCache, TTSSynthesizer  # noqa: E402
+
+TTS_CONFIG = {"model": "tts-1", "api_key": "sk-bench", "base_url": "http://tts.local/v1"}
+SCRIPT = " ".join(f"Sentence {i} of the narration walks through one idea." for i in range(40))
+
+
+def make_llm(args):
+    async def call_llm(user_prompt, system_prompt, response_format=None, stage=None, **kwargs):
+        if response_format is not None:
+            await asyncio.sleep(args.latency * args.structured_overhead)
+            return json.dumps({"script": SCRIPT, "key_points": ["a", "b", "c"]})
+        if stage == "extract_key_points":
+            await asyncio.sleep(args.latency * args.key_points_ratio)
+            return '["a", "b", "c"]'
+        await asyncio.sleep(args.latency)
+        return SCRIPT
+
+    return call_llm
+
+
+def make_tts_client_factory(args):
+    class Speech:
+        async def create(self, *, model, voice, input):
+            await asyncio.sleep(args.tts_latency)
+            return type("Response", (), {"content": input.encode()})()
+
+    class Client:
+        class audio:
+            speech = Speech()
+
+    return lambda cfg: Client()
+
+
+def make_narrator(args, structured: bool) -> NarratorAgent:
+    narrator = NarratorAgent.__new__(NarratorAgent)
+    narrator.logger = get_logger("NarratorBench", level="WARNING")
+    narrator.language = "en"
+    narrator.prompts = {
+        "generate_script_system_template": "{style_prompt}{length_instruction}",
+        "generate_script_user_short": "{content}",
+        "extract_key_points_user": "{content}",
+    }
+    narrator.get_model = lambda: "gpt-4o"
+    narrator.call_llm = make_llm(args)
+    narrator._supports_structured_output = lambda: structured
+    return narrator
+
+
+async def previous_flow(narrator: NarratorAgent, content: str) -> str:
+    system_prompt, user_prompt = narrator._build_script_prompts(content, "friendly")
+    script = await narrator._generate_script_text(system_prompt, user_prompt)
+    await narrator._extract_key_points(content)
+    return script
+
+
+async def time_to_first_audio(args, mode: str, cache_dir: Path) -> float:
+    narrator = make_narrator(args, structured=mode in ("structured", "cached"))
+    synthesizer = TTSSynthesizer(
+        cache=TTSAudioCache(cache_dir=cache_dir),
+        client_factory=make_tts_client_factory(args),
+    )
+    content = f"Notes for the {mode} run"
+    if mode == "cached":
+        await narrator.generate_script(content)
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        script = await previous_flow(narrator, content)
+    else:
+        script = (await narrator.generate_script(content))["script"]
+    stream = synthesizer.stream(script, "alloy", TTS_CONFIG)
+    await stream.__anext__()
+    elapsed = time.perf_counter() - start
+    await stream.aclose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=1.0, help="Script call latency (s)")
+    parser.add_argument(
+        "--key-points-ratio", type=float, default=0.8, help="Key-point call / script call"
+    )
+    parser.add_argument(
+        "--structured-overhead", type=float, default=1.1, help="JSON call / script call"
+    )
+    parser.add_argument("--tts-latency", type=float, default=0.3, help="Per-chunk TTS latency (s)")
+    args = parser.parse_args()
+
+    baseline = None
+    for mode in ("sequential", "concurrent", "structured", "cached"):
+        narrator_agent.clear_script_cache()
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed = asyncio.run(time_to_first_audio(args, mode, Path(tmp)))
+        baseline = baseline or elapsed
+        print(f"{mode:>10}: first audio after {elapsed:5.2f} s ({elapsed / baseline:4.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
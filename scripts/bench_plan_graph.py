@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark next-objective selection on large guided learning curricula.
+
+Compares the incremental frontier used by MasteryEngine against recomputing
+the available objectives from scratch with linear scans (the previous
+behaviour) for a simulated learner working through the plan.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_plan_graph.py [--objectives 5000] [--steps 2000]
+"""
+
+import argparse
+from pathlib import Path
+import random
+import sys
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.services.guided_learning.v2.engine import MasteryEngine, _objective_score  # noqa: E402
+from src.services.guided_learning.v2.types import (  # noqa: E402
+    Activity,
+    Confidence,
+    LearnerModel,
+    MasteryState,
+    MCQBlock,
+    NodeStatus,
+    NodeType,
+    ObjectiveNode,
+    PlanGraph,
+    ResponseEvaluation,
+    Stage,
+)
+
+
+def build_curriculum(objectives: int, seed: int) -> PlanGraph:
+    """Random DAG with 0-3 prerequisites per objective, mostly local."""
+    rng = random.Random(seed)
+    nodes = [
+        ObjectiveNode(objective_id=f"o{i}", title=f"o{i}", description="", node_type=NodeType.FACT)
+        for i in range(objectives)
+    ]
+    edges = []
+    for i in range(1, objectives):
+        for _ in range(rng.randint(0, 3)):
+            j = max(0, i - 1 - int(rng.expovariate(1 / 20)))
+            edges.append((f"o{j}", f"o{i}"))
+    return PlanGraph(nodes=nodes, edges=edges)
+
+
+def naive_select(model: LearnerModel, graph: PlanGraph) -> str | None:
+    """Old algorithm: linear scans over nodes and edges for every node."""
+
+    def get_node(obj_id):
+        for node in graph.nodes:
+            if node.objective_id == obj_id:
+                return node
+        return None
+
+    def mastered(obj_id):
+        node = get_node(obj_id)
+        if node and node.status in (NodeStatus.COMPLETED, NodeStatus.SKIPPED):
+            return True
+        m = model.objectives.get(obj_id)
+        return m is not None and m.mastery_state in (MasteryState.COMPETENT, MasteryState.AUTOMATIC)
+
+    available = []
+    for node in graph.nodes:
+        if node.status in (NodeStatus.COMPLETED, NodeStatus.SKIPPED):
+            continue
+        prereqs = [f for f, t in graph.edges if t == node.objective_id]
+        if all(mastered(p) for p in prereqs):
+            available.append(node.objective_id)
+    if not available:
+        return None
+    scored = [(obj_id, _objective_score(model.objectives.get(obj_id))) for obj_id in available]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[0][0]
+
+
+def simulate(graph: PlanGraph, steps: int, select, seed: int) -> tuple[float, list[str]]:
+    rng = random.Random(seed)
+    model = LearnerModel(user_id="bench")
+    engine = MasteryEngine()
+    block = MCQBlock(stem="q", options=["a", "b"], correct_index=0)
+    picks = []
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        obj_id = select(engine, model, graph)
+        if obj_id is None:
+            break
+        picks.append(obj_id)
+        evaluation = ResponseEvaluation(is_correct=rng.random() < 0.85, confidence=Confidence.HIGH)
+        engine.update_mastery(
+            model, evaluation, Activity(objective_id=obj_id, stage=Stage.PRACTICE, block=block)
+        )
+    return time.perf_counter() - start, picks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objectives", type=int, default=5000)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--naive-steps", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = build_curriculum(args.objectives, args.seed)
+    print(f"Curriculum: {len(graph.nodes)} objectives, {len(graph.edges)} edges")
+
+    elapsed, picks = simulate(
+        graph, args.steps, lambda e, m, g: e.select_next_objective(m, g), args.seed
+    )
+    per_step = elapsed / max(1, len(picks)) * 1e3
+    print(f"  incremental: {per_step:.3f} ms/decision ({len(picks)} decisions)")
+
+    naive_elapsed, naive_picks = simulate(
+        build_curriculum(args.objectives, args.seed),
+        args.naive_steps,
+        lambda e, m, g: naive_select(m, g),
+        args.seed,
+    )
+    naive_per_step = naive_elapsed / max(1, len(naive_picks)) * 1e3
+    print(f"  naive:       {naive_per_step:.3f} ms/decision ({len(naive_picks)} decisions)")
+    print(f"  speedup:     {naive_per_step / per_step:.0f}x")
+
+    if picks[: len(naive_picks)] != naive_picks:
+        print("  MISMATCH: incremental and naive selections differ")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
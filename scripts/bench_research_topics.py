@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compare wave-based and worker-pool scheduling of research topics.
+
+Builds a synthetic topic tree: --roots initial topics with mixed durations, where
+every topic above the leaf depth spawns --fanout follow-up topics halfway through
+its research (like ManagerAgent.add_new_topic_async during a research loop). The
+"waves" baseline reproduces the previous parallel mode: gather the pending
+blocks under a semaphore, then poll for topics added in the meantime. The
+"pool" run uses TopicWorkerPool.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_research_topics.py [--roots 6] [--fanout 2] [--depth 2] [--workers 4]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import random
+import sys
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.agents.research.data_structures import DynamicTopicQueue, TopicStatus  # noqa: E402
+from src.agents.research.utils import TopicWorkerPool  # noqa: E402
+
+
+def duration(name: str, args) -> float:
+    """Deterministic per topic: mostly quick topics with an occasional slow one"""
+    rng = random.Random(f"{args.seed}-{name}")
+    return args.unit * (4 if rng.random() < 0.2 else rng.uniform(0.5, 1.5))
+
+
+def make_research(queue: DynamicTopicQueue, args):
+    async def research(block):
+        name = block.sub_topic
+        depth = name.count(".")
+        await asyncio.sleep(duration(name, args) / 2)
+        if depth < args.depth:
+            for i in range(args.fanout):
+                queue.add_block(f"{name}.{i}", "")
+            await queue.notify_new_work()
+        await asyncio.sleep(duration(name, args) / 2)
+        queue.mark_completed(block.block_id)
+
+    return research
+
+
+def new_queue(args) -> DynamicTopicQueue:
+    queue = DynamicTopicQueue("bench")
+    for i in range(args.roots):
+        queue.add_block(f"t{i}", "")
+    return queue
+
+
+def ideal_seconds(args) -> float:
+    """Total topic time spread perfectly over the workers"""
+    names = [f"t{i}" for i in range(args.roots)]
+    total = 0.0
+    while names:
+        name = names.pop()
+        total += duration(name, args)
+        if name.count(".") < args.depth:
+            names.extend(f"{name}.{i}" for i in range(args.fanout))
+    return total / args.workers
+
+
+async def run_waves(args) -> tuple[float, int]:
+    queue = new_queue(args)
+    research = make_research(queue, args)
+    semaphore = asyncio.Semaphore(args.workers)
+
+    async def one(block):
+        async with semaphore:
+            queue.mark_researching(block.block_id)
+            await research(block)
+
+    start = time.perf_counter()
+    while True:
+        pending = [b for b in queue.blocks if b.status == TopicStatus.PENDING]
+        if not pending:
+            break
+        await asyncio.gather(*(one(b) for b in pending))
+    return time.perf_counter() - start, len(queue.blocks)
+
+
+async def run_pool(args) -> tuple[float, int]:
+    queue = new_queue(args)
+    pool = TopicWorkerPool(queue, make_research(queue, args), max_workers=args.workers)
+    start = time.perf_counter()
+    await pool.run()
+    return time.perf_counter() - start, len(queue.blocks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--roots", type=int, default=6)
+    parser.add_argument("--fanout", type=int, default=2)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--unit", type=float, default=0.1, help="Typical topic duration (s)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'ideal':>5}: {ideal_seconds(args):6.2f} s (total topic time / workers)")
+    for label, runner in (("waves", run_waves), ("pool", run_pool)):
+        elapsed, topics = asyncio.run(runner(args))
+        print(f"{label:>5}: {topics} topics with {args.workers} workers in {elapsed:6.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Measure solve-chain wall-clock time with dependency-aware parallel steps.
+
+Runs MainSolver's step execution over a synthetic plan: --steps independent
+steps followed by one integration step that depends on all of them. Solve and
+response agents are stubs that sleep --llm-ms per call (two solve iterations per
+step), so the numbers reflect scheduling only.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_solve_steps.py [--steps 5] [--llm-ms 200]
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.agents.solve.main_solver import MainSolver  # noqa: E402
+from src.agents.solve.memory import (  # noqa: E402
+    CitationMemory,
+    InvestigateMemory,
+    SolveChainStep,
+    SolveMemory,
+)
+from src.agents.solve.utils import PerformanceMonitor, TokenTracker, get_logger  # noqa: E402
+
+
+class StubSolveAgent:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls: dict[str, int] = {}
+
+    async def process(self, question, current_step, **kwargs):
+        await asyncio.sleep(self.delay)
+        n = self.calls[current_step.step_id] = self.calls.get(current_step.step_id, 0) + 1
+        return {"finish_requested": n >= 2}
+
+
+class StubResponseAgent:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def process(self, question, step, solve_memory, **kwargs):
+        await asyncio.sleep(self.delay)
+        solve_memory.submit_step_response(step.step_id, f"Response for {step.step_id}")
+        return {"step_response": "", "raw_response": ""}
+
+
+async def run(args, max_parallel: int, output_dir: str) -> float:
+    solver = MainSolver.__new__(MainSolver)
+    solver.config = {"solve": {"max_parallel_steps": max_parallel}}
+    solver.kb_name = "bench"
+    solver.logger = get_logger("BenchSolve")
+    solver.monitor = PerformanceMonitor(enabled=False)
+    solver.token_tracker = TokenTracker(prefer_tiktoken=False)
+    solver.solve_agent = StubSolveAgent(args.llm_ms / 1000)
+    solver.response_agent = StubResponseAgent(args.llm_ms / 1000)
+
+    independent = [f"S{i}" for i in range(1, args.steps + 1)]
+    steps = [SolveChainStep(step_id=sid, step_target=sid, depends_on=[]) for sid in independent]
+    steps.append(SolveChainStep(step_id="S_final", step_target="final", depends_on=independent))
+    solve_memory = SolveMemory(output_dir=output_dir)
+    solve_memory.create_chains(steps)
+
+    start = time.perf_counter()
+    await solver._execute_solve_chain(
+        question="benchmark",
+        solve_memory=solve_memory,
+        investigate_memory=InvestigateMemory(output_dir=output_dir),
+        citation_memory=CitationMemory(output_dir=output_dir),
+        output_dir=output_dir,
+    )
+    elapsed = time.perf_counter() - start
+    assert all(step.status == "done" for step in solve_memory.solve_chains)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--llm-ms", type=float, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{args.steps} independent steps + 1 integration step, {args.llm_ms:.0f} ms per LLM call")
+    with tempfile.TemporaryDirectory() as tmp:
+        for max_parallel in (1, 3, args.steps):
+            elapsed = asyncio.run(run(args, max_parallel, tmp))
+            print(f"  max_parallel_steps={max_parallel}: {elapsed:6.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
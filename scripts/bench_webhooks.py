@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure webhook delivery throughput against a local HTTP stub.
+
+Queues --events events fanned out to --endpoints webhooks on a local aiohttp
+server that answers after --latency-ms, then reports deliveries per second for
+each engine concurrency level.
+
+This is intentionally not collected by pytest (it is a manual script).
+
+Usage:
+    python scripts/bench_webhooks.py [--events 500] [--endpoints 4] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from aiohttp import web
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.services.webhooks import (  # noqa: E402
+    WebhookCreateRequest,
+    WebhookDeliveryEngine,
+    WebhookStore,
+)
+
+
+async def run(concurrency: int, args) -> float:
+    async def handler(request):
+        await request.read()
+        await asyncio.sleep(args.latency_ms / 1000)
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/hook/{n}", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = WebhookStore(Path(tmp) / "webhooks.db")
+        for n in range(args.endpoints):
+            store.create_webhook(WebhookCreateRequest(url=f"http://127.0.0.1:{port}/hook/{n}"))
+        for i in range(args.events):
+            store.enqueue("workflow.completed", {"i": i, "report": "x" * 512})
+        total = args.events * args.endpoints
+
+        engine = WebhookDeliveryEngine(
+            store, concurrency=concurrency, per_endpoint_limit=max(1, concurrency // 2)
+        )
+        start = time.perf_counter()
+        await engine.start()
+        await engine.wait_idle()
+        elapsed = time.perf_counter() - start
+        await engine.stop()
+        assert store.count_by_status() == {"success": total}
+        store.close()
+
+    await runner.cleanup()
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--endpoints", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    total = args.events * args.endpoints
+    print(f"{total} deliveries, endpoint latency {args.latency_ms:.0f} ms")
+    for concurrency in (1, 8, 32, 64):
+        rate = asyncio.run(run(concurrency, args))
+        print(f"  concurrency {concurrency:3d}: {rate:8.0f} deliveries/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,7 +26,7 @@ if str(_project_root) not in sys.path:
 from src.config.settings import settings
 from src.di import Container, get_container
 from src.logging import LLMStats, estimate_tokens, get_logger
-from src.services.config import get_agent_params
+from src.services.config import get_agent_params, get_llm_cache_params
 from src.services.llm import complete as llm_complete
 from src.services.llm import complete_with_vision as llm_complete_with_vision
 from src.services.llm import get_llm_config, get_token_limit_kwargs, supports_response_format
@@ -100,6 +100,12 @@ class BaseAgent(ABC):
         # Load agent parameters from unified config (agents.yaml)
         self._agent_params = get_agent_params(module_name)
 
+        # Exact-match LLM response cache opt-in (agents.yaml llm_cache.agents)
+        cache_params = get_llm_cache_params()
+        self.use_llm_cache = cache_params["enabled"] and agent_name in cache_params["agents"].get(
+            module_name, []
+        )
+
         # Load LLM configuration
         try:
             env_llm = get_llm_config()
@@ -424,6 +430,8 @@ class BaseAgent(ABC):
                 base_url=self.base_url,
                 api_version=self.api_version,
                 max_retries=max_retries,
+                use_cache=self.use_llm_cache,
+                cache_namespace=f"{self.module_name}.{self.agent_name}",
                 **kwargs,
             )
         except Exception as e:
@@ -438,10 +446,11 @@ class BaseAgent(ABC):
         finally:
             if response is not None:
                 try:
-                    prompt_tokens = estimate_tokens(
-                        (system_prompt or "") + "\n" + (user_prompt or "")
+                    # Count parts separately so the (repeated) system prompt hits the cache
+                    prompt_tokens = estimate_tokens(system_prompt or "", model) + estimate_tokens(
+                        user_prompt or "", model
                     )
-                    completion_tokens = estimate_tokens(response or "")
+                    completion_tokens = estimate_tokens(response or "", model)
                     metrics.add_tokens(
                         prompt=prompt_tokens, completion=completion_tokens, model=model
                     )
@@ -603,8 +612,10 @@ class BaseAgent(ABC):
             raise
         finally:
             try:
-                prompt_tokens = estimate_tokens((system_prompt or "") + "\n" + (user_prompt or ""))
-                completion_tokens = estimate_tokens(full_response or "")
+                prompt_tokens = estimate_tokens(system_prompt or "", model) + estimate_tokens(
+                    user_prompt or "", model
+                )
+                completion_tokens = estimate_tokens(full_response or "", model)
                 metrics.add_tokens(prompt=prompt_tokens, completion=completion_tokens, model=model)
             except Exception:
                 pass
@@ -21,6 +21,7 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from src.agents.base_agent import BaseAgent
+from src.services.llm.tokenizer import get_tokenizer
 from src.tools import rag_search, web_search
 
 
@@ -71,9 +72,10 @@ class ChatAgent(BaseAgent):
 
     def count_tokens(self, text: str) -> int:
         """
-        Count tokens in text using tiktoken.
+        Count tokens in text using the shared tokenizer service.
 
-        Falls back to character-based estimation if tiktoken unavailable.
+        Counts are memoized by content hash; falls back to character-based
+        estimation if tiktoken is unavailable.
 
         Args:
             text: Text to count tokens for
@@ -81,15 +83,14 @@ class ChatAgent(BaseAgent):
         Returns:
             Estimated token count
         """
-        try:
-            import tiktoken
+        return get_tokenizer().count(text, self._tokenizer_model())
 
-            # Use cl100k_base encoding (GPT-4, GPT-3.5-turbo)
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
-        except ImportError:
-            # Fallback: rough estimate of 4 characters per token
-            return len(text) // 4
+    def _tokenizer_model(self) -> str | None:
+        """Model name used to pick the token encoding (None if not configured)."""
+        try:
+            return self.get_model()
+        except ValueError:
+            return None
 
     def truncate_history(
         self,
@@ -99,7 +100,8 @@ class ChatAgent(BaseAgent):
         """
         Truncate conversation history to fit within token limit.
 
-        Keeps the most recent messages, discarding older ones first.
+        Keeps the most recent messages, discarding older ones first. Cost is
+        proportional to the kept messages; persisted counts make it O(new messages).
 
         Args:
             history: List of message dicts with 'role' and 'content'
@@ -113,22 +115,21 @@ class ChatAgent(BaseAgent):
         if not history:
             return []
 
-        # Calculate tokens for each message
-        message_tokens = []
-        for msg in history:
-            content = msg.get("content", "")
-            tokens = self.count_tokens(content)
-            message_tokens.append((msg, tokens))
-
-        # Build history from newest to oldest, stop when limit reached
+        # Build history from newest to oldest, stop when limit reached.
+        # Messages carrying a persisted token_count are not re-encoded, and older
+        # messages beyond the limit are never counted.
+        tokenizer = get_tokenizer()
+        model = self._tokenizer_model()
         truncated = []
         total_tokens = 0
 
-        for msg, tokens in reversed(message_tokens):
+        for msg in reversed(history):
+            tokens = tokenizer.count_message(msg, model)
             if total_tokens + tokens > max_tokens:
                 break
-            truncated.insert(0, msg)
+            truncated.append(msg)
             total_tokens += tokens
+        truncated.reverse()
 
         if len(truncated) < len(history):
             self.logger.info(
@@ -16,6 +16,8 @@ import time
 from typing import Any
 import uuid
 
+from src.services.llm.tokenizer import get_tokenizer
+
 
 class SessionManager:
     """
@@ -25,7 +27,8 @@ class SessionManager:
     Each session contains:
     - session_id: Unique identifier
     - title: Session title (usually first user message)
-    - messages: List of messages with role, content, sources, timestamp
+    - messages: List of messages with role, content, sources, timestamp,
+      token_count/token_encoding
     - settings: RAG/Web Search settings used
     - created_at: Creation timestamp
     - updated_at: Last update timestamp
@@ -190,10 +193,15 @@ class SessionManager:
         sources: dict[str, Any] | None = None,
         meta: dict[str, Any] | None = None,
         exclude_from_history: bool = False,
+        model: str | None = None,
     ) -> dict[str, Any] | None:
         """
         Add a single message to a session.
 
+        The message's token count is computed once here and persisted
+        (``token_count``/``token_encoding``) so history truncation on later turns
+        does not re-encode old messages.
+
         Args:
             session_id: Session identifier
             role: Message role ('user' or 'assistant')
@@ -201,6 +209,7 @@ class SessionManager:
             sources: Optional sources dict (for assistant messages)
             meta: Optional metadata to attach to the message (stored but not rendered by default)
             exclude_from_history: If True, omit this message from future LLM history
+            model: Model name used to select the token encoding (optional)
 
         Returns:
             Updated session or None if not found
@@ -220,6 +229,8 @@ class SessionManager:
             message["meta"] = meta
         if exclude_from_history:
             message["exclude_from_history"] = True
+        else:
+            get_tokenizer().annotate_message(message, model)
 
         messages = session.get("messages", [])
         messages.append(message)
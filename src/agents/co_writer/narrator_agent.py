@@ -5,29 +5,42 @@ NarratorAgent - Note narration agent.
 Inherits from unified BaseAgent with special TTS configuration.
 """
 
-from datetime import datetime
+import asyncio
+from collections import OrderedDict
+import hashlib
 import json
-import os
 from pathlib import Path
 import re
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from urllib.parse import urlparse
-import uuid
-
-from openai import AsyncAzureOpenAI, AsyncOpenAI
 
 from src.agents.base_agent import BaseAgent
-from src.services.tts import get_tts_config
+from src.services.config import subscribe_config_changes
+from src.services.llm import get_llm_config, supports_response_format
+from src.services.tts import get_tts_config, get_tts_synthesizer
 
 # Import shared stats from edit_agent for legacy compatibility
 
 # Define storage path (unified under user/co-writer/ directory)
 USER_DIR = Path(__file__).parent.parent.parent.parent / "data" / "user" / "co-writer" / "audio"
 
+# Generated scripts, keyed by a hash of (model, prompts, content, style, language);
+# shared by all instances
+SCRIPT_CACHE_SIZE = 64
+_script_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+def clear_script_cache() -> None:
+    """Drop all cached narration scripts"""
+    _script_cache.clear()
+
 
-def ensure_dirs():
-    """Ensure directories exist"""
-    USER_DIR.mkdir(parents=True, exist_ok=True)
+def _clear_on_config_change(changed: list[Path]) -> None:
+    # Generation settings (temperature, max_tokens, ...) live in config files
+    clear_script_cache()
+
+
+subscribe_config_changes(_clear_on_config_change)
 
 
 class NarratorAgent(BaseAgent):
@@ -146,6 +159,12 @@ class NarratorAgent(BaseAgent):
         """
         Generate narration script
 
+        Script and key points come from a single JSON-mode LLM call when the
+        configured binding supports response_format; otherwise (or if the JSON is
+        unusable) the script and key-point calls run concurrently. Results are
+        cached per (model, prompts, content, style, language) and dropped when a
+        config file changes.
+
         Args:
             content: Note content (Markdown format)
             style: Narration style (friendly, academic, concise)
@@ -155,6 +174,59 @@ class NarratorAgent(BaseAgent):
                 - script: Narration script text
                 - key_points: List of extracted key points
         """
+        cache_key = self._script_cache_key(content, style)
+        cached = _script_cache.get(cache_key)
+        if cached is not None:
+            _script_cache.move_to_end(cache_key)
+            self.logger.info(f"Narration script served from cache (style: {style})")
+            return {**cached, "key_points": list(cached["key_points"])}
+
+        system_prompt, user_prompt = self._build_script_prompts(content, style)
+
+        self.logger.info(f"Generating narration script with style: {style}")
+
+        script = None
+        if self._supports_structured_output():
+            script, key_points = await self._generate_script_with_key_points(
+                system_prompt, user_prompt
+            )
+        if script is None:
+            script, key_points = await asyncio.gather(
+                self._generate_script_text(system_prompt, user_prompt),
+                self._extract_key_points(content),
+            )
+
+        result = {
+            "script": script,
+            "key_points": key_points,
+            "style": style,
+            "original_length": len(content),
+            "script_length": len(script),
+        }
+        _script_cache[cache_key] = result
+        while len(_script_cache) > SCRIPT_CACHE_SIZE:
+            _script_cache.popitem(last=False)
+        return {**result, "key_points": list(key_points)}
+
+    def _script_cache_key(self, content: str, style: str) -> str:
+        canonical = json.dumps(
+            [self.get_model(), self.language, style, self.prompts, content],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _supports_structured_output(self) -> bool:
+        """Whether the configured LLM binding honours response_format (JSON mode)"""
+        try:
+            binding = getattr(get_llm_config(), "binding", None) or "openai"
+        except Exception:
+            binding = "openai"
+        return supports_response_format(binding, self.get_model())
+
+    def _build_script_prompts(self, content: str, style: str) -> tuple[str, str]:
+        """Build the (system, user) prompts of the script call"""
         # Estimate target length: OpenAI TTS supports up to 4096 characters
         is_long_content = len(content) > 5000
 
@@ -183,16 +255,51 @@ class NarratorAgent(BaseAgent):
             user_template = self.get_prompt("generate_script_user_short", "")
             user_prompt = user_template.format(content=content)
 
-        self.logger.info(f"Generating narration script with style: {style}")
+        return system_prompt, user_prompt
 
+    async def _generate_script_text(self, system_prompt: str, user_prompt: str) -> str:
+        """Plain-text script call"""
         # Use inherited call_llm method
         response = await self.call_llm(
             user_prompt=user_prompt,
             system_prompt=system_prompt,
             stage="generate_script",
         )
+        return self._clean_script(response)
+
+    async def _generate_script_with_key_points(
+        self, system_prompt: str, user_prompt: str
+    ) -> tuple[Optional[str], list]:
+        """
+        Single JSON-mode call returning script and key points
+
+        Returns:
+            (script, key_points), or (None, []) if the response has no usable script
+        """
+        response = await self.call_llm(
+            user_prompt=user_prompt,
+            system_prompt=f"{system_prompt}\n\n{self.get_prompt('narration_json_instruction', '')}",
+            response_format={"type": "json_object"},
+            stage="generate_script",
+        )
 
-        # Clean and truncate response, ensure it doesn't exceed 4000 characters
+        try:
+            json_match = re.search(r"\{.*\}", response, re.DOTALL)
+            data = json.loads(json_match.group() if json_match else response)
+            script = data.get("script") if isinstance(data, dict) else None
+        except (json.JSONDecodeError, TypeError):
+            script = None
+        if not isinstance(script, str) or not script.strip():
+            self.logger.warning("Structured narration output unusable, falling back to two calls")
+            return None, []
+
+        key_points = data.get("key_points")
+        if not isinstance(key_points, list):
+            key_points = []
+        return self._clean_script(script), [str(point) for point in key_points]
+
+    def _clean_script(self, response: str) -> str:
+        """Clean and truncate response, ensure it doesn't exceed 4000 characters"""
         script = response.strip()
         if len(script) > 4000:
             self.logger.warning(
@@ -211,16 +318,7 @@ class NarratorAgent(BaseAgent):
                 script = truncated[: last_period + 1]
             else:
                 script = truncated + "..."
-
-        key_points = await self._extract_key_points(content)
-
-        return {
-            "script": script,
-            "key_points": key_points,
-            "style": style,
-            "original_length": len(content),
-            "script_length": len(script),
-        }
+        return script
 
     async def _extract_key_points(self, content: str) -> list:
         """Extract key points from notes"""
@@ -247,10 +345,29 @@ class NarratorAgent(BaseAgent):
             self.logger.warning(f"Failed to extract key points: {e}")
             return []
 
+    def _check_audio_request(self, script: str, voice: Optional[str]) -> str:
+        """Validate TTS availability and the script; return the voice to use"""
+        if not self.tts_config:
+            raise ValueError(
+                "TTS configuration not available. Please configure TTS_MODEL, TTS_API_KEY, and TTS_URL in .env"
+            )
+
+        # Validate input parameters
+        if not script or not script.strip():
+            raise ValueError("Script cannot be empty")
+
+        # Use default voice if not specified
+        return voice or self.default_voice
+
     async def generate_audio(self, script: str, voice: str = None) -> dict[str, Any]:
         """
         Convert narration script to audio using OpenAI TTS API
 
+        The script is synthesized sentence chunk by sentence chunk (no length limit)
+        through the shared TTS synthesizer; a script already narrated with the same
+        model and voice is served from the audio cache without any TTS request.
+        The file is exported to co-writer/audio, so its URL outlives cache eviction.
+
         Args:
             script: Narration script text
             voice: Voice role (alloy, echo, fable, onyx, nova, shimmer)
@@ -259,93 +376,57 @@ class NarratorAgent(BaseAgent):
             Dict containing:
                 - audio_path: Audio file path
                 - audio_url: Audio access URL
-                - audio_id: Unique audio identifier
+                - audio_id: Content address of the audio
                 - voice: Voice used
+                - cached: Whether the audio came from the cache
         """
-        if not self.tts_config:
-            raise ValueError(
-                "TTS configuration not available. Please configure TTS_MODEL, TTS_API_KEY, and TTS_URL in .env"
-            )
-
-        # Use default voice if not specified
-        if voice is None:
-            voice = self.default_voice
-
-        # Validate input parameters
-        if not script or not script.strip():
-            raise ValueError("Script cannot be empty")
-
-        ensure_dirs()
-
-        # Truncate overly long scripts (OpenAI TTS supports up to 4096 characters)
-        original_script_length = len(script)
-        if len(script) > 4096:
-            self.logger.warning(f"Script length {len(script)} exceeds 4096 limit. Truncating...")
-            truncated = script[:4093]
-            last_period = max(
-                truncated.rfind("。"),
-                truncated.rfind("！"),
-                truncated.rfind("？"),
-                truncated.rfind("."),
-                truncated.rfind("!"),
-                truncated.rfind("?"),
-            )
-            if last_period > 3500:
-                script = truncated[: last_period + 1]
-            else:
-                script = truncated + "..."
-            self.logger.info(
-                f"Script truncated from {original_script_length} to {len(script)} characters"
-            )
-
-        audio_id = datetime.now().strftime("%Y%m%d_%H%M%S") + "_" + uuid.uuid4().hex[:6]
-        audio_filename = f"narration_{audio_id}.mp3"
-        audio_path = USER_DIR / audio_filename
+        voice = self._check_audio_request(script, voice)
 
-        self.logger.info(f"Starting TTS audio generation - ID: {audio_id}, Voice: {voice}")
+        self.logger.info(f"Starting TTS audio generation - Voice: {voice}")
 
         try:
-            binding = os.getenv("TTS_BINDING", "openai")
-            api_version = self.tts_config.get("api_version")
-
-            # Only use Azure client if binding is explicitly Azure,
-            # OR if binding is generic 'openai' but an Azure-specific api_version is present.
-            if binding == "azure_openai" or (binding == "openai" and api_version):
-                client = AsyncAzureOpenAI(
-                    api_key=self.tts_config["api_key"],
-                    azure_endpoint=self.tts_config["base_url"],
-                    api_version=api_version,
-                )
-            else:
-                # Create OpenAI client with custom base_url
-                client = AsyncOpenAI(
-                    base_url=self.tts_config["base_url"], api_key=self.tts_config["api_key"]
-                )
-
-            # Call OpenAI TTS API
-            response = await client.audio.speech.create(
-                model=self.tts_config["model"], voice=voice, input=script
+            result = await get_tts_synthesizer().synthesize(
+                script, voice=voice, tts_config=self.tts_config, output_dir=USER_DIR
             )
+        except Exception as e:
+            self.logger.error(f"TTS generation failed: {type(e).__name__}: {e}", exc_info=True)
+            raise ValueError(f"TTS generation failed: {type(e).__name__}: {e}")
 
-            # Save audio to file
-            await response.stream_to_file(audio_path)
+        if result["cached"]:
+            self.logger.info(f"Audio served from cache: {result['path']}")
+        else:
+            self.logger.info(f"Audio saved to: {result['path']} ({result['chunks']} chunks)")
 
-            self.logger.info(f"Audio saved to: {audio_path}")
+        return {
+            "audio_path": result["path"],
+            "audio_url": result["url"],
+            "audio_id": result["key"],
+            "voice": voice,
+            "cached": result["cached"],
+        }
 
-            # Use correct path: co-writer/audio (matching the actual storage directory)
-            relative_path = f"co-writer/audio/{audio_filename}"
-            audio_access_url = f"/api/outputs/{relative_path}"
+    async def stream_audio(self, script: str, voice: str = None) -> AsyncIterator[bytes]:
+        """
+        Stream the narration audio (MP3) chunk by chunk as it is synthesized
 
-            return {
-                "audio_path": str(audio_path),
-                "audio_url": audio_access_url,
-                "audio_id": audio_id,
-                "voice": voice,
-            }
+        Validation happens before the first chunk is requested, so configuration
+        errors are raised by this call rather than mid-stream.
 
+        Args:
+            script: Narration script text
+            voice: Voice role (alloy, echo, fable, onyx, nova, shimmer)
+
+        Returns:
+            Async iterator of MP3 bytes, in playback order
+        """
+        # Refresh TTS config (this is an entry point, like narrate)
+        try:
+            self.tts_config = get_tts_config()
         except Exception as e:
-            self.logger.error(f"TTS generation failed: {type(e).__name__}: {e}", exc_info=True)
-            raise ValueError(f"TTS generation failed: {type(e).__name__}: {e}")
+            self.logger.error(f"Failed to refresh TTS config: {e}")
+
+        voice = self._check_audio_request(script, voice)
+        return get_tts_synthesizer().stream(script, voice=voice, tts_config=self.tts_config)
 
     async def narrate(
         self,
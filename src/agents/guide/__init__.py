@@ -5,6 +5,7 @@ Generates personalized knowledge point learning plans based on user notebook con
 
 from .agents import ChatAgent, InteractiveAgent, LocateAgent, SummaryAgent
 from .guide_manager import GuidedSession, GuideManager
+from .page_pregenerator import PagePregenerator, get_page_pregenerator
 
 __all__ = [
     "ChatAgent",
@@ -12,5 +13,7 @@ __all__ = [
     "GuidedSession",
     "InteractiveAgent",
     "LocateAgent",
+    "PagePregenerator",
     "SummaryAgent",
+    "get_page_pregenerator",
 ]
@@ -18,6 +18,7 @@ from src.logging import get_logger
 from src.services.config import load_config_with_main, parse_language
 
 from .agents import ChatAgent, InteractiveAgent, LocateAgent, SummaryAgent
+from .page_pregenerator import get_page_pregenerator
 
 
 @dataclass
@@ -147,6 +148,38 @@ class GuideManager:
 
         self._sessions: dict[str, GuidedSession] = {}
 
+        # Interactive pages for upcoming knowledge points are generated in the background
+        pregen_config = config.get("guide", {}).get("pregenerate", {})
+        self.pregenerate_enabled = pregen_config.get("enabled", True)
+        self.pregenerator = get_page_pregenerator(
+            lookahead=pregen_config.get("lookahead", 2),
+            max_pages=pregen_config.get("max_cached_pages", 4),
+        )
+
+    def _schedule_pregeneration(self, session: GuidedSession, from_index: int):
+        """Start generating pages for the knowledge points after the current one"""
+        if not self.pregenerate_enabled:
+            return
+        self.pregenerator.schedule(
+            session.session_id,
+            session.knowledge_points,
+            from_index,
+            self.interactive_agent.process,
+            self.output_dir,
+        )
+
+    async def _get_interactive_page(
+        self, session: GuidedSession, index: int, knowledge: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Pre-generated page for a knowledge point, generating it now on a miss"""
+        if self.pregenerate_enabled:
+            page = await self.pregenerator.take(
+                session.session_id, index, knowledge, self.output_dir
+            )
+            if page is not None:
+                return {"success": True, **page}
+        return await self.interactive_agent.process(knowledge=knowledge)
+
     def _get_session_file(self, session_id: str) -> Path:
         """Get session file path"""
         return self.output_dir / f"session_{session_id}.json"
@@ -219,6 +252,7 @@ class GuideManager:
         )
 
         self._save_session(session)
+        self._schedule_pregeneration(session, 0)
 
         return {
             "success": True,
@@ -294,7 +328,7 @@ class GuideManager:
 
         current_knowledge = state.get("current_knowledge")
 
-        interactive_result = await self.interactive_agent.process(knowledge=current_knowledge)
+        interactive_result = await self._get_interactive_page(session, 0, current_knowledge)
 
         session.current_index = 0
         session.status = "learning"
@@ -310,6 +344,7 @@ class GuideManager:
         )
 
         self._save_session(session)
+        self._schedule_pregeneration(session, 1)
 
         return {
             "success": True,
@@ -343,6 +378,8 @@ class GuideManager:
             return state
 
         if state.get("status") == "completed":
+            self.pregenerator.cancel_session(session.session_id, self.output_dir)
+
             summary_result = await self.summary_agent.process(
                 notebook_name=session.notebook_name,
                 knowledge_points=session.knowledge_points,
@@ -375,7 +412,7 @@ class GuideManager:
 
         current_knowledge = state.get("current_knowledge")
 
-        interactive_result = await self.interactive_agent.process(knowledge=current_knowledge)
+        interactive_result = await self._get_interactive_page(session, new_index, current_knowledge)
 
         session.current_index = new_index
         session.current_html = interactive_result.get("html", "")
@@ -392,6 +429,7 @@ class GuideManager:
         )
 
         self._save_session(session)
+        self._schedule_pregeneration(session, new_index + 1)
 
         return {
             "success": True,
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PagePregenerator - Background generation of upcoming interactive pages
+
+The knowledge points of a guided session are known when the session is created,
+so the interactive HTML for the next few points can be generated while the
+learner studies the current one. Advancing then only has to pick up a finished
+page (or wait for the rest of one already in flight) instead of paying a full
+LLM round trip.
+
+Pages are kept per session in a bounded window ahead of the current point and
+persisted next to the session file (``session_<id>_pages.json``), so they survive
+restarts and are shared by every GuideManager instance in the process. Moving
+the window (advancing or jumping) cancels generations that fall outside it;
+ending the session cancels everything and removes the file.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any, Awaitable, Callable
+
+from src.logging import get_logger
+
+logger = get_logger("GuidePregen")
+
+# Knowledge points generated ahead of the current one
+DEFAULT_LOOKAHEAD = 2
+# Upper bound on cached plus in-flight pages per session
+DEFAULT_MAX_PAGES = 4
+
+PageGenerator = Callable[..., Awaitable[dict[str, Any]]]
+
+
+def knowledge_key(knowledge: dict[str, Any]) -> str:
+    """Fingerprint of a knowledge point, so a stale page is never served"""
+    canonical = json.dumps(knowledge, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class PagePregenerator:
+    """Per-session lookahead cache of generated interactive pages"""
+
+    def __init__(self, lookahead: int = DEFAULT_LOOKAHEAD, max_pages: int = DEFAULT_MAX_PAGES):
+        self.lookahead = max(0, lookahead)
+        self.max_pages = max(1, max_pages)
+        # session_id -> knowledge index -> {"key", "html", "is_fallback", "created_at"}
+        self._pages: dict[str, dict[int, dict[str, Any]]] = {}
+        self._tasks: dict[str, dict[int, asyncio.Task]] = {}
+        self._stats = {
+            "hits": 0,
+            "in_flight_hits": 0,
+            "misses": 0,
+            "generated": 0,
+            "failed": 0,
+            "cancelled": 0,
+        }
+
+    @staticmethod
+    def pages_file(store_dir: Path, session_id: str) -> Path:
+        return Path(store_dir) / f"session_{session_id}_pages.json"
+
+    def _session_pages(self, session_id: str, store_dir: Path) -> dict[int, dict[str, Any]]:
+        """In-memory pages of a session, loaded from disk on first access"""
+        pages = self._pages.get(session_id)
+        if pages is None:
+            pages = {}
+            try:
+                with open(self.pages_file(store_dir, session_id), encoding="utf-8") as f:
+                    data = json.load(f)
+                pages = {int(index): page for index, page in data.get("pages", {}).items()}
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable pre-generated pages of {session_id}: {e}")
+            self._pages[session_id] = pages
+        return pages
+
+    def _persist(self, session_id: str, store_dir: Path) -> None:
+        path = self.pages_file(store_dir, session_id)
+        pages = self._pages.get(session_id) or {}
+        try:
+            if not pages:
+                path.unlink(missing_ok=True)
+                return
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"session_id": session_id, "pages": {str(i): p for i, p in pages.items()}},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp, path)
+        except OSError as e:
+            # Pages stay usable from memory; only a restart loses them
+            logger.warning(f"Could not persist pre-generated pages of {session_id}: {e}")
+
+    def schedule(
+        self,
+        session_id: str,
+        knowledge_points: list[dict[str, Any]],
+        from_index: int,
+        generate: PageGenerator,
+        store_dir: Path,
+    ) -> list[int]:
+        """
+        Make the lookahead window start at ``from_index``
+
+        Pages and generations outside ``[from_index, from_index + lookahead)`` are
+        dropped or cancelled; missing pages inside it are generated in the background.
+        Must be called from a running event loop.
+
+        Args:
+            session_id: Session ID
+            knowledge_points: The session's knowledge points
+            from_index: First knowledge point that is not on screen yet
+            generate: ``InteractiveAgent.process``-compatible coroutine function
+            store_dir: Directory holding the session file
+
+        Returns:
+            Indices for which a generation was started
+        """
+        window = range(
+            max(0, from_index),
+            min(len(knowledge_points), from_index + min(self.lookahead, self.max_pages)),
+        )
+        pages = self._session_pages(session_id, store_dir)
+        tasks = self._tasks.setdefault(session_id, {})
+
+        stale = [i for i in pages if i not in window]
+        for index in stale:
+            del pages[index]
+        for index in [i for i in tasks if i not in window]:
+            tasks.pop(index).cancel()
+            self._stats["cancelled"] += 1
+        if stale:
+            self._persist(session_id, store_dir)
+
+        started = []
+        for index in window:
+            knowledge = knowledge_points[index]
+            page = pages.get(index)
+            if page and page.get("key") == knowledge_key(knowledge):
+                continue
+            if index in tasks:
+                continue
+            task = asyncio.create_task(
+                self._generate(session_id, index, knowledge, generate, store_dir),
+                name=f"guide-pregen-{session_id}-{index}",
+            )
+            tasks[index] = task
+            task.add_done_callback(lambda t, s=session_id, i=index: self._forget_task(s, i, t))
+            started.append(index)
+        return started
+
+    def _forget_task(self, session_id: str, index: int, task: asyncio.Task) -> None:
+        tasks = self._tasks.get(session_id)
+        if tasks and tasks.get(index) is task:
+            del tasks[index]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieve it so an unawaited failure is logged once, not at shutdown
+            logger.warning(
+                f"Pre-generating page {index} of {session_id} failed: {task.exception()}"
+            )
+
+    async def _generate(
+        self,
+        session_id: str,
+        index: int,
+        knowledge: dict[str, Any],
+        generate: PageGenerator,
+        store_dir: Path,
+    ) -> dict[str, Any] | None:
+        start = time.perf_counter()
+        result = await generate(knowledge=knowledge)
+        if not result.get("success") or result.get("error"):
+            # Fallback pages from a failed LLM call are not worth keeping
+            self._stats["failed"] += 1
+            return None
+        page = {
+            "key": knowledge_key(knowledge),
+            "html": result.get("html", ""),
+            "is_fallback": result.get("is_fallback", False),
+            "created_at": time.time(),
+        }
+        self._session_pages(session_id, store_dir)[index] = page
+        self._persist(session_id, store_dir)
+        self._stats["generated"] += 1
+        logger.debug(
+            f"Pre-generated page {index} of {session_id} in {time.perf_counter() - start:.1f}s"
+        )
+        return page
+
+    async def take(
+        self, session_id: str, index: int, knowledge: dict[str, Any], store_dir: Path
+    ) -> dict[str, Any] | None:
+        """
+        Get the pre-generated page for a knowledge point
+
+        Waits for the generation if it is still running (that is still faster than
+        starting over). The page is removed from the cache once taken.
+
+        Returns:
+            ``{"html", "is_fallback"}``, or None if the page has to be generated now
+        """
+        key = knowledge_key(knowledge)
+        pages = self._session_pages(session_id, store_dir)
+        page = pages.get(index)
+        if page is None:
+            task = self._tasks.get(session_id, {}).get(index)
+            if task is not None:
+                try:
+                    page = await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    if not task.cancelled():
+                        raise  # The caller itself was cancelled
+                    page = None
+                except Exception:
+                    page = None  # Logged by _forget_task
+                if page is not None and page.get("key") == key:
+                    self._stats["in_flight_hits"] += 1
+                    self._discard(session_id, index, store_dir)
+                    return {"html": page["html"], "is_fallback": page["is_fallback"]}
+        elif page.get("key") == key:
+            self._stats["hits"] += 1
+            self._discard(session_id, index, store_dir)
+            return {"html": page["html"], "is_fallback": page.get("is_fallback", False)}
+
+        self._stats["misses"] += 1
+        return None
+
+    def _discard(self, session_id: str, index: int, store_dir: Path) -> None:
+        pages = self._pages.get(session_id)
+        if pages and pages.pop(index, None) is not None:
+            self._persist(session_id, store_dir)
+
+    def cancel_session(self, session_id: str, store_dir: Path | None = None) -> None:
+        """Cancel all generations of a session and drop its pages (and their file)"""
+        for task in self._tasks.pop(session_id, {}).values():
+            task.cancel()
+            self._stats["cancelled"] += 1
+        self._pages.pop(session_id, None)
+        if store_dir is not None:
+            self.pages_file(store_dir, session_id).unlink(missing_ok=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        hits = self._stats["hits"] + self._stats["in_flight_hits"]
+        total = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "sessions": len(self._pages),
+            "in_flight": sum(len(tasks) for tasks in self._tasks.values()),
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+
+_pregenerator: PagePregenerator | None = None
+
+
+def get_page_pregenerator(
+    lookahead: int = DEFAULT_LOOKAHEAD, max_pages: int = DEFAULT_MAX_PAGES
+) -> PagePregenerator:
+    """Get the process-wide pre-generator (settings apply on first creation)"""
+    global _pregenerator
+    if _pregenerator is None:
+        _pregenerator = PagePregenerator(lookahead=lookahead, max_pages=max_pages)
+    return _pregenerator
+
+
+def reset_page_pregenerator() -> None:
+    """Drop the process-wide pre-generator (for tests)"""
+    global _pregenerator
+    _pregenerator = None
+
+
+__all__ = [
+    "PagePregenerator",
+    "get_page_pregenerator",
+    "knowledge_key",
+    "reset_page_pregenerator",
+]
@@ -19,6 +19,9 @@ if str(_project_root) not in sys.path:
 from src.agents.base_agent import BaseAgent
 from src.di import Container
 
+# Knowledge points run through explore -> strict filter -> statement concurrently
+DEFAULT_MAX_CONCURRENT_POINTS = 4
+
 
 class IdeaGenerationWorkflow(BaseAgent):
     """Idea generation workflow"""
@@ -32,6 +35,7 @@ class IdeaGenerationWorkflow(BaseAgent):
         progress_callback: Callable[[str, Any], None | Awaitable[None]] | None = None,
         output_dir: Path | None = None,
         language: str = "en",
+        max_concurrent_points: int = DEFAULT_MAX_CONCURRENT_POINTS,
         *,
         container: Container | None = None,
         prompt_manager: Any | None = None,
@@ -48,6 +52,7 @@ class IdeaGenerationWorkflow(BaseAgent):
             progress_callback: Progress callback function for streaming output
             output_dir: Output directory for saving intermediate results
             language: Language for prompts ("en" or "zh")
+            max_concurrent_points: Knowledge points processed in parallel by process_points
         """
         super().__init__(
             module_name="ideagen",
@@ -63,6 +68,7 @@ class IdeaGenerationWorkflow(BaseAgent):
         )
         self.progress_callback = progress_callback
         self.output_dir = output_dir
+        self.max_concurrent_points = max(1, max_concurrent_points)
         self._prompts = self.prompt_manager.load_prompts(
             module_name="ideagen",
             agent_name="idea_generation",
@@ -76,6 +82,31 @@ class IdeaGenerationWorkflow(BaseAgent):
             if result is not None and asyncio.iscoroutine(result):
                 await result
 
+    async def _save_json(self, filename: str, data: dict[str, Any]):
+        """Write an intermediate result to output_dir without blocking the event loop"""
+        if not self.output_dir:
+            return
+
+        def write():
+            with open(self.output_dir / filename, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+        try:
+            await asyncio.to_thread(write)
+        except OSError as e:
+            self.logger.warning(f"Failed to save {filename}: {e}")
+
+    @staticmethod
+    def _safe_name(knowledge_point: dict[str, Any]) -> str:
+        """File-name-safe version of a knowledge point title"""
+        return (
+            "".join(
+                c for c in knowledge_point["knowledge_point"] if c.isalnum() or c in (" ", "-", "_")
+            )
+            .strip()[:50]
+            .replace(" ", "_")
+        )
+
     async def loose_filter(self, knowledge_points: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Loose filtering - filter out unsuitable knowledge points
@@ -125,22 +156,16 @@ class IdeaGenerationWorkflow(BaseAgent):
                 filtered = knowledge_points
 
             # Save filtered results
-            if self.output_dir:
-                with open(
-                    self.output_dir / "02_filtered_knowledge_points.json", "w", encoding="utf-8"
-                ) as f:
-                    json.dump(
-                        {
-                            "stage": "loose_filter",
-                            "original_count": len(knowledge_points),
-                            "filtered_count": len(filtered),
-                            "filtered_points": filtered,
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                        f,
-                        ensure_ascii=False,
-                        indent=2,
-                    )
+            await self._save_json(
+                "02_filtered_knowledge_points.json",
+                {
+                    "stage": "loose_filter",
+                    "original_count": len(knowledge_points),
+                    "filtered_count": len(filtered),
+                    "filtered_points": filtered,
+                    "timestamp": datetime.now().isoformat(),
+                },
+            )
 
             await self._emit_progress(
                 "loose_filter", {"status": "complete", "filtered": len(filtered)}
@@ -192,31 +217,16 @@ class IdeaGenerationWorkflow(BaseAgent):
                 self.logger.warning(f"Only {len(ideas)} ideas generated (expected at least 5)")
 
             # Save generated research ideas
-            if self.output_dir:
-                safe_name = (
-                    "".join(
-                        c
-                        for c in knowledge_point["knowledge_point"]
-                        if c.isalnum() or c in (" ", "-", "_")
-                    )
-                    .strip()[:50]
-                    .replace(" ", "_")
-                )
-                with open(
-                    self.output_dir / f"03_ideas_{safe_name}.json", "w", encoding="utf-8"
-                ) as f:
-                    json.dump(
-                        {
-                            "stage": "explore_ideas",
-                            "knowledge_point": knowledge_point,
-                            "research_ideas": ideas,
-                            "count": len(ideas),
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                        f,
-                        ensure_ascii=False,
-                        indent=2,
-                    )
+            await self._save_json(
+                f"03_ideas_{self._safe_name(knowledge_point)}.json",
+                {
+                    "stage": "explore_ideas",
+                    "knowledge_point": knowledge_point,
+                    "research_ideas": ideas,
+                    "count": len(ideas),
+                    "timestamp": datetime.now().isoformat(),
+                },
+            )
 
             return ideas[:10]  # Return at most 10
         except json.JSONDecodeError as e:
@@ -285,35 +295,20 @@ class IdeaGenerationWorkflow(BaseAgent):
                     kept = [kept[0]]
 
             # Save filtering results
-            if self.output_dir:
-                safe_name = (
-                    "".join(
-                        c
-                        for c in knowledge_point["knowledge_point"]
-                        if c.isalnum() or c in (" ", "-", "_")
-                    )
-                    .strip()[:50]
-                    .replace(" ", "_")
-                )
-                with open(
-                    self.output_dir / f"04_filtered_ideas_{safe_name}.json", "w", encoding="utf-8"
-                ) as f:
-                    json.dump(
-                        {
-                            "stage": "strict_filter",
-                            "knowledge_point": knowledge_point,
-                            "original_ideas": research_ideas,
-                            "kept_ideas": kept,
-                            "rejected_ideas": rejected,
-                            "reasons": reasons,
-                            "kept_count": len(kept),
-                            "rejected_count": len(rejected),
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                        f,
-                        ensure_ascii=False,
-                        indent=2,
-                    )
+            await self._save_json(
+                f"04_filtered_ideas_{self._safe_name(knowledge_point)}.json",
+                {
+                    "stage": "strict_filter",
+                    "knowledge_point": knowledge_point,
+                    "original_ideas": research_ideas,
+                    "kept_ideas": kept,
+                    "rejected_ideas": rejected,
+                    "reasons": reasons,
+                    "kept_count": len(kept),
+                    "rejected_count": len(rejected),
+                    "timestamp": datetime.now().isoformat(),
+                },
+            )
 
             return kept
         except json.JSONDecodeError as e:
@@ -352,82 +347,159 @@ class IdeaGenerationWorkflow(BaseAgent):
 
         return response
 
-    async def process(self, knowledge_points: list[dict[str, Any]]) -> str:
+    async def process_point(
+        self, index: int, total: int, knowledge_point: dict[str, Any]
+    ) -> dict[str, Any] | None:
         """
-        Execute complete workflow
+        Run one knowledge point through explore -> strict filter -> statement
+
+        Progress stages (data always carries ``index`` (1-based), ``total`` and
+        ``knowledge_point``): explore processing/complete, filter processing/complete,
+        statement processing, and idea complete with the ``result``.
 
         Args:
-            knowledge_points: Knowledge points list
+            index: 1-based position of the knowledge point
+            total: Number of knowledge points being processed
+            knowledge_point: Knowledge point dictionary
 
         Returns:
-            Final markdown document
+            ``{"index", "knowledge_point", "research_ideas", "statement"}``, or None if
+            no idea survived
         """
-        # 3.1 Loose filtering
-        filtered_points = await self.loose_filter(knowledge_points)
+        base = {
+            "index": index,
+            "total": total,
+            "knowledge_point": knowledge_point.get("knowledge_point", f"Point {index}"),
+        }
+        await self._emit_progress("explore", {"status": "processing", **base})
+
+        # 3.2 Explore knowledge points
+        research_ideas = await self.explore_ideas(knowledge_point)
+        await self._emit_progress(
+            "explore", {"status": "complete", "ideas_count": len(research_ideas), **base}
+        )
+        if not research_ideas:
+            return None
 
-        if not filtered_points:
-            return "# Research Ideas Generation Result\n\nNo suitable knowledge points found."
+        # 3.3 Strict filtering
+        await self._emit_progress(
+            "filter", {"status": "processing", "ideas_count": len(research_ideas), **base}
+        )
+        kept_ideas = await self.strict_filter(knowledge_point, research_ideas)
+        await self._emit_progress("filter", {"status": "complete", "kept": len(kept_ideas), **base})
+        if not kept_ideas:
+            return None
+
+        # 3.4 Generate statement
+        await self._emit_progress(
+            "statement", {"status": "processing", "kept": len(kept_ideas), **base}
+        )
+        statement = await self.generate_statement(knowledge_point, kept_ideas)
+
+        result = {
+            "index": index,
+            "knowledge_point": knowledge_point,
+            "research_ideas": kept_ideas,
+            "statement": statement,
+        }
+        await self._emit_progress("idea", {"status": "complete", "result": result, **base})
+        return result
+
+    async def process_points(
+        self, knowledge_points: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Process knowledge points concurrently (at most max_concurrent_points at once)
 
-        # 3.2 and 3.3 Process each knowledge point
-        final_statements = []
+        Progress is emitted as each point advances, so "idea" events arrive in
+        completion order; the returned list is in input order. A "point" complete
+        event carrying ``completed`` (points finished so far) follows every point,
+        whether or not it produced an idea.
 
-        for idx, point in enumerate(filtered_points):
-            await self._emit_progress(
-                "explore", {"status": "processing", "index": idx + 1, "total": len(filtered_points)}
-            )
+        If any point fails, the remaining points are cancelled and the error is raised.
 
-            # 3.2 Explore knowledge points
-            research_ideas = await self.explore_ideas(point)
+        Args:
+            knowledge_points: Filtered knowledge points
+
+        Returns:
+            One process_point result (or None) per knowledge point, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_points)
+        total = len(knowledge_points)
+        completed = 0
+
+        async def run(index: int, point: dict[str, Any]) -> dict[str, Any] | None:
+            nonlocal completed
+            async with semaphore:
+                result = await self.process_point(index, total, point)
+            completed += 1
             await self._emit_progress(
-                "explore",
-                {"status": "complete", "index": idx + 1, "ideas_count": len(research_ideas)},
+                "point",
+                {
+                    "status": "complete",
+                    "index": index,
+                    "total": total,
+                    "completed": completed,
+                    "knowledge_point": point.get("knowledge_point", f"Point {index}"),
+                },
             )
+            return result
 
-            if not research_ideas:
-                continue
+        tasks = [
+            asyncio.ensure_future(run(index, point))
+            for index, point in enumerate(knowledge_points, 1)
+        ]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # gather does not cancel the other points when one fails (no TaskGroup on 3.10)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-            # 3.3 Strict filtering
-            kept_ideas = await self.strict_filter(point, research_ideas)
-            await self._emit_progress(
-                "filter", {"status": "complete", "index": idx + 1, "kept": len(kept_ideas)}
-            )
+    async def process(self, knowledge_points: list[dict[str, Any]]) -> str:
+        """
+        Execute complete workflow
 
-            if not kept_ideas:
-                continue
+        Args:
+            knowledge_points: Knowledge points list
 
-            # 3.4 Generate statement
-            statement = await self.generate_statement(point, kept_ideas)
-            final_statements.append(statement)
+        Returns:
+            Final markdown document
+        """
+        # 3.1 Loose filtering
+        filtered_points = await self.loose_filter(knowledge_points)
+
+        if not filtered_points:
+            return "# Research Ideas Generation Result\n\nNo suitable knowledge points found."
+
+        # 3.2 - 3.4 Process knowledge points in parallel; statements keep input order
+        results = [r for r in await self.process_points(filtered_points) if r is not None]
+        final_statements = [r["statement"] for r in results]
 
         # Join all statements
         final_markdown = "# Research Ideas Generation Result\n\n"
         final_markdown += "\n\n---\n\n".join(final_statements)
 
         # Save workflow summary
-        if self.output_dir:
-            workflow_summary = {
+        await self._save_json(
+            "06_workflow_summary.json",
+            {
                 "stage": "workflow_summary",
                 "original_knowledge_points_count": len(knowledge_points),
                 "filtered_knowledge_points_count": len(filtered_points),
                 "processed_points": [
                     {
-                        "knowledge_point": point["knowledge_point"],
-                        "description": point["description"],
-                        "statement": statement,
+                        "knowledge_point": r["knowledge_point"]["knowledge_point"],
+                        "description": r["knowledge_point"]["description"],
+                        "statement": r["statement"],
                     }
-                    for point, statement in zip(
-                        [
-                            p
-                            for p in filtered_points
-                            if any(p["knowledge_point"] in s for s in final_statements)
-                        ],
-                        final_statements,
-                    )
+                    for r in results
                 ],
                 "final_statements_count": len(final_statements),
                 "timestamp": datetime.now().isoformat(),
-            }
-            with open(self.output_dir / "06_workflow_summary.json", "w", encoding="utf-8") as f:
-                json.dump(workflow_summary, f, ensure_ascii=False, indent=2)
+            },
+        )
 
         return final_markdown
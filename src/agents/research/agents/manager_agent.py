@@ -126,7 +126,8 @@ class ManagerAgent(BaseAgent):
 
     async def add_new_topic_async(self, sub_topic: str, overview: str) -> TopicBlock:
         """
-        Thread-safe async version of add_new_topic for parallel mode
+        Thread-safe async version of add_new_topic for parallel mode.
+        Wakes idle research workers waiting for new topics.
 
         Args:
             sub_topic: Sub-topic name
@@ -136,7 +137,10 @@ class ManagerAgent(BaseAgent):
             Newly created TopicBlock
         """
         async with self._lock:
-            return self.add_new_topic(sub_topic, overview)
+            block = self.add_new_topic(sub_topic, overview)
+        if block:
+            await self.queue.notify_new_work()
+        return block
 
     def fail_task(self, block_id: str, reason: str = "") -> bool:
         """
@@ -216,6 +220,7 @@ class ManagerAgent(BaseAgent):
         print(f"   Researching: {stats['researching']}")
         print(f"   Completed: {stats['completed']}")
         print(f"   Failed: {stats['failed']}")
+        print(f"   Cancelled: {stats['cancelled']}")
         print(f"   Total Tool Calls: {stats['total_tool_calls']}")
 
         return stats
@@ -5,6 +5,7 @@ DR-in-KG 2.0 Core Data Structures
 Includes: TopicBlock, ToolTrace, DynamicTopicQueue
 """
 
+import asyncio
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -20,6 +21,7 @@ class TopicStatus(Enum):
     RESEARCHING = "researching"  # Researching
     COMPLETED = "completed"  # Completed
     FAILED = "failed"  # Failed
+    CANCELLED = "cancelled"  # Cancelled before or during research
 
 
 class ToolType(Enum):
@@ -183,6 +185,7 @@ class TopicBlock:
     status: TopicStatus = TopicStatus.PENDING  # Topic status
     tool_traces: list[ToolTrace] = field(default_factory=list)  # Tool call trace list
     iteration_count: int = 0  # Current iteration count
+    priority: int = 0  # Scheduling priority (higher is researched first)
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
     metadata: dict[str, Any] = field(default_factory=dict)  # Additional metadata
@@ -245,6 +248,11 @@ class DynamicTopicQueue:
         self.created_at = datetime.now().isoformat()
         self.max_length = max_length if isinstance(max_length, int) and max_length > 0 else None
         self.state_file = state_file
+        # Work-queue state for parallel mode (see claim_next_block)
+        self._condition: asyncio.Condition | None = None
+        self._condition_loop: asyncio.AbstractEventLoop | None = None
+        self._claimed: set[str] = set()
+        self._closed = False
 
     def set_state_file(self, filepath: str | None) -> None:
         """Set queue auto-persistence file"""
@@ -255,13 +263,14 @@ class DynamicTopicQueue:
     def _normalize_topic(text: str) -> str:
         return (text or "").strip().lower()
 
-    def add_block(self, sub_topic: str, overview: str) -> TopicBlock:
+    def add_block(self, sub_topic: str, overview: str, priority: int = 0) -> TopicBlock:
         """
         Add new topic block to the end of queue
 
         Args:
             sub_topic: Sub-topic name
             overview: Topic overview
+            priority: Scheduling priority (higher is researched first)
 
         Returns:
             Created TopicBlock
@@ -272,7 +281,9 @@ class DynamicTopicQueue:
             )
         self.block_counter += 1
         block_id = f"block_{self.block_counter}"
-        block = TopicBlock(block_id=block_id, sub_topic=sub_topic, overview=overview)
+        block = TopicBlock(
+            block_id=block_id, sub_topic=sub_topic, overview=overview, priority=priority
+        )
         self.blocks.append(block)
         self._auto_save()
         return block
@@ -290,15 +301,19 @@ class DynamicTopicQueue:
 
     def get_pending_block(self) -> TopicBlock | None:
         """
-        Get first pending topic block
+        Get next pending topic block
 
         Returns:
-            First TopicBlock with PENDING status, or None if not found
+            Highest-priority TopicBlock with PENDING status (queue order among equal
+            priorities), or None if not found
         """
+        best = None
         for block in self.blocks:
-            if block.status == TopicStatus.PENDING:
-                return block
-        return None
+            if block.status != TopicStatus.PENDING:
+                continue
+            if best is None or block.priority > best.priority:
+                best = block
+        return best
 
     def get_block_by_id(self, block_id: str) -> TopicBlock | None:
         """
@@ -369,6 +384,76 @@ class DynamicTopicQueue:
             return True
         return False
 
+    def mark_cancelled(self, block_id: str) -> bool:
+        """
+        Mark topic block as cancelled (only pending or researching blocks)
+
+        Args:
+            block_id: Topic block ID
+
+        Returns:
+            Whether marking was successful
+        """
+        block = self.get_block_by_id(block_id)
+        if block and block.status in (TopicStatus.PENDING, TopicStatus.RESEARCHING):
+            block.status = TopicStatus.CANCELLED
+            block.updated_at = datetime.now().isoformat()
+            self._auto_save()
+            return True
+        return False
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Condition signalling queue changes, bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+
+    async def claim_next_block(self) -> TopicBlock | None:
+        """
+        Wait for the next pending block and mark it as researching (parallel mode)
+
+        Blocks while nothing is pending but claimed blocks are still being researched,
+        since those may add new topics. Every claimed block must be handed back with
+        release_block.
+
+        Returns:
+            The claimed TopicBlock, or None once the queue is drained or closed
+        """
+        condition = self._get_condition()
+        async with condition:
+            while not self._closed:
+                block = self.get_pending_block()
+                if block:
+                    self.mark_researching(block.block_id)
+                    self._claimed.add(block.block_id)
+                    return block
+                if not self._claimed:
+                    return None
+                await condition.wait()
+            return None
+
+    async def release_block(self, block_id: str) -> None:
+        """Hand back a block returned by claim_next_block once its research ended"""
+        condition = self._get_condition()
+        async with condition:
+            self._claimed.discard(block_id)
+            condition.notify_all()
+
+    async def notify_new_work(self) -> None:
+        """Wake workers waiting in claim_next_block after blocks were added"""
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+
+    async def close(self) -> None:
+        """Stop handing out blocks; waiting claim_next_block calls return None"""
+        condition = self._get_condition()
+        async with condition:
+            self._closed = True
+            condition.notify_all()
+
     def get_all_completed_blocks(self) -> list[TopicBlock]:
         """Get all completed topic blocks"""
         return [b for b in self.blocks if b.status == TopicStatus.COMPLETED]
@@ -391,6 +476,7 @@ class DynamicTopicQueue:
             "researching": len([b for b in self.blocks if b.status == TopicStatus.RESEARCHING]),
             "completed": len(self.get_all_completed_blocks()),
             "failed": len([b for b in self.blocks if b.status == TopicStatus.FAILED]),
+            "cancelled": len([b for b in self.blocks if b.status == TopicStatus.CANCELLED]),
             "total_tool_calls": sum(len(b.tool_traces) for b in self.blocks),
         }
 
@@ -55,12 +55,14 @@ from src.agents.research.agents import (
 )
 from src.agents.research.data_structures import DynamicTopicQueue
 from src.agents.research.utils.citation_manager import CitationManager
+from src.agents.research.utils.topic_scheduler import TopicWorkerPool
 from src.logging import get_logger
 from src.tools.code_executor import run_code
 from src.tools.paper_search_tool import PaperSearchTool
 from src.tools.query_item_tool import query_numbered_item
 from src.tools.rag_tool import rag_search
 from src.tools.web_search import web_search
+from src.utils.network.resilience import get_resilience
 
 
 class ResearchPipeline:
@@ -132,6 +134,12 @@ class ResearchPipeline:
             max_length=queue_cfg.get("max_length"),
             state_file=str(self.queue_progress_file),
         )
+        # Shared across pipelines so latency history and circuit state carry over
+        self._resilience = get_resilience("research.tools")
+        self._tool_hedging = config.get("researching", {}).get("tool_hedging", True)
+
+        # Worker pool while parallel researching is running (see cancel_topic)
+        self._topic_pool: TopicWorkerPool | None = None
 
         # Initialize unified logging system (must be before _init_agents)
         self._init_logger()
@@ -193,29 +201,6 @@ class ResearchPipeline:
         if self.logger:
             self.logger.success(f"Initialized {len(self.agents)} Agents")
 
-    async def _call_tool_with_timeout(
-        self, coro, timeout: float = 60.0, tool_name: str = "tool"
-    ) -> Any:
-        """
-        Execute a coroutine with timeout support
-
-        Args:
-            coro: Coroutine to execute
-            timeout: Timeout in seconds (default 60s)
-            tool_name: Name of the tool for logging
-
-        Returns:
-            Result of the coroutine
-
-        Raises:
-            asyncio.TimeoutError: If timeout exceeded
-        """
-        try:
-            return await asyncio.wait_for(coro, timeout=timeout)
-        except asyncio.TimeoutError:
-            self.logger.warning(f"Tool {tool_name} timed out after {timeout}s")
-            raise
-
     async def _call_tool_with_retry(
         self,
         tool_func,
@@ -223,58 +208,44 @@ class ResearchPipeline:
         max_retries: int = 2,
         timeout: float = 60.0,
         tool_name: str = "tool",
+        hedge: bool = False,
+        adaptive_timeout: bool = True,
         **kwargs,
     ) -> Any:
         """
-        Call a tool function with retry and timeout support
+        Call a tool function with the shared resilience policy
+
+        Attempts are bounded by an adaptive timeout (observed p99, capped by
+        ``timeout``), only transient errors are retried (with decorrelated-jitter
+        backoff), and a per-tool circuit breaker fails fast while a backend is down.
 
         Args:
-            tool_func: Tool function to call
+            tool_func: Tool function to call (sync functions run on a tool thread pool)
             *args: Positional arguments for the function
             max_retries: Maximum number of retries (default 2)
-            timeout: Timeout per attempt in seconds (default 60s)
-            tool_name: Name of the tool for logging
+            timeout: Maximum timeout per attempt in seconds (default 60s)
+            tool_name: Name of the tool for logging, latency tracking and circuit breaking
+            hedge: Send a hedged duplicate when the call is slow (idempotent reads only)
+            adaptive_timeout: Lower the timeout from observed latency (off for run_code)
             **kwargs: Keyword arguments for the function
 
         Returns:
             Result of the tool function
         """
-        last_error = None
-
-        for attempt in range(max_retries + 1):
-            try:
-                if asyncio.iscoroutinefunction(tool_func):
-                    result = await self._call_tool_with_timeout(
-                        tool_func(*args, **kwargs), timeout=timeout, tool_name=tool_name
-                    )
-                else:
-                    # For sync functions, run in executor
-                    import functools
-
-                    loop = asyncio.get_event_loop()
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(None, functools.partial(tool_func, *args, **kwargs)),
-                        timeout=timeout,
-                    )
-                return result
-            except asyncio.TimeoutError as e:
-                last_error = e
-                if attempt < max_retries:
-                    self.logger.warning(
-                        f"Tool {tool_name} attempt {attempt + 1} timed out, retrying..."
-                    )
-                    await asyncio.sleep(1)  # Brief pause before retry
-            except Exception as e:
-                last_error = e
-                if attempt < max_retries:
-                    self.logger.warning(
-                        f"Tool {tool_name} attempt {attempt + 1} failed: {e}, retrying..."
-                    )
-                    await asyncio.sleep(1)
-
-        # All retries exhausted
-        self.logger.error(f"Tool {tool_name} failed after {max_retries + 1} attempts: {last_error}")
-        raise last_error if last_error else RuntimeError(f"{tool_name} failed")
+        try:
+            return await self._resilience.call(
+                tool_name,
+                tool_func,
+                *args,
+                max_retries=max_retries,
+                timeout=timeout,
+                hedge=hedge and self._tool_hedging,
+                adaptive_timeout=adaptive_timeout,
+                **kwargs,
+            )
+        except Exception as e:
+            self.logger.error(f"Tool {tool_name} failed: {type(e).__name__}: {e}")
+            raise
 
     async def _call_tool(self, tool_type: str, query: str) -> str:
         """Call tool and return raw string answer (JSON string or text)"""
@@ -306,6 +277,7 @@ class ResearchPipeline:
                         max_retries=max_retries,
                         timeout=default_timeout,
                         tool_name=f"rag_search({mode})",
+                        hedge=True,
                     )
                 except Exception:
                     # Retry with fallback mode
@@ -317,6 +289,7 @@ class ResearchPipeline:
                         max_retries=1,
                         timeout=default_timeout,
                         tool_name=f"rag_search({fallback_mode})",
+                        hedge=True,
                     )
                 return json.dumps(res, ensure_ascii=False)
 
@@ -340,6 +313,7 @@ class ResearchPipeline:
                     max_retries=max_retries,
                     timeout=default_timeout,
                     tool_name="query_item",
+                    hedge=True,
                 )
                 return json.dumps(res, ensure_ascii=False)
 
@@ -355,6 +329,7 @@ class ResearchPipeline:
                     max_retries=max_retries,
                     timeout=default_timeout,
                     tool_name="paper_search",
+                    hedge=True,
                 )
                 return json.dumps({"papers": papers}, ensure_ascii=False)
 
@@ -367,6 +342,7 @@ class ResearchPipeline:
                     max_retries=1,
                     timeout=30,  # Wrapper timeout
                     tool_name="run_code",
+                    adaptive_timeout=False,  # Duration depends on the code
                 )
                 return json.dumps(result, ensure_ascii=False)
 
@@ -380,6 +356,7 @@ class ResearchPipeline:
                 max_retries=max_retries,
                 timeout=default_timeout,
                 tool_name="rag_search(hybrid)",
+                hedge=True,
             )
             return json.dumps(res, ensure_ascii=False)
         except Exception as e:
@@ -817,7 +794,9 @@ class ResearchPipeline:
     async def _phase2_researching_parallel(self):
         """
         Phase 2: Dynamic Research Loop (Parallel Mode)
-        Executes multiple topic blocks in parallel with concurrency limit
+        A fixed pool of max_parallel_topics workers pulls blocks from the queue
+        (highest priority first) until it is drained, including topics added
+        mid-run
         """
         # Initialize researching stage event list
         if "researching" not in self._stage_events:
@@ -828,12 +807,8 @@ class ResearchPipeline:
 
         # Get configuration
         max_parallel = self.config.get("researching", {}).get("max_parallel_topics", 5)
-        semaphore = asyncio.Semaphore(max_parallel)
 
-        # Get all pending blocks at the start
-        from src.agents.research.data_structures import TopicStatus
-
-        pending_blocks = [b for b in self.queue.blocks if b.status == TopicStatus.PENDING]
+        pending_blocks = self.queue.get_all_pending_blocks()
         total_blocks = len(self.queue.blocks)
 
         self.logger.info(
@@ -904,7 +879,7 @@ class ResearchPipeline:
 
         async def research_single_block(block: Any) -> dict[str, Any] | None:
             """
-            Research a single topic block with semaphore control
+            Research a single topic block (claimed and marked researching by the pool)
 
             Args:
                 block: TopicBlock to research
@@ -912,180 +887,144 @@ class ResearchPipeline:
             Returns:
                 Research result or None if failed
             """
-            async with semaphore:
-                try:
-                    # Mark as researching (thread-safe)
-                    async with manager._lock:
-                        # Refresh block status from queue
-                        current_block = self.queue.get_block_by_id(block.block_id)
-                        if current_block and current_block.status == TopicStatus.PENDING:
-                            self.queue.mark_researching(block.block_id)
-
-                    # Add to active tasks
-                    await update_active_task(
-                        block.block_id,
-                        {
-                            "block_id": block.block_id,
-                            "sub_topic": block.sub_topic,
-                            "status": "starting",
-                            "iteration": 0,
-                            "current_tool": None,
-                            "current_query": None,
-                        },
-                    )
-
-                    self._log_researching_progress(
-                        "block_started",
-                        block_id=block.block_id,
-                        sub_topic=block.sub_topic,
-                        execution_mode="parallel",
-                        active_count=len(active_tasks),
-                    )
-
-                    if self.logger:
-                        self.logger.info(
-                            f"\n[{block.block_id}] 🔍 Starting research: {block.sub_topic}"
-                        )
+            try:
+                # Add to active tasks
+                await update_active_task(
+                    block.block_id,
+                    {
+                        "block_id": block.block_id,
+                        "sub_topic": block.sub_topic,
+                        "status": "starting",
+                        "iteration": 0,
+                        "current_tool": None,
+                        "current_query": None,
+                    },
+                )
 
-                    # Get max_iterations from config for this closure
-                    config_max_iterations = self.config.get("researching", {}).get(
-                        "max_iterations", 5
-                    )
+                self._log_researching_progress(
+                    "block_started",
+                    block_id=block.block_id,
+                    sub_topic=block.sub_topic,
+                    execution_mode="parallel",
+                    active_count=len(active_tasks),
+                )
 
-                    # Create iteration callback for parallel mode
-                    def parallel_iteration_callback(event_type: str, **data):
-                        """Handle iteration progress in parallel mode"""
-                        # Update active task info
-                        task_info = {
-                            "block_id": block.block_id,
-                            "sub_topic": block.sub_topic,
-                            "status": event_type,
-                            "iteration": data.get("iteration", 0),
-                            "max_iterations": data.get("max_iterations", config_max_iterations),
-                            "current_tool": data.get("tool_type"),
-                            "current_query": data.get("query"),
-                            "tools_used": data.get("tools_used", []),
-                        }
-                        # Schedule async update
-                        asyncio.create_task(update_active_task(block.block_id, task_info))
-
-                        # Also log the detailed progress
-                        self._log_researching_progress(
-                            event_type,
-                            block_id=block.block_id,
-                            sub_topic=block.sub_topic,
-                            execution_mode="parallel",
-                            **data,
-                        )
-
-                    # Execute research loop with async wrappers
-                    result = await research.process(
-                        topic_block=block,
-                        call_tool_callback=self._call_tool,
-                        note_agent=self.agents["note"],
-                        citation_manager=async_citation_manager,
-                        queue=self.queue,
-                        manager_agent=async_manager_agent,
-                        config=self.config,
-                        progress_callback=parallel_iteration_callback,
+                if self.logger:
+                    self.logger.info(
+                        f"\n[{block.block_id}] 🔍 Starting research: {block.sub_topic}"
                     )
 
-                    # Mark as completed (thread-safe)
-                    await manager.complete_task_async(block.block_id)
-                    completed_count["value"] += 1
-
-                    # Remove from active tasks
-                    await update_active_task(block.block_id, None)
-
+                # Get max_iterations from config for this closure
+                config_max_iterations = self.config.get("researching", {}).get("max_iterations", 5)
+
+                # Create iteration callback for parallel mode
+                def parallel_iteration_callback(event_type: str, **data):
+                    """Handle iteration progress in parallel mode"""
+                    # Update active task info
+                    task_info = {
+                        "block_id": block.block_id,
+                        "sub_topic": block.sub_topic,
+                        "status": event_type,
+                        "iteration": data.get("iteration", 0),
+                        "max_iterations": data.get("max_iterations", config_max_iterations),
+                        "current_tool": data.get("tool_type"),
+                        "current_query": data.get("query"),
+                        "tools_used": data.get("tools_used", []),
+                    }
+                    # Schedule async update
+                    asyncio.create_task(update_active_task(block.block_id, task_info))
+
+                    # Also log the detailed progress
                     self._log_researching_progress(
-                        "block_completed",
+                        event_type,
                         block_id=block.block_id,
                         sub_topic=block.sub_topic,
-                        iterations=result.get("iterations", 0),
-                        tools_used=result.get("tools_used", []),
-                        queries_used=result.get("queries_used", []),
-                        current_block=completed_count["value"],
-                        total_blocks=total_blocks,
                         execution_mode="parallel",
+                        **data,
                     )
 
-                    if self.logger:
-                        self.logger.success(f"[{block.block_id}] ✓ Completed: {block.sub_topic}")
+                # Execute research loop with async wrappers
+                result = await research.process(
+                    topic_block=block,
+                    call_tool_callback=self._call_tool,
+                    note_agent=self.agents["note"],
+                    citation_manager=async_citation_manager,
+                    queue=self.queue,
+                    manager_agent=async_manager_agent,
+                    config=self.config,
+                    progress_callback=parallel_iteration_callback,
+                )
 
-                    return result
+                # Mark as completed (thread-safe)
+                await manager.complete_task_async(block.block_id)
+                completed_count["value"] += 1
 
-                except Exception as e:
-                    # Mark as failed (thread-safe)
-                    await manager.fail_task_async(block.block_id, str(e))
-                    completed_count["value"] += 1
+                # Remove from active tasks
+                await update_active_task(block.block_id, None)
 
-                    # Remove from active tasks
-                    await update_active_task(block.block_id, None)
+                self._log_researching_progress(
+                    "block_completed",
+                    block_id=block.block_id,
+                    sub_topic=block.sub_topic,
+                    iterations=result.get("iterations", 0),
+                    tools_used=result.get("tools_used", []),
+                    queries_used=result.get("queries_used", []),
+                    current_block=completed_count["value"],
+                    total_blocks=total_blocks,
+                    execution_mode="parallel",
+                )
 
-                    if self.logger:
-                        self.logger.error(f"[{block.block_id}] ✗ Failed: {block.sub_topic} - {e}")
+                if self.logger:
+                    self.logger.success(f"[{block.block_id}] ✓ Completed: {block.sub_topic}")
 
-                    self._log_researching_progress(
-                        "block_failed",
-                        block_id=block.block_id,
-                        sub_topic=block.sub_topic,
-                        error=str(e),
-                        execution_mode="parallel",
-                    )
-                    return None
+                return result
 
-        # Execute all research tasks in parallel
-        tasks = [research_single_block(block) for block in pending_blocks]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            except asyncio.CancelledError:
+                # Cancelled through cancel_topic (the pool marks the block cancelled)
+                completed_count["value"] += 1
+                await update_active_task(block.block_id, None)
 
-        # Handle any exceptions that weren't caught
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                block = pending_blocks[i]
-                await manager.fail_task_async(block.block_id, str(result))
                 if self.logger:
-                    self.logger.error(f"[{block.block_id}] ✗ Exception: {result}")
+                    self.logger.warning(f"[{block.block_id}] Cancelled: {block.sub_topic}")
 
-        # Wait for any dynamically added topics (if manager adds new topics during research)
-        # Continue until all tasks are processed (completed or failed)
-        max_wait_iterations = 100  # Prevent infinite loop
-        wait_count = 0
-
-        while True:
-            # Check if all blocks are processed (COMPLETED or FAILED, not PENDING or RESEARCHING)
-            stats = self.queue.get_statistics()
-            pending_count = stats.get("pending", 0)
-            researching_count = stats.get("researching", 0)
+                self._log_researching_progress(
+                    "block_cancelled",
+                    block_id=block.block_id,
+                    sub_topic=block.sub_topic,
+                    execution_mode="parallel",
+                )
+                raise
 
-            # Exit if no pending or researching tasks
-            if pending_count == 0 and researching_count == 0:
-                break
+            except Exception as e:
+                # Mark as failed (thread-safe)
+                await manager.fail_task_async(block.block_id, str(e))
+                completed_count["value"] += 1
 
-            # Get any newly added pending blocks
-            new_pending = [b for b in self.queue.blocks if b.status == TopicStatus.PENDING]
-            if not new_pending:
-                # No pending blocks, but there might be researching ones
-                # Wait a bit for them to complete
-                wait_count += 1
-                if wait_count > max_wait_iterations:
-                    self.logger.warning(
-                        "Max wait iterations reached, exiting parallel research loop"
-                    )
-                    break
-                await asyncio.sleep(0.1)
-                continue
+                # Remove from active tasks
+                await update_active_task(block.block_id, None)
 
-            # Reset wait count when we have new work
-            wait_count = 0
+                if self.logger:
+                    self.logger.error(f"[{block.block_id}] ✗ Failed: {block.sub_topic} - {e}")
 
-            # Research newly added blocks
-            new_tasks = [research_single_block(block) for block in new_pending]
-            new_results = await asyncio.gather(*new_tasks, return_exceptions=True)
+                self._log_researching_progress(
+                    "block_failed",
+                    block_id=block.block_id,
+                    sub_topic=block.sub_topic,
+                    error=str(e),
+                    execution_mode="parallel",
+                )
+                return None
 
-            for i, result in enumerate(new_results):
-                if isinstance(result, Exception):
-                    block = new_pending[i]
-                    await manager.fail_task_async(block.block_id, str(result))
+        # Research blocks with a fixed worker pool; idle workers wake up as soon as
+        # new topics are added and only exit once nothing is pending or in flight
+        self._topic_pool = TopicWorkerPool(
+            self.queue, research_single_block, max_workers=max_parallel
+        )
+        try:
+            pool_stats = await self._topic_pool.run()
+        finally:
+            self._topic_pool = None
+        self.logger.debug(f"Topic worker pool: {pool_stats}")
 
         stats = self.queue.get_statistics()
         self._log_researching_progress(
@@ -1099,6 +1038,22 @@ class ResearchPipeline:
         self.logger.info(f"  - Completed Topics: {stats['completed']}")
         self.logger.info(f"  - Total Tool Calls: {stats['total_tool_calls']}")
         self.logger.info(f"  - Failed Topics: {stats.get('failed', 0)}")
+        if stats.get("cancelled"):
+            self.logger.info(f"  - Cancelled Topics: {stats['cancelled']}")
+
+    def cancel_topic(self, block_id: str) -> bool:
+        """
+        Cancel a topic block that is pending or (in parallel mode) being researched
+
+        Args:
+            block_id: Topic block ID
+
+        Returns:
+            Whether the block was cancelled
+        """
+        if self._topic_pool:
+            return self._topic_pool.cancel_block(block_id)
+        return self.queue.mark_cancelled(block_id)
 
     def _log_researching_progress(self, status: str, **payload: Any) -> None:
         """Record researching stage progress (thread-safe for parallel mode)"""
@@ -25,6 +25,7 @@ from .json_utils import (
     safe_json_loads,
 )
 from .token_tracker import TokenTracker, get_token_tracker
+from .topic_scheduler import TopicWorkerPool
 
 # Backwards compatibility: LLMLogger is now just Logger
 LLMLogger = Logger
@@ -52,6 +53,7 @@ __all__ = [
     "json_to_text",
     "get_token_tracker",
     "TokenTracker",
+    "TopicWorkerPool",
     "LLMLogger",
     "get_llm_logger",
     "reset_llm_logger",
@@ -10,6 +10,8 @@ from datetime import datetime
 import json
 from typing import Any
 
+from src.services.llm.tokenizer import get_tokenizer
+
 # Try importing tiktoken (if available)
 try:
     import tiktoken  # type: ignore
@@ -44,23 +46,13 @@ MODEL_PRICING = {
 def get_tiktoken_encoding(model_name: str):
     if not TIKTOKEN_AVAILABLE:
         return None
-    try:
-        if "gpt-4" in model_name.lower() or "gpt-3.5" in model_name.lower():
-            return tiktoken.encoding_for_model(model_name)
-        if "gpt-4o" in model_name.lower():
-            return tiktoken.encoding_for_model("gpt-4o")
-        return tiktoken.get_encoding("cl100k_base")
-    except Exception:
-        return tiktoken.get_encoding("cl100k_base") if TIKTOKEN_AVAILABLE else None
+    return get_tokenizer().get_encoder(model_name)
 
 
 def count_tokens_with_tiktoken(text: str, model_name: str) -> int:
-    if not TIKTOKEN_AVAILABLE:
-        return 0
-    enc = get_tiktoken_encoding(model_name)
-    if enc is None:
+    if get_tiktoken_encoding(model_name) is None:
         return 0
-    return len(enc.encode(text))
+    return get_tokenizer().count(text, model_name)
 
 
 def count_tokens_with_litellm(messages: list[dict], model_name: str) -> dict[str, int]:
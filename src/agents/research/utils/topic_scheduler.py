@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+TopicWorkerPool - Work-queue scheduler for parallel research mode
+
+A fixed number of workers pull topic blocks from a DynamicTopicQueue and research
+them until the queue is drained. Topics added while research is running (via
+ManagerAgent.add_new_topic_async) wake idle workers immediately, so a slot is
+never left waiting for the slowest topic of a "wave". Blocks are handed out by
+priority, and single blocks or the whole run can be cancelled.
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+from typing import Any, Awaitable, Callable
+
+project_root = Path(__file__).parent.parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.agents.research.data_structures import DynamicTopicQueue, TopicBlock, TopicStatus
+from src.logging import get_logger
+
+
+class TopicWorkerPool:
+    """Fixed-size worker pool researching topic blocks from a DynamicTopicQueue"""
+
+    def __init__(
+        self,
+        queue: DynamicTopicQueue,
+        run_block: Callable[[TopicBlock], Awaitable[Any]],
+        max_workers: int = 5,
+    ):
+        """
+        Args:
+            queue: Queue to pull blocks from
+            run_block: Coroutine function researching one block. It is responsible for
+                marking the block completed or failed; if it raises, the block is
+                marked failed here.
+            max_workers: Number of blocks researched at once
+        """
+        self.queue = queue
+        self.run_block = run_block
+        self.max_workers = max(1, int(max_workers))
+        self.logger = get_logger("TopicWorkerPool")
+        self._running: dict[str, asyncio.Task] = {}
+        self._stats = {"completed": 0, "failed": 0, "cancelled": 0, "max_active": 0}
+
+    async def run(self) -> dict[str, int]:
+        """
+        Research until no block is pending or in flight (or the pool is cancelled)
+
+        Returns:
+            Pool statistics (see get_stats)
+        """
+        workers = [
+            asyncio.create_task(self._worker(), name=f"research-worker-{i + 1}")
+            for i in range(self.max_workers)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return self.get_stats()
+
+    async def _worker(self) -> None:
+        while True:
+            block = await self.queue.claim_next_block()
+            if block is None:
+                return
+
+            task = asyncio.create_task(self.run_block(block), name=f"research-{block.block_id}")
+            self._running[block.block_id] = task
+            self._stats["max_active"] = max(self._stats["max_active"], len(self._running))
+            try:
+                # asyncio.wait does not raise when the block task is cancelled
+                await asyncio.wait({task})
+            finally:
+                if not task.done():
+                    # The pool itself is being torn down
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                self._running.pop(block.block_id, None)
+                await self.queue.release_block(block.block_id)
+
+            if task.cancelled() or block.status == TopicStatus.CANCELLED:
+                self.queue.mark_cancelled(block.block_id)
+                self._stats["cancelled"] += 1
+            elif task.exception() is not None:
+                self.logger.error(f"[{block.block_id}] Research failed: {task.exception()}")
+                self.queue.mark_failed(block.block_id)
+                self._stats["failed"] += 1
+            elif block.status == TopicStatus.FAILED:
+                self._stats["failed"] += 1
+            else:
+                self._stats["completed"] += 1
+
+    def cancel_block(self, block_id: str) -> bool:
+        """
+        Cancel a pending or in-flight block
+
+        Returns:
+            Whether the block was cancelled (False if unknown or already finished)
+        """
+        if not self.queue.mark_cancelled(block_id):
+            return False
+        task = self._running.get(block_id)
+        if task:
+            task.cancel()
+        else:
+            self._stats["cancelled"] += 1
+        return True
+
+    async def cancel(self) -> None:
+        """Cancel every pending and in-flight block; run() returns once workers stop"""
+        await self.queue.close()
+        for block in self.queue.get_all_pending_blocks():
+            self.cancel_block(block.block_id)
+        for task in list(self._running.values()):
+            task.cancel()
+
+    def get_stats(self) -> dict[str, int]:
+        """Completed/failed/cancelled block counts and the peak number of active blocks"""
+        return {**self._stats, "active": len(self._running), "max_workers": self.max_workers}
+
+
+__all__ = ["TopicWorkerPool"]
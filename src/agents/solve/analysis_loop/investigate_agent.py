@@ -4,8 +4,10 @@ InvestigateAgent - Investigator
 Generates query actions and calls tools based on current memory and reflections.
 """
 
+import asyncio
 from pathlib import Path
 import sys
+import time
 from typing import Any
 
 # Add project root to path
@@ -20,6 +22,14 @@ from src.tools import query_numbered_item, rag_search, web_search
 from ..memory import CitationMemory, InvestigateMemory, KnowledgeItem
 from ..utils.json_utils import extract_json_from_text
 
+# Default per-tool concurrency (overridable via solve.agents.investigate_agent.tool_concurrency)
+DEFAULT_TOOL_CONCURRENCY = {
+    "rag_naive": 4,
+    "rag_hybrid": 2,
+    "web_search": 2,
+    "query_item": 4,
+}
+
 
 class InvestigateAgent(BaseAgent):
     """Investigator Agent - Generates queries and calls tools"""
@@ -50,6 +60,12 @@ class InvestigateAgent(BaseAgent):
         agent_config = config.get("solve", {}).get("agents", {}).get("investigate_agent", {})
         self.max_actions_per_round = agent_config.get("max_actions_per_round", 1)
         self.max_iterations = agent_config.get("max_iterations", 3)
+        # Upper bound on simultaneous calls per tool within (and across) rounds
+        self.tool_concurrency = {
+            **DEFAULT_TOOL_CONCURRENCY,
+            **(agent_config.get("tool_concurrency") or {}),
+        }
+        self._tool_semaphores: dict[str, asyncio.Semaphore] = {}
 
     async def process(
         self,
@@ -168,31 +184,20 @@ class InvestigateAgent(BaseAgent):
         # Limit number of actions per round based on config
         tool_plans_to_execute = tool_plans[: self.max_actions_per_round]
 
-        for plan in tool_plans_to_execute:
-            tool_type = plan.get("tool")
-            if not tool_type:
-                continue
-
-            query = plan.get("query", "")
-            identifier = plan.get("identifier")
-
-            if tool_type == "none":
-                continue
-
-            knowledge_item = await self._execute_single_action(
-                tool_selection=tool_type,
-                query=query,
-                identifier=identifier,
-                kb_name=kb_name,
-                output_dir=output_dir,
-                citation_memory=citation_memory,
-            )
+        # Tools run concurrently; citations are registered in plan order afterwards
+        results = await self._execute_actions(
+            tool_plans_to_execute,
+            kb_name=kb_name,
+            output_dir=output_dir,
+            citation_memory=citation_memory,
+        )
 
+        for plan, knowledge_item in results:
             executed_actions.append(
                 {
-                    "tool_type": tool_type,
-                    "query": query,
-                    "identifier": identifier,
+                    "tool_type": plan.get("tool"),
+                    "query": plan.get("query", ""),
+                    "identifier": plan.get("identifier"),
                     "cite_id": knowledge_item.cite_id if knowledge_item else None,
                 }
             )
@@ -306,28 +311,94 @@ class InvestigateAgent(BaseAgent):
             )
         return template.format(**context)
 
-    async def _execute_single_action(
+    def _tool_semaphore(self, tool_selection: str) -> asyncio.Semaphore:
+        """Per-tool concurrency limit shared by all rounds of this agent"""
+        semaphore = self._tool_semaphores.get(tool_selection)
+        if semaphore is None:
+            limit = self.tool_concurrency.get(tool_selection, 1)
+            semaphore = asyncio.Semaphore(max(1, int(limit)))
+            self._tool_semaphores[tool_selection] = semaphore
+        return semaphore
+
+    async def _execute_actions(
+        self,
+        tool_plans: list[dict[str, Any]],
+        kb_name: str,
+        output_dir: str | None,
+        citation_memory: CitationMemory,
+    ) -> list[tuple[dict[str, Any], KnowledgeItem | None]]:
+        """
+        Execute one round of tool plans concurrently.
+
+        Tool calls overlap (bounded per tool by ``tool_concurrency``), but citations
+        are registered in plan order once all calls finish, so cite_ids do not depend
+        on which call returns first. A failed call yields ``None`` for its plan and
+        does not affect the others.
+
+        Returns:
+            list of (plan, knowledge item or None), in plan order, for plans with a tool
+        """
+        plans = [plan for plan in tool_plans if plan.get("tool") and plan.get("tool") != "none"]
+        outcomes = await asyncio.gather(
+            *(
+                self._run_tool(
+                    tool_selection=plan["tool"],
+                    query=plan.get("query", ""),
+                    identifier=plan.get("identifier"),
+                    kb_name=kb_name,
+                    output_dir=output_dir,
+                )
+                for plan in plans
+            )
+        )
+
+        results: list[tuple[dict[str, Any], KnowledgeItem | None]] = []
+        for plan, outcome in zip(plans, outcomes):
+            knowledge_item = None
+            if outcome is not None:
+                knowledge_item = self._register_knowledge(
+                    tool_selection=plan["tool"],
+                    query=plan.get("query", ""),
+                    identifier=plan.get("identifier"),
+                    kb_name=kb_name,
+                    citation_memory=citation_memory,
+                    **outcome,
+                )
+            results.append((plan, knowledge_item))
+
+        if any(item for _, item in results):
+            try:
+                citation_memory.save()
+            except Exception as e:
+                self.logger.warning(f"Failed to save citation memory: {e}")
+        return results
+
+    async def _run_tool(
         self,
         tool_selection: str,
         query: str,
         identifier: str | None,
         kb_name: str,
         output_dir: str | None,
-        citation_memory: CitationMemory,
-    ) -> KnowledgeItem | None:
-        """Execute a single tool call"""
-        import time
+    ) -> dict[str, Any] | None:
+        """
+        Call one tool.
 
+        Returns:
+            {"result", "raw_result", "elapsed_ms"}, or None if the call was rejected or failed
+        """
         start_time = time.time()
         tool_input = {"query": query, "identifier": identifier, "kb_name": kb_name}
 
         try:
             if tool_selection == "rag_naive":
-                result = await self._call_rag_naive(query, kb_name, output_dir)
+                async with self._tool_semaphore(tool_selection):
+                    result = await self._call_rag_naive(query, kb_name, output_dir)
                 raw_result = result.get("answer", "")
 
             elif tool_selection == "rag_hybrid":
-                result = await self._call_rag_hybrid(query, kb_name, output_dir)
+                async with self._tool_semaphore(tool_selection):
+                    result = await self._call_rag_hybrid(query, kb_name, output_dir)
                 raw_result = result.get("answer", "")
 
             elif tool_selection == "web_search":
@@ -337,7 +408,8 @@ class InvestigateAgent(BaseAgent):
                         "Tool call rejected (web_search): web_search is disabled in config"
                     )
                     return None
-                result = await self._call_web_search(query, output_dir)
+                async with self._tool_semaphore(tool_selection):
+                    result = await self._call_web_search(query, output_dir)
                 raw_result = json.dumps(result, ensure_ascii=False, indent=2)
 
             elif tool_selection == "query_item":
@@ -353,46 +425,14 @@ class InvestigateAgent(BaseAgent):
                     )
                     return None
 
-                result = await self._call_query_item(identifier_to_use, kb_name)
+                async with self._tool_semaphore(tool_selection):
+                    result = await self._call_query_item(identifier_to_use, kb_name)
                 raw_result = result.get("content", result.get("answer", ""))
 
             else:
                 self.logger.warning(f"Unknown tool type: {tool_selection}")
                 return None
 
-            elapsed_ms = (time.time() - start_time) * 1000
-
-            # Create and register citation
-            cite_id = citation_memory.add_citation(
-                tool_type=tool_selection,
-                query=query,
-                raw_result=raw_result,
-                stage="analysis",
-                metadata={"identifier": identifier},
-            )
-            citation_memory.save()
-
-            # Log tool call
-            self.logger.log_tool_call(
-                tool_name=tool_selection,
-                tool_input=tool_input,
-                tool_output=result,
-                status="success",
-                elapsed_ms=elapsed_ms,
-                citation_id=cite_id,
-            )
-
-            # Create knowledge item
-            knowledge_item = KnowledgeItem(
-                cite_id=cite_id,
-                tool_type=tool_selection,
-                query=query,
-                raw_result=raw_result,
-                summary="",  # Generated by NoteAgent
-            )
-
-            return knowledge_item
-
         except Exception as e:
             elapsed_ms = (time.time() - start_time) * 1000
             error_msg = str(e)
@@ -409,6 +449,50 @@ class InvestigateAgent(BaseAgent):
             self.logger.warning(f"Tool call failed ({tool_selection}): {e}")
             return None
 
+        return {
+            "result": result,
+            "raw_result": raw_result,
+            "elapsed_ms": (time.time() - start_time) * 1000,
+        }
+
+    def _register_knowledge(
+        self,
+        tool_selection: str,
+        query: str,
+        identifier: str | None,
+        kb_name: str,
+        citation_memory: CitationMemory,
+        result: Any,
+        raw_result: str,
+        elapsed_ms: float,
+    ) -> KnowledgeItem:
+        """Register the citation for a successful tool call and build its knowledge item"""
+        cite_id = citation_memory.add_citation(
+            tool_type=tool_selection,
+            query=query,
+            raw_result=raw_result,
+            stage="analysis",
+            metadata={"identifier": identifier},
+        )
+
+        # Log tool call
+        self.logger.log_tool_call(
+            tool_name=tool_selection,
+            tool_input={"query": query, "identifier": identifier, "kb_name": kb_name},
+            tool_output=result,
+            status="success",
+            elapsed_ms=elapsed_ms,
+            citation_id=cite_id,
+        )
+
+        return KnowledgeItem(
+            cite_id=cite_id,
+            tool_type=tool_selection,
+            query=query,
+            raw_result=raw_result,
+            summary="",  # Generated by NoteAgent
+        )
+
     async def _call_rag_naive(
         self, query: str, kb_name: str, output_dir: str | None
     ) -> dict[str, Any]:
@@ -422,9 +506,11 @@ class InvestigateAgent(BaseAgent):
         return await rag_search(query=query, kb_name=kb_name, mode="hybrid")
 
     async def _call_web_search(self, query: str, output_dir: str | None) -> dict[str, Any]:
-        """Call Web Search"""
-        return web_search(query=query, output_dir=output_dir or "./cache", verbose=False)
+        """Call Web Search (blocking client, run off the event loop)"""
+        return await asyncio.to_thread(
+            web_search, query=query, output_dir=output_dir or "./cache", verbose=False
+        )
 
     async def _call_query_item(self, identifier: str, kb_name: str) -> dict[str, Any]:
-        """Call Query Item"""
-        return query_numbered_item(identifier=identifier, kb_name=kb_name)
+        """Call Query Item (reads from disk, run off the event loop)"""
+        return await asyncio.to_thread(query_numbered_item, identifier=identifier, kb_name=kb_name)
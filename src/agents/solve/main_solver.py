@@ -29,7 +29,7 @@ from .solve_loop import (
     SolveAgent,
     ToolAgent,
 )
-from .utils import ConfigValidator, PerformanceMonitor, SolveAgentLogger
+from .utils import ConfigValidator, PerformanceMonitor, SolveAgentLogger, run_step_graph
 from .utils.display_manager import get_display_manager
 from .utils.token_tracker import TokenTracker
 
@@ -592,154 +592,15 @@ class MainSolver:
         if plan_result is None:
             raise ValueError("ManagerAgent failed to generate plan")
 
-        # 2. Solve Loop - Execute steps
-        self.logger.info("Solve: Executing solution steps...")
-        max_correction_iterations = self.config.get("system", {}).get(
-            "max_solve_correction_iterations", 3
-        )
-        total_planned_steps = len(solve_memory.solve_chains)
-        self.logger.log_stage_progress(
-            "SolveLoop",
-            "start",
-            f"planned_steps={total_planned_steps}, max_corrections={max_correction_iterations}",
-        )
-
-        for step_index, step in enumerate(solve_memory.solve_chains, 1):
-            if step.status in ("waiting_response", "done"):
-                continue
-
-            self.logger.info(f"  Step {step_index}: {step.step_id}")
-            self.logger.debug(f"  Target: {step.step_target[:80]}")
-
-            if hasattr(self, "_send_progress_update"):
-                self._send_progress_update(
-                    "solve",
-                    {
-                        "step_index": step_index,
-                        "step_id": step.step_id,
-                        "step_target": step.step_target,
-                    },
-                )
-
-            self.logger.log_stage_progress("SolveLoop", "running", f"step={step.step_id}")
-
-            if self._has_pending_tool_calls(step):
-                await self._execute_tool_calls(step, solve_memory, citation_memory, output_dir)
-
-            iteration = 0
-            while iteration < max_correction_iterations:
-                iteration += 1
-                current_step = solve_memory.get_step(step.step_id) or step
-
-                with self.monitor.track(f"solve_execute_{step.step_id}_iter_{iteration}"):
-                    solve_result = await self.solve_agent.process(
-                        question=question,
-                        current_step=current_step,
-                        solve_memory=solve_memory,
-                        investigate_memory=investigate_memory,
-                        citation_memory=citation_memory,
-                        kb_name=self.kb_name,
-                        output_dir=output_dir,
-                        verbose=False,
-                    )
-
-                if solve_result.get("raw_llm_response"):
-                    self.logger.log_stage_progress(
-                        "SolveLoop", "running", f"step={step.step_id}, iteration={iteration}"
-                    )
-
-                if solve_result.get("requested_calls"):
-                    await self._execute_tool_calls(
-                        current_step, solve_memory, citation_memory, output_dir
-                    )
-
-                self.logger.update_token_stats(self.token_tracker.get_summary())
-
-                if solve_result.get("finish_requested"):
-                    current_step = solve_memory.get_step(step.step_id) or step
-                    if self._has_pending_tool_calls(current_step):
-                        self.logger.debug("  Finish triggered but tools pending, continuing...")
-                        continue
-                    solve_memory.mark_step_waiting_response(current_step.step_id)
-                    solve_memory.save()
-                    self.logger.log_stage_progress(
-                        "SolveLoop", "complete", f"step={current_step.step_id} ready for response"
-                    )
-                    break
-            else:
-                self.logger.warning(f"  Step {step.step_id} max iterations reached")
-                solve_memory.mark_step_waiting_response(step.step_id)
-                solve_memory.save()
-
-        pending_steps = [
-            s.step_id
-            for s in solve_memory.solve_chains
-            if s.status not in ("waiting_response", "done")
-        ]
-        if pending_steps:
-            self.logger.warning(f"Steps not ready for response: {', '.join(pending_steps)}")
-
-        self.logger.log_stage_progress(
-            "SolveLoop", "complete", f"steps_processed={total_planned_steps - len(pending_steps)}"
+        # 2-3. Solve and respond to each step; independent steps run concurrently
+        await self._execute_solve_chain(
+            question=question,
+            solve_memory=solve_memory,
+            investigate_memory=investigate_memory,
+            citation_memory=citation_memory,
+            output_dir=output_dir,
         )
 
-        # 3. Response: Generate responses for each step
-        self.logger.info("Response: Generating step responses...")
-        self.logger.log_stage_progress("ResponseLoop", "start", "Generating responses")
-
-        accumulated_response = ""
-        for step in solve_memory.solve_chains:
-            if step.status == "done" and step.step_response:
-                accumulated_response += step.step_response + "\n\n"
-
-        for step in solve_memory.solve_chains:
-            if step.status != "waiting_response":
-                continue
-
-            original_step_index = next(
-                (
-                    i + 1
-                    for i, s in enumerate(solve_memory.solve_chains)
-                    if s.step_id == step.step_id
-                ),
-                0,
-            )
-
-            if hasattr(self, "_send_progress_update"):
-                self._send_progress_update(
-                    "response",
-                    {
-                        "step_index": original_step_index,
-                        "step_id": step.step_id,
-                        "step_target": step.step_target,
-                    },
-                )
-
-            with self.monitor.track(f"solve_response_{step.step_id}"):
-                response_result = await self.response_agent.process(
-                    question=question,
-                    step=step,
-                    solve_memory=solve_memory,
-                    investigate_memory=investigate_memory,
-                    citation_memory=citation_memory,
-                    output_dir=output_dir,
-                    verbose=False,
-                    accumulated_response=accumulated_response,
-                )
-
-            step_response = response_result.get("step_response", "")
-            if step_response:
-                accumulated_response += step_response + "\n\n"
-
-            if response_result.get("raw_response"):
-                self.logger.log_stage_progress(
-                    "ResponseLoop", "running", f"step={step.step_id} response generated"
-                )
-
-            self.logger.update_token_stats(self.token_tracker.get_summary())
-
-        self.logger.log_stage_progress("ResponseLoop", "complete", "All responses generated")
-
         # 4. Finalize: Compile final answer
         self.logger.info("Finalize: Compiling final answer...")
         self.logger.log_stage_progress("Finalize", "start", "Compiling steps")
@@ -839,6 +700,199 @@ class MainSolver:
             },
         }
 
+    async def _execute_solve_chain(
+        self,
+        question: str,
+        solve_memory: SolveMemory,
+        investigate_memory: InvestigateMemory,
+        citation_memory: CitationMemory,
+        output_dir: str,
+    ) -> None:
+        """
+        Solve and respond to every step of the chain.
+
+        Steps form a dependency graph (``SolveChainStep.depends_on``; a step without it
+        depends on every earlier step). Each step runs its tool calls, solve iterations
+        and response once all of its dependencies have responded, with up to
+        ``solve.max_parallel_steps`` steps in flight. A step's response sees only its
+        dependencies' responses. A "response" progress event is emitted when a step
+        starts responding; the final answer is still assembled in chain order.
+        """
+        max_correction_iterations = self.config.get("system", {}).get(
+            "max_solve_correction_iterations", 3
+        )
+        max_parallel_steps = int(self.config.get("solve", {}).get("max_parallel_steps", 1) or 1)
+        chain = list(solve_memory.solve_chains)
+        step_ids = [step.step_id for step in chain]
+        total_planned_steps = len(chain)
+
+        self.logger.info("Solve: Executing solution steps...")
+        self.logger.log_stage_progress(
+            "SolveLoop",
+            "start",
+            f"planned_steps={total_planned_steps}, max_corrections={max_correction_iterations}, "
+            f"max_parallel={max_parallel_steps}",
+        )
+
+        async def run_step(step_id: str) -> None:
+            step = solve_memory.get_step(step_id)
+            if step.status not in ("waiting_response", "done"):
+                await self._solve_step(
+                    step_index=step_ids.index(step_id) + 1,
+                    step=step,
+                    question=question,
+                    solve_memory=solve_memory,
+                    investigate_memory=investigate_memory,
+                    citation_memory=citation_memory,
+                    output_dir=output_dir,
+                    max_correction_iterations=max_correction_iterations,
+                )
+            step = solve_memory.get_step(step_id)
+            if step.status == "waiting_response":
+                if hasattr(self, "_send_progress_update"):
+                    self._send_progress_update(
+                        "response",
+                        {
+                            "step_index": step_ids.index(step_id) + 1,
+                            "step_id": step.step_id,
+                            "step_target": step.step_target,
+                        },
+                    )
+                await self._respond_step(
+                    step=step,
+                    question=question,
+                    solve_memory=solve_memory,
+                    investigate_memory=investigate_memory,
+                    citation_memory=citation_memory,
+                    output_dir=output_dir,
+                )
+
+        await run_step_graph(
+            step_ids,
+            {sid: solve_memory.get_step_dependencies(sid) for sid in step_ids},
+            run_step,
+            max_parallel=max_parallel_steps,
+            completed=[step.step_id for step in chain if step.status == "done"],
+        )
+
+        pending_steps = [s.step_id for s in solve_memory.solve_chains if s.status != "done"]
+        if pending_steps:
+            self.logger.warning(f"Steps without response: {', '.join(pending_steps)}")
+        self.logger.log_stage_progress(
+            "SolveLoop", "complete", f"steps_processed={total_planned_steps - len(pending_steps)}"
+        )
+        self.logger.log_stage_progress("ResponseLoop", "complete", "All responses generated")
+
+    async def _solve_step(
+        self,
+        step_index: int,
+        step: SolveChainStep,
+        question: str,
+        solve_memory: SolveMemory,
+        investigate_memory: InvestigateMemory,
+        citation_memory: CitationMemory,
+        output_dir: str,
+        max_correction_iterations: int,
+    ) -> None:
+        """Run a step's tool calls and solve iterations until it is ready for a response"""
+        self.logger.info(f"  Step {step_index}: {step.step_id}")
+        self.logger.debug(f"  Target: {step.step_target[:80]}")
+
+        if hasattr(self, "_send_progress_update"):
+            self._send_progress_update(
+                "solve",
+                {
+                    "step_index": step_index,
+                    "step_id": step.step_id,
+                    "step_target": step.step_target,
+                },
+            )
+
+        self.logger.log_stage_progress("SolveLoop", "running", f"step={step.step_id}")
+
+        if self._has_pending_tool_calls(step):
+            await self._execute_tool_calls(step, solve_memory, citation_memory, output_dir)
+
+        iteration = 0
+        while iteration < max_correction_iterations:
+            iteration += 1
+            current_step = solve_memory.get_step(step.step_id) or step
+
+            with self.monitor.track(f"solve_execute_{step.step_id}_iter_{iteration}"):
+                solve_result = await self.solve_agent.process(
+                    question=question,
+                    current_step=current_step,
+                    solve_memory=solve_memory,
+                    investigate_memory=investigate_memory,
+                    citation_memory=citation_memory,
+                    kb_name=self.kb_name,
+                    output_dir=output_dir,
+                    verbose=False,
+                )
+
+            if solve_result.get("raw_llm_response"):
+                self.logger.log_stage_progress(
+                    "SolveLoop", "running", f"step={step.step_id}, iteration={iteration}"
+                )
+
+            if solve_result.get("requested_calls"):
+                await self._execute_tool_calls(
+                    current_step, solve_memory, citation_memory, output_dir
+                )
+
+            self.logger.update_token_stats(self.token_tracker.get_summary())
+
+            if solve_result.get("finish_requested"):
+                current_step = solve_memory.get_step(step.step_id) or step
+                if self._has_pending_tool_calls(current_step):
+                    self.logger.debug("  Finish triggered but tools pending, continuing...")
+                    continue
+                solve_memory.mark_step_waiting_response(current_step.step_id)
+                solve_memory.save()
+                self.logger.log_stage_progress(
+                    "SolveLoop", "complete", f"step={current_step.step_id} ready for response"
+                )
+                break
+        else:
+            self.logger.warning(f"  Step {step.step_id} max iterations reached")
+            solve_memory.mark_step_waiting_response(step.step_id)
+            solve_memory.save()
+
+    async def _respond_step(
+        self,
+        step: SolveChainStep,
+        question: str,
+        solve_memory: SolveMemory,
+        investigate_memory: InvestigateMemory,
+        citation_memory: CitationMemory,
+        output_dir: str,
+    ) -> None:
+        """Generate a step's response from its own materials and its dependencies' responses"""
+        accumulated_response = "".join(
+            f"{s.step_response}\n\n"
+            for s in solve_memory.get_step_ancestors(step.step_id)
+            if s.status == "done" and s.step_response
+        )
+
+        with self.monitor.track(f"solve_response_{step.step_id}"):
+            response_result = await self.response_agent.process(
+                question=question,
+                step=step,
+                solve_memory=solve_memory,
+                investigate_memory=investigate_memory,
+                citation_memory=citation_memory,
+                output_dir=output_dir,
+                verbose=False,
+                accumulated_response=accumulated_response,
+            )
+
+        if response_result.get("raw_response"):
+            self.logger.log_stage_progress(
+                "ResponseLoop", "running", f"step={step.step_id} response generated"
+            )
+
+        self.logger.update_token_stats(self.token_tracker.get_summary())
+
     async def _execute_tool_calls(
         self,
         step: SolveChainStep,
@@ -75,6 +75,8 @@ class SolveChainStep:
     step_response: Optional[str] = None
     status: str = "undone"  # undone | in_progress | waiting_response | done | failed
     used_citations: List[str] = field(default_factory=list)
+    # Step ids this step builds on; None = every earlier step (plans without dependencies)
+    depends_on: Optional[List[str]] = None
     created_at: str = field(default_factory=_now)
     updated_at: str = field(default_factory=_now)
 
@@ -100,6 +102,7 @@ class SolveChainStep:
             step_response=data.get("step_response", data.get("content")),
             status=data["status"],
             used_citations=data.get("used_citations", []),
+            depends_on=data.get("depends_on"),
             created_at=data["created_at"],
             updated_at=data["updated_at"],
         )
@@ -226,6 +229,28 @@ class SolveMemory:
     def get_step(self, step_id: str) -> Optional[SolveChainStep]:
         return next((step for step in self.solve_chains if step.step_id == step_id), None)
 
+    def get_step_dependencies(self, step_id: str) -> List[str]:
+        """Direct dependencies of a step (all earlier steps if the plan gave none)."""
+        ids = [step.step_id for step in self.solve_chains]
+        if step_id not in ids:
+            raise ValueError(f"Step {step_id} not found")
+        earlier = ids[: ids.index(step_id)]
+        depends_on = self.get_step(step_id).depends_on
+        if depends_on is None:
+            return earlier
+        return [sid for sid in earlier if sid in depends_on]
+
+    def get_step_ancestors(self, step_id: str) -> List[SolveChainStep]:
+        """All steps a step transitively depends on, in chain order."""
+        ancestors: set[str] = set()
+        frontier = self.get_step_dependencies(step_id)
+        while frontier:
+            sid = frontier.pop()
+            if sid not in ancestors:
+                ancestors.add(sid)
+                frontier.extend(self.get_step_dependencies(sid))
+        return [step for step in self.solve_chains if step.step_id in ancestors]
+
     def get_current_step(self) -> Optional[SolveChainStep]:
         for step in self.solve_chains:
             if step.status in {"undone", "in_progress", "waiting_response"}:
@@ -249,6 +249,11 @@ class ManagerAgent(BaseAgent):
                         f"[ManagerAgent] Skipping unknown cite_id {cleaned} (not in knowledge chain)"
                     )
 
+            # Get dependencies (only earlier steps, which keeps the plan acyclic)
+            depends_on = self._parse_depends_on(
+                step_data.get("depends_on"), step_id, [s.step_id for s in steps]
+            )
+
             # Create step
             steps.append(
                 SolveChainStep(
@@ -256,6 +261,7 @@ class ManagerAgent(BaseAgent):
                     step_target=step_target,
                     available_cite=list(dict.fromkeys(filtered_cites)),  # Remove duplicates
                     status="undone",
+                    depends_on=depends_on,
                 )
             )
 
@@ -270,5 +276,37 @@ class ManagerAgent(BaseAgent):
                 logger.info(
                     f"    Available citations: {', '.join(step.available_cite) or '(none)'}"
                 )
+                if step.depends_on is not None:
+                    logger.info(f"    Depends on: {', '.join(step.depends_on) or '(none)'}")
 
         return steps
+
+    def _parse_depends_on(self, raw: Any, step_id: str, earlier_ids: list[str]) -> list[str] | None:
+        """
+        Normalize a step's ``depends_on`` field.
+
+        Returns None when the field is missing or unusable, meaning the step depends on
+        every earlier step (sequential execution, as for plans without dependencies).
+        """
+        if raw is None:
+            return None
+        if isinstance(raw, str):
+            raw = [] if raw.strip().lower() in ("", "none") else [raw]
+        if not isinstance(raw, list):
+            self.logger.warning(f"[ManagerAgent] Ignoring invalid depends_on for {step_id}: {raw}")
+            return None
+
+        known = {sid.upper(): sid for sid in earlier_ids}
+        depends_on = []
+        for dep in raw:
+            dep_id = str(dep).strip().strip("[]").upper()
+            if dep_id and not dep_id.startswith("S"):
+                dep_id = f"S{dep_id}"
+            if dep_id in known:
+                depends_on.append(known[dep_id])
+            else:
+                self.logger.warning(
+                    f"[ManagerAgent] {step_id} depends on {dep!r}, which is not an earlier step; "
+                    "ignoring it"
+                )
+        return list(dict.fromkeys(depends_on))
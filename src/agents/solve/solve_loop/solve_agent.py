@@ -240,9 +240,8 @@ class SolveAgent(BaseAgent):
         self, current_step: SolveChainStep, solve_memory: SolveMemory
     ) -> str:
         snippets: list[str] = []
-        for step in solve_memory.solve_chains:
-            if step.step_id == current_step.step_id:
-                break
+        # Only the steps this one depends on: independent steps may be running concurrently
+        for step in solve_memory.get_step_ancestors(current_step.step_id):
             if step.step_response:
                 snippets.append(
                     f"[{step.step_id}] {step.step_target}\n{step.step_response[:300]}..."
@@ -5,6 +5,7 @@ ToolAgent - Tool executor
 Responsible for reading tool calls in solve-chain, actually executing tools and producing summary
 """
 
+import asyncio
 from pathlib import Path
 import re
 import sys
@@ -46,6 +47,7 @@ class ToolAgent(BaseAgent):
             config=config,
             token_tracker=token_tracker,
         )
+        self._code_execution_lock = asyncio.Lock()
 
     async def _generate_code_from_intent(self, intent: str) -> str:
         system_prompt = """
@@ -250,7 +252,10 @@ Rules:
             return answer, metadata
 
         if tool_type == "web_search":
-            result = web_search(query=query, output_dir=output_dir, verbose=verbose)
+            # Blocking client: keep the loop free for concurrently running steps
+            result = await asyncio.to_thread(
+                web_search, query=query, output_dir=output_dir, verbose=verbose
+            )
             answer = result.get("answer") or result.get("summary") or ""
             used_citation_ids = self._extract_answer_citations(answer)
             filtered_citations = self._select_web_citations(used_citation_ids, result)
@@ -258,61 +263,68 @@ Rules:
             return answer, metadata
 
         if tool_type == "code_execution":
-            artifacts_path = Path(artifacts_dir)
-            before_snapshot = self._snapshot_image_artifacts(artifacts_path)
+            return await self._execute_code(query, output_dir, artifacts_dir)
 
-            if not query or not query.strip():
-                # If code is empty, directly return failure without execution
-                raw_answer = "【⚠️ Code execution failed】\nError: No valid code input received (Code is empty). Please check if [QUERY] contains a markdown code block."
-                metadata = {
-                    "exit_code": 1,
-                    "artifacts": [],
-                    "artifact_paths": [],
-                    "artifact_rel_paths": [],
-                    "work_dir": artifacts_dir,
-                    "execution_failed": True,
-                }
-                return raw_answer, metadata
+        raise ValueError(f"Unknown tool type: {tool_type}")
+
+    async def _execute_code(
+        self, query: str, output_dir: str | None, artifacts_dir: str
+    ) -> tuple[str, dict[str, Any]]:
+        artifacts_path = Path(artifacts_dir)
+
+        if not query or not query.strip():
+            # If code is empty, directly return failure without execution
+            raw_answer = "【⚠️ Code execution failed】\nError: No valid code input received (Code is empty). Please check if [QUERY] contains a markdown code block."
+            metadata = {
+                "exit_code": 1,
+                "artifacts": [],
+                "artifact_paths": [],
+                "artifact_rel_paths": [],
+                "work_dir": artifacts_dir,
+                "execution_failed": True,
+            }
+            return raw_answer, metadata
 
-            code = await self._generate_code_from_intent(query)
+        code = await self._generate_code_from_intent(query)
 
+        # Steps share the artifacts directory: run one execution at a time so new
+        # images are attributed to the call that produced them
+        async with self._code_execution_lock:
+            before_snapshot = self._snapshot_image_artifacts(artifacts_path)
             exec_result = await run_code(
                 language="python",
                 code=code,
                 timeout=self.agent_config.get("code_timeout", 20),
                 assets_dir=artifacts_dir,
             )
-            raw_answer = self._format_code_answer(exec_result, artifacts_dir)
-            exit_code = exec_result.get("exit_code", 0)
-
-            # Check if code execution failed
-            is_failed = exit_code != 0
-            if is_failed:
-                stderr = exec_result.get("stderr", "")
-                # Add obvious error prefix at the beginning of raw_answer
-                error_prefix = "【⚠️ Code execution failed】\n"
-                if "FileNotFoundError" in stderr and "artifacts/" in stderr:
-                    error_prefix += "Path error detected: Code uses 'artifacts/xxx.png', but working directory is already the artifacts directory.\n"
-                    error_prefix += "Please use 'xxx.png' instead of 'artifacts/xxx.png'.\n\n"
-                raw_answer = error_prefix + raw_answer
-
             new_image_paths = self._collect_new_image_artifacts(
                 artifacts_path=artifacts_path,
                 before_snapshot=before_snapshot,
                 output_dir=output_dir,
             )
-
-            metadata = {
-                "exit_code": exit_code,
-                "artifacts": exec_result.get("artifacts", []),
-                "artifact_paths": exec_result.get("artifact_paths", []),
-                "artifact_rel_paths": new_image_paths,
-                "work_dir": artifacts_dir,
-                "execution_failed": is_failed,
-            }
-            return raw_answer, metadata
-
-        raise ValueError(f"Unknown tool type: {tool_type}")
+        raw_answer = self._format_code_answer(exec_result, artifacts_dir)
+        exit_code = exec_result.get("exit_code", 0)
+
+        # Check if code execution failed
+        is_failed = exit_code != 0
+        if is_failed:
+            stderr = exec_result.get("stderr", "")
+            # Add obvious error prefix at the beginning of raw_answer
+            error_prefix = "【⚠️ Code execution failed】\n"
+            if "FileNotFoundError" in stderr and "artifacts/" in stderr:
+                error_prefix += "Path error detected: Code uses 'artifacts/xxx.png', but working directory is already the artifacts directory.\n"
+                error_prefix += "Please use 'xxx.png' instead of 'artifacts/xxx.png'.\n\n"
+            raw_answer = error_prefix + raw_answer
+
+        metadata = {
+            "exit_code": exit_code,
+            "artifacts": exec_result.get("artifacts", []),
+            "artifact_paths": exec_result.get("artifact_paths", []),
+            "artifact_rel_paths": new_image_paths,
+            "work_dir": artifacts_dir,
+            "execution_failed": is_failed,
+        }
+        return raw_answer, metadata
 
     def _format_code_answer(self, exec_result: dict[str, Any], artifacts_dir: str) -> str:
         stdout = exec_result.get("stdout", "")
@@ -33,6 +33,7 @@ from .error_handler import (
 # Backwards compatibility alias
 ParseError = LLMParseError
 from .performance_monitor import PerformanceMonitor
+from .step_scheduler import run_step_graph
 
 # Token tracker
 from .token_tracker import TokenTracker, calculate_cost, get_model_pricing
@@ -46,6 +47,8 @@ __all__ = [
     "SolveAgentLogger",  # Backwards compatibility
     # Performance monitoring
     "PerformanceMonitor",
+    # Step scheduling
+    "run_step_graph",
     # Config validation
     "ConfigValidator",
     # Token tracker
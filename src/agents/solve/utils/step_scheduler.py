@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Step Scheduler - runs solve-chain steps as a dependency graph
+
+Each step starts as soon as all of its dependencies have finished, with at most
+``max_parallel`` steps in flight. Ready steps are started in chain order, so with
+``max_parallel=1`` (or a purely sequential plan) steps run exactly in order.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, Mapping
+
+
+async def run_step_graph(
+    step_ids: list[str],
+    dependencies: Mapping[str, Iterable[str]],
+    run_step: Callable[[str], Awaitable[None]],
+    max_parallel: int = 1,
+    completed: Iterable[str] = (),
+) -> None:
+    """
+    Run ``run_step(step_id)`` for every step not in ``completed``.
+
+    Args:
+        step_ids: Steps in chain order
+        dependencies: step_id -> ids it waits for (ids outside ``step_ids`` are ignored)
+        run_step: Coroutine function executing one step
+        max_parallel: Maximum number of steps running at once
+        completed: Steps already finished (e.g. when resuming)
+
+    Raises:
+        ValueError: If the remaining steps have circular dependencies
+        Exception: The first exception raised by ``run_step``; other running steps
+            are cancelled
+    """
+    done = set(completed)
+    known = set(step_ids)
+    pending = [sid for sid in step_ids if sid not in done]
+    waits_for = {sid: (set(dependencies.get(sid, ())) & known) - {sid} for sid in pending}
+    running: dict[asyncio.Task, str] = {}
+    max_parallel = max(1, max_parallel)
+
+    try:
+        while pending or running:
+            ready = [sid for sid in pending if waits_for[sid] <= done]
+            for sid in ready[: max_parallel - len(running)]:
+                pending.remove(sid)
+                running[asyncio.create_task(run_step(sid), name=f"solve-step-{sid}")] = sid
+
+            if not running:
+                raise ValueError(f"Circular step dependencies: {', '.join(pending)}")
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                sid = running.pop(task)
+                task.result()  # Re-raise step failures
+                done.add(sid)
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
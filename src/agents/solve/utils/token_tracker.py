@@ -10,6 +10,8 @@ from datetime import datetime
 import json
 from typing import Any
 
+from src.services.llm.tokenizer import get_tokenizer
+
 # Try importing tiktoken (if available)
 try:
     import tiktoken
@@ -69,17 +71,8 @@ def get_tiktoken_encoding(model_name: str):
     if not TIKTOKEN_AVAILABLE:
         return None
 
-    try:
-        # Try getting encoding based on model name
-        if "gpt-4" in model_name.lower() or "gpt-3.5" in model_name.lower():
-            return tiktoken.encoding_for_model(model_name)
-        if "gpt-4o" in model_name.lower():
-            return tiktoken.encoding_for_model("gpt-4o")
-        # Default to cl100k_base (encoding for GPT-3.5/GPT-4)
-        return tiktoken.get_encoding("cl100k_base")
-    except Exception:
-        # If fails, use default encoding
-        return tiktoken.get_encoding("cl100k_base")
+    # Encoders are resolved and cached once per model by the shared tokenizer service
+    return get_tokenizer().get_encoder(model_name)
 
 
 def count_tokens_with_tiktoken(text: str, model_name: str) -> int:
@@ -96,11 +89,11 @@ def count_tokens_with_tiktoken(text: str, model_name: str) -> int:
     if not TIKTOKEN_AVAILABLE:
         return 0
 
-    encoding = get_tiktoken_encoding(model_name)
-    if encoding is None:
+    if get_tiktoken_encoding(model_name) is None:
         return 0
 
-    return len(encoding.encode(text))
+    # Memoized by content hash in the shared tokenizer service
+    return get_tokenizer().count(text, model_name)
 
 
 def count_tokens_with_litellm(messages: list[dict], model_name: str) -> dict[str, int]:
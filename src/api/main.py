@@ -21,6 +21,7 @@ from src.api.routers import (
     settings,
     solve,
     system,
+    webhooks,
 )
 from src.logging import get_logger
 
@@ -131,9 +132,16 @@ async def lifespan(app: FastAPI):
     # Validate configuration consistency
     validate_tool_consistency()
 
+    # Deliver queued webhook events in the background
+    from src.services.webhooks import get_webhook_engine
+
+    webhook_engine = get_webhook_engine()
+    await webhook_engine.start()
+
     yield
     # Execute on shutdown
     logger.info("Application shutdown")
+    await webhook_engine.stop()
 
 
 app = FastAPI(title="DeepTutor API", version="1.0.0", lifespan=lifespan)
@@ -182,6 +190,7 @@ app.include_router(settings.router, prefix="/api/v1/settings", tags=["settings"]
 app.include_router(system.router, prefix="/api/v1/system", tags=["system"])
 app.include_router(config.router, prefix="/api/v1/config", tags=["config"])
 app.include_router(agent_config.router, prefix="/api/v1/agent-config", tags=["agent-config"])
+app.include_router(webhooks.router, prefix="/api/v1/webhooks", tags=["webhooks"])
 
 
 @app.get("/")
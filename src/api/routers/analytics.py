@@ -7,6 +7,9 @@ Provides endpoints for:
 - Knowledge gaps and strength areas
 - Predictive success metrics
 - Learning trajectories over time
+
+Endpoints read the hourly/daily rollups maintained by AnalyticsStore (updated as
+history entries are recorded) instead of rescanning the full history.
 """
 
 import time
@@ -16,6 +19,7 @@ from enum import Enum
 
 from fastapi import APIRouter
 
+from src.api.utils.analytics_store import HOURLY_RETENTION_DAYS, AnalyticsStore
 from src.api.utils.history import history_manager
 
 router = APIRouter()
@@ -41,6 +45,24 @@ def _get_time_cutoff(time_range: TimeRange) -> float:
         return 0  # All time
 
 
+def _get_rollups() -> AnalyticsStore:
+    """Analytics rollups, backfilled from history the first time they are needed."""
+    store = history_manager.analytics
+    if not store.is_backfilled():
+        store.backfill(history_manager._load_history())
+    return store
+
+
+def _current_streak(active_dates: set[str]) -> int:
+    """Consecutive active days ending today."""
+    streak = 0
+    current_date = datetime.now()
+    while current_date.strftime("%Y-%m-%d") in active_dates:
+        streak += 1
+        current_date = datetime.fromtimestamp(current_date.timestamp() - 86400)
+    return streak
+
+
 @router.get("/summary")
 async def get_analytics_summary(time_range: TimeRange = TimeRange.WEEK):
     """
@@ -53,46 +75,17 @@ async def get_analytics_summary(time_range: TimeRange = TimeRange.WEEK):
         - Topics covered
         - Average session duration
     """
-    cutoff = _get_time_cutoff(time_range)
-    history = history_manager._load_history()
-
-    # Filter by time range
-    filtered_history = [
-        entry for entry in history
-        if entry.get("timestamp", 0) >= cutoff
-    ]
-
-    # Activity counts by type
-    activity_counts = defaultdict(int)
-    total_tokens = 0
-    total_cost = 0.0
-    topics = set()
-
-    for entry in filtered_history:
-        entry_type = entry.get("type", "unknown")
-        activity_counts[entry_type] += 1
-
-        # Extract token stats from content
-        content = entry.get("content", {})
-        if isinstance(content, dict):
-            token_stats = content.get("token_stats", {})
-            if isinstance(token_stats, dict):
-                total_tokens += token_stats.get("tokens", 0)
-                total_cost += token_stats.get("cost", 0)
-
-            # Extract topic/title
-            title = entry.get("title", "")
-            if title:
-                topics.add(title[:50])  # Truncate long titles
+    summary = _get_rollups().summarize(_get_time_cutoff(time_range))
+    topics = list(summary["topics"])
 
     return {
         "time_range": time_range,
-        "total_activities": len(filtered_history),
-        "activity_breakdown": dict(activity_counts),
-        "total_tokens": total_tokens,
-        "total_cost": round(total_cost, 4),
+        "total_activities": summary["total"],
+        "activity_breakdown": summary["types"],
+        "total_tokens": summary["tokens"],
+        "total_cost": round(summary["cost"], 4),
         "unique_topics": len(topics),
-        "topics_sample": list(topics)[:10],  # Sample of topics
+        "topics_sample": topics[:10],  # Sample of topics
     }
 
 
@@ -109,32 +102,28 @@ async def get_activity_timeline(time_range: TimeRange = TimeRange.WEEK, granular
         Timeline data suitable for charting
     """
     cutoff = _get_time_cutoff(time_range)
-    history = history_manager._load_history()
-
-    # Filter by time range
-    filtered_history = [
-        entry for entry in history
-        if entry.get("timestamp", 0) >= cutoff
-    ]
+    store = _get_rollups()
+    if granularity == "hour":
+        # Hourly buckets even for "all" (limited to the hourly retention window)
+        buckets = store.get_buckets(max(cutoff, time.time() - HOURLY_RETENTION_DAYS * 86400))
+    else:
+        buckets = store.get_buckets(cutoff)
 
     # Group by time period
     timeline = defaultdict(lambda: defaultdict(int))
 
-    for entry in filtered_history:
-        timestamp = entry.get("timestamp", 0)
-        entry_type = entry.get("type", "unknown")
-
-        # Convert to datetime and format based on granularity
-        dt = datetime.fromtimestamp(timestamp)
+    for bucket_key, bucket in buckets:
+        # Bucket keys are "YYYY-MM-DD HH:00" (hourly) or "YYYY-MM-DD" (daily)
         if granularity == "hour":
-            key = dt.strftime("%Y-%m-%d %H:00")
+            key = bucket_key
         elif granularity == "week":
-            key = dt.strftime("%Y-W%W")
+            key = datetime.fromtimestamp(bucket["start"]).strftime("%Y-W%W")
         else:  # day
-            key = dt.strftime("%Y-%m-%d")
+            key = bucket_key[:10]
 
-        timeline[key][entry_type] += 1
-        timeline[key]["total"] += 1
+        for entry_type, count in bucket["types"].items():
+            timeline[key][entry_type] += count
+        timeline[key]["total"] += bucket["total"]
 
     # Convert to list sorted by time
     result = []
@@ -159,72 +148,18 @@ async def get_learning_progress(time_range: TimeRange = TimeRange.MONTH):
         - Topic mastery levels
         - Learning streak information
     """
-    cutoff = _get_time_cutoff(time_range)
-    history = history_manager._load_history()
-
-    # Filter by time range
-    filtered_history = [
-        entry for entry in history
-        if entry.get("timestamp", 0) >= cutoff
-    ]
-
-    # Track questions and solving sessions
-    question_sessions = []
-    solve_sessions = []
-    research_sessions = []
-
-    for entry in filtered_history:
-        entry_type = entry.get("type", "")
-        timestamp = entry.get("timestamp", 0)
-        content = entry.get("content", {})
-
-        if entry_type == "question":
-            if isinstance(content, dict):
-                question_sessions.append({
-                    "timestamp": timestamp,
-                    "topic": entry.get("title", ""),
-                    "count": content.get("count", 1),
-                })
-        elif entry_type == "solve":
-            solve_sessions.append({
-                "timestamp": timestamp,
-                "topic": entry.get("title", ""),
-            })
-        elif entry_type == "research":
-            research_sessions.append({
-                "timestamp": timestamp,
-                "topic": entry.get("title", ""),
-            })
-
-    # Calculate daily activity for streak
-    daily_activity = set()
-    for entry in filtered_history:
-        timestamp = entry.get("timestamp", 0)
-        date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
-        daily_activity.add(date)
-
-    # Calculate current streak
-    today = datetime.now().strftime("%Y-%m-%d")
-    streak = 0
-    current_date = datetime.now()
-
-    while True:
-        date_str = current_date.strftime("%Y-%m-%d")
-        if date_str in daily_activity:
-            streak += 1
-            current_date = datetime.fromtimestamp(current_date.timestamp() - 86400)
-        else:
-            break
+    summary = _get_rollups().summarize(_get_time_cutoff(time_range))
+    daily_activity = summary["dates"]
 
     return {
         "time_range": time_range,
-        "question_sessions": len(question_sessions),
-        "solve_sessions": len(solve_sessions),
-        "research_sessions": len(research_sessions),
-        "total_sessions": len(filtered_history),
-        "current_streak": streak,
+        "question_sessions": summary["types"].get("question", 0),
+        "solve_sessions": summary["types"].get("solve", 0),
+        "research_sessions": summary["types"].get("research", 0),
+        "total_sessions": summary["total"],
+        "current_streak": _current_streak(daily_activity),
         "active_days": len(daily_activity),
-        "daily_average": round(len(filtered_history) / max(len(daily_activity), 1), 2),
+        "daily_average": round(summary["total"] / max(len(daily_activity), 1), 2),
     }
 
 
@@ -238,36 +173,7 @@ async def get_topic_analysis(time_range: TimeRange = TimeRange.MONTH):
         - Topic categorization (strength vs gap based on activity)
         - Recommended focus areas
     """
-    cutoff = _get_time_cutoff(time_range)
-    history = history_manager._load_history()
-
-    # Filter by time range
-    filtered_history = [
-        entry for entry in history
-        if entry.get("timestamp", 0) >= cutoff
-    ]
-
-    # Track topic frequency and recency
-    topic_data = defaultdict(lambda: {
-        "count": 0,
-        "last_accessed": 0,
-        "types": defaultdict(int),
-    })
-
-    for entry in filtered_history:
-        title = entry.get("title", "").strip()
-        if not title:
-            continue
-
-        # Normalize topic name (first 50 chars)
-        topic = title[:50]
-
-        topic_data[topic]["count"] += 1
-        topic_data[topic]["last_accessed"] = max(
-            topic_data[topic]["last_accessed"],
-            entry.get("timestamp", 0)
-        )
-        topic_data[topic]["types"][entry.get("type", "unknown")] += 1
+    topic_data = _get_rollups().summarize(_get_time_cutoff(time_range))["topics"]
 
     # Sort by frequency and categorize
     sorted_topics = sorted(
@@ -290,7 +196,7 @@ async def get_topic_analysis(time_range: TimeRange = TimeRange.MONTH):
     # Knowledge gaps: topics accessed only once or very long ago
     now = time.time()
     for topic, data in sorted_topics:
-        days_since_last = (now - data["last_accessed"]) / 86400
+        days_since_last = (now - data["last"]) / 86400
         if data["count"] == 1 or days_since_last > 14:
             knowledge_gaps.append({
                 "topic": topic,
@@ -327,15 +233,9 @@ async def get_predictive_metrics(time_range: TimeRange = TimeRange.MONTH):
         - Recommended study time
     """
     cutoff = _get_time_cutoff(time_range)
-    history = history_manager._load_history()
-
-    # Filter by time range
-    filtered_history = [
-        entry for entry in history
-        if entry.get("timestamp", 0) >= cutoff
-    ]
+    summary = _get_rollups().summarize(cutoff)
 
-    if not filtered_history:
+    if not summary["total"]:
         return {
             "time_range": time_range,
             "engagement_score": 0,
@@ -346,25 +246,15 @@ async def get_predictive_metrics(time_range: TimeRange = TimeRange.MONTH):
 
     # Calculate engagement score (activity frequency)
     days_in_range = max((time.time() - cutoff) / 86400, 1)
-    activities_per_day = len(filtered_history) / days_in_range
+    activities_per_day = summary["total"] / days_in_range
     engagement_score = min(100, int(activities_per_day * 33))  # 3+ activities/day = 100%
 
     # Calculate consistency score (spread of activity across days)
-    daily_activity = set()
-    for entry in filtered_history:
-        timestamp = entry.get("timestamp", 0)
-        date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
-        daily_activity.add(date)
-
+    daily_activity = summary["dates"]
     consistency_score = int((len(daily_activity) / days_in_range) * 100)
 
     # Calculate diversity score (variety of activity types)
-    activity_types = set()
-    for entry in filtered_history:
-        activity_types.add(entry.get("type", "unknown"))
-
-    diversity_score = min(100, len(activity_types) * 25)  # 4+ types = 100%
-
+    diversity_score = min(100, len(summary["types"]) * 25)  # 4+ types = 100%
     # Generate recommendations
     recommendations = []
 
@@ -386,7 +276,7 @@ async def get_predictive_metrics(time_range: TimeRange = TimeRange.MONTH):
         "consistency_score": consistency_score,
         "diversity_score": diversity_score,
         "overall_score": int((engagement_score + consistency_score + diversity_score) / 3),
-        "total_activities": len(filtered_history),
+        "total_activities": summary["total"],
         "active_days": len(daily_activity),
         "recommendations": recommendations,
     }
@@ -18,6 +18,7 @@ sys.path.insert(0, str(_project_root))
 
 from src.agents.chat import ChatAgent, SessionManager
 from src.api.utils.user_memory import get_user_memory_manager
+from src.api.utils.ws_batcher import WebSocketStreamBatcher
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm.config import get_llm_config
@@ -225,27 +226,35 @@ async def websocket_chat(websocket: WebSocket):
                         role = msg.get("role")
                         if role not in ("user", "assistant"):
                             continue
-                        history.append({"role": role, "content": msg.get("content", "")})
+                        entry = {"role": role, "content": msg.get("content", "")}
+                        if "token_count" in msg:
+                            entry["token_count"] = msg["token_count"]
+                            entry["token_encoding"] = msg.get("token_encoding")
+                        history.append(entry)
 
-                # Add user message to session (chat action only)
-                if action != "verify":
-                    session_manager.add_message(
-                        session_id=session_id,
-                        role="user",
-                        content=message,
-                    )
-
-                # Initialize ChatAgent
+                # Resolve LLM config (model also selects the token encoding for counts)
                 try:
                     llm_config = get_llm_config()
                     api_key = llm_config.api_key
                     base_url = llm_config.base_url
                     api_version = getattr(llm_config, "api_version", None)
+                    llm_model = llm_config.model
                 except Exception:
                     api_key = None
                     base_url = None
                     api_version = None
+                    llm_model = None
+
+                # Add user message to session (chat action only)
+                if action != "verify":
+                    session_manager.add_message(
+                        session_id=session_id,
+                        role="user",
+                        content=message,
+                        model=llm_model,
+                    )
 
+                # Initialize ChatAgent
                 agent = ChatAgent(
                     language=language,
                     config=config,
@@ -574,18 +583,20 @@ async def websocket_chat(websocket: WebSocket):
                         stream=True,
                     )
 
-                    async for chunk_data in stream_generator:
-                        if chunk_data["type"] == "chunk":
-                            await websocket.send_json(
-                                {
-                                    "type": "stream",
-                                    "content": chunk_data["content"],
-                                }
-                            )
-                            full_response += chunk_data["content"]
-                        elif chunk_data["type"] == "complete":
-                            full_response = chunk_data["response"]
-                            sources = chunk_data.get("sources", {"rag": [], "web": []})
+                    # Token chunks are coalesced into ~25ms frames; leaving the block flushes
+                    async with WebSocketStreamBatcher(websocket) as batcher:
+                        async for chunk_data in stream_generator:
+                            if chunk_data["type"] == "chunk":
+                                await batcher.send(
+                                    {
+                                        "type": "stream",
+                                        "content": chunk_data["content"],
+                                    }
+                                )
+                                full_response += chunk_data["content"]
+                            elif chunk_data["type"] == "complete":
+                                full_response = chunk_data["response"]
+                                sources = chunk_data.get("sources", {"rag": [], "web": []})
 
                 if action != "verify":
                     # Send sources if any
@@ -606,6 +617,7 @@ async def websocket_chat(websocket: WebSocket):
                         role="assistant",
                         content=full_response,
                         sources=sources if (sources.get("rag") or sources.get("web")) else None,
+                        model=llm_model,
                     )
 
                 logger.info(f"Chat completed: session={session_id}, {len(full_response)} chars")
@@ -4,7 +4,7 @@ import traceback
 from typing import Literal
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 # Ensure co_writer module can be imported
@@ -23,7 +23,7 @@ from src.agents.co_writer.edit_agent import (
 from src.agents.co_writer.narrator_agent import NarratorAgent
 from src.logging import get_logger
 from src.services.config import load_config_with_main
-from src.services.tts import get_tts_config
+from src.services.tts import get_tts_config, get_tts_synthesizer
 
 router = APIRouter()
 
@@ -187,6 +187,13 @@ class NarrateResponse(BaseModel):
     audio_error: str | None = None
 
 
+class NarrateAudioRequest(BaseModel):
+    """Audio-only narration request (for an already generated script)"""
+
+    script: str
+    voice: str | None = None  # If None, will use default value from config
+
+
 class ScriptOnlyRequest(BaseModel):
     """Script-only generation request"""
 
@@ -239,6 +246,24 @@ async def generate_script_only(request: ScriptOnlyRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/narrate/audio/stream")
+async def stream_narration_audio(request: NarrateAudioRequest):
+    """
+    Stream TTS audio (audio/mpeg) for a narration script
+
+    The script is synthesized in sentence chunks with bounded parallelism and sent
+    as each chunk (in order) is ready, so playback can start before the whole
+    script is synthesized. Scripts of any length are supported; cached audio is
+    sent immediately.
+    """
+    try:
+        narrator = get_narrator_agent()
+        audio = await narrator.stream_audio(request.script, voice=request.voice)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(audio, media_type="audio/mpeg")
+
+
 @router.get("/tts/status")
 async def get_tts_status():
     """
@@ -252,6 +277,7 @@ async def get_tts_status():
             "available": True,
             "model": tts_config.get("model"),
             "default_voice": tts_config.get("voice", "alloy"),
+            "synthesis": get_tts_synthesizer().get_stats(),
         }
     except ValueError as e:
         return {
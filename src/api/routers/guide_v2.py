@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -75,7 +76,7 @@ async def create_session(request: CreateSessionRequest) -> SessionResponse:
 
     _session_store.save_session(session_id, session_data)
 
-    _ledger_writer.append_event(
+    await _ledger_writer.append_event_async(
         session_id,
         {
             "event_type": "session_created",
@@ -107,7 +108,7 @@ async def start_session(session_id: str) -> SessionResponse:
     session_data["updated_at"] = datetime.now().isoformat()
     _session_store.save_session(session_id, session_data)
 
-    _ledger_writer.append_event(
+    await _ledger_writer.append_event_async(
         session_id,
         {
             "event_type": "session_started",
@@ -209,7 +210,7 @@ async def submit_answer(
 
     _learner_model_store.save_model(user_id, _learner_model_to_dict(learner_model))
 
-    _ledger_writer.append_event(
+    await _ledger_writer.append_event_async(
         session_id,
         {
             "event_type": "answer_submitted",
@@ -240,7 +241,7 @@ async def submit_answer(
 
 @router.get("/sessions/{session_id}/ledger", response_model=LedgerResponse)
 async def get_ledger(session_id: str) -> LedgerResponse:
-    events = _ledger_writer.read_events(session_id)
+    events = await asyncio.to_thread(_ledger_writer.read_events, session_id)
     return LedgerResponse(
         events=[
             LedgerEventSchema(
@@ -3,6 +3,7 @@ IdeaGen API Router
 Used to generate research ideas from notebook content
 """
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -270,7 +271,8 @@ async def websocket_ideagen(websocket: WebSocket):
             base_url=llm_config.base_url,
             api_version=getattr(llm_config, "api_version", None),
             model=llm_config.model,
-            progress_callback=None,  # We manually manage status here
+            progress_callback=None,  # Set below, once the knowledge points are filtered
+            max_concurrent_points=config.get("ideagen", {}).get("max_concurrent_points", 4),
         )
 
         filtered_points = await workflow.loose_filter(knowledge_points)
@@ -302,98 +304,107 @@ async def websocket_ideagen(websocket: WebSocket):
             await websocket.close()
             return
 
-        # ========== Stage 6-10: Process each knowledge point ==========
-        all_ideas = []
+        # ========== Stage 6-10: Process knowledge points in parallel ==========
         total_points = len(filtered_points)
-
-        for idx, point in enumerate(filtered_points):
-            point_name = point.get("knowledge_point", f"Point {idx + 1}")
-            logger.info(f"Processing knowledge point {idx + 1}/{total_points}: {point_name}")
-
-            # ========== Stage 6: EXPLORING ==========
-            await send_status(
-                websocket,
-                IdeaGenStage.EXPLORING,
-                f"Exploring research ideas for: {point_name} ({idx + 1}/{total_points})",
-                {"index": idx + 1, "total": total_points, "knowledge_point": point_name},
-                task_id=task_id,
-            )
-
-            research_ideas = await workflow.explore_ideas(point)
-            logger.info(f"Generated {len(research_ideas)} research ideas")
-
-            # ========== Stage 7: EXPLORED ==========
-            await send_status(
-                websocket,
-                IdeaGenStage.EXPLORED,
-                f"Generated {len(research_ideas)} research ideas for: {point_name}",
-                {
-                    "index": idx + 1,
-                    "ideas_count": len(research_ideas),
-                    "knowledge_point": point_name,
-                },
-                task_id=task_id,
-            )
-
-            if not research_ideas:
-                logger.warning("No ideas generated, skipping")
-                continue
-
-            # ========== Stage 8: STRICT_FILTERING ==========
-            await send_status(
-                websocket,
-                IdeaGenStage.STRICT_FILTERING,
-                f"Strictly filtering {len(research_ideas)} ideas for: {point_name}",
-                {
-                    "index": idx + 1,
-                    "ideas_count": len(research_ideas),
-                    "knowledge_point": point_name,
-                },
-                task_id=task_id,
-            )
-
-            kept_ideas = await workflow.strict_filter(point, research_ideas)
-            logger.info(f"Kept {len(kept_ideas)} ideas after strict filter")
-
-            if not kept_ideas:
-                logger.warning("No ideas kept, skipping")
-                continue
-
-            # ========== Stage 9: GENERATING ==========
-            await send_status(
-                websocket,
-                IdeaGenStage.GENERATING,
-                f"Generating statement for: {point_name}",
-                {"index": idx + 1, "kept_ideas": len(kept_ideas), "knowledge_point": point_name},
-                task_id=task_id,
-            )
-
-            statement = await workflow.generate_statement(point, kept_ideas)
-            logger.info(f"Statement generated ({len(statement)} chars)")
-
-            idea_result = {
-                "id": f"idea-{idx}",
-                "knowledge_point": point_name,
+        # Points progress concurrently; keep their websocket messages from interleaving
+        send_lock = asyncio.Lock()
+        # Points finish out of order, so progress counts finished points, not indices
+        completed_points = 0
+
+        def to_idea(result: dict) -> dict:
+            point = result["knowledge_point"]
+            return {
+                "id": f"idea-{result['index'] - 1}",
+                "knowledge_point": point.get("knowledge_point", f"Point {result['index']}"),
                 "description": point.get("description", ""),
-                "research_ideas": kept_ideas,
-                "statement": statement,
+                "research_ideas": result["research_ideas"],
+                "statement": result["statement"],
                 "expanded": False,
             }
-            all_ideas.append(idea_result)
-
-            # ========== Stage 10: IDEA_READY ==========
-            # Send status message
-            await send_status(
-                websocket,
-                IdeaGenStage.IDEA_READY,
-                f"Research idea ready: {point_name}",
-                {"index": idx + 1, "total": total_points},
-                task_id=task_id,
-            )
 
-            # Important: Also send type="idea" message, frontend needs this to render ideas
-            await websocket.send_json({"type": "idea", "data": idea_result})
-            logger.info(f"Sent idea to frontend: {point_name}")
+        async def on_progress(stage: str, data: dict):
+            nonlocal completed_points
+            index, point_name = data["index"], data["knowledge_point"]
+            status = data["status"]
+            async with send_lock:
+                if stage == "explore" and status == "processing":
+                    # ========== Stage 6: EXPLORING ==========
+                    await send_status(
+                        websocket,
+                        IdeaGenStage.EXPLORING,
+                        f"Exploring research ideas for: {point_name} ({index}/{total_points})",
+                        {
+                            "index": index,
+                            "completed": completed_points,
+                            "total": total_points,
+                            "knowledge_point": point_name,
+                        },
+                        task_id=task_id,
+                    )
+                elif stage == "explore":
+                    # ========== Stage 7: EXPLORED ==========
+                    await send_status(
+                        websocket,
+                        IdeaGenStage.EXPLORED,
+                        f"Generated {data['ideas_count']} research ideas for: {point_name}",
+                        {
+                            "index": index,
+                            "ideas_count": data["ideas_count"],
+                            "knowledge_point": point_name,
+                        },
+                        task_id=task_id,
+                    )
+                elif stage == "filter" and status == "processing":
+                    # ========== Stage 8: STRICT_FILTERING ==========
+                    await send_status(
+                        websocket,
+                        IdeaGenStage.STRICT_FILTERING,
+                        f"Strictly filtering {data['ideas_count']} ideas for: {point_name}",
+                        {
+                            "index": index,
+                            "ideas_count": data["ideas_count"],
+                            "knowledge_point": point_name,
+                        },
+                        task_id=task_id,
+                    )
+                elif stage == "filter":
+                    logger.info(f"Kept {data['kept']} ideas after strict filter: {point_name}")
+                elif stage == "statement":
+                    # ========== Stage 9: GENERATING ==========
+                    await send_status(
+                        websocket,
+                        IdeaGenStage.GENERATING,
+                        f"Generating statement for: {point_name}",
+                        {"index": index, "kept_ideas": data["kept"], "knowledge_point": point_name},
+                        task_id=task_id,
+                    )
+                elif stage == "idea":
+                    # ========== Stage 10: IDEA_READY ==========
+                    await send_status(
+                        websocket,
+                        IdeaGenStage.IDEA_READY,
+                        f"Research idea ready: {point_name}",
+                        {"index": index, "completed": completed_points, "total": total_points},
+                        task_id=task_id,
+                    )
+                    # Important: Also send type="idea" message, frontend needs this to render ideas
+                    await websocket.send_json({"type": "idea", "data": to_idea(data["result"])})
+                    logger.info(f"Sent idea to frontend: {point_name}")
+                elif stage == "point":
+                    # Sent for every finished point, including those that yielded no idea
+                    completed_points = max(completed_points, data["completed"])
+                    await websocket.send_json(
+                        {
+                            "type": "progress",
+                            "data": {"completed": completed_points, "total": total_points},
+                        }
+                    )
+
+        workflow.progress_callback = on_progress
+        results = await workflow.process_points(filtered_points)
+        # Ideas are streamed in completion order (the frontend sorts them by id);
+        # the final list keeps input order
+        all_ideas = [to_idea(result) for result in results if result is not None]
 
         # ========== Stage 11: COMPLETE ==========
         logger.success(
@@ -29,6 +29,7 @@ from src.api.utils.progress_broadcaster import ProgressBroadcaster
 from src.api.utils.task_id_manager import TaskIDManager
 from src.knowledge.add_documents import DocumentAdder
 from src.knowledge.initializer import KnowledgeBaseInitializer
+from src.knowledge.kb_stats import get_kb_stats_cache
 from src.knowledge.manager import KnowledgeBaseManager
 from src.knowledge.progress_tracker import ProgressStage, ProgressTracker
 from src.utils.document_validator import DocumentValidator
@@ -39,6 +40,7 @@ sys.path.insert(0, str(_project_root))
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm import get_llm_config
+from src.services.webhooks import WebhookEventType, emit_webhook_event_async
 
 # Initialize logger with config
 project_root = Path(__file__).parent.parent.parent.parent
@@ -107,6 +109,10 @@ async def run_initialization_task(initializer: KnowledgeBaseInitializer):
 
         logger.success(f"[{task_id}] KB '{initializer.kb_name}' initialized")
         task_manager.update_task_status(task_id, "completed")
+        await emit_webhook_event_async(
+            WebhookEventType.KNOWLEDGE_BASE_UPDATED,
+            {"kb_name": initializer.kb_name, "action": "initialized", "task_id": task_id},
+        )
     except Exception as e:
         error_msg = str(e)
 
@@ -177,6 +183,15 @@ async def run_upload_processing_task(
 
         logger.success(f"[{task_id}] Processed {len(processed_files)} files to KB '{kb_name}'")
         task_manager.update_task_status(task_id, "completed")
+        await emit_webhook_event_async(
+            WebhookEventType.KNOWLEDGE_BASE_UPDATED,
+            {
+                "kb_name": kb_name,
+                "action": "documents_added",
+                "task_id": task_id,
+                "files": [Path(p).name for p in processed_files],
+            },
+        )
     except Exception as e:
         error_msg = f"Upload processing failed (KB '{kb_name}'): {e}"
         logger.error(f"[{task_id}] {error_msg}")
@@ -341,6 +356,8 @@ async def upload_files(
 
         uploaded_files = []
         uploaded_file_paths = []
+        new_raw_files = 0
+        raw_snapshot = get_kb_stats_cache().snapshot(kb_path)
 
         # 1. Save files and validate size during streaming
         for file in files:
@@ -352,6 +369,7 @@ async def upload_files(
 
                 # Save file to disk with size checking during streaming
                 file_path = raw_dir / file.filename
+                is_new_file = not file_path.exists()
                 max_size = DocumentValidator.MAX_FILE_SIZE
                 written_bytes = 0
                 with open(file_path, "wb") as buffer:
@@ -371,6 +389,7 @@ async def upload_files(
 
                 uploaded_files.append(file.filename)
                 uploaded_file_paths.append(str(file_path))
+                new_raw_files += is_new_file
 
             except Exception as e:
                 # Clean up partially saved file
@@ -387,6 +406,8 @@ async def upload_files(
                 raise HTTPException(status_code=400, detail=error_message) from e
 
         logger.info(f"Uploading {len(uploaded_files)} files to KB '{kb_name}'")
+        if new_raw_files:
+            get_kb_stats_cache().record(kb_path, raw_snapshot, raw_documents=new_raw_files)
 
         background_tasks.add_task(
             run_upload_processing_task,
@@ -7,6 +7,10 @@ Provides endpoints for real-time performance monitoring:
 - GET /metrics/agents - Per-agent aggregated stats
 - GET /metrics/modules - Per-module statistics
 - GET /metrics/history - Historical metrics data
+- GET /metrics/latency - p50/p90/p95/p99 latency per module, agent and model
+- GET /metrics/prometheus - Prometheus text exposition
+- GET /metrics/llm-cache - LLM response cache hit/miss statistics
+- GET /metrics/single-flight - Coalesced duplicate LLM/RAG/search call counts
 - POST /metrics/export - Export metrics report
 - POST /metrics/reset - Reset all metrics
 - WebSocket /metrics/stream - Real-time metrics stream
@@ -18,6 +22,7 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from src.di import get_container
@@ -160,6 +165,30 @@ async def get_metrics_history(
     return service.get_history(limit=limit, module=module)
 
 
+@router.get("/latency")
+async def get_latency_percentiles(
+    module: str | None = Query(None, description="Filter by module name"),
+):
+    """
+    Get streaming latency percentiles.
+
+    Returns one entry per (module, agent, model) with p50/p90/p95/p99 durations in ms.
+    """
+    service = get_container().metrics_service()
+    return service.get_latency_percentiles(module=module)
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """
+    Get metrics in the Prometheus text exposition format (for scraping).
+    """
+    service = get_container().metrics_service()
+    return PlainTextResponse(
+        service.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @router.get("/active")
 async def get_active_metrics():
     """
@@ -171,6 +200,44 @@ async def get_active_metrics():
     return service.get_active_metrics()
 
 
+@router.get("/llm-cache")
+async def get_llm_cache_stats():
+    """
+    Get LLM response cache statistics.
+
+    Returns hit/miss/write counts, hit rate and the active cache mode.
+    """
+    from src.services.llm.response_cache import get_llm_response_cache
+
+    return get_llm_response_cache().get_stats()
+
+
+@router.get("/single-flight")
+async def get_single_flight_stats():
+    """
+    Get request coalescing statistics.
+
+    Returns call, execution and coalesced counts per group
+    (llm.complete, rag.search, web_search).
+    """
+    from src.utils.network.single_flight import get_single_flight_stats as _collect
+
+    return _collect()
+
+
+@router.get("/tool-resilience")
+async def get_tool_resilience_stats():
+    """
+    Get tool call resilience statistics.
+
+    Returns retry, timeout, hedge and circuit breaker counters plus latency
+    percentiles per tool (research.tools).
+    """
+    from src.utils.network.resilience import get_resilience_stats
+
+    return get_resilience_stats()
+
+
 @router.post("/export", response_model=ExportResponse)
 async def export_metrics_report():
     """
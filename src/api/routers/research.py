@@ -12,9 +12,11 @@ from src.agents.research.agents import RephraseAgent
 from src.agents.research.research_pipeline import ResearchPipeline
 from src.api.utils.history import ActivityType, history_manager
 from src.api.utils.task_id_manager import TaskIDManager
+from src.api.utils.ws_batcher import WebSocketStreamBatcher
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm import get_llm_config
+from src.services.webhooks import WebhookEventType, emit_webhook_event_async
 
 # Force stdout to use utf-8 to prevent encoding errors with emojis on Windows
 if sys.platform == "win32":
@@ -83,6 +85,8 @@ async def websocket_research_run(websocket: WebSocket):
 
     pusher_task = None
     progress_pusher_task = None
+    # Log/progress/result messages share one batcher so frames stay ordered
+    batcher = WebSocketStreamBatcher(websocket)
     original_stdout = sys.stdout  # Save original stdout at the start
 
     try:
@@ -285,7 +289,7 @@ async def websocket_research_run(websocket: WebSocket):
                     log = await log_queue.get()
                     if log is None:
                         break
-                    await websocket.send_json({"type": "log", "content": log})
+                    await batcher.send({"type": "log", "content": log})
                     log_queue.task_done()
                 except Exception as e:
                     logger.error(f"Log pusher error: {e}")
@@ -298,7 +302,7 @@ async def websocket_research_run(websocket: WebSocket):
                     event = await progress_queue.get()
                     if event is None:
                         break
-                    await websocket.send_json(event)
+                    await batcher.send(event)
                     progress_queue.task_done()
                 except Exception as e:
                     logger.error(f"Progress pusher error: {e}")
@@ -332,7 +336,7 @@ async def websocket_research_run(websocket: WebSocket):
         sys.stdout = ResearchStdoutInterceptor(log_queue)
 
         try:
-            await websocket.send_json(
+            await batcher.send_json(
                 {"type": "status", "content": "started", "research_id": pipeline.research_id}
             )
 
@@ -350,7 +354,7 @@ async def websocket_research_run(websocket: WebSocket):
                 summary=f"Research ID: {result['research_id']}",
             )
 
-            await websocket.send_json(
+            await batcher.send_json(
                 {
                     "type": "result",
                     "report": report_content,
@@ -359,6 +363,18 @@ async def websocket_research_run(websocket: WebSocket):
                 }
             )
 
+            await emit_webhook_event_async(
+                WebhookEventType.WORKFLOW_COMPLETED,
+                {
+                    "workflow": "research",
+                    "task_id": task_id,
+                    "research_id": result["research_id"],
+                    "topic": topic,
+                    "kb_name": kb_name,
+                    "report_path": str(result["final_report_path"]),
+                },
+            )
+
             # Update task status to completed
             try:
                 log_dir = config.get("paths", {}).get("user_log_dir") or config.get(
@@ -374,7 +390,7 @@ async def websocket_research_run(websocket: WebSocket):
             sys.stdout = original_stdout  # Safely restore using saved reference
 
     except Exception as e:
-        await websocket.send_json({"type": "error", "content": str(e)})
+        await batcher.send_json({"type": "error", "content": str(e)})
         logging.error(f"Research error: {e}", exc_info=True)
 
         # Update task status to error
@@ -392,3 +408,4 @@ async def websocket_research_run(websocket: WebSocket):
             pusher_task.cancel()
         if progress_pusher_task:
             progress_pusher_task.cancel()
+        await batcher.aclose()
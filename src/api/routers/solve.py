@@ -18,11 +18,13 @@ from src.api.utils.history import ActivityType, history_manager
 from src.api.utils.log_interceptor import LogInterceptor
 from src.api.utils.task_id_manager import TaskIDManager
 from src.api.utils.user_memory import get_user_memory_manager
+from src.api.utils.ws_batcher import WebSocketStreamBatcher
 
 _project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(_project_root))
 from src.logging import get_logger
 from src.services.config import load_config_with_main
+from src.services.webhooks import WebhookEventType, emit_webhook_event_async
 
 # Initialize logger with config
 project_root = Path(__file__).parent.parent.parent.parent
@@ -125,6 +127,9 @@ async def websocket_solve(websocket: WebSocket):
 
         # 5. Background task to push logs to WebSocket
         connection_closed = asyncio.Event()
+        # All outgoing messages share one batcher so frames stay ordered; superseded
+        # agent_status/token_stats/progress updates are dropped when the client lags
+        batcher = WebSocketStreamBatcher(websocket)
 
         async def log_pusher():
             while not connection_closed.is_set():
@@ -132,7 +137,7 @@ async def websocket_solve(websocket: WebSocket):
                     # Use timeout to periodically check if connection is closed
                     entry = await asyncio.wait_for(log_queue.get(), timeout=0.5)
                     try:
-                        await websocket.send_json(entry)
+                        await batcher.send(entry)
                     except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
                         # Connection closed, stop pushing
                         logger.debug(f"WebSocket connection closed in log_pusher: {e}")
@@ -157,7 +162,7 @@ async def websocket_solve(websocket: WebSocket):
             if connection_closed.is_set():
                 return False
             try:
-                await websocket.send_json(data)
+                await batcher.send_json(data)
                 return True
             except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
                 logger.debug(f"WebSocket connection closed: {e}")
@@ -239,6 +244,17 @@ async def websocket_solve(websocket: WebSocket):
                 }
                 await safe_send_json(final_res)
 
+                await emit_webhook_event_async(
+                    WebhookEventType.WORKFLOW_COMPLETED,
+                    {
+                        "workflow": "solve",
+                        "task_id": task_id,
+                        "kb_name": kb_name,
+                        "question": question,
+                        "output_dir": output_dir_str,
+                    },
+                )
+
                 # Save to history
                 history_manager.add_entry(
                     activity_type=ActivityType.SOLVE,
@@ -286,6 +302,12 @@ async def websocket_solve(websocket: WebSocket):
             except Exception as e:
                 logger.debug(f"Error waiting for pusher task: {e}")
 
+            # Deliver anything still queued, then stop the batcher's writer
+            try:
+                await batcher.close()
+            except Exception as e:
+                logger.debug(f"Error flushing WebSocket batcher: {e}")
+
             # Close WebSocket connection
             try:
                 # Check if connection is still open before closing
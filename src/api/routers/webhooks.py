@@ -0,0 +1,103 @@
+"""
+Webhooks API Router
+Register webhook endpoints, send test events and inspect delivery history.
+Deliveries themselves are made by the background engine in src.services.webhooks.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+
+from src.services.webhooks import (
+    WebhookConfig,
+    WebhookCreateRequest,
+    WebhookDelivery,
+    WebhookDeliveryStatus,
+    WebhookTestRequest,
+    WebhookUpdateRequest,
+    get_webhook_engine,
+    get_webhook_store,
+)
+
+router = APIRouter()
+
+
+def _public(config: WebhookConfig) -> dict:
+    """Webhook config with the signing secret redacted."""
+    data = config.model_dump(mode="json")
+    data["secret"] = "********" if config.secret else ""
+    return data
+
+
+@router.get("")
+async def list_webhooks():
+    webhooks = await asyncio.to_thread(get_webhook_store().list_webhooks)
+    return {"webhooks": [_public(w) for w in webhooks]}
+
+
+@router.post("")
+async def create_webhook(request: WebhookCreateRequest):
+    """Create a webhook. The response is the only time the secret is returned."""
+    config = await asyncio.to_thread(get_webhook_store().create_webhook, request)
+    return config.model_dump(mode="json")
+
+
+@router.get("/stats")
+async def get_webhook_stats():
+    counts = await asyncio.to_thread(get_webhook_store().count_by_status)
+    return {"deliveries": counts, "engine": get_webhook_engine().get_stats()}
+
+
+@router.get("/deliveries/{delivery_id}", response_model=WebhookDelivery)
+async def get_delivery(delivery_id: str):
+    delivery = await asyncio.to_thread(get_webhook_store().get_delivery, delivery_id)
+    if delivery is None:
+        raise HTTPException(status_code=404, detail="Delivery not found")
+    return delivery
+
+
+@router.get("/{webhook_id}")
+async def get_webhook(webhook_id: str):
+    config = await asyncio.to_thread(get_webhook_store().get_webhook, webhook_id)
+    if config is None:
+        raise HTTPException(status_code=404, detail="Webhook not found")
+    return _public(config)
+
+
+@router.patch("/{webhook_id}")
+async def update_webhook(webhook_id: str, request: WebhookUpdateRequest):
+    config = await asyncio.to_thread(get_webhook_store().update_webhook, webhook_id, request)
+    if config is None:
+        raise HTTPException(status_code=404, detail="Webhook not found")
+    return _public(config)
+
+
+@router.delete("/{webhook_id}")
+async def delete_webhook(webhook_id: str):
+    deleted = await asyncio.to_thread(get_webhook_store().delete_webhook, webhook_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Webhook not found")
+    return {"success": True}
+
+
+@router.post("/{webhook_id}/test", response_model=WebhookDelivery)
+async def test_webhook(webhook_id: str, request: WebhookTestRequest):
+    """Queue a delivery to this webhook only, regardless of its event subscriptions."""
+    store = get_webhook_store()
+    config = await asyncio.to_thread(store.get_webhook, webhook_id)
+    if config is None:
+        raise HTTPException(status_code=404, detail="Webhook not found")
+    payload = request.payload or {"test": True}
+    deliveries = await asyncio.to_thread(store.enqueue, request.event_type, payload, [config])
+    get_webhook_engine().notify()
+    return deliveries[0]
+
+
+@router.get("/{webhook_id}/deliveries")
+async def list_deliveries(
+    webhook_id: str, status: WebhookDeliveryStatus | None = None, limit: int = 50
+):
+    deliveries = await asyncio.to_thread(
+        get_webhook_store().list_deliveries, webhook_id, status, min(max(limit, 1), 500)
+    )
+    return {"deliveries": [d.model_dump(mode="json") for d in deliveries]}
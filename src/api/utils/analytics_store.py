@@ -0,0 +1,349 @@
+"""
+AnalyticsStore - Incremental rollups of history entries for the analytics dashboard.
+
+Every history entry is folded into an hourly and a daily bucket when it is
+recorded, so dashboard queries read O(buckets) instead of reloading and
+rescanning the whole history:
+
+    {
+        "hourly": {"2025-01-31 14:00": bucket, ...},   # kept for HOURLY_RETENTION_DAYS
+        "daily":  {"2025-01-31": bucket, ...},         # kept forever
+    }
+
+    bucket = {
+        "start": <epoch seconds of the bucket start, local time>,
+        "total": 3,
+        "types": {"solve": 2, "question": 1},
+        "tokens": 1234,
+        "cost": 0.01,
+        "topics": {"<title[:50]>": {"count": 2, "last": <epoch>, "types": {...}}},
+    }
+
+Bucket keys use local time, matching how the analytics router formats dates.
+Each bucket keeps at most MAX_TOPICS_PER_BUCKET topics; when a new topic arrives
+in a full bucket, the least used one is dropped, so topic counts are approximate
+for very busy days.
+
+Rollups are stored in data/user/analytics_rollups.json and cached in memory
+(reloaded when the file changes on disk). Recorded entries are written back at
+most once per ``save_delay`` seconds (and at exit), not on every record.
+HistoryManager records every new entry; ``scripts/backfill_analytics.py`` builds
+rollups for existing history. Rollups carry a ``backfilled_at`` marker, and until
+it is set the first use rebuilds them from the full history rather than
+recording onto an empty store.
+"""
+
+import atexit
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any, Iterable
+import weakref
+
+HOURLY_RETENTION_DAYS = 35
+TOPIC_LENGTH = 50
+MAX_TOPICS_PER_BUCKET = 200
+# Seconds between a record and the write that persists it
+DEFAULT_SAVE_DELAY = 2.0
+
+# Stores with unsaved records, flushed at exit
+_live_stores: "weakref.WeakSet[AnalyticsStore]" = weakref.WeakSet()
+
+
+def _new_bucket(start: float) -> dict[str, Any]:
+    return {"start": start, "total": 0, "types": {}, "tokens": 0, "cost": 0.0, "topics": {}}
+
+
+def merge_bucket(into: dict[str, Any], bucket: dict[str, Any]) -> dict[str, Any]:
+    """Add one bucket's counters into another (topics included)."""
+    into["total"] += bucket.get("total", 0)
+    into["tokens"] += bucket.get("tokens", 0)
+    into["cost"] += bucket.get("cost", 0.0)
+    for entry_type, count in bucket.get("types", {}).items():
+        into["types"][entry_type] = into["types"].get(entry_type, 0) + count
+    for topic, data in bucket.get("topics", {}).items():
+        merged = into["topics"].setdefault(topic, {"count": 0, "last": 0, "types": {}})
+        merged["count"] += data.get("count", 0)
+        merged["last"] = max(merged["last"], data.get("last", 0))
+        for entry_type, count in data.get("types", {}).items():
+            merged["types"][entry_type] = merged["types"].get(entry_type, 0) + count
+    return into
+
+
+def _add_topic(topics: dict[str, Any], topic: str) -> dict[str, Any]:
+    """Get a bucket's topic counters, evicting the least used topic if the bucket is full."""
+    data = topics.get(topic)
+    if data is None:
+        if len(topics) >= MAX_TOPICS_PER_BUCKET:
+            least_used = min(topics, key=lambda t: (topics[t]["count"], topics[t]["last"]))
+            del topics[least_used]
+        data = topics[topic] = {"count": 0, "last": 0, "types": {}}
+    return data
+
+
+class AnalyticsStore:
+    def __init__(self, base_dir: str | Path | None = None, save_delay: float = DEFAULT_SAVE_DELAY):
+        """
+        Analytics rollup store
+
+        Args:
+            base_dir: Directory holding analytics_rollups.json. Defaults to
+                      project_root/data/user (next to user_history.json)
+            save_delay: Seconds to batch records before writing the file
+                        (0 writes on every record)
+        """
+        if base_dir is None:
+            project_root = Path(__file__).resolve().parents[3]
+            base_dir_path = project_root / "data" / "user"
+        else:
+            base_dir_path = Path(base_dir)
+
+        self.base_dir = base_dir_path
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.rollup_file = self.base_dir / "analytics_rollups.json"
+
+        self._lock = threading.RLock()
+        self._data: dict[str, Any] | None = None
+        self._mtime_ns: int | None = None
+        self.save_delay = save_delay
+        self._dirty = False
+        self._save_timer: threading.Timer | None = None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def is_backfilled(self) -> bool:
+        """Whether the rollups were built from existing history (not just new entries)."""
+        with self._lock:
+            return "backfilled_at" in self._load()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            mtime_ns = self.rollup_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if self._data is not None and (self._dirty or mtime_ns == self._mtime_ns):
+            # Unsaved records win over changes made on disk meanwhile
+            return self._data
+
+        data: dict[str, Any] = {"version": "1.0", "hourly": {}, "daily": {}}
+        if mtime_ns is not None:
+            try:
+                with open(self.rollup_file, encoding="utf-8") as f:
+                    loaded = json.load(f)
+                if isinstance(loaded, dict):
+                    data["hourly"] = loaded.get("hourly", {}) or {}
+                    data["daily"] = loaded.get("daily", {}) or {}
+                    data["last_timestamp"] = loaded.get("last_timestamp", 0)
+                    if "backfilled_at" in loaded:
+                        data["backfilled_at"] = loaded["backfilled_at"]
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        self._data = data
+        self._mtime_ns = mtime_ns
+        return data
+
+    def _save(self, data: dict[str, Any]) -> None:
+        data["updated_at"] = time.time()
+        fd, tmp_path = tempfile.mkstemp(
+            prefix="analytics_rollups.", suffix=".tmp", dir=str(self.base_dir)
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.rollup_file)
+        except Exception:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            raise
+        self._mtime_ns = self.rollup_file.stat().st_mtime_ns
+        self._dirty = False
+
+    def _schedule_save(self) -> None:
+        """Mark the rollups dirty and write them once ``save_delay`` has passed."""
+        if self.save_delay <= 0:
+            self._save(self._data)
+            return
+        self._dirty = True
+        _live_stores.add(self)
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending records to disk now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty and self._data is not None:
+                self._save(self._data)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, entry: dict[str, Any]) -> None:
+        """Fold one history entry into its hourly and daily buckets."""
+        self.record_many([entry])
+
+    def record_many(self, entries: Iterable[dict[str, Any]]) -> int:
+        with self._lock:
+            data = self._load()
+            count = 0
+            for entry in entries:
+                self._apply(data, entry)
+                count += 1
+            self._prune(data)
+            self._schedule_save()
+            return count
+
+    def backfill(self, entries: Iterable[dict[str, Any]], merge: bool = False) -> int:
+        """
+        Build rollups from existing history entries.
+
+        Args:
+            entries: History entries (any order)
+            merge: Keep existing rollups and only add entries newer than the
+                   newest one already recorded; otherwise rebuild from scratch
+
+        Returns:
+            Number of entries applied
+        """
+        with self._lock:
+            if merge:
+                data = self._load()
+                newest = data.get("last_timestamp", 0)
+                entries = [e for e in entries if self._timestamp(e) > newest]
+            else:
+                self.flush()
+                self._data = {"version": "1.0", "hourly": {}, "daily": {}}
+                self._mtime_ns = None
+                data = self._data
+
+            count = 0
+            for entry in entries:
+                self._apply(data, entry)
+                count += 1
+            self._prune(data)
+            data["backfilled_at"] = time.time()
+            self._save(data)
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            return count
+
+    @staticmethod
+    def _timestamp(entry: dict[str, Any]) -> float:
+        try:
+            return float(entry.get("timestamp", 0) or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _apply(self, data: dict[str, Any], entry: dict[str, Any]) -> None:
+        timestamp = self._timestamp(entry)
+        raw_type = entry.get("type", "unknown")
+        entry_type = str(getattr(raw_type, "value", raw_type))
+        data["last_timestamp"] = max(data.get("last_timestamp", 0), timestamp)
+
+        tokens = 0
+        cost = 0.0
+        content = entry.get("content", {})
+        if isinstance(content, dict):
+            token_stats = content.get("token_stats", {})
+            if isinstance(token_stats, dict):
+                tokens = token_stats.get("tokens", 0) or 0
+                cost = token_stats.get("cost", 0) or 0.0
+
+        title = str(entry.get("title", "") or "").strip()
+        topic = title[:TOPIC_LENGTH] if title else None
+
+        dt = datetime.fromtimestamp(timestamp)
+        hour_start = dt.replace(minute=0, second=0, microsecond=0)
+        day_start = hour_start.replace(hour=0)
+        for table, key, start in (
+            ("hourly", hour_start.strftime("%Y-%m-%d %H:00"), hour_start.timestamp()),
+            ("daily", day_start.strftime("%Y-%m-%d"), day_start.timestamp()),
+        ):
+            bucket = data[table].get(key)
+            if bucket is None:
+                bucket = _new_bucket(start)
+                data[table][key] = bucket
+            bucket["total"] += 1
+            bucket["types"][entry_type] = bucket["types"].get(entry_type, 0) + 1
+            bucket["tokens"] += tokens
+            bucket["cost"] += cost
+            if topic:
+                topic_data = _add_topic(bucket["topics"], topic)
+                topic_data["count"] += 1
+                topic_data["last"] = max(topic_data["last"], timestamp)
+                topic_data["types"][entry_type] = topic_data["types"].get(entry_type, 0) + 1
+
+    @staticmethod
+    def _prune(data: dict[str, Any]) -> None:
+        cutoff = time.time() - HOURLY_RETENTION_DAYS * 86400
+        stale = [k for k, b in data["hourly"].items() if b.get("start", 0) < cutoff]
+        for key in stale:
+            del data["hourly"][key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_buckets(self, since: float = 0) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Buckets covering ``since`` .. now, oldest first.
+
+        Hourly buckets (key "YYYY-MM-DD HH:00") are used when ``since`` falls inside
+        the hourly retention window, daily buckets (key "YYYY-MM-DD") otherwise. The
+        first bucket may start up to one bucket before ``since``.
+        """
+        with self._lock:
+            data = self._load()
+            hourly_floor = time.time() - HOURLY_RETENTION_DAYS * 86400
+            if since and since >= hourly_floor:
+                table, span = data["hourly"], 3600
+            else:
+                table, span = data["daily"], 86400
+            return sorted(
+                ((key, bucket) for key, bucket in table.items() if bucket["start"] + span > since),
+                key=lambda item: item[1]["start"],
+            )
+
+    def summarize(self, since: float = 0) -> dict[str, Any]:
+        """
+        Combined counters for ``since`` .. now.
+
+        Returns:
+            A merged bucket plus "dates": the set of active local dates
+        """
+        total = _new_bucket(since)
+        dates: set[str] = set()
+        for key, bucket in self.get_buckets(since):
+            merge_bucket(total, bucket)
+            if bucket.get("total"):
+                dates.add(key[:10])
+        total["dates"] = dates
+        return total
+
+
+def _flush_live_stores() -> None:
+    for store in list(_live_stores):
+        try:
+            store.flush()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_live_stores)
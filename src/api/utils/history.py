@@ -1,8 +1,13 @@
 from enum import Enum
 import json
+import logging
 from pathlib import Path
 import time
 
+from .analytics_store import AnalyticsStore
+
+logger = logging.getLogger(__name__)
+
 
 class ActivityType(str, Enum):
     SOLVE = "solve"
@@ -40,6 +45,9 @@ class HistoryManager:
         self.history_file = self.base_dir / "user_history.json"
         self._ensure_file()
 
+        # Incremental rollups for the analytics dashboard
+        self.analytics = AnalyticsStore(self.base_dir)
+
     def _ensure_file(self):
         """
         Ensure history file exists with correct format.
@@ -156,6 +164,15 @@ class HistoryManager:
             history = history[:100]
 
         self._save_history(history)
+
+        try:
+            if self.analytics.is_backfilled():
+                self.analytics.record(entry)
+            else:
+                # First entry since the rollups were introduced: include older history
+                self.analytics.backfill(history)
+        except Exception as e:
+            logger.warning(f"Failed to update analytics rollups: {e}")
         return entry
 
     def get_recent(self, limit: int = 10, type_filter: str | None = None) -> list[dict]:
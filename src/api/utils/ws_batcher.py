@@ -0,0 +1,257 @@
+"""
+WebSocket Stream Batcher - Coalesces streamed messages into fewer frames
+
+Token streams produce many tiny messages; sending each one as its own frame costs
+a JSON serialization and a socket write per token. The batcher queues outgoing
+messages and flushes them from one writer task when either the size threshold
+or the time window is reached:
+
+    async with WebSocketStreamBatcher(websocket) as batcher:
+        async for chunk in stream:
+            await batcher.send({"type": "stream", "content": chunk})
+        await batcher.send_json({"type": "result", "content": full})
+
+Message schema is unchanged:
+- Consecutive ``stream`` messages are merged by concatenating ``content``
+  (pending status updates in between don't break a run)
+- Status-like messages (``token_stats``, ``agent_status``, solve's
+  ``{stage, progress}`` updates) still waiting to be sent are replaced by newer
+  ones of the same kind; progress events carrying anything else (e.g. research's
+  per-block ``status``/``block_id``) are always delivered
+- Everything else is sent as-is, in order
+
+When the client is slow, messages pile up while a frame is being written and are
+merged into the next flush instead of growing an unbounded backlog of frames.
+"""
+
+import asyncio
+import json
+from typing import Any, Optional
+
+from fastapi import WebSocket
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Flush as soon as this many content characters are pending
+DEFAULT_FLUSH_CHARS = 2048
+# Otherwise flush this long after the first pending message
+DEFAULT_FLUSH_INTERVAL = 0.025
+
+# Message types whose ``content`` can be concatenated
+DEFAULT_MERGE_TYPES = ("stream",)
+# Message types where only the latest pending message matters, with the fields
+# that identify "the same" message
+DEFAULT_LATEST_ONLY = {
+    "token_stats": (),
+    "agent_status": ("agent",),
+    "progress": ("stage",),
+}
+# Latest-only types that are only replaced when a message has exactly these fields
+DEFAULT_LATEST_ONLY_FIELDS = {
+    "progress": frozenset({"type", "stage", "progress"}),
+}
+
+
+def dumps_message(message: dict[str, Any]) -> str:
+    """Serialize a message the way ``WebSocket.send_json`` does, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message).decode("utf-8")
+        except TypeError:
+            # e.g. non-str keys; let the stdlib handle (or reject) it
+            pass
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
+class WebSocketStreamBatcher:
+    """Batches outgoing WebSocket messages for a single connection"""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        flush_chars: int = DEFAULT_FLUSH_CHARS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        merge_types: tuple[str, ...] = DEFAULT_MERGE_TYPES,
+        latest_only: Optional[dict[str, tuple[str, ...]]] = None,
+        latest_only_fields: Optional[dict[str, frozenset[str]]] = None,
+    ):
+        self.websocket = websocket
+        self.flush_chars = flush_chars
+        self.flush_interval = flush_interval
+        self.merge_types = set(merge_types)
+        self.latest_only = DEFAULT_LATEST_ONLY if latest_only is None else latest_only
+        self.latest_only_fields = (
+            DEFAULT_LATEST_ONLY_FIELDS if latest_only_fields is None else latest_only_fields
+        )
+
+        # Pending messages; superseded latest-only entries become None
+        self._pending: list[Optional[dict[str, Any]]] = []
+        self._pending_chars = 0
+        self._latest_index: dict[tuple, int] = {}
+        # Last mergeable message; only status updates may sit between it and the tail
+        self._merge_index: Optional[int] = None
+
+        self._has_data = asyncio.Event()
+        self._flush_now = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._writer: Optional[asyncio.Task] = None
+
+        self._stats = {"messages": 0, "frames": 0, "merged": 0, "replaced": 0}
+
+    async def __aenter__(self) -> "WebSocketStreamBatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def send(self, message: dict[str, Any]) -> None:
+        """
+        Queue a message for the next flush.
+
+        Raises the writer's error (e.g. WebSocketDisconnect) if a previous flush failed.
+        """
+        self._raise_if_failed()
+        if self._closed:
+            raise RuntimeError("WebSocketStreamBatcher is closed")
+
+        self._stats["messages"] += 1
+        self._enqueue(message)
+        self._idle.clear()
+        self._has_data.set()
+        if self._pending_chars >= self.flush_chars:
+            self._flush_now.set()
+        self._ensure_writer()
+
+    async def send_json(self, message: dict[str, Any]) -> None:
+        """Send a message immediately, after everything queued before it."""
+        await self.send(message)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been written."""
+        self._raise_if_failed()
+        if not self._idle.is_set():
+            self._flush_now.set()
+            self._has_data.set()
+            await self._idle.wait()
+        self._raise_if_failed()
+
+    async def close(self) -> None:
+        """Flush pending messages and stop the writer task."""
+        try:
+            await self.flush()
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop the writer task without flushing."""
+        self._closed = True
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+            try:
+                await self._writer
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def get_stats(self) -> dict[str, int]:
+        """Get message/frame counters."""
+        return dict(self._stats)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _enqueue(self, message: dict[str, Any]) -> None:
+        msg_type = message.get("type")
+        content = message.get("content")
+
+        if msg_type in self.merge_types and isinstance(content, str):
+            tail = self._pending[self._merge_index] if self._merge_index is not None else None
+            if (
+                tail is not None
+                and tail.get("type") == msg_type
+                and tail.keys() == message.keys()
+                and all(tail[k] == v for k, v in message.items() if k != "content")
+            ):
+                tail["content"] += content
+                self._pending_chars += len(content)
+                self._stats["merged"] += 1
+                return
+            # Copy so later merges don't mutate the caller's dict
+            self._merge_index = len(self._pending)
+            self._pending.append(dict(message))
+            self._pending_chars += len(content)
+            return
+
+        if msg_type in self.latest_only and self._is_status_update(msg_type, message):
+            key = (msg_type,) + tuple(message.get(f) for f in self.latest_only[msg_type])
+            previous = self._latest_index.get(key)
+            if previous is not None:
+                self._pending[previous] = None
+                self._stats["replaced"] += 1
+            self._latest_index[key] = len(self._pending)
+        else:
+            # Merging past this message would reorder it
+            self._merge_index = None
+
+        self._pending.append(message)
+        if isinstance(content, str):
+            self._pending_chars += len(content)
+
+    def _is_status_update(self, msg_type: str, message: dict[str, Any]) -> bool:
+        fields = self.latest_only_fields.get(msg_type)
+        return fields is None or message.keys() == fields
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._has_data.wait()
+                if not self._flush_now.is_set():
+                    # Give the stream a short window to accumulate more chunks
+                    try:
+                        await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+                    except asyncio.TimeoutError:
+                        pass
+
+                batch = self._pending
+                self._pending = []
+                self._pending_chars = 0
+                self._latest_index = {}
+                self._merge_index = None
+                self._has_data.clear()
+                self._flush_now.clear()
+
+                for message in batch:
+                    if message is None:
+                        continue
+                    await self.websocket.send_text(dumps_message(message))
+                    self._stats["frames"] += 1
+
+                if not self._pending:
+                    self._idle.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._error = e
+            self._idle.set()
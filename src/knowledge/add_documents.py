@@ -67,6 +67,7 @@ def load_dynamic_imports(project_root: Path):
 
 
 from src.knowledge.extract_numbered_items import process_content_list
+from src.knowledge.kb_stats import get_kb_stats_cache
 from src.logging import LightRAGLogContext, get_logger
 from src.services.embedding import (
     get_embedding_client,
@@ -156,6 +157,8 @@ class DocumentAdder:
         ingested_hashes = self.get_ingested_hashes()
 
         files_to_process = []
+        new_raw_files = 0
+        raw_snapshot = get_kb_stats_cache().snapshot(self.kb_dir)
         for source in source_files:
             source_path = Path(source)
             if not source_path.exists():
@@ -191,11 +194,14 @@ class DocumentAdder:
                         logger.info(f"  → Overwriting existing raw file: {source_path.name}")
 
             if should_copy:
+                new_raw_files += 0 if dest_path.exists() else 1
                 shutil.copy2(source_path, dest_path)
                 logger.info(f"  ✓ Staged to raw: {source_path.name}")
 
             files_to_process.append(dest_path)
 
+        if new_raw_files:
+            get_kb_stats_cache().record(self.kb_dir, raw_snapshot, raw_documents=new_raw_files)
         return files_to_process
 
     async def process_new_documents(self, new_files: List[Path]):
@@ -369,6 +375,8 @@ class DocumentAdder:
                 logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
 
         await self.fix_structure()
+        # Recount once here (entities/chunks changed) so listing KBs stays cheap
+        await self._run_in_executor(get_kb_stats_cache().refresh, self.kb_dir)
         return processed_files
 
     def _record_successful_hash(self, file_path: Path):
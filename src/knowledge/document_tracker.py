@@ -5,10 +5,16 @@ Document Tracker for Incremental Indexing
 
 Provides content-hash based change detection for knowledge base documents.
 Tracks document status, file hashes, and enables incremental updates.
+
+Change detection is two-level: a (size, mtime_ns, inode) fingerprint stored with
+each document is compared first, and only files whose fingerprint changed are
+re-hashed (in a thread pool; hashlib releases the GIL while hashing).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import json
+import os
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
@@ -19,6 +25,11 @@ from src.logging import get_logger
 
 logger = get_logger("DocumentTracker")
 
+# Read buffer for hashing (large reads keep per-call overhead negligible)
+HASH_BUFFER_SIZE = 1024 * 1024
+# Upper bound on hashing threads
+MAX_HASH_WORKERS = 8
+
 
 class DocumentStatus(str, Enum):
     """Document processing status"""
@@ -42,6 +53,8 @@ class DocumentInfo:
     status: str = DocumentStatus.NEW
     chunks_count: int = 0
     error_message: Optional[str] = None
+    # [size, mtime_ns, inode] when file_hash was computed
+    fingerprint: Optional[list[int]] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -117,14 +130,40 @@ class DocumentTracker:
             Hash string prefixed with algorithm name (e.g., "sha256:abc123...")
         """
         hash_func = hashlib.new(algorithm)
+        buffer = bytearray(HASH_BUFFER_SIZE)
+        view = memoryview(buffer)
 
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(8192), b""):
-                hash_func.update(chunk)
+        with open(file_path, "rb", buffering=0) as f:
+            # Read in large chunks to handle large files
+            while n := f.readinto(buffer):
+                hash_func.update(view[:n])
 
         return f"{algorithm}:{hash_func.hexdigest()}"
 
+    @staticmethod
+    def get_fingerprint(file_stat: os.stat_result) -> list[int]:
+        """Cheap change fingerprint: [size, mtime_ns, inode]"""
+        return [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino]
+
+    def _hash_files(self, file_paths: list[Path]) -> dict[Path, str]:
+        """Hash several files in parallel; unreadable files are left out"""
+
+        def _hash(path: Path) -> Optional[str]:
+            try:
+                return self.calculate_file_hash(path)
+            except OSError as e:
+                logger.warning(f"Failed to hash {path.name}: {e}")
+                return None
+
+        if len(file_paths) <= 1:
+            hashes = [_hash(p) for p in file_paths]
+        else:
+            workers = min(MAX_HASH_WORKERS, os.cpu_count() or 1, len(file_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                hashes = list(executor.map(_hash, file_paths))
+
+        return {p: h for p, h in zip(file_paths, hashes) if h is not None}
+
     def get_document_info(self, filename: str) -> Optional[DocumentInfo]:
         """
         Get tracked information for a document.
@@ -157,6 +196,10 @@ class DocumentTracker:
         """
         Detect all document changes by comparing current files with tracked metadata.
 
+        Files whose fingerprint matches the stored one are UNCHANGED without being
+        read; the rest are hashed in parallel. Files that were only touched
+        (same hash) get their stored fingerprint refreshed.
+
         Returns:
             Dictionary mapping filename to detected status:
             - NEW: File exists on disk but not in metadata
@@ -170,32 +213,50 @@ class DocumentTracker:
         tracked = self._metadata.get(self.TRACKING_KEY, {})
         tracked_filenames = set(tracked.keys())
 
-        # Get current files on disk
-        current_files = set()
+        # Get current files on disk (one stat per file via scandir)
+        current_stats: dict[str, os.stat_result] = {}
         if self.raw_dir.exists():
-            for file_path in self.raw_dir.glob("*"):
-                if file_path.is_file():
-                    current_files.add(file_path.name)
-
-        # Check for new and modified files
-        for filename in current_files:
-            file_path = self.raw_dir / filename
-
+            with os.scandir(self.raw_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        current_stats[entry.name] = entry.stat()
+        current_files = set(current_stats)
+
+        # Check for new files; compare fingerprints of tracked ones
+        to_hash: dict[Path, list[int]] = {}
+        for filename, file_stat in current_stats.items():
             if filename not in tracked_filenames:
                 # New file
                 changes[filename] = DocumentStatus.NEW
                 logger.info(f"  [NEW] {filename}")
+                continue
+
+            fingerprint = self.get_fingerprint(file_stat)
+            if tracked[filename].get("fingerprint") == fingerprint:
+                changes[filename] = DocumentStatus.UNCHANGED
+            else:
+                to_hash[self.raw_dir / filename] = fingerprint
+
+        # Hash only files whose fingerprint changed
+        refreshed = False
+        hashes = self._hash_files(list(to_hash))
+        for file_path, fingerprint in to_hash.items():
+            filename = file_path.name
+            current_hash = hashes.get(file_path)
+            stored_hash = tracked[filename].get("file_hash", "")
+
+            if current_hash != stored_hash:
+                changes[filename] = DocumentStatus.MODIFIED
+                logger.info(f"  [MODIFIED] {filename} (hash changed)")
             else:
-                # Check if modified
-                current_hash = self.calculate_file_hash(file_path)
-                stored_hash = tracked[filename].get("file_hash", "")
+                changes[filename] = DocumentStatus.UNCHANGED
+                logger.debug(f"  [UNCHANGED] {filename}")
+                # Same content: remember the new fingerprint to skip hashing next time
+                tracked[filename]["fingerprint"] = fingerprint
+                refreshed = True
 
-                if current_hash != stored_hash:
-                    changes[filename] = DocumentStatus.MODIFIED
-                    logger.info(f"  [MODIFIED] {filename} (hash changed)")
-                else:
-                    changes[filename] = DocumentStatus.UNCHANGED
-                    logger.debug(f"  [UNCHANGED] {filename}")
+        if refreshed:
+            self._save_metadata()
 
         # Check for deleted files
         for filename in tracked_filenames:
@@ -229,6 +290,7 @@ class DocumentTracker:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        # Stat before hashing: a write during hashing then shows up as a changed fingerprint
         file_stat = file_path.stat()
 
         doc_info = DocumentInfo(
@@ -240,6 +302,7 @@ class DocumentTracker:
             status=status.value if isinstance(status, DocumentStatus) else status,
             chunks_count=chunks_count,
             error_message=error_message,
+            fingerprint=self.get_fingerprint(file_stat),
         )
 
         # Update tracking metadata
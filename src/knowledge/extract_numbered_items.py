@@ -9,7 +9,6 @@ Use LLM to identify these contents and store the mapping between numbers and ori
 
 import argparse
 import asyncio
-import inspect
 import json
 import os
 from pathlib import Path
@@ -19,8 +18,9 @@ from typing import Any
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from dotenv import load_dotenv
-from lightrag.llm.openai import openai_complete_if_cache
 
+from src.services.config import get_llm_cache_params
+from src.services.llm import complete as llm_complete
 from src.services.llm import get_llm_config
 
 load_dotenv(dotenv_path=".env", override=False)
@@ -62,25 +62,32 @@ async def _call_llm_async(
     temperature: float = 0.1,
     model: str = None,
 ) -> str:
-    """Asynchronously call LLM"""
+    """Asynchronously call LLM (through the factory; deterministic calls may hit the response cache)"""
     # If model not specified, get from env_config
     if model is None:
         llm_cfg = get_llm_config()
         model = llm_cfg.model
 
-    result = openai_complete_if_cache(
-        model,
+    return await llm_complete(
         prompt,
         system_prompt=system_prompt,
+        model=model,
         api_key=api_key,
         base_url=base_url,
         max_tokens=max_tokens,
         temperature=temperature,
+        use_cache=_use_llm_cache(),
+        cache_namespace="knowledge.extract_numbered_items",
     )
 
-    if inspect.isawaitable(result):
-        return await result
-    return str(result)
+
+def _use_llm_cache() -> bool:
+    """Whether extraction calls opt into the LLM response cache (agents.yaml llm_cache)."""
+    try:
+        params = get_llm_cache_params()
+    except Exception:
+        return False
+    return params["enabled"] and "extract_numbered_items" in params["agents"].get("knowledge", [])
 
 
 def _extract_json_block(text: str) -> str:
@@ -27,6 +27,7 @@ logger = get_logger("KnowledgeInit")
 
 # Import numbered items extraction functionality
 from src.knowledge.extract_numbered_items import process_content_list
+from src.knowledge.kb_stats import get_kb_stats_cache
 from src.knowledge.progress_tracker import ProgressStage, ProgressTracker
 
 
@@ -433,14 +434,12 @@ class KnowledgeBaseInitializer:
         logger.info("Knowledge Base Statistics")
         logger.info("=" * 50)
 
-        # Count files
-        raw_files = list(self.raw_dir.glob("*"))
-        image_files = list(self.images_dir.glob("*"))
-        content_files = list(self.content_list_dir.glob("*.json"))
+        # Recount once after indexing; list/info requests then hit the cache
+        statistics = await asyncio.to_thread(get_kb_stats_cache().refresh, self.kb_dir)
 
-        logger.info(f"Raw documents: {len(raw_files)}")
-        logger.info(f"Extracted images: {len(image_files)}")
-        logger.info(f"Content lists: {len(content_files)}")
+        logger.info(f"Raw documents: {statistics['raw_documents']}")
+        logger.info(f"Extracted images: {statistics['images']}")
+        logger.info(f"Content lists: {statistics['content_lists']}")
 
         # Read provider from metadata instead of env var
         provider = self.rag_provider or os.getenv("RAG_PROVIDER", "raganything")
@@ -457,28 +456,18 @@ class KnowledgeBaseInitializer:
                 pass
 
         # RAGAnything/LightRAG format
-        entities_file = self.rag_storage_dir / "kv_store_full_entities.json"
-        relations_file = self.rag_storage_dir / "kv_store_full_relations.json"
-        chunks_file = self.rag_storage_dir / "kv_store_text_chunks.json"
+        rag_stats = statistics.get("rag", {})
 
         # LlamaIndex format
         vector_store_dir = self.base_dir / self.kb_name / "vector_store"
 
         try:
-            if entities_file.exists():
-                with open(entities_file, encoding="utf-8") as f:
-                    entities = json.load(f)
-                    logger.info(f"Knowledge entities: {len(entities)}")
-
-            if relations_file.exists():
-                with open(relations_file, encoding="utf-8") as f:
-                    relations = json.load(f)
-                    logger.info(f"Knowledge relations: {len(relations)}")
-
-            if chunks_file.exists():
-                with open(chunks_file, encoding="utf-8") as f:
-                    chunks = json.load(f)
-                    logger.info(f"Text chunks: {len(chunks)}")
+            if "entities" in rag_stats:
+                logger.info(f"Knowledge entities: {rag_stats['entities']}")
+            if "relations" in rag_stats:
+                logger.info(f"Knowledge relations: {rag_stats['relations']}")
+            if "chunks" in rag_stats:
+                logger.info(f"Text chunks: {rag_stats['chunks']}")
 
             if vector_store_dir.exists():
                 metadata_file = vector_store_dir / "metadata.json"
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Knowledge Base Statistics Cache
+
+Keeps per-KB counters (raw documents, images, content lists, and the entity,
+relation and chunk counts of the RAG key-value stores) so listing knowledge bases
+does not re-read them.
+
+Every counter is stored with a (size, mtime_ns, inode) fingerprint of the file or
+directory it was counted from. A lookup only stats those paths; a counter is
+recomputed when its fingerprint no longer matches. Directories are recounted with
+``os.scandir`` and the ``kv_store_*.json`` files are counted one entry at a time,
+never by loading them whole. Counters are persisted in ``<kb>/.kb_stats.json`` so
+a restart starts warm.
+
+Write paths keep the counters current themselves: adding documents adjusts the
+raw document count in place (``snapshot`` before writing, ``record`` after), and
+indexing or cleaning RAG storage recounts once in the background task
+(``refresh``), not on the next list request.
+"""
+
+import json
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Optional
+
+from src.logging import get_logger
+
+logger = get_logger("KBStats")
+
+STATS_FILE = ".kb_stats.json"
+STATS_VERSION = 1
+
+# Read size when streaming through kv_store files
+COUNT_CHUNK_SIZE = 1024 * 1024
+
+# counter -> (directory relative to the KB, required suffix or None)
+DIR_COUNTERS = {
+    "raw_documents": ("raw", None),
+    "images": ("images", None),
+    "content_lists": ("content_list", ".json"),
+}
+
+# counter -> kv_store file in rag_storage
+RAG_COUNTERS = {
+    "entities": "kv_store_full_entities.json",
+    "relations": "kv_store_full_relations.json",
+    "chunks": "kv_store_text_chunks.json",
+}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def count_json_entries(path: Path, chunk_size: int = COUNT_CHUNK_SIZE) -> int:
+    """
+    Count the top-level entries of a JSON object or array without loading it.
+
+    Entries are decoded one at a time (``JSONDecoder.raw_decode``) from a rolling
+    buffer and discarded, so memory is bounded by ``chunk_size`` plus the largest
+    single entry. Returns 0 if the document is not an object or array.
+
+    Raises:
+        ValueError: If the document is malformed or truncated
+    """
+    decoder = json.JSONDecoder()
+    skip = _WHITESPACE.match
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        while pos >= len(buffer):
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return 0
+            buffer = chunk
+            pos = skip(buffer).end()
+        opener = buffer[pos]
+        if opener not in "[{":
+            return 0
+        closer = "]" if opener == "[" else "}"
+        pos += 1
+
+        count = 0
+        while True:
+            start = pos
+            try:
+                pos = skip(buffer, pos).end()
+                if count == 0 and buffer[pos] == closer:
+                    return 0
+                if opener == "{":
+                    key, pos = decoder.raw_decode(buffer, pos)
+                    pos = skip(buffer, pos).end()
+                    if not isinstance(key, str) or buffer[pos] != ":":
+                        raise ValueError(f"Malformed JSON object in {path}")
+                    pos = skip(buffer, pos + 1).end()
+                _, pos = decoder.raw_decode(buffer, pos)
+                pos = skip(buffer, pos).end()
+                separator = buffer[pos]
+            except (IndexError, json.JSONDecodeError):
+                # The entry runs past the buffer: keep it and read on
+                chunk = f.read(max(chunk_size, len(buffer) - start))
+                if not chunk:
+                    raise ValueError(f"Malformed or truncated JSON document: {path}") from None
+                buffer = buffer[start:] + chunk
+                pos = 0
+                continue
+            count += 1
+            if separator == closer:
+                return count
+            if separator != ",":
+                raise ValueError(f"Malformed JSON document: {path}")
+            pos += 1
+
+
+def _fingerprint(path: Path) -> Optional[list[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def _count_dir(path: Path, suffix: Optional[str]) -> int:
+    count = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file() and (suffix is None or entry.name.endswith(suffix)):
+                count += 1
+    return count
+
+
+def _counter_path(kb_dir: Path, name: str) -> Path:
+    if name in DIR_COUNTERS:
+        return kb_dir / DIR_COUNTERS[name][0]
+    return kb_dir / "rag_storage" / RAG_COUNTERS[name]
+
+
+def _count(kb_dir: Path, name: str) -> Optional[int]:
+    """Count one counter from disk; None if its source is missing or unreadable."""
+    path = _counter_path(kb_dir, name)
+    try:
+        if name in DIR_COUNTERS:
+            return _count_dir(path, DIR_COUNTERS[name][1])
+        return count_json_entries(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not count {name} in {path}: {e}")
+        return None
+
+
+class KBStatsCache:
+    """Fingerprint-validated, persisted statistics counters for knowledge bases."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # kb_dir -> counter name -> {"fingerprint": [...] | None, "value": int | None}
+        self._entries: dict[Path, dict[str, dict]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def _load(self, kb_dir: Path) -> dict[str, dict]:
+        with self._lock:
+            entry = self._entries.get(kb_dir)
+        if entry is not None:
+            return entry
+        entry = {}
+        try:
+            with open(kb_dir / STATS_FILE, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == STATS_VERSION:
+                entry = {
+                    name: counter
+                    for name, counter in data.get("counters", {}).items()
+                    if name in DIR_COUNTERS or name in RAG_COUNTERS
+                }
+        except (OSError, ValueError):
+            pass
+        with self._lock:
+            return self._entries.setdefault(kb_dir, entry)
+
+    def _save(self, kb_dir: Path, entry: dict[str, dict]) -> None:
+        with self._lock:
+            data = {"version": STATS_VERSION, "counters": dict(entry)}
+        path = kb_dir / STATS_FILE
+        tmp = path.with_name(f"{STATS_FILE}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            # The in-memory counters are still valid; only the warm restart is lost
+            logger.debug(f"Could not persist KB statistics to {path}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def get_statistics(self, kb_dir: str | Path) -> dict:
+        """
+        Current counters for a knowledge base.
+
+        Returns:
+            ``{"raw_documents", "images", "content_lists"}`` plus a ``"rag"`` dict
+            with whichever of entities/relations/chunks exist
+        """
+        kb_dir = Path(kb_dir).resolve()
+        entry = self._load(kb_dir)
+        changed = False
+        values: dict[str, Optional[int]] = {}
+        for name in (*DIR_COUNTERS, *RAG_COUNTERS):
+            fingerprint = _fingerprint(_counter_path(kb_dir, name))
+            with self._lock:
+                cached = entry.get(name)
+            if cached is not None and cached.get("fingerprint") == fingerprint:
+                self._hits += 1
+                values[name] = cached.get("value")
+                continue
+            self._misses += 1
+            value = _count(kb_dir, name) if fingerprint is not None else None
+            with self._lock:
+                entry[name] = {"fingerprint": fingerprint, "value": value}
+            values[name] = value
+            changed = True
+        if changed:
+            self._save(kb_dir, entry)
+
+        statistics = {name: values[name] or 0 for name in DIR_COUNTERS}
+        rag = {name: values[name] for name in RAG_COUNTERS if values[name] is not None}
+        if rag:
+            statistics["rag"] = rag
+        return statistics
+
+    def snapshot(self, kb_dir: str | Path) -> dict[str, Optional[list[int]]]:
+        """Fingerprints of the directory counters, taken before a write for ``record``."""
+        kb_dir = Path(kb_dir).resolve()
+        return {name: _fingerprint(_counter_path(kb_dir, name)) for name in DIR_COUNTERS}
+
+    def record(
+        self, kb_dir: str | Path, before: dict[str, Optional[list[int]]], **deltas: int
+    ) -> None:
+        """
+        Apply known changes to directory counters, e.g.
+        ``record(kb, before, raw_documents=2)`` after copying two new files into ``raw/``.
+
+        ``before`` is the ``snapshot`` taken before the write. The delta is only
+        applied if the cached counter matched the directory at that point; the
+        counter is then re-stamped with the directory's current fingerprint, so the
+        next lookup does not rescan. A counter that was already stale (the
+        directory changed some other way) is dropped and recounted on the next
+        lookup, as are counters that were never computed.
+        """
+        kb_dir = Path(kb_dir).resolve()
+        entry = self._load(kb_dir)
+        updated = False
+        for name, delta in deltas.items():
+            if name not in DIR_COUNTERS:
+                raise ValueError(f"Unknown directory counter: {name}")
+            with self._lock:
+                cached = entry.get(name)
+                if cached is None or cached.get("value") is None:
+                    continue
+                if cached.get("fingerprint") != before.get(name):
+                    del entry[name]
+                    updated = True
+                    continue
+                entry[name] = {
+                    "fingerprint": _fingerprint(_counter_path(kb_dir, name)),
+                    "value": max(0, cached["value"] + delta),
+                }
+            updated = True
+        if updated:
+            self._save(kb_dir, entry)
+
+    def refresh(self, kb_dir: str | Path) -> dict:
+        """Recount everything (after indexing or cleaning) and return the statistics."""
+        kb_dir = Path(kb_dir).resolve()
+        with self._lock:
+            self._entries[kb_dir] = {}
+        return self.get_statistics(kb_dir)
+
+    def forget(self, kb_dir: str | Path) -> None:
+        """Drop a knowledge base (e.g. after it was deleted)."""
+        with self._lock:
+            self._entries.pop(Path(kb_dir).resolve(), None)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "knowledge_bases": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+            }
+
+
+_kb_stats_cache: Optional[KBStatsCache] = None
+
+
+def get_kb_stats_cache() -> KBStatsCache:
+    """Get the process-wide statistics cache."""
+    global _kb_stats_cache
+    if _kb_stats_cache is None:
+        _kb_stats_cache = KBStatsCache()
+    return _kb_stats_cache
+
+
+def reset_kb_stats_cache() -> None:
+    """Drop the process-wide statistics cache (for tests)."""
+    global _kb_stats_cache
+    _kb_stats_cache = None
@@ -11,6 +11,8 @@ import json
 from pathlib import Path
 import shutil
 
+from src.knowledge.kb_stats import get_kb_stats_cache
+
 
 class KnowledgeBaseManager:
     """Manager for knowledge bases"""
@@ -181,89 +183,22 @@ class KnowledgeBaseManager:
             # metadata.json doesn't exist, use empty dict
             info["metadata"] = {}
 
-        # Count files - handle errors gracefully
-        raw_dir = kb_dir / "raw"
-        images_dir = kb_dir / "images"
-        content_list_dir = kb_dir / "content_list"
+        # Counters come from the statistics cache: only stat calls unless something changed
         rag_storage_dir = kb_dir / "rag_storage"
-
         try:
-            raw_count = (
-                len([f for f in raw_dir.iterdir() if f.is_file()]) if raw_dir.exists() else 0
-            )
-        except Exception:
-            raw_count = 0
-
-        try:
-            images_count = (
-                len([f for f in images_dir.iterdir() if f.is_file()]) if images_dir.exists() else 0
-            )
-        except Exception:
-            images_count = 0
-
-        try:
-            content_lists_count = (
-                len(list(content_list_dir.glob("*.json"))) if content_list_dir.exists() else 0
-            )
-        except Exception:
-            content_lists_count = 0
+            statistics = get_kb_stats_cache().get_statistics(kb_dir)
+        except Exception as e:
+            print(f"Warning: Failed to collect statistics for KB '{kb_name}': {e}")
+            statistics = {"raw_documents": 0, "images": 0, "content_lists": 0}
 
         metadata = info["metadata"]
         rag_provider = metadata.get("rag_provider") if isinstance(metadata, dict) else None
-        info["statistics"] = {
-            "raw_documents": raw_count,
-            "images": images_count,
-            "content_lists": content_lists_count,
-            "rag_initialized": rag_storage_dir.exists() and rag_storage_dir.is_dir(),
-            "rag_provider": rag_provider,  # Add RAG provider info
-        }
-
-        # Try to get RAG statistics
-        if rag_storage_dir.exists() and rag_storage_dir.is_dir():
-            try:
-                entities_file = rag_storage_dir / "kv_store_full_entities.json"
-                relations_file = rag_storage_dir / "kv_store_full_relations.json"
-                chunks_file = rag_storage_dir / "kv_store_text_chunks.json"
-
-                rag_stats = {}
-                if entities_file.exists():
-                    try:
-                        with open(entities_file, encoding="utf-8") as f:
-                            entities_data = json.load(f)
-                            rag_stats["entities"] = (
-                                len(entities_data) if isinstance(entities_data, (list, dict)) else 0
-                            )
-                    except Exception:
-                        pass
-
-                if relations_file.exists():
-                    try:
-                        with open(relations_file, encoding="utf-8") as f:
-                            relations_data = json.load(f)
-                            rag_stats["relations"] = (
-                                len(relations_data)
-                                if isinstance(relations_data, (list, dict))
-                                else 0
-                            )
-                    except Exception:
-                        pass
-
-                if chunks_file.exists():
-                    try:
-                        with open(chunks_file, encoding="utf-8") as f:
-                            chunks_data = json.load(f)
-                            rag_stats["chunks"] = (
-                                len(chunks_data) if isinstance(chunks_data, (list, dict)) else 0
-                            )
-                    except Exception:
-                        pass
-
-                if rag_stats:
-                    statistics = info["statistics"]
-                    if isinstance(statistics, dict):
-                        statistics["rag"] = rag_stats
-            except Exception:
-                pass
+        rag_stats = statistics.pop("rag", None)
+        statistics["rag_initialized"] = rag_storage_dir.exists() and rag_storage_dir.is_dir()
+        statistics["rag_provider"] = rag_provider  # Add RAG provider info
+        if rag_stats and statistics["rag_initialized"]:
+            statistics["rag"] = rag_stats
+        info["statistics"] = statistics
 
         return info
 
@@ -294,6 +229,7 @@ class KnowledgeBaseManager:
 
         # Delete the directory
         shutil.rmtree(kb_dir)
+        get_kb_stats_cache().forget(kb_dir)
 
         # Remove from config
         if name in self.config.get("knowledge_bases", {}):
@@ -337,6 +273,7 @@ class KnowledgeBaseManager:
         # Delete RAG storage
         shutil.rmtree(rag_storage_dir)
         rag_storage_dir.mkdir(parents=True, exist_ok=True)
+        get_kb_stats_cache().refresh(kb_dir)
 
         print(f"✓ RAG storage cleaned for '{kb_name}'")
         return True
@@ -9,10 +9,19 @@ Provides versioning capabilities for knowledge bases including:
 - Rollback to previous versions
 - Compare versions to show document changes
 - Delete old versions
+
+rag_storage snapshots are content-addressed: each distinct file content is stored
+once under versions/objects/<sha256[:2]>/<sha256> and hardlinked into the version
+tree, with a manifest (path -> hash, size) per version. A stat cache lets
+unchanged files skip rehashing, so snapshot and rollback cost scales with the
+number of changed files rather than the size of the knowledge base.
 """
 
+import hashlib
 import json
+import os
 import shutil
+import tempfile
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
@@ -44,6 +53,8 @@ class VersionInfo:
     document_count: int
     storage_size_bytes: int
     metadata_snapshot: dict
+    # Bytes this snapshot added to the shared object store (0 for legacy copies)
+    new_object_bytes: int = 0
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -83,6 +94,10 @@ class VersionManager:
     VERSION_INDEX_FILE = "versions.json"
     VERSION_INFO_FILE = "version_info.json"
     DOCUMENT_TRACKING_FILE = "document_tracking.json"
+    MANIFEST_FILE = "manifest.json"
+    OBJECTS_DIR = "objects"
+    STAT_CACHE_FILE = "stat_cache.json"
+    HASH_CHUNK_SIZE = 1024 * 1024
 
     def __init__(self, kb_dir: Path):
         """
@@ -95,6 +110,8 @@ class VersionManager:
         self.kb_name = self.kb_dir.name
         self.versions_dir = self.kb_dir / self.VERSIONS_DIR
         self.version_index_file = self.versions_dir / self.VERSION_INDEX_FILE
+        self.objects_dir = self.versions_dir / self.OBJECTS_DIR
+        self.stat_cache_file = self.versions_dir / self.STAT_CACHE_FILE
 
         # Ensure versions directory exists
         self.versions_dir.mkdir(parents=True, exist_ok=True)
@@ -125,16 +142,242 @@ class VersionManager:
         """Get directory path for a version"""
         return self.versions_dir / version_id
 
-    def _calculate_dir_size(self, directory: Path) -> int:
-        """Calculate total size of a directory in bytes"""
-        total_size = 0
+    # ------------------------------------------------------------------
+    # Content-addressed object store
+    # ------------------------------------------------------------------
+
+    def _object_path(self, file_hash: str) -> Path:
+        """Get object path for a content hash"""
+        return self.objects_dir / file_hash[:2] / file_hash
+
+    def _hash_file(self, path: Path) -> str:
+        """SHA-256 of a file's content"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(self.HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_stat_cache(self) -> dict:
+        """Load rag_storage stat cache: relative path -> [size, mtime_ns, inode, hash]"""
+        if self.stat_cache_file.exists():
+            try:
+                with open(self.stat_cache_file, encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load stat cache: {e}")
+        return {}
+
+    def _save_stat_cache(self, cache: dict) -> None:
+        """Save stat cache (best effort; a lost cache only means rehashing)"""
         try:
-            for item in directory.rglob("*"):
-                if item.is_file():
-                    total_size += item.stat().st_size
+            with open(self.stat_cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f, ensure_ascii=False)
         except Exception as e:
-            logger.warning(f"Error calculating directory size: {e}")
-        return total_size
+            logger.warning(f"Failed to save stat cache: {e}")
+
+    def _scan_rag_storage(self, cache: dict) -> dict:
+        """
+        Hash every file in rag_storage, reusing cached hashes for files whose
+        size, mtime and inode are unchanged.
+
+        Returns:
+            Manifest: relative path -> {"hash", "size"}
+        """
+        rag_storage = self.kb_dir / "rag_storage"
+        manifest = {}
+        seen = set()
+        if not rag_storage.exists():
+            cache.clear()
+            return manifest
+
+        for root, _, files in os.walk(rag_storage):
+            for name in files:
+                path = Path(root) / name
+                rel = path.relative_to(rag_storage).as_posix()
+                st = path.stat()
+                cached = cache.get(rel)
+                if cached and cached[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]:
+                    file_hash = cached[3]
+                else:
+                    file_hash = self._hash_file(path)
+                    cache[rel] = [st.st_size, st.st_mtime_ns, st.st_ino, file_hash]
+                manifest[rel] = {"hash": file_hash, "size": st.st_size}
+                seen.add(rel)
+
+        for rel in list(cache):
+            if rel not in seen:
+                del cache[rel]
+        return manifest
+
+    def _store_object(self, source: Path, file_hash: str) -> tuple[str, int]:
+        """
+        Copy a file into the object store unless its content is already there.
+
+        Returns:
+            (hash actually stored, bytes added)
+        """
+        object_path = self._object_path(file_hash)
+        if object_path.exists():
+            return file_hash, 0
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".ingest.", dir=str(self.objects_dir))
+        try:
+            # Hash while copying in case the file changed since it was scanned
+            digest = hashlib.sha256()
+            size = 0
+            with os.fdopen(fd, "wb") as out, open(source, "rb") as src:
+                while chunk := src.read(self.HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            actual_hash = digest.hexdigest()
+            object_path = self._object_path(actual_hash)
+            if object_path.exists():
+                os.remove(tmp_path)
+                return actual_hash, 0
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            # Objects are shared by every version that links them; never modify in place
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, object_path)
+            return actual_hash, size
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _link_object(self, file_hash: str, target: Path) -> None:
+        """Hardlink an object into a version tree (copy if hardlinks are unsupported)"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(self._object_path(file_hash), target)
+        except OSError:
+            shutil.copy2(self._object_path(file_hash), target)
+
+    def _snapshot_rag_storage(self, version_dir: Path) -> tuple[dict, int]:
+        """
+        Snapshot rag_storage into the object store and link it into version_dir.
+
+        Returns:
+            (manifest, bytes added to the object store)
+        """
+        rag_storage = self.kb_dir / "rag_storage"
+        cache = self._load_stat_cache()
+        manifest = self._scan_rag_storage(cache)
+
+        new_bytes = 0
+        version_rag = version_dir / "rag_storage"
+        version_rag.mkdir(parents=True, exist_ok=True)
+        for rel, info in manifest.items():
+            stored_hash, added = self._store_object(rag_storage / rel, info["hash"])
+            if stored_hash != info["hash"]:
+                # File changed under us; record what was actually captured
+                info["hash"] = stored_hash
+                info["size"] = self._object_path(stored_hash).stat().st_size
+                cache.pop(rel, None)
+            new_bytes += added
+            self._link_object(stored_hash, version_rag / rel)
+
+        self._save_stat_cache(cache)
+        with open(version_dir / self.MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        return manifest, new_bytes
+
+    def _load_manifest(self, version_id: str) -> Optional[dict]:
+        """Load a version's manifest (None for legacy full-copy versions)"""
+        manifest_file = self._get_version_dir(version_id) / self.MANIFEST_FILE
+        if not manifest_file.exists():
+            return None
+        with open(manifest_file, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _restore_rag_storage(self, manifest: dict) -> int:
+        """
+        Make rag_storage match a manifest, touching only files that differ.
+
+        Returns:
+            Number of files written or removed
+        """
+        rag_storage = self.kb_dir / "rag_storage"
+        rag_storage.mkdir(parents=True, exist_ok=True)
+        cache = self._load_stat_cache()
+        current = self._scan_rag_storage(cache)
+        changed = 0
+
+        for rel, info in manifest.items():
+            if current.get(rel, {}).get("hash") == info["hash"]:
+                continue
+            target = rag_storage / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Copy (not link): live files are modified in place by the RAG backend
+            fd, tmp_path = tempfile.mkstemp(prefix=".restore.", dir=str(target.parent))
+            os.close(fd)
+            try:
+                shutil.copyfile(self._object_path(info["hash"]), tmp_path)
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, target)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            st = target.stat()
+            cache[rel] = [st.st_size, st.st_mtime_ns, st.st_ino, info["hash"]]
+            changed += 1
+
+        for rel in set(current) - set(manifest):
+            (rag_storage / rel).unlink()
+            cache.pop(rel, None)
+            changed += 1
+
+        # Drop directories emptied by removals
+        for root, dirs, files in os.walk(rag_storage, topdown=False):
+            if Path(root) != rag_storage and not dirs and not files:
+                try:
+                    os.rmdir(root)
+                except OSError:
+                    pass
+
+        self._save_stat_cache(cache)
+        return changed
+
+    def collect_garbage(self) -> dict:
+        """
+        Remove objects no longer referenced by any version's manifest.
+
+        Returns:
+            {"removed_objects": int, "freed_bytes": int}
+        """
+        referenced = set()
+        for version_entry in self._version_index.get("versions", []):
+            try:
+                manifest = self._load_manifest(version_entry.get("version_id"))
+            except Exception as e:
+                # Unreadable manifest: keep everything rather than risk data loss
+                logger.warning(f"Skipping garbage collection, bad manifest: {e}")
+                return {"removed_objects": 0, "freed_bytes": 0}
+            if manifest:
+                referenced.update(info["hash"] for info in manifest.values())
+
+        removed = 0
+        freed = 0
+        if self.objects_dir.exists():
+            for object_path in self.objects_dir.glob("*/*"):
+                if object_path.name not in referenced:
+                    freed += object_path.stat().st_size
+                    object_path.unlink()
+                    removed += 1
+
+        if removed:
+            store_bytes = self._version_index.get("object_store_bytes", 0)
+            self._version_index["object_store_bytes"] = max(0, store_bytes - freed)
+            self._save_version_index()
+            logger.info(f"Garbage collected {removed} objects ({freed} bytes)")
+        return {"removed_objects": removed, "freed_bytes": freed}
+
+    def get_object_store_size(self) -> int:
+        """Total bytes held in the shared object store (tracked incrementally)"""
+        return self._version_index.get("object_store_bytes", 0)
 
     def _load_metadata(self) -> dict:
         """Load knowledge base metadata"""
@@ -191,10 +434,8 @@ class VersionManager:
             if metadata_file.exists():
                 shutil.copy2(metadata_file, version_dir / "metadata.json")
 
-            # Copy rag_storage directory
-            rag_storage = self.kb_dir / "rag_storage"
-            if rag_storage.exists():
-                shutil.copytree(rag_storage, version_dir / "rag_storage")
+            # Snapshot rag_storage into the object store (only new content is copied)
+            manifest, new_bytes = self._snapshot_rag_storage(version_dir)
 
             # Export document tracking separately for easy comparison
             document_tracking = self._get_document_tracking()
@@ -214,7 +455,12 @@ class VersionManager:
                 version_type=version_type.value if isinstance(version_type, VersionType) else version_type,
                 created_by=created_by,
                 document_count=self._count_raw_documents(),
-                storage_size_bytes=self._calculate_dir_size(version_dir),
+                storage_size_bytes=sum(info["size"] for info in manifest.values())
+                + sum(
+                    f.stat().st_size
+                    for f in (version_dir / "metadata.json", tracking_file)
+                    if f.exists()
+                ),
                 metadata_snapshot={
                     "name": metadata_snapshot.get("name"),
                     "created_at": metadata_snapshot.get("created_at"),
@@ -222,6 +468,7 @@ class VersionManager:
                     "version": metadata_snapshot.get("version"),
                     "last_updated": metadata_snapshot.get("last_updated"),
                 },
+                new_object_bytes=new_bytes,
             )
 
             # Save version info in version directory
@@ -237,9 +484,15 @@ class VersionManager:
                 "version_type": version_info.version_type,
             })
             self._version_index["current_version"] = version_id
+            self._version_index["object_store_bytes"] = (
+                self._version_index.get("object_store_bytes", 0) + new_bytes
+            )
             self._save_version_index()
 
-            logger.info(f"Snapshot '{version_id}' created successfully ({version_info.storage_size_bytes} bytes)")
+            logger.info(
+                f"Snapshot '{version_id}' created successfully "
+                f"({version_info.storage_size_bytes} bytes, {new_bytes} new)"
+            )
 
             return version_info
 
@@ -334,17 +587,23 @@ class VersionManager:
                     version_type=VersionType.PRE_ROLLBACK,
                 )
 
-            # Remove current rag_storage
+            manifest = self._load_manifest(version_id)
             current_rag = self.kb_dir / "rag_storage"
-            if current_rag.exists():
-                shutil.rmtree(current_rag)
-
-            # Copy rag_storage from version
-            version_rag = version_dir / "rag_storage"
-            if version_rag.exists():
-                shutil.copytree(version_rag, current_rag)
+            if manifest is not None:
+                # Only rewrite files whose content differs from the version
+                changed = self._restore_rag_storage(manifest)
+                logger.info(f"Restored {changed} changed files in rag_storage")
             else:
-                current_rag.mkdir(parents=True, exist_ok=True)
+                # Legacy full-copy version
+                if current_rag.exists():
+                    shutil.rmtree(current_rag)
+                version_rag = version_dir / "rag_storage"
+                if version_rag.exists():
+                    shutil.copytree(version_rag, current_rag)
+                else:
+                    current_rag.mkdir(parents=True, exist_ok=True)
+                # The stat cache no longer describes rag_storage
+                self.stat_cache_file.unlink(missing_ok=True)
 
             # Restore metadata.json
             version_metadata = version_dir / "metadata.json"
@@ -495,6 +754,9 @@ class VersionManager:
 
             self._save_version_index()
 
+            # Drop objects only this version referenced
+            self.collect_garbage()
+
             logger.info(f"Version '{version_id}' deleted successfully")
             return True
 
@@ -44,12 +44,15 @@ from .config import (
 
 # Handlers
 from .handlers import (
+    AsyncFileHandler,
     ConsoleHandler,
     FileHandler,
     JSONFileHandler,
     LogInterceptor,
     RotatingFileHandler,
     WebSocketLogHandler,
+    flush_log_writers,
+    shutdown_log_writers,
 )
 from .logger import (
     ConsoleFormatter,
@@ -78,12 +81,15 @@ __all__ = [
     "ConsoleFormatter",
     "FileFormatter",
     # Handlers
+    "AsyncFileHandler",
     "ConsoleHandler",
     "FileHandler",
     "JSONFileHandler",
     "RotatingFileHandler",
     "WebSocketLogHandler",
     "LogInterceptor",
+    "flush_log_writers",
+    "shutdown_log_writers",
     # Adapters
     "LightRAGLogContext",
     "LightRAGLogForwarder",
@@ -5,11 +5,21 @@ Log Handlers
 Custom logging handlers for various output destinations.
 """
 
+from .async_writer import (
+    AsyncFileHandler,
+    AsyncLogWriter,
+    flush_log_writers,
+    get_log_writer,
+    release_log_writer,
+    shutdown_log_writers,
+)
 from .console import ConsoleHandler
 from .file import FileHandler, JSONFileHandler, RotatingFileHandler, create_task_logger
 from .websocket import LogInterceptor, WebSocketLogHandler
 
 __all__ = [
+    "AsyncFileHandler",
+    "AsyncLogWriter",
     "ConsoleHandler",
     "FileHandler",
     "JSONFileHandler",
@@ -17,4 +27,8 @@ __all__ = [
     "WebSocketLogHandler",
     "LogInterceptor",
     "create_task_logger",
+    "get_log_writer",
+    "release_log_writer",
+    "flush_log_writers",
+    "shutdown_log_writers",
 ]
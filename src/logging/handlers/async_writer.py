@@ -0,0 +1,423 @@
+"""
+Async Log Writer
+================
+
+Background, batched log file writing.
+
+Handlers only build the record (a formatted line or a dict for JSONL) and hand it
+to an ``AsyncLogWriter``; a daemon thread drains the queue in batches, serializes
+dicts, writes through a buffered file and flushes periodically. Nothing on the
+caller's thread (usually the event loop) touches the file system.
+
+One writer is shared per file path (``get_log_writer``), so every Logger writing
+to the daily log goes through a single open file.
+
+Overload policies (queue full):
+    drop   Discard the record and count it (default; never blocks callers)
+    block  Wait for space (no loss, but callers can stall)
+"""
+
+import atexit
+from datetime import datetime
+import json
+import logging
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+from typing import Any, Optional, Union
+
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_FLUSH_INTERVAL = 0.5  # seconds
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+OVERFLOW_POLICIES = ("drop", "block")
+
+_STOP = object()
+
+
+class _FlushRequest:
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class AsyncLogWriter:
+    """
+    Queue-backed writer that appends lines to one file from a background thread.
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        encoding: str = "utf-8",
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow: str = "drop",
+        max_bytes: int = 0,
+        rotate_interval: Optional[float] = None,
+        backup_count: int = 5,
+    ):
+        """
+        Initialize the writer (the thread starts on first write).
+
+        Args:
+            filepath: File to append to
+            encoding: File encoding
+            queue_size: Maximum records waiting to be written
+            batch_size: Maximum records written per batch
+            flush_interval: Seconds between buffer flushes while records keep arriving
+            overflow: "drop" or "block" when the queue is full
+            max_bytes: Rotate once the file exceeds this size (0 disables)
+            rotate_interval: Rotate after this many seconds (None disables)
+            backup_count: Number of rotated files to keep (name.1 ... name.N)
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+
+        self.filepath = Path(filepath)
+        self.encoding = encoding
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stream = None
+        self._opened_at = 0.0
+        # Approximate size (characters written); avoids tell(), which forces a flush
+        self._size = 0
+        self._closed = False
+        # "dropped" is counted on producer threads; the rest only on the writer thread
+        self._stats_lock = threading.Lock()
+        self._stats = {"written": 0, "dropped": 0, "batches": 0, "rotations": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Producer side (any thread)
+    # ------------------------------------------------------------------
+
+    def write(self, item: Union[str, dict[str, Any]]) -> bool:
+        """
+        Queue a line (str) or a JSON record (dict) for writing.
+
+        Returns:
+            False if the record was dropped
+        """
+        if self._closed:
+            return False
+        self._ensure_started()
+        if self.overflow == "block":
+            self._queue.put(item)
+            return True
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["dropped"] += 1
+            return False
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Block until everything queued so far is written and flushed.
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            return False
+        return request.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0, wait: bool = True) -> None:
+        """
+        Write everything queued, close the file and stop the thread.
+
+        Args:
+            timeout: Seconds to wait for the writer thread
+            wait: If False, return at once and let the writer thread finish on its own
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is None or not self._thread.is_alive():
+            return
+        if not wait:
+            # If the queue is full, the thread stops once it has drained it
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:
+                pass
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            stats: dict[str, Any] = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        stats["path"] = str(self.filepath)
+        return stats
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"log-writer:{self.filepath.name}", daemon=True
+                )
+                self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._closed:
+                    self._close_stream()
+                    return
+                # Idle: make sure everything written so far reaches the file
+                self._flush_stream()
+                last_flush = time.monotonic()
+                continue
+
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            flush_requests: list[_FlushRequest] = []
+            lines: list[str] = []
+            for entry in batch:
+                if entry is _STOP:
+                    stop = True
+                elif isinstance(entry, _FlushRequest):
+                    flush_requests.append(entry)
+                elif isinstance(entry, dict):
+                    try:
+                        lines.append(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+                    except Exception:
+                        self._stats["errors"] += 1
+                else:
+                    lines.append(entry if entry.endswith("\n") else entry + "\n")
+
+            if lines:
+                self._write_lines(lines)
+
+            now = time.monotonic()
+            if flush_requests or stop or now - last_flush >= self.flush_interval:
+                self._flush_stream()
+                last_flush = now
+            for request in flush_requests:
+                request.done.set()
+
+            if stop:
+                self._close_stream()
+                return
+
+    def _open_stream(self) -> None:
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = open(
+            self.filepath, "a", encoding=self.encoding, buffering=DEFAULT_BUFFER_SIZE
+        )
+        self._opened_at = time.time()
+        try:
+            self._size = self.filepath.stat().st_size
+        except OSError:
+            self._size = 0
+
+    def _write_lines(self, lines: list[str]) -> None:
+        try:
+            if self._stream is None:
+                self._open_stream()
+            elif self._should_rotate():
+                self._rotate()
+            data = "".join(lines)
+            self._stream.write(data)
+            self._size += len(data)
+            self._stats["written"] += len(lines)
+            self._stats["batches"] += 1
+        except Exception:
+            self._stats["errors"] += 1
+
+    def _should_rotate(self) -> bool:
+        if self.rotate_interval and time.time() - self._opened_at >= self.rotate_interval:
+            return True
+        return bool(self.max_bytes) and self._size >= self.max_bytes
+
+    def _rotate(self) -> None:
+        self._close_stream()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = self.filepath.with_name(f"{self.filepath.name}.{i}")
+                if src.exists():
+                    os.replace(src, self.filepath.with_name(f"{self.filepath.name}.{i + 1}"))
+            if self.filepath.exists():
+                os.replace(self.filepath, self.filepath.with_name(f"{self.filepath.name}.1"))
+        elif self.filepath.exists():
+            self.filepath.unlink()
+        self._stats["rotations"] += 1
+        self._open_stream()
+
+    def _flush_stream(self) -> None:
+        if self._stream is not None:
+            try:
+                self._stream.flush()
+            except Exception:
+                self._stats["errors"] += 1
+
+    def _close_stream(self) -> None:
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception:
+                self._stats["errors"] += 1
+            self._stream = None
+
+
+# Shared writers, one per resolved file path, with the number of handlers using each
+_writers: dict[str, AsyncLogWriter] = {}
+_writer_refs: dict[str, int] = {}
+_writers_lock = threading.Lock()
+
+
+def get_log_writer(filepath: Union[str, Path], **kwargs: Any) -> AsyncLogWriter:
+    """
+    Get the shared writer for a file, creating it on first use.
+
+    Keyword arguments only apply when the writer is created. Pair every call with
+    ``release_log_writer`` so per-task files don't keep a thread alive.
+    """
+    key = str(Path(filepath).resolve())
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer._closed:
+            writer = AsyncLogWriter(key, **kwargs)
+            _writers[key] = writer
+            _writer_refs[key] = 0
+        _writer_refs[key] += 1
+        return writer
+
+
+def release_log_writer(writer: AsyncLogWriter) -> None:
+    """
+    Drop one reference to a shared writer; the last one closes it.
+
+    Never blocks: handlers are closed from the event loop, so the writer thread
+    drains the queue and closes the file in the background.
+    """
+    key = str(writer.filepath)
+    with _writers_lock:
+        if _writers.get(key) is not writer:
+            last = True
+        else:
+            _writer_refs[key] -= 1
+            last = _writer_refs[key] <= 0
+            if last:
+                del _writers[key]
+                del _writer_refs[key]
+    if last:
+        writer.close(wait=False)
+
+
+def flush_log_writers(timeout: Optional[float] = 5.0) -> None:
+    """Flush every shared writer."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.flush(timeout)
+
+
+def shutdown_log_writers(timeout: Optional[float] = 5.0) -> None:
+    """Drain and close every shared writer (registered with atexit)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+        _writer_refs.clear()
+    for writer in writers:
+        writer.close(timeout)
+
+
+atexit.register(shutdown_log_writers)
+
+
+class AsyncFileHandler(logging.Handler):
+    """
+    Text log handler that formats records on the caller's thread and leaves the
+    file I/O to a shared ``AsyncLogWriter``.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        level: int = logging.DEBUG,
+        encoding: str = "utf-8",
+        **writer_kwargs: Any,
+    ):
+        """
+        Initialize async file handler.
+
+        Args:
+            filename: Path to log file
+            level: Minimum log level
+            encoding: File encoding
+            **writer_kwargs: AsyncLogWriter options (overflow, max_bytes, ...)
+        """
+        super().__init__(level)
+        self.baseFilename = str(Path(filename).resolve())
+        self.writer = get_log_writer(self.baseFilename, encoding=encoding, **writer_kwargs)
+        self._released = False
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.writer.write(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        # The writer may be shared with other handlers on the same file
+        if not self._released:
+            self._released = True
+            release_log_writer(self.writer)
+        super().close()
+
+
+def build_json_record(record: logging.LogRecord, message: str) -> dict[str, Any]:
+    """Build the JSONL entry for a log record (shared by JSON handlers)."""
+    entry = {
+        "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+        "level": record.levelname,
+        "module": getattr(record, "module_name", record.name),
+        "message": message,
+    }
+    for key in ("symbol", "display_level", "tool_name", "elapsed_ms", "tokens"):
+        if hasattr(record, key):
+            entry[key] = getattr(record, key)
+    return entry
@@ -2,17 +2,24 @@
 File Log Handlers
 =================
 
-File-based logging with rotation support.
+File-based logging with rotation support. File writes are handed off to a
+background AsyncLogWriter so logging never blocks the event loop on disk I/O.
 """
 
 import asyncio
 from datetime import datetime
-import json
 import logging
 from logging.handlers import RotatingFileHandler as BaseRotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+from .async_writer import (
+    AsyncFileHandler,
+    build_json_record,
+    get_log_writer,
+    release_log_writer,
+)
+
 
 class FileFormatter(logging.Formatter):
     """
@@ -101,6 +108,9 @@ class JSONFileHandler(logging.Handler):
     A logging handler that writes structured JSON logs to a file.
     Each line is a valid JSON object (JSONL format).
 
+    Records are built into dicts on the caller's thread and written in batches
+    by a background AsyncLogWriter (serialization and file I/O happen there).
+
     Useful for:
     - LLM call logging
     - Structured analysis
@@ -112,6 +122,10 @@ class JSONFileHandler(logging.Handler):
         filepath: str,
         level: int = logging.DEBUG,
         encoding: str = "utf-8",
+        overflow: str = "drop",
+        max_bytes: int = 0,
+        rotate_interval: Optional[float] = None,
+        backup_count: int = 5,
     ):
         """
         Initialize JSON file handler.
@@ -120,6 +134,10 @@ class JSONFileHandler(logging.Handler):
             filepath: Path to log file
             level: Minimum log level
             encoding: File encoding
+            overflow: "drop" or "block" when the write queue is full
+            max_bytes: Rotate once the file exceeds this size (0 disables)
+            rotate_interval: Rotate after this many seconds (None disables)
+            backup_count: Number of rotated files to keep
         """
         super().__init__()
 
@@ -130,30 +148,33 @@ class JSONFileHandler(logging.Handler):
         self.encoding = encoding
         self.setLevel(level)
         self.setFormatter(logging.Formatter("%(message)s"))
+        self.writer = get_log_writer(
+            filepath,
+            encoding=encoding,
+            overflow=overflow,
+            max_bytes=max_bytes,
+            rotate_interval=rotate_interval,
+            backup_count=backup_count,
+        )
+        self._released = False
 
     def emit(self, record: logging.LogRecord):
-        """Emit a log record as JSON."""
+        """Queue a log record as a JSON entry."""
         try:
-            # Build JSON entry
-            entry = {
-                "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-                "level": record.levelname,
-                "module": getattr(record, "module_name", record.name),
-                "message": self.format(record),
-            }
-
-            # Add extra fields if present
-            for key in ["symbol", "display_level", "tool_name", "elapsed_ms", "tokens"]:
-                if hasattr(record, key):
-                    entry[key] = getattr(record, key)
-
-            # Write to file
-            with open(self.filepath, "a", encoding=self.encoding) as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-
+            self.writer.write(build_json_record(record, self.format(record)))
         except Exception:
             self.handleError(record)
 
+    def flush(self):
+        """Block until queued entries are on disk."""
+        self.writer.flush()
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            release_log_writer(self.writer)
+        super().close()
+
 
 def create_task_logger(
     task_id: str,
@@ -189,7 +210,8 @@ def create_task_logger(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_path / f"{module_name}_{task_id}_{timestamp}.log"
 
-    file_handler = FileHandler(str(log_file))
+    file_handler = AsyncFileHandler(log_file)
+    file_handler.setFormatter(FileFormatter())
     logger.addHandler(file_handler)
 
     # WebSocket handler if queue provided
@@ -8,12 +8,18 @@ Handlers for streaming logs to WebSocket clients.
 
 import asyncio
 import logging
+import threading
+from typing import Any, Optional
 
 
 class WebSocketLogHandler(logging.Handler):
     """
     A logging handler that streams log records to a WebSocket via asyncio Queue.
 
+    Safe to use from worker threads: records emitted off the event loop's thread
+    are handed to the loop with ``call_soon_threadsafe`` instead of touching the
+    (non thread-safe) asyncio.Queue directly.
+
     Usage:
         queue = asyncio.Queue()
         handler = WebSocketLogHandler(queue)
@@ -35,19 +41,33 @@ class WebSocketLogHandler(logging.Handler):
         "CRITICAL": "✗",
     }
 
-    def __init__(self, queue: asyncio.Queue, include_module: bool = True):
+    def __init__(
+        self,
+        queue: asyncio.Queue,
+        include_module: bool = True,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
         """
         Initialize WebSocket log handler.
 
         Args:
             queue: asyncio.Queue to put log entries into
             include_module: Whether to include module name in output
+            loop: Event loop that consumes the queue (defaults to the running loop)
         """
         super().__init__()
         self.queue = queue
         self.include_module = include_module
         self.setFormatter(logging.Formatter("%(message)s"))
 
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self.loop = loop
+        self._loop_thread_id = threading.get_ident() if loop is not None else None
+
     def emit(self, record: logging.LogRecord):
         """Emit a log record to the queue."""
         try:
@@ -77,15 +97,22 @@ class WebSocketLogHandler(logging.Handler):
                 "timestamp": record.created,
             }
 
-            # Put into queue non-blocking
-            try:
-                self.queue.put_nowait(log_entry)
-            except asyncio.QueueFull:
-                pass  # Drop log if queue is full
+            loop = self.loop
+            if loop is None or threading.get_ident() == self._loop_thread_id:
+                self._put(log_entry)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(self._put, log_entry)
 
         except Exception:
             self.handleError(record)
 
+    def _put(self, log_entry: dict[str, Any]) -> None:
+        # Put into queue non-blocking
+        try:
+            self.queue.put_nowait(log_entry)
+        except asyncio.QueueFull:
+            pass  # Drop log if queue is full
+
 
 class LogInterceptor:
     """
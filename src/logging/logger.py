@@ -23,6 +23,8 @@ from typing import Any, List, Optional, Union
 
 from src.config.constants import LOG_SYMBOLS, PROJECT_ROOT
 
+from .handlers.async_writer import AsyncFileHandler
+
 
 class LogLevel(Enum):
     """Log levels with associated symbols"""
@@ -179,7 +181,7 @@ class Logger:
             timestamp = datetime.now().strftime("%Y%m%d")
             log_file = log_dir_path / f"ai_tutor_{timestamp}.log"
 
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            file_handler = AsyncFileHandler(log_file, encoding="utf-8")
             file_handler.setLevel(logging.DEBUG)  # Log everything to file
             file_handler.setFormatter(FileFormatter())
             self.logger.addHandler(file_handler)
@@ -207,7 +209,7 @@ class Logger:
         task_path = Path(task_log_file)
         task_path.parent.mkdir(parents=True, exist_ok=True)
 
-        handler = logging.FileHandler(task_log_file, encoding="utf-8")
+        handler = AsyncFileHandler(task_log_file, encoding="utf-8")
         handler.setLevel(logging.DEBUG)
         handler.setFormatter(FileFormatter())
         self.logger.addHandler(handler)
@@ -49,9 +49,12 @@ def get_pricing(model: str) -> dict[str, float]:
     return MODEL_PRICING.get("gpt-4o-mini", {"input": 0.00015, "output": 0.0006})
 
 
-def estimate_tokens(text: str) -> int:
-    """Rough estimate of tokens (1.3 tokens per word)."""
-    return int(len(text.split()) * 1.3)
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Count tokens via the shared tokenizer service (memoized; estimated without tiktoken)."""
+    # Imported lazily: the LLM service package itself depends on src.logging
+    from src.services.llm.tokenizer import count_tokens
+
+    return count_tokens(text or "", model)
 
 
 @dataclass
@@ -108,11 +111,12 @@ class LLMStats:
         """
         # Estimate tokens if not provided
         if prompt_tokens is None and (system_prompt or user_prompt):
-            prompt_text = (system_prompt or "") + "\n" + (user_prompt or "")
-            prompt_tokens = estimate_tokens(prompt_text)
+            prompt_tokens = estimate_tokens(system_prompt or "", model) + estimate_tokens(
+                user_prompt or "", model
+            )
 
         if completion_tokens is None and response:
-            completion_tokens = estimate_tokens(response)
+            completion_tokens = estimate_tokens(response, model)
 
         prompt_tokens = prompt_tokens or 0
         completion_tokens = completion_tokens or 0
@@ -5,7 +5,11 @@ Configuration Service
 Provides two types of configuration:
 
 1. **YAML Configuration (loader.py)** - For application settings from config/*.yaml
-   - PROJECT_ROOT, load_config_with_main, get_path_from_config, parse_language, get_agent_params
+   - PROJECT_ROOT, load_config_with_main, get_path_from_config, parse_language, get_agent_params,
+     get_llm_cache_params
+   - Parsed files are cached and revalidated by mtime: get_config_snapshot (read-only view),
+     subscribe_config_changes / unsubscribe_config_changes, check_config_changes,
+     clear_config_cache
 
 2. **Unified Config Service (unified_config.py)** - For service configurations (LLM, Embedding, TTS, Search)
    - ConfigType, UnifiedConfigManager, get_config_manager
@@ -15,10 +19,17 @@ Provides two types of configuration:
 # Re-export everything from loader.py (existing functionality)
 from .loader import (
     PROJECT_ROOT,
+    check_config_changes,
+    clear_config_cache,
     get_agent_params,
+    get_config_snapshot,
+    get_llm_cache_params,
     get_path_from_config,
     load_config_with_main,
+    load_config_with_main_async,
     parse_language,
+    subscribe_config_changes,
+    unsubscribe_config_changes,
 )
 
 # Export new unified config service
@@ -36,9 +47,16 @@ __all__ = [
     # From loader.py
     "PROJECT_ROOT",
     "load_config_with_main",
+    "load_config_with_main_async",
+    "get_config_snapshot",
+    "subscribe_config_changes",
+    "unsubscribe_config_changes",
+    "check_config_changes",
+    "clear_config_cache",
     "get_path_from_config",
     "parse_language",
     "get_agent_params",
+    "get_llm_cache_params",
     # From unified_config.py
     "ConfigType",
     "UnifiedConfigManager",
@@ -6,12 +6,25 @@ Configuration Loader
 
 Unified configuration loading for all praDeep modules.
 Provides YAML configuration loading, path resolution, and language parsing.
+
+Parsed configuration is cached per process and revalidated against the
+(mtime, size) of every file it was built from, so repeated loads only cost a
+couple of ``stat`` calls. Edits are picked up on the next load; listeners
+registered with ``subscribe_config_changes`` are told which files changed.
+
+Only files loaded through this module (config/*.yaml) are watched. Prompt YAML
+files are not: editing a prompt does not trigger a reload, and PromptManager only
+drops its cache when one of the config files changes. LLM settings are not cached
+(``get_llm_config`` reads them on every call), so they need no listener.
 """
 
 import asyncio
+import copy
 import os
 from pathlib import Path
-from typing import Any
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 import yaml
 
@@ -59,52 +72,143 @@ async def _load_yaml_file_async(file_path: Path) -> dict[str, Any]:
     return await asyncio.to_thread(_load_yaml_file, file_path)
 
 
-def load_config_with_main(config_file: str, project_root: Path | None = None) -> dict[str, Any]:
-    """
-    Load configuration file, automatically merge with main.yaml common configuration
-
-    Args:
-        config_file: Sub-module configuration file name (e.g., "solve_config.yaml")
-        project_root: Project root directory (if None, will try to auto-detect)
+# ---------------------------------------------------------------------------
+# Process-wide config cache
+# ---------------------------------------------------------------------------
 
-    Returns:
-        Merged configuration dictionary
-    """
-    if project_root is None:
-        project_root = PROJECT_ROOT
+# Cache key (tuple of source paths) -> (signatures, merged dict, frozen snapshot)
+_config_cache: dict[tuple[Path, ...], tuple[tuple, dict[str, Any], Mapping[str, Any]]] = {}
+_config_cache_lock = threading.Lock()
+_config_listeners: list[Callable[[list[Path]], None]] = []
 
-    config_dir = project_root / "config"
 
-    # 1. Load main.yaml (common configuration)
-    main_config = {}
-    main_config_path = config_dir / "main.yaml"
-    if main_config_path.exists():
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a config file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _read_config_files(paths: tuple[Path, ...]) -> dict[str, Any]:
+    """Parse and deep-merge ``paths`` in order; missing or broken files count as empty."""
+    merged: dict[str, Any] = {}
+    for path in paths:
+        if not path.exists():
+            continue
         try:
-            main_config = _load_yaml_file(main_config_path)
+            merged = _deep_merge(merged, _load_yaml_file(path))
         except Exception as e:
-            print(f"⚠️ Failed to load main.yaml: {e}")
+            print(f"⚠️ Failed to load {path.name}: {e}")
+    return merged
+
+
+def _fresh_entry(paths: tuple[Path, ...]):
+    """Return the cached entry for ``paths`` if every source file is unchanged."""
+    entry = _config_cache.get(paths)
+    if entry is not None and entry[0] == tuple(_file_signature(p) for p in paths):
+        return entry
+    return None
+
+
+def _reload_entry(paths: tuple[Path, ...]):
+    """Re-parse ``paths``, store the result and notify listeners if it replaced a stale entry."""
+    signatures = tuple(_file_signature(p) for p in paths)
+    merged = _read_config_files(paths)
+    entry = (signatures, merged, _freeze(merged))
+
+    with _config_cache_lock:
+        previous = _config_cache.get(paths)
+        _config_cache[paths] = entry
+
+    if previous is not None and previous[0] != signatures:
+        changed = [p for p, old, new in zip(paths, previous[0], signatures) if old != new]
+        _notify_config_listeners(changed)
+    return entry
+
+
+def _load_cached(paths: tuple[Path, ...]):
+    return _fresh_entry(paths) or _reload_entry(paths)
 
-    # 2. Load sub-module configuration file
-    module_config = {}
-    module_config_path = config_dir / config_file
-    if module_config_path.exists():
+
+def _main_config_paths(config_file: str, project_root: Path | None) -> tuple[Path, ...]:
+    config_dir = (project_root if project_root is not None else PROJECT_ROOT) / "config"
+    # main.yaml as base, sub-module config overrides
+    return (config_dir / "main.yaml", config_dir / config_file)
+
+
+def _notify_config_listeners(changed: list[Path]) -> None:
+    for callback in list(_config_listeners):
         try:
-            module_config = _load_yaml_file(module_config_path)
+            callback(changed)
         except Exception as e:
-            print(f"⚠️ Failed to load {config_file}: {e}")
+            print(f"⚠️ Config change listener {callback!r} failed: {e}")
+
+
+def subscribe_config_changes(callback: Callable[[list[Path]], None]) -> None:
+    """
+    Register ``callback`` to be called with the list of changed file paths whenever a
+    cached configuration is found to be stale and reloaded.
 
-    # 3. Merge configurations: main.yaml as base, sub-module config overrides
-    merged_config = _deep_merge(main_config, module_config)
+    Reloads are detected lazily on the next load of an affected config, or eagerly via
+    ``check_config_changes``. Callbacks run on the thread that detected the change.
+    Only config files loaded through this module are watched (not prompt files).
+    """
+    if callback not in _config_listeners:
+        _config_listeners.append(callback)
 
-    return merged_config
 
+def unsubscribe_config_changes(callback: Callable[[list[Path]], None]) -> None:
+    """Remove a callback registered with ``subscribe_config_changes``."""
+    if callback in _config_listeners:
+        _config_listeners.remove(callback)
 
-async def load_config_with_main_async(
-    config_file: str, project_root: Path | None = None
-) -> dict[str, Any]:
+
+def check_config_changes() -> list[Path]:
     """
-    Async version of load_config_with_main for non-blocking file operations.
+    Revalidate every cached configuration, reloading stale ones.
+
+    Returns:
+        Paths of the files that changed since they were last loaded
+    """
+    changed: list[Path] = []
+    for paths in list(_config_cache):
+        entry = _config_cache.get(paths)
+        if entry is None or _fresh_entry(paths) is not None:
+            continue
+        changed.extend(p for p, old in zip(paths, entry[0]) if _file_signature(p) != old)
+        _reload_entry(paths)
+    return list(dict.fromkeys(changed))
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configuration (the next load re-reads from disk)."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def get_config_snapshot(config_file: str, project_root: Path | None = None) -> Mapping[str, Any]:
+    """
+    Read-only view of ``load_config_with_main(config_file, project_root)``.
+
+    The snapshot is shared between callers and is not copied: nested sections are
+    mappings and lists are tuples. Use this on hot paths that only read settings.
+    """
+    return _load_cached(_main_config_paths(config_file, project_root))[2]
 
+
+def load_config_with_main(config_file: str, project_root: Path | None = None) -> dict[str, Any]:
+    """
     Load configuration file, automatically merge with main.yaml common configuration
 
     Args:
@@ -112,35 +216,33 @@ async def load_config_with_main_async(
         project_root: Project root directory (if None, will try to auto-detect)
 
     Returns:
-        Merged configuration dictionary
+        Merged configuration dictionary (a private copy the caller may modify)
     """
-    if project_root is None:
-        project_root = PROJECT_ROOT
+    entry = _load_cached(_main_config_paths(config_file, project_root))
+    return copy.deepcopy(entry[1])
 
-    config_dir = project_root / "config"
 
-    # 1. Load main.yaml (common configuration)
-    main_config = {}
-    main_config_path = config_dir / "main.yaml"
-    if main_config_path.exists():
-        try:
-            main_config = await _load_yaml_file_async(main_config_path)
-        except Exception as e:
-            print(f"⚠️ Failed to load main.yaml: {e}")
+async def load_config_with_main_async(
+    config_file: str, project_root: Path | None = None
+) -> dict[str, Any]:
+    """
+    Async version of load_config_with_main for non-blocking file operations.
 
-    # 2. Load sub-module configuration file
-    module_config = {}
-    module_config_path = config_dir / config_file
-    if module_config_path.exists():
-        try:
-            module_config = await _load_yaml_file_async(module_config_path)
-        except Exception as e:
-            print(f"⚠️ Failed to load {config_file}: {e}")
+    Load configuration file, automatically merge with main.yaml common configuration
 
-    # 3. Merge configurations: main.yaml as base, sub-module config overrides
-    merged_config = _deep_merge(main_config, module_config)
+    Args:
+        config_file: Sub-module configuration file name (e.g., "solve_config.yaml")
+        project_root: Project root directory (if None, will try to auto-detect)
 
-    return merged_config
+    Returns:
+        Merged configuration dictionary (a private copy the caller may modify)
+    """
+    paths = _main_config_paths(config_file, project_root)
+    entry = _fresh_entry(paths)
+    if entry is None:
+        # Only parsing is pushed off the event loop; cache hits are a couple of stats
+        entry = await asyncio.to_thread(_reload_entry, paths)
+    return copy.deepcopy(entry[1])
 
 
 def get_path_from_config(config: dict[str, Any], path_key: str, default: str = None) -> str:
@@ -258,8 +360,7 @@ def get_agent_params(module_name: str) -> dict:
         config_path = PROJECT_ROOT / "config" / "agents.yaml"
 
         if config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                agents_config = yaml.safe_load(f) or {}
+            agents_config = _load_cached((config_path,))[2]
 
             if module_name in agents_config:
                 module_config = agents_config[module_name]
@@ -277,11 +378,59 @@ def get_agent_params(module_name: str) -> dict:
     return params
 
 
+def get_llm_cache_params() -> dict[str, Any]:
+    """
+    Get LLM response cache settings from the ``llm_cache`` section of config/agents.yaml.
+
+    Returns:
+        dict: Dictionary containing:
+            - enabled: bool, master switch (default True)
+            - ttl_seconds: float, entry lifetime (default 7 days)
+            - cache_dir: str | None, storage directory override
+            - agents: dict[str, list[str]], module name -> agent names that opt in
+
+    Example:
+        >>> params = get_llm_cache_params()
+        >>> "decompose_agent" in params["agents"].get("research", [])
+    """
+    params: dict[str, Any] = {
+        "enabled": True,
+        "ttl_seconds": 7 * 24 * 3600,
+        "cache_dir": None,
+        "agents": {},
+    }
+
+    try:
+        config_path = PROJECT_ROOT / "config" / "agents.yaml"
+        if config_path.exists():
+            agents_config = _load_cached((config_path,))[2]
+            cache_config = agents_config.get("llm_cache") or {}
+            params["enabled"] = bool(cache_config.get("enabled", params["enabled"]))
+            params["ttl_seconds"] = float(cache_config.get("ttl_seconds", params["ttl_seconds"]))
+            params["cache_dir"] = cache_config.get("cache_dir") or None
+            agents = cache_config.get("agents") or {}
+            if isinstance(agents, Mapping):
+                params["agents"] = {
+                    str(module): [str(a) for a in (names or [])] for module, names in agents.items()
+                }
+    except Exception as e:
+        print(f"⚠️ Failed to load llm_cache from agents.yaml: {e}, using defaults")
+
+    return params
+
+
 __all__ = [
     "PROJECT_ROOT",
     "load_config_with_main",
+    "load_config_with_main_async",
+    "get_config_snapshot",
+    "subscribe_config_changes",
+    "unsubscribe_config_changes",
+    "check_config_changes",
+    "clear_config_cache",
     "get_path_from_config",
     "parse_language",
     "get_agent_params",
+    "get_llm_cache_params",
     "_deep_merge",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from src.services.config import load_config_with_main
+from src.services.config import get_config_snapshot
 
 from .types import CouncilRun
 
@@ -33,7 +33,7 @@ class CouncilLogStore:
                 self._user_data_dir = self._base_dir
             return
 
-        config = load_config_with_main("solve_config.yaml", self._project_root)
+        config = get_config_snapshot("solve_config.yaml", self._project_root)
         user_data_dir = config.get("paths", {}).get("user_data_dir", "./data/user")
         user_data_path = (
             Path(user_data_dir)
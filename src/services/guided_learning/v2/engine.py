@@ -5,7 +5,9 @@ No I/O, no LLM calls. All external interactions go through adapters.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime
+import heapq
 
 from .types import (
     Activity,
@@ -15,13 +17,149 @@ from .types import (
     MasteryState,
     NodeStatus,
     ObjectiveMastery,
+    ObjectiveNode,
     PlanGraph,
     ResponseEvaluation,
     Stage,
 )
 
+_DONE_STATUSES = (NodeStatus.COMPLETED, NodeStatus.SKIPPED)
+_MASTERED_STATES = (MasteryState.COMPETENT, MasteryState.AUTOMATIC)
+
+# Frontiers kept per engine (learner models x plan graphs)
+MAX_TRACKED_FRONTIERS = 256
+
+
+def _objective_score(mastery: ObjectiveMastery | None) -> int:
+    if mastery is None:
+        return 100
+    if mastery.mastery_state == MasteryState.NOVICE:
+        return 90
+    if mastery.mastery_state == MasteryState.SHAKY:
+        return 80
+    if mastery.mastery_state == MasteryState.COMPETENT:
+        return 20
+    return 10
+
+
+class ObjectiveFrontier:
+    """
+    Available objectives of one plan graph for one learner, kept up to date
+    incrementally.
+
+    Each objective keeps a count of unmet prerequisites; a mastery or status
+    change only touches the objective's dependents (O(degree)). Selection pops
+    from a heap keyed by (score, node position) with lazy deletion of stale
+    entries.
+
+    Objectives are re-checked against the graph and learner model before they
+    are returned, so a node status or mastery state assigned directly (instead of
+    through ``MasteryEngine``) is picked up when it affects the answer.
+    """
+
+    def __init__(self, plan_graph: PlanGraph, learner_model: LearnerModel):
+        self.plan_graph = plan_graph
+        self.learner_model = learner_model
+        self.graph_version = plan_graph.version
+
+        self._met: dict[str, bool] = {}
+        self._unmet: dict[str, int] = {}
+        self._available: set[str] = set()
+        self._heap: list[tuple[int, int, str]] = []
+        self._scores: dict[str, int] = {}
+
+        for node in plan_graph.nodes:
+            self._unmet.setdefault(node.objective_id, 0)
+        for from_id, to_id in plan_graph.edges:
+            if to_id in self._unmet and not self._prereq_met(from_id):
+                self._unmet[to_id] += 1
+        for obj_id in self._unmet:
+            self._refresh(obj_id)
+
+    def _prereq_met(self, objective_id: str) -> bool:
+        met = self._met.get(objective_id)
+        if met is None:
+            met = self._is_mastered(objective_id)
+            self._met[objective_id] = met
+        return met
+
+    def _is_mastered(self, objective_id: str) -> bool:
+        node = self.plan_graph.get_node(objective_id)
+        if node is not None and node.status in _DONE_STATUSES:
+            return True
+        mastery = self.learner_model.objectives.get(objective_id)
+        return mastery is not None and mastery.mastery_state in _MASTERED_STATES
+
+    def _refresh(self, objective_id: str) -> None:
+        """Recompute membership and score of one objective."""
+        node = self.plan_graph.get_node(objective_id)
+        if node is None or node.status in _DONE_STATUSES or self._unmet[objective_id] > 0:
+            self._available.discard(objective_id)
+            return
+        self._available.add(objective_id)
+        score = _objective_score(self.learner_model.objectives.get(objective_id))
+        if self._scores.get(objective_id) != score:
+            self._scores[objective_id] = score
+            heapq.heappush(
+                self._heap, (-score, self.plan_graph.get_position(objective_id), objective_id)
+            )
+
+    def update(self, objective_id: str) -> None:
+        """Re-evaluate an objective after its mastery or node status changed."""
+        met = self._is_mastered(objective_id)
+        previous = self._met.get(objective_id)
+        self._met[objective_id] = met
+        if previous is not None and previous != met:
+            delta = -1 if met else 1
+            for dependent in self.plan_graph.get_dependents(objective_id):
+                if dependent in self._unmet:
+                    self._unmet[dependent] += delta
+                    self._refresh(dependent)
+        if objective_id in self._unmet:
+            self._refresh(objective_id)
+
+    def _is_current(self, objective_id: str) -> bool:
+        """Whether the cached state of an available objective still holds."""
+        node = self.plan_graph.get_node(objective_id)
+        if node is None or node.status in _DONE_STATUSES:
+            return False
+        met = self._met.get(objective_id)
+        if met is not None and met != self._is_mastered(objective_id):
+            return False
+        mastery = self.learner_model.objectives.get(objective_id)
+        return self._scores.get(objective_id) == _objective_score(mastery)
+
+    def available(self) -> list[str]:
+        """Available objectives in plan order."""
+        for obj_id in list(self._available):
+            if not self._is_current(obj_id):
+                self.update(obj_id)
+        return sorted(self._available, key=self.plan_graph.get_position)
+
+    def select(self) -> str | None:
+        """Highest-priority available objective (ties go to the earlier node)."""
+        heap = self._heap
+        while heap:
+            neg_score, _, obj_id = heap[0]
+            if obj_id in self._available and self._scores.get(obj_id) == -neg_score:
+                if self._is_current(obj_id):
+                    return obj_id
+                # Changed without going through the engine; update and look again
+                self.update(obj_id)
+                continue
+            heapq.heappop(heap)
+            if obj_id not in self._available:
+                self._scores.pop(obj_id, None)
+        return None
+
 
 class MasteryEngine:
+    def __init__(self, max_tracked_frontiers: int = MAX_TRACKED_FRONTIERS):
+        self.max_tracked_frontiers = max_tracked_frontiers
+        # id(learner_model) -> {id(plan_graph): frontier}; frontiers hold both objects,
+        # so the ids stay valid while an entry exists
+        self._frontiers: OrderedDict[int, dict[int, ObjectiveFrontier]] = OrderedDict()
+
     def evaluate_response(
         self,
         activity: Activity,
@@ -34,11 +172,7 @@ class MasteryEngine:
         learner_model: LearnerModel,
         plan_graph: PlanGraph,
     ) -> Activity | None:
-        available_objectives = self._get_available_objectives(learner_model, plan_graph)
-        if not available_objectives:
-            return None
-
-        objective_id = self._select_next_objective(available_objectives, learner_model, plan_graph)
+        objective_id = self.select_next_objective(learner_model, plan_graph)
         if not objective_id:
             return None
 
@@ -77,28 +211,66 @@ class MasteryEngine:
         mastery.confidence = evaluation.confidence
         learner_model.streaks[activity.objective_id] = mastery.correct_streak
 
+        for frontier in self._frontiers.get(id(learner_model), {}).values():
+            frontier.update(activity.objective_id)
+
         return learner_model
 
-    def _get_available_objectives(
+    def select_next_objective(
         self,
         learner_model: LearnerModel,
         plan_graph: PlanGraph,
-    ) -> list[str]:
-        available = []
-        for node in plan_graph.nodes:
-            if node.status in (NodeStatus.COMPLETED, NodeStatus.SKIPPED):
-                continue
-
-            prerequisites = plan_graph.get_prerequisites(node.objective_id)
-            all_prereqs_met = all(
-                self._is_objective_mastered(prereq_id, learner_model, plan_graph)
-                for prereq_id in prerequisites
-            )
+    ) -> str | None:
+        return self._get_frontier(learner_model, plan_graph).select()
 
-            if all_prereqs_met:
-                available.append(node.objective_id)
+    def set_node_status(
+        self,
+        plan_graph: PlanGraph,
+        objective_id: str,
+        status: NodeStatus,
+    ) -> ObjectiveNode | None:
+        """Change a node's status and update every frontier over this graph."""
+        node = plan_graph.get_node(objective_id)
+        if node is None:
+            return None
+        node.status = status
+        for by_graph in self._frontiers.values():
+            frontier = by_graph.get(id(plan_graph))
+            if frontier is not None:
+                frontier.update(objective_id)
+        return node
+
+    def _get_frontier(
+        self,
+        learner_model: LearnerModel,
+        plan_graph: PlanGraph,
+    ) -> ObjectiveFrontier:
+        by_graph = self._frontiers.get(id(learner_model))
+        if by_graph is None:
+            by_graph = {}
+            self._frontiers[id(learner_model)] = by_graph
+            while len(self._frontiers) > self.max_tracked_frontiers:
+                self._frontiers.popitem(last=False)
+        else:
+            self._frontiers.move_to_end(id(learner_model))
+
+        frontier = by_graph.get(id(plan_graph))
+        if (
+            frontier is None
+            or frontier.plan_graph is not plan_graph
+            or frontier.learner_model is not learner_model
+            or frontier.graph_version != plan_graph.version
+        ):
+            frontier = ObjectiveFrontier(plan_graph, learner_model)
+            by_graph[id(plan_graph)] = frontier
+        return frontier
 
-        return available
+    def _get_available_objectives(
+        self,
+        learner_model: LearnerModel,
+        plan_graph: PlanGraph,
+    ) -> list[str]:
+        return self._get_frontier(learner_model, plan_graph).available()
 
     def _is_objective_mastered(
         self,
@@ -107,14 +279,11 @@ class MasteryEngine:
         plan_graph: PlanGraph,
     ) -> bool:
         node = plan_graph.get_node(objective_id)
-        if node and node.status in (NodeStatus.COMPLETED, NodeStatus.SKIPPED):
+        if node and node.status in _DONE_STATUSES:
             return True
 
         mastery = learner_model.objectives.get(objective_id)
-        if mastery and mastery.mastery_state in (
-            MasteryState.COMPETENT,
-            MasteryState.AUTOMATIC,
-        ):
+        if mastery and mastery.mastery_state in _MASTERED_STATES:
             return True
 
         return False
@@ -128,24 +297,13 @@ class MasteryEngine:
         if not available_objectives:
             return None
 
-        scored = []
-        for obj_id in available_objectives:
-            mastery = learner_model.objectives.get(obj_id)
-            if mastery is None:
-                score = 100
-            elif mastery.mastery_state == MasteryState.NOVICE:
-                score = 90
-            elif mastery.mastery_state == MasteryState.SHAKY:
-                score = 80
-            elif mastery.mastery_state == MasteryState.COMPETENT:
-                score = 20
-            else:
-                score = 10
-
-            scored.append((obj_id, score))
-
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[0][0]
+        # Max score, earliest in the given order on ties
+        heap = [
+            (-_objective_score(learner_model.objectives.get(obj_id)), i, obj_id)
+            for i, obj_id in enumerate(available_objectives)
+        ]
+        heapq.heapify(heap)
+        return heap[0][2]
 
     def _determine_stage(
         self,
@@ -213,4 +371,4 @@ class MasteryEngine:
         return None
 
 
-__all__ = ["MasteryEngine"]
+__all__ = ["MasteryEngine", "ObjectiveFrontier"]
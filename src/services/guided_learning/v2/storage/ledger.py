@@ -1,78 +1,269 @@
+"""
+Append-only event ledger for guided learning v2 sessions (one JSONL file per session).
+
+Writes go through a committer thread that group-commits: events appended while a
+previous fsync is in flight, from any number of sessions or callers, are written
+together with one write + one fsync per ledger file. ``append_event`` blocks until
+its event is durable; ``append_event_async`` awaits the same commit without
+blocking the event loop.
+
+Next to each ledger the writer keeps a sparse offset index (``<session>.idx``):
+roughly every ``INDEX_INTERVAL_BYTES`` it records the byte offset of an event and
+the latest timestamp written before it, so ``get_events_since`` seeks straight
+to the right region instead of parsing the whole file. The index is only a hint;
+a missing or stale index falls back to scanning.
+"""
+
+import asyncio
+import bisect
+from concurrent.futures import Future
+from datetime import datetime
 import fcntl
 import json
 import os
-from datetime import datetime
 from pathlib import Path
+import threading
 from typing import Any, Iterator, Optional
 
+# Write a sparse index entry at most once per this many ledger bytes
+INDEX_INTERVAL_BYTES = 32 * 1024
+
+
+class _SessionIndex:
+    """In-memory copy of one session's sparse index."""
+
+    __slots__ = ("max_ts", "offsets", "last_offset", "max_ts_seen", "index_size")
+
+    def __init__(self):
+        # Parallel lists: latest timestamp before offsets[i], and the offset
+        self.max_ts: list[str] = []
+        self.offsets: list[int] = []
+        self.last_offset = 0
+        # Latest timestamp written to the ledger so far
+        self.max_ts_seen = ""
+        # Size of the .idx file this copy reflects
+        self.index_size = 0
+
 
 class LedgerWriter:
     BASE_DIR = Path("data/user/guide_v2/ledger")
 
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        index_interval_bytes: int = INDEX_INTERVAL_BYTES,
+    ):
         self._base_dir = Path(base_dir) if base_dir else self.BASE_DIR
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self.index_interval_bytes = index_interval_bytes
+
+        self._lock = threading.Lock()
+        self._has_work = threading.Condition(self._lock)
+        self._pending: list[tuple[str, bytes, str, Future]] = []
+        self._committer: Optional[threading.Thread] = None
+
+        self._index_lock = threading.Lock()
+        self._indexes: dict[str, _SessionIndex] = {}
+        self._stats = {"events": 0, "commits": 0, "fsyncs": 0}
 
     def _ledger_path(self, session_id: str) -> Path:
         return self._base_dir / f"{session_id}.jsonl"
 
-    def append_event(self, session_id: str, event: dict[str, Any]) -> None:
-        path = self._ledger_path(session_id)
-        path.parent.mkdir(parents=True, exist_ok=True)
+    def _index_path(self, session_id: str) -> Path:
+        return self._base_dir / f"{session_id}.idx"
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
 
-        event_with_meta = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "session_id": session_id,
-            **event,
-        }
+    def append_event(self, session_id: str, event: dict[str, Any]) -> int:
+        """
+        Append an event and wait until it is fsynced.
 
-        line = json.dumps(event_with_meta, ensure_ascii=False) + "\n"
-        encoded = line.encode("utf-8")
+        Returns:
+            Ledger offset just past the event
+        """
+        return self._submit(session_id, event).result()
+
+    async def append_event_async(self, session_id: str, event: dict[str, Any]) -> int:
+        """Append an event without blocking the event loop (same group commit)."""
+        return await asyncio.wrap_future(self._submit(session_id, event))
+
+    def get_stats(self) -> dict[str, int]:
+        """Get event/commit counters (events per fsync shows group-commit efficiency)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _submit(self, session_id: str, event: dict[str, Any]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            # Timestamp under the lock so ledger order matches timestamp order
+            event_with_meta = {
+                "timestamp": datetime.utcnow().isoformat(),
+                "session_id": session_id,
+                **event,
+            }
+            line = json.dumps(event_with_meta, ensure_ascii=False) + "\n"
+            timestamp = str(event_with_meta.get("timestamp", ""))
+            self._pending.append((session_id, line.encode("utf-8"), timestamp, future))
+            if self._committer is None or not self._committer.is_alive():
+                self._committer = threading.Thread(
+                    target=self._commit_loop, name="ledger-committer", daemon=True
+                )
+                self._committer.start()
+            self._has_work.notify()
+        return future
+
+    def _commit_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending:
+                    # Exit when idle; the next append starts a new committer
+                    if not self._has_work.wait(timeout=5.0) and not self._pending:
+                        self._committer = None
+                        return
+                batch = self._pending
+                self._pending = []
+
+            by_session: dict[str, list[tuple[bytes, str, Future]]] = {}
+            for session_id, data, timestamp, future in batch:
+                by_session.setdefault(session_id, []).append((data, timestamp, future))
+
+            for session_id, entries in by_session.items():
+                try:
+                    end_offsets = self._commit_session(session_id, entries)
+                except BaseException as e:
+                    for _, _, future in entries:
+                        future.set_exception(e)
+                    continue
+                for (_, _, future), end in zip(entries, end_offsets):
+                    future.set_result(end)
+
+    def _commit_session(
+        self, session_id: str, entries: list[tuple[bytes, str, Future]]
+    ) -> list[int]:
+        path = self._ledger_path(session_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
 
         fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
         try:
             fcntl.flock(fd, fcntl.LOCK_EX)
             try:
-                os.write(fd, encoded)
+                start = os.fstat(fd).st_size
+                data = b"".join(data for data, _, _ in entries)
+                written = 0
+                while written < len(data):
+                    written += os.write(fd, data[written:])
                 os.fsync(fd)
             finally:
                 fcntl.flock(fd, fcntl.LOCK_UN)
         finally:
             os.close(fd)
 
-    def read_events(self, session_id: str) -> list[dict[str, Any]]:
-        path = self._ledger_path(session_id)
-        if not path.exists():
-            return []
+        end_offsets = []
+        offset = start
+        for data, _, _ in entries:
+            offset += len(data)
+            end_offsets.append(offset)
 
-        events = []
-        with open(path, "r", encoding="utf-8") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
+        with self._lock:
+            self._stats["events"] += len(entries)
+            self._stats["commits"] += 1
+            self._stats["fsyncs"] += 1
+        self._update_index(session_id, start, entries)
+        return end_offsets
+
+    # ------------------------------------------------------------------
+    # Sparse offset index
+    # ------------------------------------------------------------------
+
+    def _load_index(self, session_id: str) -> _SessionIndex:
+        """Return the cached index, reloading it if the .idx file changed on disk."""
+        index_path = self._index_path(session_id)
+        try:
+            size = index_path.stat().st_size
+        except OSError:
+            size = 0
+
+        cached = self._indexes.get(session_id)
+        if cached is not None and cached.index_size == size:
+            return cached
+
+        index = _SessionIndex()
+        if size:
+            with open(index_path, "r", encoding="utf-8") as f:
                 for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            events.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-        return events
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) != 2:
+                        continue
+                    try:
+                        offset = int(parts[1])
+                    except ValueError:
+                        continue
+                    if index.offsets and offset <= index.offsets[-1]:
+                        continue
+                    index.max_ts.append(parts[0])
+                    index.offsets.append(offset)
+            index.index_size = size
+            if index.offsets:
+                index.last_offset = index.offsets[-1]
+                index.max_ts_seen = index.max_ts[-1]
 
-    def get_events_since(self, session_id: str, since: datetime) -> list[dict[str, Any]]:
-        events = self.read_events(session_id)
-        since_iso = since.isoformat()
-        return [e for e in events if e.get("timestamp", "") >= since_iso]
+        # Events after the last entry still count towards the next entry's max_ts
+        for event in self._read_from(self._ledger_path(session_id), index.last_offset):
+            timestamp = str(event.get("timestamp", ""))
+            if timestamp > index.max_ts_seen:
+                index.max_ts_seen = timestamp
 
-    def iter_events(self, session_id: str) -> Iterator[dict[str, Any]]:
-        path = self._ledger_path(session_id)
+        self._indexes[session_id] = index
+        return index
+
+    def _update_index(
+        self, session_id: str, start: int, entries: list[tuple[bytes, str, Future]]
+    ) -> None:
+        with self._index_lock:
+            index = self._load_index(session_id)
+            new_lines = []
+            offset = start
+            for data, timestamp, _ in entries:
+                if offset and offset - index.last_offset >= self.index_interval_bytes:
+                    index.max_ts.append(index.max_ts_seen)
+                    index.offsets.append(offset)
+                    index.last_offset = offset
+                    new_lines.append(f"{index.max_ts_seen}\t{offset}\n")
+                if timestamp > index.max_ts_seen:
+                    index.max_ts_seen = timestamp
+                offset += len(data)
+
+            if new_lines:
+                # Not fsynced: a lost entry only means a longer scan
+                with open(self._index_path(session_id), "a", encoding="utf-8") as f:
+                    f.write("".join(new_lines))
+                index.index_size = self._index_path(session_id).stat().st_size
+
+    def _seek_offset(self, session_id: str, since_iso: str) -> int:
+        """Largest indexed offset before which every event is older than ``since_iso``."""
+        with self._index_lock:
+            index = self._load_index(session_id)
+            i = bisect.bisect_left(index.max_ts, since_iso)
+            return index.offsets[i - 1] if i else 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read_from(self, path: Path, offset: int = 0) -> Iterator[dict[str, Any]]:
         if not path.exists():
             return
 
-        with open(path, "r", encoding="utf-8") as f:
+        with open(path, "rb") as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_SH)
             try:
+                if offset:
+                    if offset > os.fstat(f.fileno()).st_size:
+                        # Stale index (file replaced); scan everything
+                        offset = 0
+                    f.seek(offset)
                 for line in f:
                     line = line.strip()
                     if line:
@@ -82,3 +273,18 @@ class LedgerWriter:
                             continue
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def read_events(self, session_id: str) -> list[dict[str, Any]]:
+        return list(self._read_from(self._ledger_path(session_id)))
+
+    def get_events_since(self, session_id: str, since: datetime) -> list[dict[str, Any]]:
+        since_iso = since.isoformat()
+        offset = self._seek_offset(session_id, since_iso)
+        return [
+            e
+            for e in self._read_from(self._ledger_path(session_id), offset)
+            if e.get("timestamp", "") >= since_iso
+        ]
+
+    def iter_events(self, session_id: str) -> Iterator[dict[str, Any]]:
+        yield from self._read_from(self._ledger_path(session_id))
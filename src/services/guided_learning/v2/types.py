@@ -8,6 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import heapq
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -153,20 +154,127 @@ class ObjectiveNode:
 
 @dataclass
 class PlanGraph:
+    """
+    Objective DAG. Lookups go through adjacency indices built lazily from
+    ``nodes``/``edges``; the indices are rebuilt if either list is replaced or
+    changes length, and kept up to date by ``add_node``/``add_edge``.
+    """
+
     nodes: list[ObjectiveNode] = field(default_factory=list)
     edges: list[tuple[str, str]] = field(default_factory=list)
 
+    _index_key: tuple[int, int, int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _by_id: dict[str, ObjectiveNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _positions: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _prereqs: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _dependents: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _topo_order: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _current_key(self) -> tuple[int, int, int, int]:
+        return (id(self.nodes), len(self.nodes), id(self.edges), len(self.edges))
+
+    def _ensure_index(self) -> None:
+        if self._index_key == self._current_key():
+            return
+        self._by_id = {}
+        self._positions = {}
+        for position, node in enumerate(self.nodes):
+            # First occurrence wins, like the linear scan did
+            if node.objective_id not in self._by_id:
+                self._by_id[node.objective_id] = node
+                self._positions[node.objective_id] = position
+        self._prereqs = {}
+        self._dependents = {}
+        for from_id, to_id in self.edges:
+            self._prereqs.setdefault(to_id, []).append(from_id)
+            self._dependents.setdefault(from_id, []).append(to_id)
+        self._topo_order = None
+        self._index_key = self._current_key()
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Changes whenever the graph structure changes."""
+        self._ensure_index()
+        return self._version
+
     def get_node(self, objective_id: str) -> ObjectiveNode | None:
-        for node in self.nodes:
-            if node.objective_id == objective_id:
-                return node
-        return None
+        self._ensure_index()
+        return self._by_id.get(objective_id)
+
+    def get_position(self, objective_id: str) -> int:
+        """Index of the node in ``nodes`` (-1 if unknown)."""
+        self._ensure_index()
+        return self._positions.get(objective_id, -1)
 
     def get_prerequisites(self, objective_id: str) -> list[str]:
-        return [from_id for from_id, to_id in self.edges if to_id == objective_id]
+        self._ensure_index()
+        return list(self._prereqs.get(objective_id, ()))
 
     def get_dependents(self, objective_id: str) -> list[str]:
-        return [to_id for from_id, to_id in self.edges if from_id == objective_id]
+        self._ensure_index()
+        return list(self._dependents.get(objective_id, ()))
+
+    def add_node(self, node: ObjectiveNode) -> None:
+        self._ensure_index()
+        self.nodes.append(node)
+        if node.objective_id not in self._by_id:
+            self._by_id[node.objective_id] = node
+            self._positions[node.objective_id] = len(self.nodes) - 1
+        self._topo_order = None
+        self._index_key = self._current_key()
+        self._version += 1
+
+    def add_edge(self, from_id: str, to_id: str) -> None:
+        self._ensure_index()
+        self.edges.append((from_id, to_id))
+        self._prereqs.setdefault(to_id, []).append(from_id)
+        self._dependents.setdefault(from_id, []).append(to_id)
+        self._topo_order = None
+        self._index_key = self._current_key()
+        self._version += 1
+
+    def topological_order(self) -> list[str]:
+        """
+        Objective ids with prerequisites first (ties keep node order). Nodes on a
+        cycle are appended at the end in node order. Cached until the graph changes.
+        """
+        self._ensure_index()
+        if self._topo_order is not None:
+            return list(self._topo_order)
+
+        in_degree = {obj_id: 0 for obj_id in self._by_id}
+        for to_id, prereqs in self._prereqs.items():
+            if to_id in in_degree:
+                in_degree[to_id] = sum(1 for p in prereqs if p in in_degree)
+
+        ready = [self._positions[obj_id] for obj_id, d in in_degree.items() if d == 0]
+        heapq.heapify(ready)
+        order: list[str] = []
+        while ready:
+            obj_id = self.nodes[heapq.heappop(ready)].objective_id
+            order.append(obj_id)
+            for dependent in self._dependents.get(obj_id, ()):
+                if dependent in in_degree:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        heapq.heappush(ready, self._positions[dependent])
+
+        if len(order) < len(in_degree):
+            placed = set(order)
+            order.extend(obj_id for obj_id in self._by_id if obj_id not in placed)
+
+        self._topo_order = order
+        return list(order)
 
 
 @dataclass
@@ -43,6 +43,10 @@ Usage:
     from src.services.llm import get_llm_config, LLMConfig
     config = get_llm_config()
 
+    # Token counting (cached encoders, memoized counts)
+    from src.services.llm import count_tokens
+    n = count_tokens("Hello!", model="gpt-4o-mini")
+
     # URL utilities for local LLM servers
     from src.services.llm import sanitize_url, is_local_llm_server
 """
@@ -54,6 +58,7 @@ from .capabilities import (
     MODEL_OVERRIDES,
     PROVIDER_CAPABILITIES,
     get_capability,
+    get_context_window,
     has_thinking_tags,
     requires_api_version,
     supports_response_format,
@@ -90,6 +95,17 @@ from .factory import (
     get_provider_presets,
     stream,
 )
+from .response_cache import (
+    LLMResponseCache,
+    LLMResponseCacheMiss,
+    get_llm_response_cache,
+)
+from .tokenizer import (
+    TokenizerService,
+    count_message_tokens,
+    count_tokens,
+    get_tokenizer,
+)
 from .utils import (
     build_auth_headers,
     build_chat_url,
@@ -114,6 +130,7 @@ __all__ = [
     "MODEL_OVERRIDES",
     "DEFAULT_CAPABILITIES",
     "get_capability",
+    "get_context_window",
     "supports_response_format",
     "supports_streaming",
     "system_in_messages",
@@ -141,6 +158,15 @@ __all__ = [
     "DEFAULT_MAX_RETRIES",
     "DEFAULT_RETRY_DELAY",
     "DEFAULT_EXPONENTIAL_BACKOFF",
+    # Response cache
+    "LLMResponseCache",
+    "LLMResponseCacheMiss",
+    "get_llm_response_cache",
+    # Tokenizer
+    "TokenizerService",
+    "get_tokenizer",
+    "count_tokens",
+    "count_message_tokens",
     # Providers
     "cloud_provider",
     "local_provider",
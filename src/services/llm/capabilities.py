@@ -15,6 +15,9 @@ Usage:
     # Generic capability check
     if get_capability(binding, "streaming", default=True):
         # use streaming
+
+    # Context window used for pre-flight prompt budgeting (None if unknown)
+    window = get_context_window(binding, model)
 """
 
 from typing import Any, Optional
@@ -134,33 +137,56 @@ DEFAULT_CAPABILITIES: dict[str, Any] = {
 # Model-specific overrides
 # Format: {model_pattern: {capability: value}}
 # Patterns are matched with case-insensitive startswith
+# "context_window" is the total (prompt + completion) token limit; models without
+# a known window are not budgeted up front (see get_context_window).
 MODEL_OVERRIDES: dict[str, dict[str, Any]] = {
+    # OpenAI models
+    "gpt-3.5-turbo": {"context_window": 16385},
+    "gpt-4": {"context_window": 8192},
+    "gpt-4-32k": {"context_window": 32768},
+    "gpt-4-turbo": {"context_window": 128000},
+    "gpt-4o": {"context_window": 128000},
+    "gpt-4.1": {"context_window": 1047576},
+    "gpt-5": {"context_window": 400000},
+    "o1": {"context_window": 200000},
+    "o3": {"context_window": 200000},
+    "o4": {"context_window": 200000},
     "deepseek": {
         "supports_response_format": False,
         "has_thinking_tags": True,
+        "context_window": 65536,
     },
     "deepseek-reasoner": {
         "supports_response_format": False,
         "has_thinking_tags": True,
+        "context_window": 65536,
     },
     "qwen": {
         # Qwen models may have thinking tags
         "has_thinking_tags": True,
+        "context_window": 32768,
     },
     "qwq": {
         # QwQ is Qwen's reasoning model with thinking tags
         "has_thinking_tags": True,
+        "context_window": 32768,
     },
     # Claude models through OpenRouter or other providers
     "claude": {
         "supports_response_format": False,
         "system_in_messages": False,
+        "context_window": 200000,
     },
     # Anthropic models
     "anthropic/": {
         "supports_response_format": False,
         "system_in_messages": False,
+        "context_window": 200000,
     },
+    "openai/gpt-4o": {"context_window": 128000},
+    "mistral-large": {"context_window": 131072},
+    "llama-3.1": {"context_window": 131072},
+    "llama-3.3": {"context_window": 131072},
 }
 
 
@@ -299,6 +325,24 @@ def requires_api_version(binding: str, model: Optional[str] = None) -> bool:
     return get_capability(binding, "requires_api_version", model, default=False)
 
 
+def get_context_window(binding: str, model: Optional[str] = None) -> Optional[int]:
+    """
+    Get the context window (prompt + completion tokens) for a provider/model.
+
+    Args:
+        binding: Provider binding name
+        model: Optional model name
+
+    Returns:
+        Context window in tokens, or None if unknown
+    """
+    value = get_capability(binding, "context_window", model, default=None)
+    try:
+        return int(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
 __all__ = [
     "PROVIDER_CAPABILITIES",
     "MODEL_OVERRIDES",
@@ -310,4 +354,5 @@ __all__ = [
     "has_thinking_tags",
     "supports_tools",
     "requires_api_version",
+    "get_context_window",
 ]
@@ -28,16 +28,29 @@ Retry Mechanism:
 - Automatic retry with exponential backoff for transient errors
 - Configurable max_retries, retry_delay, and exponential_backoff
 - Only retries on retriable errors (timeout, rate limit, server errors)
+
+Context Budgeting:
+- Before the first request, prompts are counted (memoized tokenizer) and fitted to
+  the model's context window from capabilities.py: oldest history first, then
+  RAG/system context, then remaining history
+- Provider context-window errors still trigger the shrink-and-retry path as a fallback
+
+Response Cache:
+- Opt-in exact-match cache for deterministic calls (complete(..., use_cache=True)),
+  see response_cache.py
 """
 
 import asyncio
+import hashlib
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import tenacity
 
 from src.logging.logger import get_logger
+from src.utils.network.single_flight import get_single_flight, make_flight_key
 
 from . import cloud_provider, local_provider
+from .capabilities import get_context_window
 from .config import get_llm_config
 from .exceptions import (
     LLMAPIError,
@@ -47,6 +60,8 @@ from .exceptions import (
     LLMTimeoutError,
     ProviderContextWindowError,
 )
+from .response_cache import LLMResponseCacheMiss, get_llm_response_cache, make_cache_key
+from .tokenizer import MESSAGE_OVERHEAD_TOKENS, REPLY_OVERHEAD_TOKENS, get_tokenizer
 from .utils import is_local_llm_server
 
 # Initialize logger
@@ -66,6 +81,13 @@ DEFAULT_USER_SUMMARY_CHUNK_CHARS = 3500
 DEFAULT_USER_SUMMARY_MAX_CHUNKS = 5
 DEFAULT_USER_SUMMARY_MAX_OUTPUT_CHARS = 1800
 
+# Pre-flight context budgeting (applied before the first request)
+DEFAULT_CONTEXT_BUDGET_OUTPUT_RESERVE = 4096
+DEFAULT_CONTEXT_BUDGET_SAFETY_RATIO = 0.05
+
+# Concurrent identical complete() calls share one provider request
+_llm_flight = get_single_flight("llm.complete")
+
 
 def _extract_text_content(content: Any) -> str:
     if isinstance(content, str):
@@ -201,6 +223,117 @@ def _shrink_rag_context_messages(
     return new_messages
 
 
+def _truncate_text_to_tokens(text: str, max_tokens: int, model: Optional[str]) -> str:
+    if max_tokens <= 0:
+        return ""
+    tokenizer = get_tokenizer()
+    current = tokenizer.count(text, model)
+    if current <= max_tokens:
+        return text
+
+    # Proportional character cut, tightened until the token count fits.
+    max_chars = int(len(text) * max_tokens / current)
+    for _ in range(3):
+        candidate = _truncate_text(text, max_chars)
+        if tokenizer.count(candidate, model) <= max_tokens:
+            return candidate
+        max_chars = int(max_chars * 0.9)
+    return _truncate_text(text, max_chars)
+
+
+def _fit_messages_to_context_budget(
+    messages: List[Dict[str, Any]],
+    model: Optional[str],
+    binding: Optional[str],
+    max_output_tokens: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Deterministically fit messages to the model's context window before sending.
+
+    Mirrors the shrink-and-retry order without network round trips:
+    1) drop oldest history down to the most recent exchange
+    2) trim RAG/system context messages
+    3) drop remaining history (the last user message is always kept)
+
+    Models with an unknown context window are returned unchanged. If the prompt
+    still does not fit (e.g. a single oversized user message), the provider error
+    path handles it.
+    """
+    context_window = get_context_window(binding or "openai", model)
+    if not context_window or not messages:
+        return messages
+
+    reserve = (
+        int(max_output_tokens)
+        if max_output_tokens
+        else min(DEFAULT_CONTEXT_BUDGET_OUTPUT_RESERVE, context_window // 4)
+    )
+    budget = int(context_window * (1 - DEFAULT_CONTEXT_BUDGET_SAFETY_RATIO)) - reserve
+    if budget <= 0:
+        return messages
+
+    tokenizer = get_tokenizer()
+    counts = [tokenizer.count_message(m, model) + MESSAGE_OVERHEAD_TOKENS for m in messages]
+    total = sum(counts) + REPLY_OVERHEAD_TOKENS
+    if total <= budget:
+        return messages
+    original_total = total
+
+    last_user_index = None
+    for i in range(len(messages) - 1, -1, -1):
+        if _message_role(messages[i]) == "user":
+            last_user_index = i
+            break
+
+    history_indices = [
+        i for i, m in enumerate(messages) if _message_role(m) != "system" and i != last_user_index
+    ]
+    dropped: set[int] = set()
+    replaced: dict[int, Dict[str, Any]] = {}
+
+    # 1) Oldest history first, keeping the most recent exchange for now.
+    min_keep = DEFAULT_HISTORY_KEEP_LAST_LEVELS[-1]
+    for i in history_indices[: max(0, len(history_indices) - min_keep)]:
+        if total <= budget:
+            break
+        dropped.add(i)
+        total -= counts[i]
+
+    # 2) RAG/system context, oldest context message first.
+    if total > budget:
+        for i, m in enumerate(messages):
+            if total <= budget:
+                break
+            if not _is_rag_context_message(i, m) or not isinstance(m.get("content"), str):
+                continue
+            content_tokens = counts[i] - MESSAGE_OVERHEAD_TOKENS
+            target = content_tokens - (total - budget)
+            truncated = _truncate_text_to_tokens(m["content"], target, model)
+            if truncated:
+                replaced[i] = {**m, "content": truncated}
+                new_count = tokenizer.count(truncated, model) + MESSAGE_OVERHEAD_TOKENS
+            else:
+                dropped.add(i)
+                new_count = 0
+            total -= counts[i] - new_count
+
+    # 3) Remaining history.
+    for i in history_indices:
+        if total <= budget:
+            break
+        if i not in dropped:
+            dropped.add(i)
+            total -= counts[i]
+
+    fitted = [replaced.get(i, m) for i, m in enumerate(messages) if i not in dropped]
+    logger.info(
+        f"Pre-flight context budget: {original_total} -> {total} tokens "
+        f"(budget {budget}, window {context_window}, dropped {len(dropped)} message(s))"
+    )
+    if total > budget:
+        logger.debug("Prompt still exceeds context budget; relying on provider shrink fallback")
+    return fitted
+
+
 def _split_text_into_chunks(text: str, chunk_chars: int, max_chunks: int) -> list[str]:
     if chunk_chars <= 0:
         return [text]
@@ -335,11 +468,15 @@ async def complete(
     retry_delay: float = DEFAULT_RETRY_DELAY,
     exponential_backoff: bool = DEFAULT_EXPONENTIAL_BACKOFF,
     enable_context_shrink: bool = True,
+    enable_context_budget: bool = True,
     context_shrink_retries: int = DEFAULT_CONTEXT_SHRINK_RETRIES,
     user_summary_trigger_chars: int = DEFAULT_USER_SUMMARY_TRIGGER_CHARS,
     user_summary_chunk_chars: int = DEFAULT_USER_SUMMARY_CHUNK_CHARS,
     user_summary_max_chunks: int = DEFAULT_USER_SUMMARY_MAX_CHUNKS,
     user_summary_max_output_chars: int = DEFAULT_USER_SUMMARY_MAX_OUTPUT_CHARS,
+    use_cache: bool = False,
+    cache_namespace: Optional[str] = None,
+    single_flight: bool = True,
     **kwargs,
 ) -> str:
     """
@@ -360,6 +497,13 @@ async def complete(
         max_retries: Maximum number of retry attempts (default: 3)
         retry_delay: Initial delay between retries in seconds (default: 1.0)
         exponential_backoff: Whether to use exponential backoff (default: True)
+        enable_context_shrink: Shrink and retry on provider context-window errors
+        enable_context_budget: Fit messages to the model's context window before
+            the first request (default: True)
+        use_cache: Serve/store the response from the exact-match response cache
+        cache_namespace: Label stored with cache entries (e.g. "research.decompose_agent")
+        single_flight: Share one provider call between concurrent identical requests
+            (only for deterministic calls: temperature 0 or unset)
         **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
     Returns:
@@ -469,90 +613,143 @@ async def complete(
     else:
         current_messages = list(call_kwargs["messages"] or [])
 
-    # Track whether we've already summarized the user content so we don't re-summarize.
-    user_summarized = False
+    # Exact-match response cache (keyed on the caller's full request)
+    response_cache = get_llm_response_cache()
+    cache_key: Optional[str] = None
+    if response_cache.should_use(use_cache):
+        cache_key = make_cache_key(
+            model=model,
+            binding=call_kwargs.get("binding"),
+            messages=current_messages,
+            temperature=kwargs.get("temperature"),
+            response_format=kwargs.get("response_format"),
+            max_tokens=kwargs.get("max_tokens") or kwargs.get("max_completion_tokens"),
+        )
+        cached = await response_cache.aget(cache_key)
+        if cached is not None:
+            logger.debug(f"LLM response cache hit ({cache_namespace or model})")
+            return cached
+        if response_cache.replay_only:
+            raise LLMResponseCacheMiss(
+                f"No recorded LLM response for request {cache_key[:12]} (replay mode)"
+            )
 
-    for shrink_attempt in range(shrink_retries + 1):
-        try:
-            call_kwargs["messages"] = current_messages
-            return await _do_complete(**call_kwargs)
-        except Exception as e:
-            if not enable_context_shrink or not _is_context_window_error(e):
-                raise
+    async def _complete_uncached(current_messages: List[Dict[str, Any]]) -> str:
+        if enable_context_budget:
+            current_messages = _fit_messages_to_context_budget(
+                current_messages,
+                model,
+                binding,
+                kwargs.get("max_tokens") or kwargs.get("max_completion_tokens"),
+            )
+
+        # Track whether we've already summarized the user content so we don't re-summarize.
+        user_summarized = False
+
+        for shrink_attempt in range(shrink_retries + 1):
+            try:
+                call_kwargs["messages"] = current_messages
+                response = await _do_complete(**call_kwargs)
+                if cache_key is not None and response:
+                    await response_cache.aset(
+                        cache_key, response, model=model, namespace=cache_namespace
+                    )
+                return response
+            except Exception as e:
+                if not enable_context_shrink or not _is_context_window_error(e):
+                    raise
 
-            if shrink_attempt >= shrink_retries:
-                raise ProviderContextWindowError(
-                    "Context length exceeded (even after shrinking). Please shorten the input or disable RAG/context.",
-                    provider=getattr(e, "provider", None),
-                ) from e
-
-            # Shrink steps (deterministic order):
-            # 1) Trim older chat history (keep most recent messages)
-            # 2) Trim RAG/system context
-            # 3) Summarize oversized user content in bounded chunks
-            history_keep = DEFAULT_HISTORY_KEEP_LAST_LEVELS[
-                min(shrink_attempt, len(DEFAULT_HISTORY_KEEP_LAST_LEVELS) - 1)
-            ]
-            current_messages = _trim_history_messages(current_messages, history_keep)
-
-            if shrink_attempt >= 1:
-                rag_cap = DEFAULT_RAG_CONTEXT_MAX_CHARS_LEVELS[
-                    min(shrink_attempt - 1, len(DEFAULT_RAG_CONTEXT_MAX_CHARS_LEVELS) - 1)
+                if shrink_attempt >= shrink_retries:
+                    raise ProviderContextWindowError(
+                        "Context length exceeded (even after shrinking). "
+                        "Please shorten the input or disable RAG/context.",
+                        provider=getattr(e, "provider", None),
+                    ) from e
+
+                # Shrink steps (deterministic order):
+                # 1) Trim older chat history (keep most recent messages)
+                # 2) Trim RAG/system context
+                # 3) Summarize oversized user content in bounded chunks
+                history_keep = DEFAULT_HISTORY_KEEP_LAST_LEVELS[
+                    min(shrink_attempt, len(DEFAULT_HISTORY_KEEP_LAST_LEVELS) - 1)
                 ]
-                current_messages = _shrink_rag_context_messages(current_messages, rag_cap)
-
-            if shrink_attempt >= 2 and not user_summarized:
-                # Summarize only if user content is clearly oversized.
-                last_user_index = None
-                for i in range(len(current_messages) - 1, -1, -1):
-                    if _message_role(current_messages[i]) == "user":
-                        last_user_index = i
-                        break
-
-                if last_user_index is not None:
-                    last_user_content = current_messages[last_user_index].get("content")
-                    last_user_text = _extract_text_content(last_user_content)
-
-                    if len(last_user_text) >= int(user_summary_trigger_chars):
-                        chunks = _split_text_into_chunks(
-                            last_user_text,
-                            int(user_summary_chunk_chars),
-                            int(user_summary_max_chunks),
-                        )
-
-                        base_call_kwargs = {
-                            k: v
-                            for k, v in call_kwargs.items()
-                            if k
-                            in {
-                                "model",
-                                "api_key",
-                                "base_url",
-                                "api_version",
-                                "binding",
-                            }
-                        }
-
-                        summary = await _summarize_text_chunks_via_llm(
-                            chunks=chunks,
-                            do_complete=_do_complete,
-                            base_call_kwargs=base_call_kwargs,
-                            max_output_chars=int(user_summary_max_output_chars),
-                        )
-
-                        if summary.strip():
-                            current_messages[last_user_index] = {
-                                **current_messages[last_user_index],
-                                "content": (
-                                    "[User content was too long; summarized]\n\n" + summary.strip()
-                                ),
+                current_messages = _trim_history_messages(current_messages, history_keep)
+
+                if shrink_attempt >= 1:
+                    rag_cap = DEFAULT_RAG_CONTEXT_MAX_CHARS_LEVELS[
+                        min(shrink_attempt - 1, len(DEFAULT_RAG_CONTEXT_MAX_CHARS_LEVELS) - 1)
+                    ]
+                    current_messages = _shrink_rag_context_messages(current_messages, rag_cap)
+
+                if shrink_attempt >= 2 and not user_summarized:
+                    # Summarize only if user content is clearly oversized.
+                    last_user_index = None
+                    for i in range(len(current_messages) - 1, -1, -1):
+                        if _message_role(current_messages[i]) == "user":
+                            last_user_index = i
+                            break
+
+                    if last_user_index is not None:
+                        last_user_content = current_messages[last_user_index].get("content")
+                        last_user_text = _extract_text_content(last_user_content)
+
+                        if len(last_user_text) >= int(user_summary_trigger_chars):
+                            chunks = _split_text_into_chunks(
+                                last_user_text,
+                                int(user_summary_chunk_chars),
+                                int(user_summary_max_chunks),
+                            )
+
+                            base_call_kwargs = {
+                                k: v
+                                for k, v in call_kwargs.items()
+                                if k
+                                in {
+                                    "model",
+                                    "api_key",
+                                    "base_url",
+                                    "api_version",
+                                    "binding",
+                                }
                             }
-                            user_summarized = True
 
-            logger.warning(
-                "LLM context window exceeded; shrinking and retrying "
-                f"(attempt {shrink_attempt + 1}/{shrink_retries})."
-            )
+                            summary = await _summarize_text_chunks_via_llm(
+                                chunks=chunks,
+                                do_complete=_do_complete,
+                                base_call_kwargs=base_call_kwargs,
+                                max_output_chars=int(user_summary_max_output_chars),
+                            )
+
+                            if summary.strip():
+                                current_messages[last_user_index] = {
+                                    **current_messages[last_user_index],
+                                    "content": (
+                                        "[User content was too long; summarized]\n\n"
+                                        + summary.strip()
+                                    ),
+                                }
+                                user_summarized = True
+
+                logger.warning(
+                    "LLM context window exceeded; shrinking and retrying "
+                    f"(attempt {shrink_attempt + 1}/{shrink_retries})."
+                )
+
+    # Sampled completions are expected to differ between callers, so only
+    # deterministic requests are shared
+    if not single_flight or kwargs.get("temperature") not in (None, 0):
+        return await _complete_uncached(current_messages)
+
+    # Coalesce identical requests already in flight; the cache lookup above stays per-caller
+    flight_key = make_flight_key(
+        use_local,
+        enable_context_budget,
+        enable_context_shrink,
+        hashlib.sha256((api_key or "").encode("utf-8")).hexdigest(),
+        {k: v for k, v in call_kwargs.items() if k not in ("api_key", "messages")},
+        current_messages,
+    )
+    return await _llm_flight.do(flight_key, lambda: _complete_uncached(current_messages))
 
 
 async def complete_with_vision(
@@ -624,6 +821,7 @@ async def stream(
     retry_delay: float = DEFAULT_RETRY_DELAY,
     exponential_backoff: bool = DEFAULT_EXPONENTIAL_BACKOFF,
     enable_context_shrink: bool = True,
+    enable_context_budget: bool = True,
     context_shrink_retries: int = DEFAULT_CONTEXT_SHRINK_RETRIES,
     user_summary_trigger_chars: int = DEFAULT_USER_SUMMARY_TRIGGER_CHARS,
     user_summary_chunk_chars: int = DEFAULT_USER_SUMMARY_CHUNK_CHARS,
@@ -652,6 +850,9 @@ async def stream(
         max_retries: Maximum number of retry attempts (default: 3)
         retry_delay: Initial delay between retries in seconds (default: 1.0)
         exponential_backoff: Whether to use exponential backoff (default: True)
+        enable_context_shrink: Shrink and retry on provider context-window errors
+        enable_context_budget: Fit messages to the model's context window before
+            the first request (default: True)
         **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
     Yields:
@@ -701,6 +902,14 @@ async def stream(
     else:
         current_messages = list(call_kwargs["messages"] or [])
 
+    if enable_context_budget:
+        current_messages = _fit_messages_to_context_budget(
+            current_messages,
+            model,
+            binding,
+            kwargs.get("max_tokens") or kwargs.get("max_completion_tokens"),
+        )
+
     user_summarized = False
     last_exception: Exception | None = None
 
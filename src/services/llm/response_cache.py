@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Response Cache
+==================
+
+Exact-match, disk-backed cache for deterministic LLM calls made through
+``factory.complete``.
+
+Entries are keyed on (model, binding, full messages, temperature,
+response_format, max_tokens) and stored as one JSON file per key under
+``data/user/llm_cache/<key[:2]>/<key>.json`` with a TTL.
+
+Caching is opt-in per call (``complete(..., use_cache=True)``); BaseAgent turns it
+on for the agents listed under ``llm_cache.agents`` in ``config/agents.yaml``.
+
+Modes (``PRADEEP_LLM_CACHE_MODE``):
+    default   Opt-in calls read and write the cache (TTL applies)
+    record    Every ``complete`` call is written (no TTL) - use with
+              ``PRADEEP_LLM_CACHE_DIR`` to capture fixtures
+    replay    Every ``complete`` call is served from the cache; a miss raises
+              ``LLMResponseCacheMiss`` instead of calling the provider
+    disabled  Never read or write the cache
+
+Usage:
+    from src.services.llm.response_cache import get_llm_response_cache
+
+    cache = get_llm_response_cache()
+    print(cache.get_stats())  # hits, misses, writes, expired, hit_rate
+"""
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Optional
+
+from .exceptions import LLMError
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "data" / "user" / "llm_cache"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MEMORY_ENTRIES = 1024
+
+CACHE_MODES = ("default", "record", "replay", "disabled")
+
+
+class LLMResponseCacheMiss(LLMError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def make_cache_key(
+    model: Optional[str],
+    binding: Optional[str],
+    messages: list[dict[str, Any]],
+    temperature: Any = None,
+    response_format: Any = None,
+    max_tokens: Any = None,
+) -> str:
+    """
+    Build a stable cache key for an LLM request.
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON request
+    """
+    payload = {
+        "model": model,
+        "binding": (binding or "openai").lower(),
+        "messages": [
+            {"role": m.get("role"), "content": m.get("content")}
+            for m in messages
+            if isinstance(m, dict)
+        ],
+        "temperature": temperature,
+        "response_format": response_format,
+        "max_tokens": max_tokens,
+    }
+    canonical = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Disk-backed response store with TTL and a small in-memory LRU front.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        mode: str = "default",
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: data/user/llm_cache)
+            ttl_seconds: Entry lifetime; <= 0 means entries never expire
+            mode: One of CACHE_MODES
+            memory_entries: Size of the in-memory LRU in front of the disk store
+        """
+        if mode not in CACHE_MODES:
+            logger.warning(f"Unknown LLM cache mode '{mode}', using 'default'")
+            mode = "default"
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl_seconds = ttl_seconds
+        self.mode = mode
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "expired": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Policy
+    # ------------------------------------------------------------------
+
+    def should_use(self, requested: bool) -> bool:
+        """Whether a call should consult the cache given its opt-in flag."""
+        if self.mode == "disabled":
+            return False
+        if self.mode in ("record", "replay"):
+            return True
+        return bool(requested)
+
+    @property
+    def replay_only(self) -> bool:
+        return self.mode == "replay"
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _is_expired(self, entry: dict[str, Any]) -> bool:
+        expires_at = entry.get("expires_at")
+        return bool(expires_at) and time.time() > float(expires_at)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Response text, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is None:
+            path = self._path_for(key)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+            except FileNotFoundError:
+                entry = None
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug(f"Unreadable LLM cache entry {path}: {e}")
+                self._count("errors")
+                entry = None
+
+        if entry is None:
+            self._count("misses")
+            return None
+
+        if self._is_expired(entry):
+            self._count("expired")
+            self._count("misses")
+            self.delete(key)
+            return None
+
+        self._remember(key, entry)
+        self._count("hits")
+        return entry.get("response")
+
+    def set(
+        self,
+        key: str,
+        response: str,
+        model: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """Store a response (atomic write; failures are logged, never raised)."""
+        if self.mode == "disabled" or response is None:
+            return
+
+        now = time.time()
+        # Recorded fixtures never expire
+        ttl = 0 if self.mode == "record" else self.ttl_seconds
+        entry = {
+            "key": key,
+            "model": model,
+            "namespace": namespace,
+            "created_at": now,
+            "expires_at": now + ttl if ttl and ttl > 0 else None,
+            "response": response,
+        }
+
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry: {e}")
+            self._count("errors")
+            return
+
+        self._remember(key, entry)
+        self._count("writes")
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from memory and disk."""
+        with self._lock:
+            self._memory.pop(key, None)
+        try:
+            self._path_for(key).unlink()
+        except OSError:
+            pass
+
+    def _remember(self, key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Async lookup (disk I/O runs in a worker thread)."""
+        with self._lock:
+            in_memory = key in self._memory
+        if in_memory:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(
+        self,
+        key: str,
+        response: str,
+        model: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """Async store (disk I/O runs in a worker thread)."""
+        await asyncio.to_thread(self.set, key, response, model, namespace)
+
+    def clear(self) -> int:
+        """
+        Delete all cache entries.
+
+        Returns:
+            Number of entries deleted from disk
+        """
+        with self._lock:
+            self._memory.clear()
+        deleted = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    path.unlink()
+                    deleted += 1
+                except OSError:
+                    pass
+        return deleted
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss metrics."""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["hits"] / lookups) if lookups else 0.0
+            stats["memory_entries"] = len(self._memory)
+        stats["mode"] = self.mode
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["cache_dir"] = str(self.cache_dir)
+        return stats
+
+
+# Singleton instance for convenience
+_response_cache: LLMResponseCache | None = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """
+    Get or create the global LLMResponseCache.
+
+    Settings come from ``llm_cache`` in config/agents.yaml, overridden by the
+    ``PRADEEP_LLM_CACHE_MODE`` / ``PRADEEP_LLM_CACHE_DIR`` environment variables.
+    """
+    global _response_cache
+    if _response_cache is None:
+        from src.services.config import get_llm_cache_params, subscribe_config_changes
+
+        subscribe_config_changes(_reset_on_agents_config_change)
+        params = get_llm_cache_params()
+        mode = (os.getenv("PRADEEP_LLM_CACHE_MODE") or "").strip().lower()
+        if not mode:
+            mode = "default" if params["enabled"] else "disabled"
+        _response_cache = LLMResponseCache(
+            cache_dir=os.getenv("PRADEEP_LLM_CACHE_DIR") or params.get("cache_dir"),
+            ttl_seconds=params["ttl_seconds"],
+            mode=mode,
+        )
+    return _response_cache
+
+
+def reset_llm_response_cache() -> None:
+    """Drop the global cache instance (settings are re-read on next use)."""
+    global _response_cache
+    _response_cache = None
+
+
+def _reset_on_agents_config_change(changed: list[Path]) -> None:
+    if any(path.name == "agents.yaml" for path in changed):
+        reset_llm_response_cache()
+
+
+__all__ = [
+    "CACHE_MODES",
+    "LLMResponseCache",
+    "LLMResponseCacheMiss",
+    "get_llm_response_cache",
+    "make_cache_key",
+    "reset_llm_response_cache",
+]
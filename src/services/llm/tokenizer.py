@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+Tokenizer Service
+=================
+
+Single place for token counting across praDeep.
+
+- Encoders are resolved once per model and cached (tiktoken loads BPE ranks lazily,
+  which is expensive and may require network access on first use).
+- Counts are memoized by content hash, so re-counting the same history message,
+  prompt template or RAG chunk is a dictionary lookup.
+- Batch counting uses tiktoken's multi-threaded ``encode_ordinary_batch``.
+- Messages may carry a persisted ``token_count``/``token_encoding`` pair (see
+  ``SessionManager.add_message``), which is trusted without re-encoding.
+
+When tiktoken (or its encoding files) is unavailable, counts fall back to a
+deterministic ~4 characters per token estimate.
+
+Usage:
+    from src.services.llm.tokenizer import count_tokens, get_tokenizer
+
+    n = count_tokens("Hello world", model="gpt-4o-mini")
+    total = get_tokenizer().count_messages(messages, model="gpt-4o-mini")
+"""
+
+from collections import OrderedDict
+import hashlib
+import logging
+import threading
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+# Encoding name recorded when tiktoken cannot be used
+FALLBACK_ENCODING = "chars/4"
+DEFAULT_CACHE_SIZE = 50_000
+DEFAULT_BATCH_THREADS = 8
+# Per-message framing overhead used by OpenAI chat formats (role + separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+# Reply priming tokens added once per request
+REPLY_OVERHEAD_TOKENS = 3
+
+
+def estimate_tokens_from_chars(text: str) -> int:
+    """Rough estimate of 4 characters per token."""
+    return len(text) // 4
+
+
+def _content_text(content: Any) -> str:
+    """Extract the text of a message ``content`` (string or OpenAI content parts)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            str(part.get("text") or "")
+            for part in content
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return str(content) if content is not None else ""
+
+
+def _content_key(encoding_name: str, text: str) -> tuple[str, bytes]:
+    return encoding_name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class TokenizerService:
+    """
+    Thread-safe token counter with cached encoders and memoized counts.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        batch_threads: int = DEFAULT_BATCH_THREADS,
+    ):
+        """
+        Initialize the tokenizer service.
+
+        Args:
+            cache_size: Maximum number of memoized (encoding, content hash) counts
+            batch_threads: Worker threads used by tiktoken for batch encoding
+        """
+        self.cache_size = cache_size
+        self.batch_threads = batch_threads
+        self._counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._encoders: dict[str, Any] = {}
+        self._model_encodings: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._tiktoken_failed = False
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Encoders
+    # ------------------------------------------------------------------
+
+    def encoding_name_for(self, model: Optional[str] = None) -> str:
+        """
+        Resolve the encoding name used for a model.
+
+        Unknown models use ``cl100k_base``. Returns ``FALLBACK_ENCODING`` when
+        tiktoken cannot be used at all.
+        """
+        if self._tiktoken_failed:
+            return FALLBACK_ENCODING
+
+        key = (model or "").lower()
+        cached = self._model_encodings.get(key)
+        if cached is not None:
+            return cached
+
+        name = DEFAULT_ENCODING
+        try:
+            import tiktoken
+
+            if key:
+                try:
+                    name = tiktoken.encoding_name_for_model(key)
+                except KeyError:
+                    name = DEFAULT_ENCODING
+        except ImportError:
+            self._tiktoken_failed = True
+            return FALLBACK_ENCODING
+
+        self._model_encodings[key] = name
+        return name
+
+    def get_encoder(self, model: Optional[str] = None):
+        """
+        Get the (cached) tiktoken encoder for a model.
+
+        Returns:
+            tiktoken.Encoding, or None if tiktoken is unavailable
+        """
+        name = self.encoding_name_for(model)
+        if name == FALLBACK_ENCODING:
+            return None
+
+        encoder = self._encoders.get(name)
+        if encoder is not None:
+            return encoder
+
+        with self._lock:
+            encoder = self._encoders.get(name)
+            if encoder is not None:
+                return encoder
+            try:
+                import tiktoken
+
+                encoder = tiktoken.get_encoding(name)
+            except Exception as e:
+                # Missing package or BPE files that cannot be downloaded: don't retry per call.
+                logger.warning(f"tiktoken encoding '{name}' unavailable, estimating tokens: {e}")
+                self._tiktoken_failed = True
+                return None
+            self._encoders[name] = encoder
+            return encoder
+
+    # ------------------------------------------------------------------
+    # Memoization
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: tuple[str, bytes]) -> Optional[int]:
+        with self._lock:
+            value = self._counts.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._counts.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _cache_put(self, key: tuple[str, bytes], value: int) -> None:
+        with self._lock:
+            self._counts[key] = value
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop memoized counts (encoders are kept)."""
+        with self._lock:
+            self._counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Counting
+    # ------------------------------------------------------------------
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        """
+        Count tokens in text.
+
+        Args:
+            text: Text to count
+            model: Model name (selects the encoding)
+
+        Returns:
+            Token count
+        """
+        if not text:
+            return 0
+
+        encoder = self.get_encoder(model)
+        if encoder is None:
+            return estimate_tokens_from_chars(text)
+
+        key = _content_key(encoder.name, text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        value = len(encoder.encode_ordinary(text))
+        self._cache_put(key, value)
+        return value
+
+    def count_batch(self, texts: Iterable[str], model: Optional[str] = None) -> list[int]:
+        """
+        Count tokens for many texts, encoding cache misses in parallel threads.
+
+        Args:
+            texts: Texts to count
+            model: Model name (selects the encoding)
+
+        Returns:
+            Token counts in input order
+        """
+        texts = list(texts)
+        encoder = self.get_encoder(model)
+        if encoder is None:
+            return [estimate_tokens_from_chars(t or "") for t in texts]
+
+        results: list[int] = [0] * len(texts)
+        pending_keys: list[tuple[str, bytes]] = []
+        pending_texts: list[str] = []
+        pending_slots: dict[tuple[str, bytes], list[int]] = {}
+
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = _content_key(encoder.name, text)
+            if key in pending_slots:
+                pending_slots[key].append(i)
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+                continue
+            pending_slots[key] = [i]
+            pending_keys.append(key)
+            pending_texts.append(text)
+
+        if pending_texts:
+            encoded = encoder.encode_ordinary_batch(pending_texts, num_threads=self.batch_threads)
+            for key, tokens in zip(pending_keys, encoded):
+                value = len(tokens)
+                self._cache_put(key, value)
+                for i in pending_slots[key]:
+                    results[i] = value
+
+        return results
+
+    def count_message(self, message: dict[str, Any], model: Optional[str] = None) -> int:
+        """
+        Count the content tokens of a single chat message.
+
+        A persisted ``token_count`` is reused when its ``token_encoding`` matches
+        the encoding of ``model``.
+        """
+        persisted = message.get("token_count")
+        if isinstance(persisted, int) and message.get("token_encoding") == self.encoding_name_for(
+            model
+        ):
+            return persisted
+        return self.count(_content_text(message.get("content")), model)
+
+    def count_messages(self, messages: list[dict[str, Any]], model: Optional[str] = None) -> int:
+        """
+        Count tokens of a full chat request, including per-message framing overhead.
+
+        Args:
+            messages: OpenAI-style messages
+            model: Model name (selects the encoding)
+
+        Returns:
+            Estimated prompt token count
+        """
+        if not messages:
+            return 0
+        total = sum(self.count_message(m, model) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+        return total + REPLY_OVERHEAD_TOKENS
+
+    def annotate_message(
+        self, message: dict[str, Any], model: Optional[str] = None
+    ) -> dict[str, Any]:
+        """
+        Store ``token_count``/``token_encoding`` on a message dict (in place).
+
+        Returns:
+            The same message dict
+        """
+        message["token_count"] = self.count(_content_text(message.get("content")), model)
+        message["token_encoding"] = self.encoding_name_for(model)
+        return message
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "cached_counts": len(self._counts),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "encoders": sorted(self._encoders),
+                "tiktoken_available": not self._tiktoken_failed,
+            }
+
+
+# Singleton instance for convenience
+_tokenizer: TokenizerService | None = None
+_tokenizer_lock = threading.Lock()
+
+
+def get_tokenizer() -> TokenizerService:
+    """Get or create the global TokenizerService instance."""
+    global _tokenizer
+    if _tokenizer is None:
+        with _tokenizer_lock:
+            if _tokenizer is None:
+                _tokenizer = TokenizerService()
+    return _tokenizer
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Count tokens in text using the global tokenizer."""
+    return get_tokenizer().count(text, model)
+
+
+def count_message_tokens(messages: list[dict[str, Any]], model: Optional[str] = None) -> int:
+    """Count tokens of a chat request using the global tokenizer."""
+    return get_tokenizer().count_messages(messages, model)
+
+
+__all__ = [
+    "DEFAULT_ENCODING",
+    "FALLBACK_ENCODING",
+    "TokenizerService",
+    "get_tokenizer",
+    "count_tokens",
+    "count_message_tokens",
+    "estimate_tokens_from_chars",
+]
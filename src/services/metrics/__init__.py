@@ -3,7 +3,8 @@ Performance Metrics Service
 ============================
 
 Centralized service for tracking real-time performance metrics across all agent modules.
-Provides aggregated statistics per agent type with exportable reports.
+Provides aggregated statistics per agent type with exportable reports, streaming
+latency percentiles and Prometheus text exposition.
 """
 
 from .service import (
@@ -12,10 +13,12 @@ from .service import (
     get_metrics_service,
     reset_metrics_service,
 )
+from .sketch import QuantileSketch
 
 __all__ = [
     "MetricsService",
     "AgentMetrics",
     "get_metrics_service",
     "reset_metrics_service",
+    "QuantileSketch",
 ]
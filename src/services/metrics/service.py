@@ -8,25 +8,32 @@ Tracks real-time performance metrics across all agent modules:
 - Success rates
 - Error patterns
 
-Provides aggregated statistics per agent type with exportable reports.
+Provides aggregated statistics per agent type with exportable reports, streaming
+latency percentiles per (module, agent, model) and Prometheus text exposition.
 """
 
 import asyncio
-import json
-import threading
-import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+import json
 from pathlib import Path
+import threading
+import time
 from typing import Any, Callable
 
 from src.logging.stats import MODEL_PRICING, get_pricing
 
+from .sketch import QuantileSketch
 
-@dataclass
+# Quantiles reported in aggregated stats and the Prometheus summary
+REPORTED_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+PROMETHEUS_PREFIX = "pradeep"
+
+
+@dataclass(slots=True)
 class AgentMetrics:
-    """Metrics for a single agent invocation."""
+    """Metrics for a single agent invocation (also the handle returned by start_tracking)."""
 
     agent_name: str
     module_name: str
@@ -50,7 +57,8 @@ class AgentMetrics:
 
     # Additional context
     metadata: dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # ISO start time; derived from start_time on first read to keep tracking cheap
+    timestamp: str | None = None
 
     def mark_end(self, success: bool = True):
         """Mark the end of agent execution."""
@@ -81,12 +89,19 @@ class AgentMetrics:
         self.errors += 1
         self.success = False
 
+    def get_timestamp(self) -> str:
+        """ISO-formatted start time."""
+        if self.timestamp is None:
+            self.timestamp = datetime.fromtimestamp(self.start_time).isoformat()
+        return self.timestamp
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        self.get_timestamp()
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedStats:
     """Aggregated statistics for an agent type."""
 
@@ -121,9 +136,11 @@ class AggregatedStats:
     # Time range
     first_seen: str | None = None
     last_seen: str | None = None
+    # Start time of the latest invocation; last_seen is formatted from it in to_dict
+    _last_seen_at: float | None = field(default=None, repr=False)
 
     def update_from_metrics(self, metrics: AgentMetrics):
-        """Update aggregated stats from a single metric."""
+        """Update aggregated stats from a single metric (averages/rates are derived in to_dict)."""
         self.total_invocations += 1
 
         if metrics.success:
@@ -131,40 +148,90 @@ class AggregatedStats:
         else:
             self.failed_invocations += 1
 
-        if metrics.duration_ms is not None:
-            self.total_duration_ms += metrics.duration_ms
-            self.min_duration_ms = min(self.min_duration_ms, metrics.duration_ms)
-            self.max_duration_ms = max(self.max_duration_ms, metrics.duration_ms)
-            self.avg_duration_ms = self.total_duration_ms / self.total_invocations
+        duration_ms = metrics.duration_ms
+        if duration_ms is not None:
+            self.total_duration_ms += duration_ms
+            if duration_ms < self.min_duration_ms:
+                self.min_duration_ms = duration_ms
+            if duration_ms > self.max_duration_ms:
+                self.max_duration_ms = duration_ms
 
         self.total_prompt_tokens += metrics.prompt_tokens
         self.total_completion_tokens += metrics.completion_tokens
         self.total_tokens += metrics.total_tokens
-        self.avg_tokens_per_call = self.total_tokens / self.total_invocations
 
         self.total_api_calls += metrics.api_calls
         self.total_errors += metrics.errors
         self.total_cost_usd += metrics.cost_usd
 
-        self.success_rate = (
-            (self.successful_invocations / self.total_invocations) * 100
-            if self.total_invocations > 0
-            else 0.0
-        )
-
         if self.first_seen is None:
-            self.first_seen = metrics.timestamp
-        self.last_seen = metrics.timestamp
+            self.first_seen = metrics.get_timestamp()
+        # Formatted lazily in to_dict; this runs on every end_tracking
+        self._last_seen_at = metrics.start_time
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
+        if self.total_invocations > 0:
+            self.avg_duration_ms = self.total_duration_ms / self.total_invocations
+            self.avg_tokens_per_call = self.total_tokens / self.total_invocations
+            self.success_rate = (self.successful_invocations / self.total_invocations) * 100
+        if self._last_seen_at is not None:
+            self.last_seen = datetime.fromtimestamp(self._last_seen_at).isoformat()
         result = asdict(self)
+        del result["_last_seen_at"]
         # Handle infinity for min_duration_ms when no data
         if result["min_duration_ms"] == float("inf"):
             result["min_duration_ms"] = 0.0
         return result
 
 
+class SeriesStats:
+    """Counters and latency sketch for one (module, agent, model) series."""
+
+    __slots__ = (
+        "invocations",
+        "failures",
+        "errors",
+        "prompt_tokens",
+        "completion_tokens",
+        "cost_usd",
+        "latency",
+    )
+
+    def __init__(self):
+        self.invocations = 0
+        self.failures = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.latency = QuantileSketch()
+
+    def record(self, metrics: AgentMetrics) -> None:
+        self.invocations += 1
+        if not metrics.success:
+            self.failures += 1
+        self.errors += metrics.errors
+        self.prompt_tokens += metrics.prompt_tokens
+        self.completion_tokens += metrics.completion_tokens
+        self.cost_usd += metrics.cost_usd
+        if metrics.duration_ms is not None:
+            self.latency.add(metrics.duration_ms)
+
+
+def _quantile_fields(sketch: QuantileSketch) -> dict[str, float]:
+    """Render sketch quantiles as ``p50_duration_ms``-style fields."""
+    return {f"p{round(q * 100)}_duration_ms": sketch.quantile(q) for q in REPORTED_QUANTILES}
+
+
+def _prometheus_labels(**labels: str) -> str:
+    parts = []
+    for name, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
 class MetricsService:
     """
     Centralized service for tracking performance metrics across all agent modules.
@@ -172,12 +239,15 @@ class MetricsService:
     Features:
     - Real-time metric collection
     - Aggregated statistics per agent type and module
-    - Historical data storage
-    - Export capabilities (JSON)
+    - Historical data storage (fixed-size ring buffer)
+    - Streaming p50/p90/p95/p99 latency per (module, agent, model)
+    - Export capabilities (JSON, Prometheus text format)
     - Callback system for real-time updates
     """
 
-    def __init__(self, enabled: bool = True, save_dir: str | None = None, history_limit: int = 1000):
+    def __init__(
+        self, enabled: bool = True, save_dir: str | None = None, history_limit: int = 1000
+    ):
         """
         Initialize metrics service.
 
@@ -191,9 +261,13 @@ class MetricsService:
         self._lock = threading.Lock()
 
         # Storage
-        self._active_metrics: dict[str, AgentMetrics] = {}  # Currently running
-        self._history: list[AgentMetrics] = []  # Completed metrics
+        # Currently running, keyed by id() of the AgentMetrics handle
+        self._active_metrics: dict[int, AgentMetrics] = {}
+        # Completed metrics; the deque drops the oldest entry once full
+        self._history: deque[AgentMetrics] = deque(maxlen=history_limit)
         self._aggregated: dict[str, AggregatedStats] = {}  # Per-agent aggregations
+        # Per (module, agent, model) counters and latency sketches
+        self._series: dict[tuple[str, str, str], SeriesStats] = {}
         self._module_stats: dict[str, dict[str, Any]] = defaultdict(
             lambda: {
                 "total_calls": 0,
@@ -227,18 +301,16 @@ class MetricsService:
             module_name: Name of the module (solve, research, etc.)
 
         Returns:
-            AgentMetrics instance for updating during execution
+            AgentMetrics instance for updating during execution; pass it back to
+            end_tracking (it is also the handle for the active entry)
         """
-        if not self.enabled:
-            return AgentMetrics(agent_name=agent_name, module_name=module_name, start_time=time.time())
-
-        metrics = AgentMetrics(agent_name=agent_name, module_name=module_name, start_time=time.time())
-
-        # Create a unique key for this invocation
-        key = f"{module_name}:{agent_name}:{time.time()}"
+        metrics = AgentMetrics(
+            agent_name=agent_name, module_name=module_name, start_time=time.time()
+        )
 
-        with self._lock:
-            self._active_metrics[key] = metrics
+        if self.enabled:
+            with self._lock:
+                self._active_metrics[id(metrics)] = metrics
 
         return metrics
 
@@ -256,27 +328,28 @@ class MetricsService:
         metrics.mark_end(success)
 
         with self._lock:
-            # Remove from active
-            key_to_remove = None
-            for key, m in self._active_metrics.items():
-                if m is metrics:
-                    key_to_remove = key
-                    break
-            if key_to_remove:
-                del self._active_metrics[key_to_remove]
-
-            # Add to history (with limit)
+            # Remove from active (the handle is the metrics object itself)
+            self._active_metrics.pop(id(metrics), None)
+
+            # Add to history (ring buffer, oldest entries fall off)
             self._history.append(metrics)
-            if len(self._history) > self.history_limit:
-                self._history = self._history[-self.history_limit :]
 
             # Update aggregated stats
             agg_key = f"{metrics.module_name}:{metrics.agent_name}"
-            if agg_key not in self._aggregated:
-                self._aggregated[agg_key] = AggregatedStats(
+            aggregated = self._aggregated.get(agg_key)
+            if aggregated is None:
+                aggregated = self._aggregated[agg_key] = AggregatedStats(
                     agent_name=metrics.agent_name, module_name=metrics.module_name
                 )
-            self._aggregated[agg_key].update_from_metrics(metrics)
+            aggregated.update_from_metrics(metrics)
+
+            # Update per-model series (latency percentiles, Prometheus)
+            model = metrics.model or metrics.metadata.get("model") or ""
+            series_key = (metrics.module_name, metrics.agent_name, model)
+            series = self._series.get(series_key)
+            if series is None:
+                series = self._series[series_key] = SeriesStats()
+            series.record(metrics)
 
             # Update module stats
             module_stats = self._module_stats[metrics.module_name]
@@ -336,10 +409,16 @@ class MetricsService:
             module: Filter by module name (optional)
         """
         with self._lock:
-            history = self._history
-            if module:
-                history = [m for m in history if m.module_name == module]
-            return [m.to_dict() for m in history[-limit:]]
+            recent: list[AgentMetrics] = []
+            if limit > 0:
+                # Walk newest-first so only the requested tail is touched
+                for m in reversed(self._history):
+                    if module and m.module_name != module:
+                        continue
+                    recent.append(m)
+                    if len(recent) >= limit:
+                        break
+            return [m.to_dict() for m in reversed(recent)]
 
     def get_aggregated_stats(self, module: str | None = None) -> dict[str, dict[str, Any]]:
         """
@@ -353,6 +432,41 @@ class MetricsService:
             for key, stats in self._aggregated.items():
                 if module is None or stats.module_name == module:
                     result[key] = stats.to_dict()
+
+            # Percentiles per agent, merged across models
+            merged: dict[str, QuantileSketch] = {}
+            for (series_module, agent, _model), series in self._series.items():
+                key = f"{series_module}:{agent}"
+                if key not in result:
+                    continue
+                if key in merged:
+                    merged[key].merge(series.latency)
+                else:
+                    merged[key] = series.latency.copy()
+            for key, sketch in merged.items():
+                result[key].update(_quantile_fields(sketch))
+            return result
+
+    def get_latency_percentiles(self, module: str | None = None) -> list[dict[str, Any]]:
+        """
+        Get streaming latency percentiles per (module, agent, model).
+
+        Args:
+            module: Filter by module name (optional)
+        """
+        with self._lock:
+            result = []
+            for (series_module, agent, model), series in self._series.items():
+                if module is not None and series_module != module:
+                    continue
+                entry: dict[str, Any] = {
+                    "module_name": series_module,
+                    "agent_name": agent,
+                    "model": model or None,
+                    "count": series.latency.count,
+                }
+                entry.update(_quantile_fields(series.latency))
+                result.append(entry)
             return result
 
     def get_module_stats(self) -> dict[str, dict[str, Any]]:
@@ -384,7 +498,9 @@ class MetricsService:
 
             # Calculate overall success rate from aggregated stats
             total_invocations = sum(s.total_invocations for s in self._aggregated.values())
-            successful_invocations = sum(s.successful_invocations for s in self._aggregated.values())
+            successful_invocations = sum(
+                s.successful_invocations for s in self._aggregated.values()
+            )
 
             return {
                 "total_calls": total_calls,
@@ -434,12 +550,93 @@ class MetricsService:
 
         return str(filepath)
 
+    def render_prometheus(self) -> str:
+        """
+        Render current metrics in the Prometheus text exposition format (v0.0.4).
+
+        Series are labelled by module, agent and model; latency is exported as a
+        summary with p50/p90/p95/p99 quantiles.
+        """
+        p = PROMETHEUS_PREFIX
+        with self._lock:
+            series_items = list(self._series.items())
+            snapshots = [
+                (
+                    key,
+                    series.invocations,
+                    series.failures,
+                    series.errors,
+                    series.prompt_tokens,
+                    series.completion_tokens,
+                    series.cost_usd,
+                    series.latency.copy(),
+                )
+                for key, series in series_items
+            ]
+            active = len(self._active_metrics)
+
+        lines = [
+            f"# HELP {p}_agent_invocations_total Completed agent invocations.",
+            f"# TYPE {p}_agent_invocations_total counter",
+        ]
+        for (module, agent, model), calls, failures, *_ in snapshots:
+            for status, value in (("success", calls - failures), ("failure", failures)):
+                labels = _prometheus_labels(module=module, agent=agent, model=model, status=status)
+                lines.append(f"{p}_agent_invocations_total{labels} {value}")
+
+        lines += [
+            f"# HELP {p}_agent_errors_total Errors recorded during agent invocations.",
+            f"# TYPE {p}_agent_errors_total counter",
+        ]
+        for (module, agent, model), _, _, errors, *_ in snapshots:
+            labels = _prometheus_labels(module=module, agent=agent, model=model)
+            lines.append(f"{p}_agent_errors_total{labels} {errors}")
+
+        lines += [
+            f"# HELP {p}_agent_tokens_total Tokens used by agent invocations.",
+            f"# TYPE {p}_agent_tokens_total counter",
+        ]
+        for (module, agent, model), _, _, _, prompt, completion, *_ in snapshots:
+            for kind, value in (("prompt", prompt), ("completion", completion)):
+                labels = _prometheus_labels(module=module, agent=agent, model=model, type=kind)
+                lines.append(f"{p}_agent_tokens_total{labels} {value}")
+
+        lines += [
+            f"# HELP {p}_agent_cost_usd_total Estimated cost of agent invocations in USD.",
+            f"# TYPE {p}_agent_cost_usd_total counter",
+        ]
+        for (module, agent, model), *_, cost, _sketch in snapshots:
+            labels = _prometheus_labels(module=module, agent=agent, model=model)
+            lines.append(f"{p}_agent_cost_usd_total{labels} {cost:.6f}")
+
+        lines += [
+            f"# HELP {p}_agent_duration_milliseconds Agent invocation latency.",
+            f"# TYPE {p}_agent_duration_milliseconds summary",
+        ]
+        for (module, agent, model), *_, sketch in snapshots:
+            for q in REPORTED_QUANTILES:
+                labels = _prometheus_labels(
+                    module=module, agent=agent, model=model, quantile=str(q)
+                )
+                lines.append(f"{p}_agent_duration_milliseconds{labels} {sketch.quantile(q):.3f}")
+            labels = _prometheus_labels(module=module, agent=agent, model=model)
+            lines.append(f"{p}_agent_duration_milliseconds_sum{labels} {sketch.sum:.3f}")
+            lines.append(f"{p}_agent_duration_milliseconds_count{labels} {sketch.count}")
+
+        lines += [
+            f"# HELP {p}_agent_active Agent invocations currently running.",
+            f"# TYPE {p}_agent_active gauge",
+            f"{p}_agent_active {active}",
+        ]
+        return "\n".join(lines) + "\n"
+
     def reset(self):
         """Reset all metrics."""
         with self._lock:
             self._active_metrics.clear()
             self._history.clear()
             self._aggregated.clear()
+            self._series.clear()
             self._module_stats.clear()
 
 
@@ -463,7 +660,9 @@ def get_metrics_service(
     """
     from src.di import get_container
 
-    return get_container().metrics_service(enabled=enabled, save_dir=save_dir, history_limit=history_limit)
+    return get_container().metrics_service(
+        enabled=enabled, save_dir=save_dir, history_limit=history_limit
+    )
 
 
 def reset_metrics_service():
@@ -0,0 +1,130 @@
+"""
+Streaming Quantile Sketch
+=========================
+
+Fixed-memory latency histogram with logarithmic buckets (HDR-histogram style).
+
+Every recorded value lands in the bucket ``ceil(log(value) / log(gamma))``, so any
+quantile is reported within ``(gamma - 1) / 2`` relative error (~1% by default)
+no matter how many values were recorded. Memory is one integer per bucket,
+fixed at construction.
+"""
+
+import math
+from typing import Iterable
+
+# ~1% relative error
+DEFAULT_RELATIVE_ACCURACY = 0.01
+# Values are clamped into [min_value, max_value] (milliseconds: 10µs .. ~2.8h)
+DEFAULT_MIN_VALUE = 0.01
+DEFAULT_MAX_VALUE = 1e7
+
+
+class QuantileSketch:
+    """Log-bucketed histogram answering quantile queries in fixed memory."""
+
+    __slots__ = (
+        "relative_accuracy",
+        "min_value",
+        "max_value",
+        "_gamma",
+        "_inv_log_gamma",
+        "_offset",
+        "_counts",
+        "count",
+        "sum",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        min_value: float = DEFAULT_MIN_VALUE,
+        max_value: float = DEFAULT_MAX_VALUE,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+        self._offset = math.ceil(math.log(min_value) * self._inv_log_gamma)
+        num_buckets = math.ceil(math.log(max_value) * self._inv_log_gamma) - self._offset + 1
+        self._counts = [0] * num_buckets
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value <= self.min_value:
+            index = 0
+        elif value >= self.max_value:
+            index = len(self._counts) - 1
+        else:
+            index = math.ceil(math.log(value) * self._inv_log_gamma) - self._offset
+        self._counts[index] += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+
+        Returns:
+            Estimated value, or 0.0 when nothing has been recorded
+        """
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen > rank:
+                # Bucket i covers (gamma^(i-1), gamma^i]; its midpoint is within
+                # relative_accuracy of every value in it
+                value = 2 * self._gamma ** (index + self._offset) / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def quantiles(self, qs: Iterable[float]) -> dict[float, float]:
+        """Estimate several quantiles at once."""
+        return {q: self.quantile(q) for q in qs}
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch with the same bucket layout into this one."""
+        if len(other._counts) != len(self._counts) or other._gamma != self._gamma:
+            raise ValueError("Cannot merge sketches with different bucket layouts")
+        counts = self._counts
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "QuantileSketch":
+        """Return an independent snapshot of this sketch."""
+        clone = QuantileSketch(self.relative_accuracy, self.min_value, self.max_value)
+        clone._counts = list(self._counts)
+        clone.count = self.count
+        clone.sum = self.sum
+        clone.min = self.min
+        clone.max = self.max
+        return clone
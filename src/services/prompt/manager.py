@@ -10,7 +10,7 @@ from typing import Any
 
 import yaml
 
-from src.services.config import PROJECT_ROOT, parse_language
+from src.services.config import PROJECT_ROOT, parse_language, subscribe_config_changes
 
 
 class PromptManager:
@@ -31,8 +31,13 @@ class PromptManager:
     def __new__(cls) -> "PromptManager":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            # Drop cached prompts whenever a config reload is detected
+            subscribe_config_changes(cls._instance._on_config_change)
         return cls._instance
 
+    def _on_config_change(self, changed: list[Path]) -> None:
+        self.clear_cache()
+
     def load_prompts(
         self,
         module_name: str,
@@ -5,17 +5,22 @@ RAG Service
 Unified RAG service providing a single entry point for all RAG operations.
 """
 
+import copy
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from src.logging import get_logger
+from src.utils.network.single_flight import get_single_flight, make_flight_key
 
 # Default knowledge base directory
 DEFAULT_KB_BASE_DIR = str(
     Path(__file__).resolve().parent.parent.parent.parent / "data" / "knowledge_bases"
 )
 
+# Concurrent identical searches share one pipeline call
+_search_flight = get_single_flight("rag.search")
+
 
 class RAGService:
     """
@@ -121,21 +126,28 @@ class RAGService:
 
         pipeline = get_pipeline(provider, kb_base_dir=self.kb_base_dir)
 
-        result = await pipeline.search(query=query, kb_name=kb_name, mode=mode, **kwargs)
-
-        # Ensure consistent return format
-        if "query" not in result:
-            result["query"] = query
-        if "answer" not in result and "content" in result:
-            result["answer"] = result["content"]
-        if "content" not in result and "answer" in result:
-            result["content"] = result["answer"]
-        if "provider" not in result:
-            result["provider"] = provider
-        if "mode" not in result:
-            result["mode"] = mode
-
-        return result
+        async def _search() -> Dict[str, Any]:
+            result = await pipeline.search(query=query, kb_name=kb_name, mode=mode, **kwargs)
+
+            # Ensure consistent return format
+            if "query" not in result:
+                result["query"] = query
+            if "answer" not in result and "content" in result:
+                result["answer"] = result["content"]
+            if "content" not in result and "answer" in result:
+                result["content"] = result["answer"]
+            if "provider" not in result:
+                result["provider"] = provider
+            if "mode" not in result:
+                result["mode"] = mode
+
+            return result
+
+        flight_key = make_flight_key(self.kb_base_dir, provider, kb_name, query, mode, **kwargs)
+        result = await _search_flight.do(flight_key, _search)
+
+        # Callers may mutate their result; don't let that leak between them
+        return copy.deepcopy(result)
 
     def _get_provider_for_kb(self, kb_name: str) -> str:
         """
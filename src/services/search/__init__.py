@@ -34,14 +34,16 @@ Environment Variables:
     - SEARCH_API_KEY: Unified API key for all providers
 """
 
+import copy
 from datetime import datetime
 import json
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from src.logging import get_logger
-from src.services.config import PROJECT_ROOT, load_config_with_main
+from src.services.config import PROJECT_ROOT, get_config_snapshot
+from src.utils.network.single_flight import get_single_flight, make_flight_key
 
 from .base import SEARCH_API_KEY_ENV, BaseSearchProvider
 from .consolidation import CONSOLIDATION_TYPES, PROVIDER_TEMPLATES, AnswerConsolidator
@@ -57,16 +59,19 @@ from .types import Citation, SearchResult, WebSearchResponse
 # Module logger
 _logger = get_logger("Search", level="INFO")
 
+# Concurrent identical searches share one provider request
+_web_search_flight = get_single_flight("web_search")
 
-def _get_web_search_config() -> dict[str, Any]:
+
+def _get_web_search_config() -> Mapping[str, Any]:
     """
     Load web search configuration from config/main.yaml using the standard config loader.
 
     Returns:
-        dict with web_search config from tools.web_search section
+        Read-only mapping with web_search config from tools.web_search section
     """
     try:
-        config = load_config_with_main("main.yaml", PROJECT_ROOT)
+        config = get_config_snapshot("main.yaml", PROJECT_ROOT)
         return config.get("tools", {}).get("web_search", {})
     except Exception as e:
         _logger.debug(f"Could not load config: {e}")
@@ -138,6 +143,56 @@ def web_search(
         >>> print(result["citations"])
         [{"id": 1, "url": "https://...", "title": "...", ...}]
     """
+    flight_key = make_flight_key(
+        query,
+        output_dir,
+        verbose,
+        provider,
+        consolidation,
+        consolidation_custom_template,
+        consolidation_llm_model,
+        baidu_model,
+        baidu_enable_deep_search,
+        baidu_search_recency_filter,
+        **provider_kwargs,
+    )
+    # Identical searches already in flight (e.g. parallel research topics) share one request
+    result = _web_search_flight.do_sync(
+        flight_key,
+        lambda: _web_search(
+            query,
+            output_dir=output_dir,
+            verbose=verbose,
+            provider=provider,
+            consolidation=consolidation,
+            consolidation_custom_template=consolidation_custom_template,
+            consolidation_llm_model=consolidation_llm_model,
+            baidu_model=baidu_model,
+            baidu_enable_deep_search=baidu_enable_deep_search,
+            baidu_search_recency_filter=baidu_search_recency_filter,
+            **provider_kwargs,
+        ),
+    )
+    # Callers may mutate their result; don't let that leak between them
+    return copy.deepcopy(result)
+
+
+def _web_search(
+    query: str,
+    output_dir: str | None = None,
+    verbose: bool = False,
+    provider: str | None = None,
+    # Consolidation options (only for SERP providers: serper, jina)
+    consolidation: str | None = None,  # none, template, llm
+    consolidation_custom_template: str | None = None,  # Custom Jinja2 template
+    consolidation_llm_model: str | None = None,  # Model for LLM consolidation
+    # Legacy Baidu-specific params (for backward compatibility)
+    baidu_model: str = "ernie-4.5-turbo-32k",
+    baidu_enable_deep_search: bool = False,
+    baidu_search_recency_filter: str = "week",
+    **provider_kwargs: Any,
+) -> dict[str, Any]:
+    """Run a web search without request coalescing (see ``web_search``)."""
     # Load config from main.yaml
     config = _get_web_search_config()
 
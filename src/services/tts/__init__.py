@@ -9,9 +9,31 @@ Usage:
 
     config = get_tts_config()
     # config = {"model": "tts-1", "api_key": "...", "base_url": "...", "voice": "alloy"}
+
+    # Chunked, cached synthesis of texts of any length
+    from src.services.tts import get_tts_synthesizer
+
+    result = await get_tts_synthesizer().synthesize(script, voice="alloy")
 """
 
+from .audio_cache import TTSAudioCache, make_audio_key, normalize_tts_text
 from .config import get_tts_config
 from .service import synthesize_speech_to_file
+from .synthesizer import (
+    TTSSynthesizer,
+    get_tts_synthesizer,
+    reset_tts_synthesizer,
+    split_tts_chunks,
+)
 
-__all__ = ["get_tts_config", "synthesize_speech_to_file"]
+__all__ = [
+    "TTSAudioCache",
+    "TTSSynthesizer",
+    "get_tts_config",
+    "get_tts_synthesizer",
+    "make_audio_key",
+    "normalize_tts_text",
+    "reset_tts_synthesizer",
+    "split_tts_chunks",
+    "synthesize_speech_to_file",
+]
@@ -0,0 +1,265 @@
+"""
+TTS Audio Cache
+===============
+
+Content-addressed store for synthesized speech.
+
+Audio is keyed on (model, voice, normalized text) - whitespace runs collapsed -
+so narrating the same script again, or a script sharing chunks with an earlier
+one, reuses the stored MP3 instead of calling the TTS API. Entries are written
+atomically to ``data/user/tts_cache/<key[:2]>/<key>.mp3``, which is served under
+``/api/outputs/tts_cache/``.
+
+The directory is bounded by ``max_bytes``: when a write pushes it over the
+budget, the least recently used files are deleted (hits refresh a file's mtime).
+Cache URLs are therefore not stable; audio handed out to users is exported to
+its own directory first (``export``), which eviction never touches.
+
+Usage:
+    from src.services.tts import TTSAudioCache, make_audio_key
+
+    cache = TTSAudioCache()
+    key = make_audio_key("tts-1", "alloy", "Hello there.")
+    audio = cache.get(key)  # bytes or None
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+OUTPUTS_DIR = PROJECT_ROOT / "data" / "user"
+DEFAULT_CACHE_DIR = OUTPUTS_DIR / "tts_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def normalize_tts_text(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share an entry."""
+    return " ".join((text or "").split())
+
+
+def outputs_url(path: str | Path) -> str | None:
+    """``/api/outputs/...`` URL of a file, or None if it is not under data/user."""
+    try:
+        relative = Path(path).resolve().relative_to(OUTPUTS_DIR.resolve())
+    except ValueError:
+        return None
+    return f"/api/outputs/{relative.as_posix()}"
+
+
+def make_audio_key(model: str, voice: str, text: str, audio_format: str = "mp3") -> str:
+    """
+    Build the content address of a synthesized text.
+
+    Returns:
+        SHA-256 hex digest of (model, voice, format, normalized text)
+    """
+    canonical = json.dumps(
+        [model, voice, audio_format, normalize_tts_text(text)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class TTSAudioCache:
+    """
+    Disk store of synthesized audio, bounded by total size with LRU eviction.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory for audio files (default: data/user/tts_cache)
+            max_bytes: Size budget of the directory; <= 0 disables eviction
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: int | None = None  # Computed on first write
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0, "errors": 0}
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.mp3"
+
+    def url_for(self, key: str) -> str | None:
+        """``/api/outputs/...`` URL of an entry, or None if the cache is not served there."""
+        return outputs_url(self.path_for(key))
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def lookup(self, key: str) -> Path | None:
+        """
+        Find an entry without reading it.
+
+        Returns:
+            Path of the audio file, or None on miss
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except OSError as e:
+            logger.debug(f"Unusable TTS cache entry {path}: {e}")
+            self._count("errors")
+            self._count("misses")
+            return None
+        self._count("hits")
+        return path
+
+    def get(self, key: str) -> bytes | None:
+        """Read an entry's audio bytes (None on miss)."""
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            logger.debug(f"Unreadable TTS cache entry {path}: {e}")
+            self._count("errors")
+            return None
+
+    def set(self, key: str, audio: bytes) -> Path | None:
+        """
+        Store audio (atomic write; failures are logged, never raised).
+
+        Returns:
+            Path of the stored file, or None if it could not be written
+        """
+        if not audio:
+            return None
+        path = self.path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                previous = path.stat().st_size
+            except FileNotFoundError:
+                previous = 0
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache entry: {e}")
+            self._count("errors")
+            return None
+
+        self._count("writes")
+        with self._lock:
+            if self._size is not None:
+                self._size += len(audio) - previous
+        self._evict_over_budget(keep=path)
+        return path
+
+    def export(self, key: str, dest: str | Path) -> Path | None:
+        """
+        Place the audio of an entry at ``dest``, outside the reach of eviction.
+
+        A hard link is made where possible (no extra disk space), otherwise the
+        file is copied. An existing ``dest`` is kept, so names derived from the
+        key make repeated exports free.
+
+        Returns:
+            ``dest``, or None if the entry is missing or could not be exported
+        """
+        dest = Path(dest)
+        if dest.exists():
+            return dest
+        source = self.path_for(key)
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = dest.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, dest)
+        except OSError as e:
+            logger.warning(f"Failed to export TTS cache entry {key}: {e}")
+            self._count("errors")
+            return None
+        return dest
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*/*.mp3"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict_over_budget(self, keep: Path) -> None:
+        if self.max_bytes <= 0:
+            return
+        with self._lock:
+            if self._size is not None and self._size <= self.max_bytes:
+                return
+        entries = self._entries()
+        size = sum(entry_size for _, entry_size, _ in entries)
+        evicted = 0
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+            evicted += 1
+        with self._lock:
+            self._size = size
+            self._stats["evicted"] += evicted
+
+    def clear(self) -> int:
+        """
+        Delete all entries.
+
+        Returns:
+            Number of files deleted
+        """
+        deleted = 0
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+                deleted += 1
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+        return deleted
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss metrics."""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["hits"] / lookups) if lookups else 0.0
+            stats["size_bytes"] = self._size
+        stats["max_bytes"] = self.max_bytes
+        stats["cache_dir"] = str(self.cache_dir)
+        return stats
+
+
+__all__ = [
+    "DEFAULT_CACHE_DIR",
+    "TTSAudioCache",
+    "make_audio_key",
+    "normalize_tts_text",
+    "outputs_url",
+]
@@ -0,0 +1,359 @@
+"""
+TTS Synthesizer
+===============
+
+Sentence-chunked speech synthesis on top of the content-addressed audio cache.
+
+Text is split at sentence boundaries into chunks well below the API's
+4096-character input limit (the first chunk is kept short so playback can start
+early). Chunks are synthesized with bounded parallelism and yielded in order, so
+a script of any length can be streamed to the browser as it is produced or
+assembled into a single file. MP3 is a frame stream, so concatenated chunk audio
+plays back as one track.
+
+Every chunk and every complete text is cached by (model, voice, normalized
+text); repeating a narration costs no TTS request at all. API clients are pooled
+per endpoint/key instead of being created for each call.
+
+Usage:
+    from src.services.tts import get_tts_synthesizer
+
+    synthesizer = get_tts_synthesizer()
+    result = await synthesizer.synthesize(script, voice="alloy")  # path, url, cached
+    async for audio in synthesizer.stream(script, voice="alloy"):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+import logging
+import os
+from pathlib import Path
+import re
+from typing import Any, AsyncIterator, Callable
+
+from .audio_cache import (
+    DEFAULT_MAX_BYTES,
+    TTSAudioCache,
+    make_audio_key,
+    normalize_tts_text,
+    outputs_url,
+)
+from .config import get_tts_config
+
+logger = logging.getLogger(__name__)
+
+MAX_TTS_INPUT_CHARS = 4096
+DEFAULT_CHUNK_CHARS = 600
+DEFAULT_FIRST_CHUNK_CHARS = 200
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Split after sentence punctuation (Latin needs following whitespace, CJK does not)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?;…])\s+|(?<=[。！？；])|\n+")
+
+
+def _split_long(sentence: str, max_chars: int) -> list[str]:
+    """Split a sentence longer than max_chars at whitespace, or hard-cut it."""
+    if len(sentence) <= max_chars:
+        return [sentence]
+    pieces: list[str] = []
+    current = ""
+    for word in sentence.split(" "):
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_tts_chunks(
+    text: str,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    first_chunk_chars: int = DEFAULT_FIRST_CHUNK_CHARS,
+) -> list[str]:
+    """
+    Pack the sentences of ``text`` into chunks for synthesis.
+
+    Args:
+        text: Text to synthesize
+        max_chars: Chunk size limit (capped at the API input limit)
+        first_chunk_chars: Smaller limit for the first chunk, to start playback early
+
+    Returns:
+        Normalized chunks in reading order (empty if the text is blank)
+    """
+    max_chars = max(1, min(int(max_chars), MAX_TTS_INPUT_CHARS))
+    first_chunk_chars = max(1, min(int(first_chunk_chars), max_chars))
+    chunks: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_BOUNDARY.split(text or ""):
+        for piece in _split_long(normalize_tts_text(sentence), max_chars):
+            if not piece:
+                continue
+            limit = max_chars if chunks else first_chunk_chars
+            if current and len(current) + 1 + len(piece) > limit:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _default_client_factory(tts_config: dict[str, Any]):
+    from openai import AsyncAzureOpenAI, AsyncOpenAI
+
+    binding = os.getenv("TTS_BINDING", "openai")
+    api_version = tts_config.get("api_version")
+    # Only use Azure client if binding is explicitly Azure,
+    # OR if binding is generic 'openai' but an Azure-specific api_version is present.
+    if binding == "azure_openai" or (binding == "openai" and api_version):
+        return AsyncAzureOpenAI(
+            api_key=tts_config["api_key"],
+            azure_endpoint=tts_config["base_url"],
+            api_version=api_version,
+        )
+    return AsyncOpenAI(base_url=tts_config["base_url"], api_key=tts_config["api_key"])
+
+
+class TTSSynthesizer:
+    """
+    Chunked, cached TTS with a pooled async client per endpoint.
+    """
+
+    def __init__(
+        self,
+        cache: TTSAudioCache | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        first_chunk_chars: int = DEFAULT_FIRST_CHUNK_CHARS,
+        client_factory: Callable[[dict[str, Any]], Any] = _default_client_factory,
+    ):
+        """
+        Args:
+            cache: Audio cache (default: TTSAudioCache under data/user/tts_cache)
+            max_concurrency: Chunks synthesized at once per text
+            chunk_chars: Chunk size limit
+            first_chunk_chars: Size limit of the first chunk
+            client_factory: Builds an async OpenAI-compatible client from a TTS config
+                (dependency injection point for tests)
+        """
+        self.cache = cache or TTSAudioCache()
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.chunk_chars = chunk_chars
+        self.first_chunk_chars = first_chunk_chars
+        self.client_factory = client_factory
+        # (base_url, api_key, api_version) -> (event loop, client); httpx pools are loop-bound
+        self._clients: dict[tuple, tuple[asyncio.AbstractEventLoop, Any]] = {}
+        self._stats = {"texts": 0, "text_hits": 0, "chunks": 0, "chunk_hits": 0, "requests": 0}
+
+    def _resolve(
+        self, voice: str | None, tts_config: dict[str, Any] | None
+    ) -> tuple[dict[str, Any], str, str]:
+        cfg = tts_config or get_tts_config()
+        model = str(cfg.get("model") or "").strip()
+        voice_id = str(voice or cfg.get("voice") or "alloy").strip()
+        if not model or not cfg.get("base_url") or not cfg.get("api_key"):
+            raise ValueError("TTS configuration incomplete (model/base_url/api_key).")
+        return cfg, model, voice_id
+
+    def _client_for(self, cfg: dict[str, Any]):
+        key = (cfg.get("base_url"), cfg.get("api_key"), cfg.get("api_version"))
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(key)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, self.client_factory(cfg))
+            self._clients[key] = entry
+        return entry[1]
+
+    async def _synthesize_chunk(self, cfg: dict[str, Any], model: str, voice: str, text: str):
+        key = make_audio_key(model, voice, text)
+        self._stats["chunks"] += 1
+        audio = await asyncio.to_thread(self.cache.get, key)
+        if audio is not None:
+            self._stats["chunk_hits"] += 1
+            return audio
+
+        self._stats["requests"] += 1
+        response = await self._client_for(cfg).audio.speech.create(
+            model=model, voice=voice, input=text
+        )
+        audio = response.content
+        await asyncio.to_thread(self.cache.set, key, audio)
+        return audio
+
+    async def _iter_chunks(
+        self, cfg: dict[str, Any], model: str, voice: str, text: str
+    ) -> AsyncIterator[bytes]:
+        chunks = split_tts_chunks(text, self.chunk_chars, self.first_chunk_chars)
+        if not chunks:
+            raise ValueError("TTS input text is empty.")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(chunk: str) -> bytes:
+            async with semaphore:
+                return await self._synthesize_chunk(cfg, model, voice, chunk)
+
+        # Tasks acquire the semaphore in creation order, so earlier chunks go first
+        tasks = [asyncio.create_task(run(chunk)) for chunk in chunks]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def stream(
+        self,
+        text: str,
+        voice: str | None = None,
+        tts_config: dict[str, Any] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the audio of ``text`` chunk by chunk, in order.
+
+        The complete audio is cached once the last chunk has been produced.
+
+        Raises:
+            ValueError: If the TTS configuration is incomplete or the text is empty
+        """
+        cfg, model, voice = self._resolve(voice, tts_config)
+        key = make_audio_key(model, voice, text)
+        self._stats["texts"] += 1
+        audio = await asyncio.to_thread(self.cache.get, key)
+        if audio is not None:
+            self._stats["text_hits"] += 1
+            yield audio
+            return
+
+        parts = []
+        # aclosing: a client that disconnects mid-stream cancels the pending chunks
+        async with aclosing(self._iter_chunks(cfg, model, voice, text)) as chunks:
+            async for part in chunks:
+                parts.append(part)
+                yield part
+        await asyncio.to_thread(self.cache.set, key, b"".join(parts))
+
+    async def synthesize(
+        self,
+        text: str,
+        voice: str | None = None,
+        tts_config: dict[str, Any] | None = None,
+        output_dir: str | Path | None = None,
+    ) -> dict[str, Any]:
+        """
+        Synthesize ``text`` into a single cached MP3 file.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice id (default: the configured voice)
+            tts_config: Explicit TTS config (default: get_tts_config())
+            output_dir: Directory to export the audio to as ``<key>.mp3``. Without it
+                the returned path lies in the cache and may be evicted later.
+
+        Returns:
+            Dict containing:
+                - key: Content address of the audio
+                - path: Audio file path (in output_dir when given)
+                - url: ``/api/outputs/...`` URL of the file (None if not served)
+                - voice: Voice used
+                - cached: Whether the audio was already cached
+                - chunks: Number of chunks synthesized (0 when cached)
+
+        Raises:
+            ValueError: If the TTS configuration is incomplete or the text is empty
+            OSError: If the audio could not be stored
+        """
+        cfg, model, voice = self._resolve(voice, tts_config)
+        key = make_audio_key(model, voice, text)
+        self._stats["texts"] += 1
+        path = await asyncio.to_thread(self.cache.lookup, key)
+        chunks = 0
+        if path is not None:
+            self._stats["text_hits"] += 1
+        else:
+            parts = [part async for part in self._iter_chunks(cfg, model, voice, text)]
+            chunks = len(parts)
+            path = await asyncio.to_thread(self.cache.set, key, b"".join(parts))
+            if path is None:
+                raise OSError("Could not store synthesized audio")
+        if output_dir is not None:
+            path = await asyncio.to_thread(self.cache.export, key, Path(output_dir) / f"{key}.mp3")
+            if path is None:
+                raise OSError("Could not export synthesized audio")
+
+        return {
+            "key": key,
+            "path": str(path),
+            "url": outputs_url(path),
+            "voice": voice,
+            "cached": chunks == 0,
+            "chunks": chunks,
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Text/chunk hit counts, TTS requests made, and the audio cache metrics."""
+        stats: dict[str, Any] = dict(self._stats)
+        stats["text_hit_rate"] = stats["text_hits"] / stats["texts"] if stats["texts"] else 0.0
+        stats["clients"] = len(self._clients)
+        stats["cache"] = self.cache.get_stats()
+        return stats
+
+
+# Singleton instance for convenience
+_synthesizer: TTSSynthesizer | None = None
+
+
+def get_tts_synthesizer() -> TTSSynthesizer:
+    """
+    Get or create the global TTSSynthesizer.
+
+    Settings come from the ``tts`` section of config/main.yaml.
+    """
+    global _synthesizer
+    if _synthesizer is None:
+        settings: dict[str, Any] = {}
+        try:
+            from src.services.config import PROJECT_ROOT, load_config_with_main
+
+            settings = load_config_with_main("solve_config.yaml", PROJECT_ROOT).get("tts") or {}
+        except Exception as e:
+            logger.warning(f"Failed to load TTS settings, using defaults: {e}")
+        max_mb = settings.get("cache_max_size_mb")
+        _synthesizer = TTSSynthesizer(
+            cache=TTSAudioCache(
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else DEFAULT_MAX_BYTES
+            ),
+            max_concurrency=settings.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+            chunk_chars=settings.get("chunk_chars", DEFAULT_CHUNK_CHARS),
+            first_chunk_chars=settings.get("first_chunk_chars", DEFAULT_FIRST_CHUNK_CHARS),
+        )
+    return _synthesizer
+
+
+def reset_tts_synthesizer() -> None:
+    """Drop the global synthesizer (settings are re-read on next use)."""
+    global _synthesizer
+    _synthesizer = None
+
+
+__all__ = [
+    "MAX_TTS_INPUT_CHARS",
+    "TTSSynthesizer",
+    "get_tts_synthesizer",
+    "reset_tts_synthesizer",
+    "split_tts_chunks",
+]
@@ -0,0 +1,120 @@
+"""
+Webhook Service
+===============
+
+Durable outbound webhooks for pipeline events (research/solve runs finishing,
+knowledge bases being rebuilt) so integrations don't have to poll the API.
+
+- ``WebhookStore``: SQLite registry of endpoints plus the delivery outbox
+- ``WebhookDeliveryEngine``: async worker pool with per-endpoint limits, retries
+  with exponential backoff and HMAC-signed requests
+- ``emit_webhook_event`` / ``emit_webhook_event_async``: record an event for every
+  subscribed endpoint; never raises, so pipelines can call it unconditionally
+
+Usage:
+    from src.services.webhooks import WebhookEventType, emit_webhook_event
+
+    emit_webhook_event(WebhookEventType.WORKFLOW_COMPLETED, {"workflow": "solve", ...})
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from src.logging import get_logger
+
+from .engine import (
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+    WebhookDeliveryEngine,
+    sign_payload,
+    verify_signature,
+)
+from .models import (
+    WebhookConfig,
+    WebhookCreateRequest,
+    WebhookDelivery,
+    WebhookDeliveryStatus,
+    WebhookEventType,
+    WebhookTestRequest,
+    WebhookUpdateRequest,
+)
+from .store import WebhookStore
+
+logger = get_logger("Webhooks")
+
+_store: WebhookStore | None = None
+_engine: WebhookDeliveryEngine | None = None
+
+
+def get_webhook_store() -> WebhookStore:
+    """Get the global WebhookStore (data/user/webhooks.db)."""
+    global _store
+    if _store is None:
+        _store = WebhookStore()
+    return _store
+
+
+def get_webhook_engine() -> WebhookDeliveryEngine:
+    """Get the global delivery engine (started by the API lifespan)."""
+    global _engine
+    if _engine is None:
+        _engine = WebhookDeliveryEngine(get_webhook_store())
+    return _engine
+
+
+def reset_webhook_service() -> None:
+    """Drop the global store and engine (tests)."""
+    global _store, _engine
+    _store = None
+    _engine = None
+
+
+def emit_webhook_event(event_type: WebhookEventType | str, payload: dict[str, Any]) -> int:
+    """
+    Queue ``event_type`` for delivery to every subscribed webhook.
+
+    Safe to call from any thread. Errors are logged, never raised.
+
+    Returns:
+        Number of deliveries queued
+    """
+    event = getattr(event_type, "value", event_type)
+    try:
+        deliveries = get_webhook_store().enqueue(event, payload)
+    except Exception as e:
+        logger.warning(f"Failed to queue webhook event {event}: {e}")
+        return 0
+    if deliveries and _engine is not None:
+        _engine.notify()
+    return len(deliveries)
+
+
+async def emit_webhook_event_async(
+    event_type: WebhookEventType | str, payload: dict[str, Any]
+) -> int:
+    """Async version of emit_webhook_event (the outbox write runs in a worker thread)."""
+    return await asyncio.to_thread(emit_webhook_event, event_type, payload)
+
+
+__all__ = [
+    "SIGNATURE_HEADER",
+    "TIMESTAMP_HEADER",
+    "WebhookConfig",
+    "WebhookCreateRequest",
+    "WebhookDelivery",
+    "WebhookDeliveryEngine",
+    "WebhookDeliveryStatus",
+    "WebhookEventType",
+    "WebhookStore",
+    "WebhookTestRequest",
+    "WebhookUpdateRequest",
+    "emit_webhook_event",
+    "emit_webhook_event_async",
+    "get_webhook_engine",
+    "get_webhook_store",
+    "reset_webhook_service",
+    "sign_payload",
+    "verify_signature",
+]
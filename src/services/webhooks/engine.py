@@ -0,0 +1,410 @@
+"""
+Webhook Delivery Engine
+=======================
+
+Delivers outbox rows from ``WebhookStore`` to their endpoints.
+
+A dispatcher task claims due deliveries and hands them to a bounded pool of
+concurrent requests. Each endpoint has its own connection pool and concurrency
+limit, so one slow receiver cannot occupy every slot. Results are written back
+in batches, one store round trip per dispatcher pass. Failed
+attempts are rescheduled with exponential backoff (with jitter, and honouring
+``Retry-After``) by moving ``next_attempt_at`` forward; after ``max_attempts``
+the delivery is marked failed.
+
+Requests are signed when the webhook has a ``secret``:
+
+    X-Webhook-Timestamp: <unix seconds>
+    X-Webhook-Signature: sha256=<hex HMAC-SHA256 of "<timestamp>.<body>">
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+import hashlib
+import hmac
+import json
+import random
+import time
+from typing import Any
+
+import httpx
+
+from src.logging import get_logger
+
+from .models import WebhookConfig, WebhookDelivery, WebhookDeliveryStatus
+from .store import WebhookStore
+
+logger = get_logger("Webhooks")
+
+SIGNATURE_HEADER = "X-Webhook-Signature"
+# How long the dispatcher trusts its copy of the webhook configs
+WEBHOOK_CACHE_SECONDS = 5.0
+TIMESTAMP_HEADER = "X-Webhook-Timestamp"
+
+
+def sign_payload(secret: str, timestamp: int | str, body: bytes) -> str:
+    """Signature header value for ``body`` sent at ``timestamp``."""
+    message = f"{timestamp}.".encode() + body
+    return "sha256=" + hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def verify_signature(
+    secret: str,
+    timestamp: int | str,
+    body: bytes,
+    signature: str,
+    tolerance_seconds: float | None = 300,
+) -> bool:
+    """
+    Check a received signature (for receivers and tests).
+
+    Rejects timestamps older than ``tolerance_seconds`` to prevent replays.
+    """
+    if tolerance_seconds is not None and abs(time.time() - float(timestamp)) > tolerance_seconds:
+        return False
+    return hmac.compare_digest(sign_payload(secret, timestamp, body), signature)
+
+
+def build_request_body(delivery: WebhookDelivery) -> bytes:
+    envelope = {
+        "id": delivery.id,
+        "type": delivery.event_type,
+        "created_at": delivery.created_at,
+        "attempt": delivery.attempt_count + 1,
+        "data": delivery.payload,
+    }
+    return json.dumps(envelope, ensure_ascii=False, default=str).encode("utf-8")
+
+
+class WebhookDeliveryEngine:
+    """
+    Async worker pool that drains the webhook outbox.
+
+    Args:
+        store: Outbox and webhook registry
+        concurrency: Maximum requests in flight overall
+        per_endpoint_limit: Maximum requests in flight per webhook
+        base_backoff: Delay before the first retry, doubled per attempt
+        max_backoff: Upper bound for the retry delay
+        poll_interval: Longest the dispatcher sleeps without being woken by ``notify``
+        client: Optional pre-configured HTTP client (the engine owns it otherwise)
+    """
+
+    def __init__(
+        self,
+        store: WebhookStore,
+        *,
+        concurrency: int = 32,
+        per_endpoint_limit: int = 4,
+        base_backoff: float = 2.0,
+        max_backoff: float = 3600.0,
+        poll_interval: float = 5.0,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.store = store
+        self.concurrency = concurrency
+        self.per_endpoint_limit = per_endpoint_limit
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+
+        # An injected client is shared by every endpoint; otherwise each endpoint gets
+        # its own small pool (httpcore scans the whole pool for every queued request,
+        # so one large shared pool gets slower as concurrency grows).
+        self._client = client
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._inflight: dict[str, int] = defaultdict(int)
+        self._outcomes: list[dict[str, Any]] = []
+        self._webhooks: dict[str, WebhookConfig] = {}
+        self._webhooks_expiry = 0.0
+        self._stats = {"delivered": 0, "retried": 0, "failed": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._dispatcher is not None and not self._dispatcher.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        recovered = await asyncio.to_thread(self.store.recover_inflight)
+        if recovered:
+            logger.info(f"Requeued {recovered} interrupted webhook deliveries")
+        self._dispatcher = asyncio.create_task(self._run(), name="webhook-dispatcher")
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """Stop claiming work and wait (up to ``drain_timeout``) for in-flight requests."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=drain_timeout)
+        for task in list(self._tasks):
+            task.cancel()
+        if self._outcomes:
+            outcomes, self._outcomes = self._outcomes, []
+            await asyncio.to_thread(self.store.record_attempts, outcomes)
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    def notify(self) -> None:
+        """Wake the dispatcher (thread-safe); called after new deliveries are enqueued."""
+        if self._loop is None or self._wakeup is None or self._loop.is_closed():
+            return
+        try:
+            if asyncio.get_running_loop() is self._loop:
+                self._wakeup.set()
+                return
+        except RuntimeError:
+            pass
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def wait_idle(self, timeout: float | None = None) -> None:
+        """Wait until no deliveries are due or in flight (retries scheduled later don't count)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            due = await asyncio.to_thread(self.store.next_due_at)
+            idle = not self._tasks and not self._outcomes
+            if idle and (due is None or due > time.time()):
+                # Results are written by the dispatcher; make sure they have landed
+                await asyncio.sleep(0)
+                if not self._outcomes:
+                    return
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("webhook deliveries still pending")
+            await asyncio.sleep(0.01)
+
+    def get_stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = dict(self._stats)
+        stats["in_flight"] = len(self._tasks)
+        stats["running"] = self.running
+        return stats
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _endpoint_filter(self):
+        """Claim filter enforcing per-endpoint limits (runs in the claim thread)."""
+        in_flight = dict(self._inflight)
+
+        def accept(delivery: WebhookDelivery) -> bool:
+            if in_flight.get(delivery.webhook_id, 0) >= self.per_endpoint_limit:
+                return False
+            in_flight[delivery.webhook_id] = in_flight.get(delivery.webhook_id, 0) + 1
+            return True
+
+        return accept
+
+    def _store_step(
+        self, outcomes: list[dict[str, Any]], free: int, accept, refresh_webhooks: bool
+    ) -> tuple[list[WebhookDelivery], dict[str, WebhookConfig] | None, float | None]:
+        """
+        One round trip to the store (runs in a worker thread): record finished
+        attempts, claim new work and, if needed, reload webhook configs.
+        """
+        if outcomes:
+            self.store.record_attempts(outcomes)
+        claimed = self.store.claim_due(free, None, accept) if free > 0 else []
+        webhooks = None
+        if refresh_webhooks or any(d.webhook_id not in self._webhooks for d in claimed):
+            webhooks = {w.id: w for w in self.store.list_webhooks()}
+        next_due = self.store.next_due_at() if free > 0 and not claimed else None
+        return claimed, webhooks, next_due
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            self._wakeup.clear()
+            outcomes, self._outcomes = self._outcomes, []
+            free = self.concurrency - len(self._tasks)
+            refresh = time.monotonic() >= self._webhooks_expiry
+            try:
+                claimed, webhooks, next_due = await asyncio.to_thread(
+                    self._store_step, outcomes, free, self._endpoint_filter(), refresh
+                )
+            except Exception as e:
+                logger.error(f"Webhook outbox update failed: {e}")
+                self._outcomes = outcomes + self._outcomes
+                claimed, webhooks, next_due = [], None, None
+                await asyncio.sleep(min(1.0, self.poll_interval))
+
+            if webhooks is not None:
+                self._webhooks = webhooks
+                self._webhooks_expiry = time.monotonic() + WEBHOOK_CACHE_SECONDS
+            for delivery in claimed:
+                self._inflight[delivery.webhook_id] += 1
+                task = asyncio.create_task(self._deliver(delivery))
+                self._tasks.add(task)
+                task.add_done_callback(self._task_done)
+
+            if (claimed and len(self._tasks) < self.concurrency) or self._outcomes:
+                # More due work (or results) may be waiting; go round again
+                await asyncio.sleep(0)
+                continue
+
+            # Due work that was not claimed is waiting for a busy endpoint, and a
+            # finishing request sets the wakeup event. Otherwise sleep until the next
+            # scheduled retry.
+            timeout = self.poll_interval
+            if next_due is not None and next_due > time.time():
+                timeout = min(timeout, next_due - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _deliver(self, delivery: WebhookDelivery) -> None:
+        try:
+            webhook = self._webhooks.get(delivery.webhook_id)
+            if webhook is None:
+                self._finish(delivery, WebhookDeliveryStatus.FAILED, error="webhook deleted")
+                return
+            status_code, error, retry_after = await self._send(webhook, delivery)
+            if error is None:
+                self._finish(delivery, WebhookDeliveryStatus.SUCCESS, status_code=status_code)
+            else:
+                self._schedule_retry(delivery, status_code, error, retry_after)
+        except Exception as e:  # The row stays "delivering" and is recovered on restart
+            logger.error(f"Webhook delivery {delivery.id} crashed: {e}")
+        finally:
+            self._inflight[delivery.webhook_id] -= 1
+            if self._inflight[delivery.webhook_id] <= 0:
+                del self._inflight[delivery.webhook_id]
+
+    def _client_for(self, webhook_id: str) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        client = self._clients.get(webhook_id)
+        if client is None:
+            limit = self.per_endpoint_limit
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+                follow_redirects=False,
+            )
+            self._clients[webhook_id] = client
+        return client
+
+    async def _send(
+        self, webhook: WebhookConfig, delivery: WebhookDelivery
+    ) -> tuple[int | None, str | None, float | None]:
+        """POST one delivery. Returns (status_code, error or None, retry_after seconds)."""
+        body = build_request_body(delivery)
+        timestamp = int(time.time())
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "praDeep-Webhooks/1.0",
+            "X-Webhook-Id": webhook.id,
+            "X-Webhook-Event": delivery.event_type,
+            "X-Webhook-Delivery": delivery.id,
+            TIMESTAMP_HEADER: str(timestamp),
+        }
+        if webhook.secret:
+            headers[SIGNATURE_HEADER] = sign_payload(webhook.secret, timestamp, body)
+
+        try:
+            response = await self._client_for(webhook.id).post(
+                str(webhook.url), content=body, headers=headers, timeout=webhook.timeout_seconds
+            )
+        except httpx.HTTPError as e:
+            return None, f"{type(e).__name__}: {e}" if str(e) else type(e).__name__, None
+
+        if 200 <= response.status_code < 300:
+            return response.status_code, None, None
+        retry_after = None
+        raw = response.headers.get("Retry-After")
+        if raw:
+            try:
+                retry_after = float(raw)
+            except ValueError:
+                pass
+        return response.status_code, f"HTTP {response.status_code}", retry_after
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Delay after the ``attempt``-th failure: exponential with equal jitter."""
+        delay = min(self.max_backoff, self.base_backoff * (2 ** max(0, attempt - 1)))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _schedule_retry(
+        self,
+        delivery: WebhookDelivery,
+        status_code: int | None,
+        error: str,
+        retry_after: float | None,
+    ) -> None:
+        attempts = delivery.attempt_count + 1
+        if attempts >= delivery.max_attempts:
+            logger.warning(
+                f"Webhook delivery {delivery.id} ({delivery.event_type}) failed after "
+                f"{attempts} attempts: {error}"
+            )
+            self._finish(
+                delivery, WebhookDeliveryStatus.FAILED, status_code=status_code, error=error
+            )
+            return
+        delay = self.backoff_delay(attempts)
+        if retry_after is not None:
+            delay = min(self.max_backoff, max(delay, retry_after))
+        self._stats["retried"] += 1
+        self._record(
+            delivery,
+            WebhookDeliveryStatus.RETRYING,
+            next_attempt_at=time.time() + delay,
+            status_code=status_code,
+            error=error,
+        )
+
+    def _finish(
+        self,
+        delivery: WebhookDelivery,
+        status: WebhookDeliveryStatus,
+        status_code: int | None = None,
+        error: str | None = None,
+    ) -> None:
+        self._stats["delivered" if status == WebhookDeliveryStatus.SUCCESS else "failed"] += 1
+        self._record(
+            delivery,
+            status,
+            next_attempt_at=delivery.next_attempt_at,
+            status_code=status_code,
+            error=error,
+        )
+
+    def _record(
+        self,
+        delivery: WebhookDelivery,
+        status: WebhookDeliveryStatus,
+        *,
+        next_attempt_at: float,
+        status_code: int | None,
+        error: str | None,
+    ) -> None:
+        # Written by the dispatcher's next store step, batched with other results
+        self._outcomes.append(
+            {
+                "delivery_id": delivery.id,
+                "status": status,
+                "attempt_count": delivery.attempt_count + 1,
+                "next_attempt_at": next_attempt_at,
+                "attempted_at": time.time(),
+                "status_code": status_code,
+                "error": error,
+            }
+        )
@@ -0,0 +1,351 @@
+"""
+Webhook Store
+=============
+
+SQLite-backed registry of webhook endpoints and the delivery outbox.
+
+Every emitted event becomes one ``deliveries`` row per subscribed webhook, written in
+a single transaction, so events survive restarts and nothing is lost if an endpoint
+is down. Workers claim due rows (``status`` pending/retrying with ``next_attempt_at``
+in the past) by flipping them to ``delivering``; rows left in that state by a crash
+are handed back by ``recover_inflight``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterable
+import uuid
+
+from .models import (
+    WebhookConfig,
+    WebhookCreateRequest,
+    WebhookDelivery,
+    WebhookDeliveryStatus,
+    WebhookUpdateRequest,
+)
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[3] / "data" / "user" / "webhooks.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhooks (
+    id TEXT PRIMARY KEY,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS deliveries (
+    id TEXT PRIMARY KEY,
+    webhook_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempt_count INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    last_attempt_at REAL,
+    last_status_code INTEGER,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_deliveries_due ON deliveries (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS idx_deliveries_webhook ON deliveries (webhook_id, created_at);
+"""
+
+_DUE_STATUSES = (WebhookDeliveryStatus.PENDING.value, WebhookDeliveryStatus.RETRYING.value)
+
+_DELIVERY_COLUMNS = (
+    "id, webhook_id, event_type, payload, status, attempt_count, max_attempts, "
+    "next_attempt_at, last_attempt_at, last_status_code, last_error, created_at, updated_at"
+)
+
+
+def _row_to_delivery(row: sqlite3.Row) -> WebhookDelivery:
+    data = dict(row)
+    data["payload"] = json.loads(data["payload"])
+    return WebhookDelivery(**data)
+
+
+class WebhookStore:
+    """Thread-safe SQLite store for webhook configs and deliveries."""
+
+    def __init__(self, db_path: str | Path | None = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        # WAL + NORMAL: one fsync per checkpoint instead of per commit, still crash-safe
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Webhooks
+    # ------------------------------------------------------------------
+
+    def create_webhook(self, request: WebhookCreateRequest) -> WebhookConfig:
+        now = time.time()
+        config = WebhookConfig(
+            id=f"wh_{uuid.uuid4().hex[:12]}",
+            url=request.url,
+            enabled=request.enabled,
+            events=request.events,
+            secret=request.secret if request.secret is not None else uuid.uuid4().hex,
+            max_attempts=request.max_attempts,
+            timeout_seconds=request.timeout_seconds,
+            created_at=now,
+            updated_at=now,
+        )
+        self._save_webhook(config)
+        return config
+
+    def update_webhook(
+        self, webhook_id: str, request: WebhookUpdateRequest
+    ) -> WebhookConfig | None:
+        config = self.get_webhook(webhook_id)
+        if config is None:
+            return None
+        changes = request.model_dump(exclude_unset=True, exclude_none=True)
+        updated = config.model_copy(update={**changes, "updated_at": time.time()})
+        # Re-validate (e.g. url) after applying the partial update
+        updated = WebhookConfig.model_validate(updated.model_dump())
+        self._save_webhook(updated)
+        return updated
+
+    def _save_webhook(self, config: WebhookConfig) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO webhooks (id, config) VALUES (?, ?)",
+                (config.id, config.model_dump_json()),
+            )
+
+    def delete_webhook(self, webhook_id: str) -> bool:
+        """Remove a webhook and its undelivered deliveries."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM webhooks WHERE id = ?", (webhook_id,))
+            self._conn.execute(
+                "DELETE FROM deliveries WHERE webhook_id = ? AND status IN (?, ?, ?)",
+                (webhook_id, *_DUE_STATUSES, WebhookDeliveryStatus.DELIVERING.value),
+            )
+        return cur.rowcount > 0
+
+    def get_webhook(self, webhook_id: str) -> WebhookConfig | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT config FROM webhooks WHERE id = ?", (webhook_id,)
+            ).fetchone()
+        return WebhookConfig.model_validate_json(row["config"]) if row else None
+
+    def list_webhooks(self) -> list[WebhookConfig]:
+        with self._lock:
+            rows = self._conn.execute("SELECT config FROM webhooks").fetchall()
+        configs = [WebhookConfig.model_validate_json(row["config"]) for row in rows]
+        return sorted(configs, key=lambda c: c.created_at)
+
+    # ------------------------------------------------------------------
+    # Outbox
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        event_type: str,
+        payload: dict[str, Any],
+        webhooks: Iterable[WebhookConfig] | None = None,
+    ) -> list[WebhookDelivery]:
+        """
+        Record one delivery per enabled webhook subscribed to ``event_type``.
+
+        A webhook with an empty ``events`` list receives every event. Pass ``webhooks``
+        to target specific endpoints (e.g. a test delivery) regardless of subscription.
+        """
+        if webhooks is None:
+            webhooks = [
+                w
+                for w in self.list_webhooks()
+                if w.enabled and (not w.events or event_type in w.events)
+            ]
+        now = time.time()
+        deliveries = [
+            WebhookDelivery(
+                id=f"whd_{uuid.uuid4().hex}",
+                webhook_id=w.id,
+                event_type=event_type,
+                payload=payload,
+                status=WebhookDeliveryStatus.PENDING,
+                attempt_count=0,
+                max_attempts=w.max_attempts,
+                next_attempt_at=now,
+                created_at=now,
+                updated_at=now,
+            )
+            for w in webhooks
+        ]
+        if not deliveries:
+            return []
+        body = json.dumps(payload, ensure_ascii=False, default=str)
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    f"INSERT INTO deliveries ({_DELIVERY_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, 0, ?, ?, NULL, NULL, NULL, ?, ?)",
+                    [
+                        (
+                            d.id,
+                            d.webhook_id,
+                            d.event_type,
+                            body,
+                            d.status.value,
+                            d.max_attempts,
+                            d.next_attempt_at,
+                            d.created_at,
+                            d.updated_at,
+                        )
+                        for d in deliveries
+                    ],
+                )
+        return deliveries
+
+    def claim_due(
+        self,
+        limit: int,
+        now: float | None = None,
+        accept: Callable[[WebhookDelivery], bool] | None = None,
+    ) -> list[WebhookDelivery]:
+        """
+        Atomically mark up to ``limit`` due deliveries as ``delivering`` and return them.
+
+        Args:
+            limit: Maximum number of deliveries to claim
+            now: Current time (defaults to time.time())
+            accept: Optional filter, e.g. to skip endpoints already at their
+                concurrency limit; rejected rows stay due
+        """
+        if limit <= 0:
+            return []
+        now = time.time() if now is None else now
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                rows = self._conn.execute(
+                    f"SELECT {_DELIVERY_COLUMNS} FROM deliveries "
+                    "WHERE status IN (?, ?) AND next_attempt_at <= ? "
+                    "ORDER BY next_attempt_at LIMIT ?",
+                    (*_DUE_STATUSES, now, limit * 4 if accept else limit),
+                ).fetchall()
+                claimed: list[WebhookDelivery] = []
+                for row in rows:
+                    delivery = _row_to_delivery(row)
+                    if accept is not None and not accept(delivery):
+                        continue
+                    claimed.append(delivery)
+                    if len(claimed) >= limit:
+                        break
+                self._conn.executemany(
+                    "UPDATE deliveries SET status = ?, updated_at = ? WHERE id = ?",
+                    [(WebhookDeliveryStatus.DELIVERING.value, now, d.id) for d in claimed],
+                )
+        for delivery in claimed:
+            delivery.status = WebhookDeliveryStatus.DELIVERING
+        return claimed
+
+    def next_due_at(self) -> float | None:
+        """Earliest ``next_attempt_at`` among waiting deliveries."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) AS due FROM deliveries WHERE status IN (?, ?)",
+                _DUE_STATUSES,
+            ).fetchone()
+        return row["due"] if row else None
+
+    def record_attempts(self, outcomes: list[dict[str, Any]]) -> None:
+        """
+        Record the results of delivery attempts in one transaction.
+
+        Each outcome has ``delivery_id``, ``status``, ``attempt_count``,
+        ``next_attempt_at`` and optionally ``attempted_at``, ``status_code``, ``error``.
+        """
+        now = time.time()
+        rows = [
+            (
+                WebhookDeliveryStatus(o["status"]).value,
+                o["attempt_count"],
+                o["next_attempt_at"],
+                o.get("attempted_at", now),
+                o.get("status_code"),
+                o.get("error"),
+                now,
+                o["delivery_id"],
+            )
+            for o in outcomes
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "UPDATE deliveries SET status = ?, attempt_count = ?, next_attempt_at = ?, "
+                    "last_attempt_at = ?, last_status_code = ?, last_error = ?, updated_at = ? "
+                    "WHERE id = ?",
+                    rows,
+                )
+
+    def recover_inflight(self) -> int:
+        """Return deliveries stuck in ``delivering`` (e.g. after a crash) to the queue."""
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE deliveries SET status = ?, next_attempt_at = ?, updated_at = ? "
+                "WHERE status = ?",
+                (
+                    WebhookDeliveryStatus.RETRYING.value,
+                    now,
+                    now,
+                    WebhookDeliveryStatus.DELIVERING.value,
+                ),
+            )
+        return cur.rowcount
+
+    def get_delivery(self, delivery_id: str) -> WebhookDelivery | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_DELIVERY_COLUMNS} FROM deliveries WHERE id = ?", (delivery_id,)
+            ).fetchone()
+        return _row_to_delivery(row) if row else None
+
+    def list_deliveries(
+        self,
+        webhook_id: str | None = None,
+        status: WebhookDeliveryStatus | None = None,
+        limit: int = 100,
+    ) -> list[WebhookDelivery]:
+        """Most recent deliveries first."""
+        clauses, params = [], []
+        if webhook_id:
+            clauses.append("webhook_id = ?")
+            params.append(webhook_id)
+        if status:
+            clauses.append("status = ?")
+            params.append(status.value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_DELIVERY_COLUMNS} FROM deliveries {where} "
+                "ORDER BY created_at DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [_row_to_delivery(row) for row in rows]
+
+    def count_by_status(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM deliveries GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["n"] for row in rows}
@@ -1,17 +1,33 @@
+from src.storage.aio import AsyncStorageProvider
+from src.storage.cached import CachedStorageProvider
 from src.storage.factory import create_storage_provider
 from src.storage.local import LocalFileSystemStorageProvider
-from src.storage.memory import InMemoryStorageProvider
-from src.storage.provider import DirListing, StorageError, StorageProvider, join_key
+from src.storage.memory import InMemoryS3Client, InMemoryS3Error, InMemoryStorageProvider
+from src.storage.provider import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PART_SIZE,
+    DirListing,
+    ObjectInfo,
+    StorageError,
+    StorageProvider,
+    join_key,
+)
 from src.storage.s3 import S3StorageProvider
 
 __all__ = [
     "create_storage_provider",
+    "AsyncStorageProvider",
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_PART_SIZE",
     "DirListing",
+    "ObjectInfo",
     "StorageError",
     "StorageProvider",
     "join_key",
     "LocalFileSystemStorageProvider",
     "S3StorageProvider",
+    "CachedStorageProvider",
     "InMemoryStorageProvider",
+    "InMemoryS3Client",
+    "InMemoryS3Error",
 ]
-
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, TypeVar
+
+from src.storage.provider import DEFAULT_CHUNK_SIZE, DirListing, StorageProvider
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class AsyncStorageProvider:
+    """
+    Non-blocking facade over a ``StorageProvider``.
+
+    Every blocking call (file I/O, S3 requests) runs on a thread pool owned by this
+    facade, so the event loop never waits on storage and a burst of storage calls
+    cannot starve the loop's default executor. Streams are moved one chunk at a time:
+    ``iter_chunks`` yields as each ranged read arrives and ``upload_stream`` sends
+    multipart parts as they fill, so large objects are never held in memory.
+
+    Example:
+        async with provider.as_async() as storage:
+            async for chunk in storage.iter_chunks("audio/narration.mp3"):
+                await response.write(chunk)
+    """
+
+    def __init__(self, provider: StorageProvider, max_workers: int = 8):
+        self.provider = provider
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="storage-io"
+        )
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def __aenter__(self) -> "AsyncStorageProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def exists(self, key: str) -> bool:
+        return await self._run(self.provider.exists, key)
+
+    async def size(self, key: str) -> int:
+        return await self._run(self.provider.size, key)
+
+    async def read_bytes(self, key: str) -> bytes:
+        return await self._run(self.provider.read_bytes, key)
+
+    async def read_text(self, key: str, encoding: str = "utf-8") -> str:
+        return await self._run(self.provider.read_text, key, encoding)
+
+    async def read_range(self, key: str, start: int, end: int | None = None) -> bytes:
+        return await self._run(self.provider.read_range, key, start, end)
+
+    async def write_bytes(self, key: str, data: bytes) -> None:
+        await self._run(self.provider.write_bytes, key, data)
+
+    async def write_text(self, key: str, text: str, encoding: str = "utf-8") -> None:
+        await self._run(self.provider.write_text, key, text, encoding)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self.provider.delete, key)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        await self._run(self.provider.delete_many, list(keys))
+
+    async def list(self, prefix: str = "", recursive: bool = True) -> list[str]:
+        return await self._run(self.provider.list, prefix, recursive)
+
+    async def list_dir(self, prefix: str) -> DirListing:
+        return await self._run(self.provider.list_dir, prefix)
+
+    async def upload_file(self, path: str | Path, key: str) -> int:
+        return await self._run(self.provider.upload_file, path, key)
+
+    async def upload_dir(
+        self, local_dir: str | Path, prefix: str = "", max_workers: int = 8
+    ) -> list[str]:
+        return await self._run(self.provider.upload_dir, local_dir, prefix, max_workers)
+
+    async def iter_chunks(
+        self,
+        key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Async version of ``StorageProvider.iter_chunks``; each chunk is read off-loop."""
+        chunks = await self._run(self.provider.iter_chunks, key, chunk_size, start, end)
+        try:
+            while (chunk := await self._run(next, chunks, _END)) is not _END:
+                yield chunk
+        finally:
+            await self._run(chunks.close)
+
+    async def upload_stream(self, key: str, chunks: AsyncIterable[bytes] | Iterable[bytes]) -> int:
+        """
+        Store chunks produced by an (async) iterable, uploading parts as they fill.
+
+        The object only appears once the stream is exhausted; if the producer raises,
+        the upload is aborted.
+
+        Returns:
+            Number of bytes written
+        """
+        ctx = self.provider.open(key, "wb")
+        writer = await self._run(ctx.__enter__)
+        try:
+            if hasattr(chunks, "__aiter__"):
+                async for chunk in chunks:
+                    await self._run(writer.write, chunk)
+            else:
+                for chunk in chunks:
+                    await self._run(writer.write, chunk)
+            written = writer.tell()
+        except BaseException as e:
+            await self._run(ctx.__exit__, type(e), e, e.__traceback__)
+            raise
+        await self._run(ctx.__exit__, None, None, None)
+        return written
@@ -0,0 +1,566 @@
+from __future__ import annotations
+
+import atexit
+from collections import OrderedDict
+from contextlib import contextmanager
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, BinaryIO, Generator, Iterable, Iterator
+
+from src.storage.provider import (
+    DEFAULT_CHUNK_SIZE,
+    DirListing,
+    ObjectInfo,
+    OpenMode,
+    StorageProvider,
+    _normalize_key,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+WRITE_MODES = ("through", "back")
+
+
+class CachedStorageProvider(StorageProvider):
+    """
+    Read-through local disk cache in front of a (remote) storage provider.
+
+    Objects are cached on disk keyed by object key and tagged with the backend's
+    ETag. An entry is served without any remote call for ``validate_ttl`` seconds
+    after it was fetched or last validated; after that a single metadata request
+    (``stat``) confirms the ETag before the local copy is used again. ``exists``
+    results are cached too, negative ones for ``negative_ttl`` seconds, so probing
+    for optional files does not hit the backend every time.
+
+    The cache is bounded by ``max_bytes`` with LRU eviction; objects larger than
+    ``max_object_bytes`` bypass it. Writes are either:
+
+    - ``"through"``: stored on the backend immediately, then cached.
+    - ``"back"``: stored in the cache and marked dirty; a background thread uploads
+      dirty objects every ``flush_interval`` seconds (also on ``flush``, ``close``,
+      before listings and at exit). Dirty objects are never evicted.
+
+    The index of cached objects is written at most once per ``index_save_delay``
+    seconds (and on ``flush``, ``close`` and at exit), except that newly dirty
+    write-back objects are recorded immediately so a crash cannot lose them. A
+    stale index only costs refetches: entries whose file is missing or has another
+    size are ignored on load, and ETags are revalidated before use.
+
+    ``get_stats()`` reports hit/miss/revalidation/eviction counters.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        backend: StorageProvider,
+        cache_dir: str | Path,
+        *,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        max_object_bytes: int | None = None,
+        write_mode: str = "through",
+        validate_ttl: float = 30.0,
+        negative_ttl: float = 30.0,
+        flush_interval: float = 5.0,
+        index_save_delay: float = 1.0,
+    ):
+        if write_mode not in WRITE_MODES:
+            raise ValueError(f"write_mode must be one of {WRITE_MODES}, got {write_mode!r}")
+        self.backend = backend
+        self.part_size = backend.part_size
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_file = self.cache_dir / self.INDEX_FILE
+        self.max_bytes = max_bytes
+        self.max_object_bytes = max_object_bytes if max_object_bytes else max(1, max_bytes // 8)
+        self.write_mode = write_mode
+        self.validate_ttl = validate_ttl
+        self.negative_ttl = negative_ttl
+        self.flush_interval = flush_interval
+        self.index_save_delay = index_save_delay
+
+        # key -> {"etag", "size", "dirty", "gen"}; ordered oldest -> most recently used
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._validated: dict[str, float] = {}
+        self._exists: dict[str, tuple[bool, float]] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._index_timer: threading.Timer | None = None
+        self._index_dirty = False
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "revalidations": 0,
+            "stale": 0,
+            "exists_hits": 0,
+            "negative_hits": 0,
+            "evictions": 0,
+            "write_backs": 0,
+        }
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if write_mode == "back":
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="storage-cache-flush", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self.close)
+        else:
+            atexit.register(self._flush_index)
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _object_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.objects_dir / digest[:2] / digest
+
+    def _load_index(self) -> None:
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                rows = json.load(f).get("entries", [])
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable storage cache index {self.index_file}: {e}")
+            return
+
+        for key, etag, size, dirty in rows:
+            try:
+                if self._object_path(key).stat().st_size != size:
+                    continue
+            except OSError:
+                continue
+            self._entries[key] = {"etag": etag, "size": size, "dirty": dirty, "gen": 0}
+            self._bytes += size
+
+    def _save_index(self) -> None:
+        with self._lock:
+            if self._index_timer is not None:
+                self._index_timer.cancel()
+                self._index_timer = None
+            self._index_dirty = False
+            rows = [[k, e["etag"], e["size"], e["dirty"]] for k, e in self._entries.items()]
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"entries": rows}, f)
+            os.replace(tmp, self.index_file)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _schedule_index_save(self) -> None:
+        """Save the index once ``index_save_delay`` has passed, batching changes."""
+        if self.index_save_delay <= 0:
+            self._save_index()
+            return
+        with self._lock:
+            self._index_dirty = True
+            if self._index_timer is None:
+                self._index_timer = threading.Timer(self.index_save_delay, self._flush_index)
+                self._index_timer.daemon = True
+                self._index_timer.start()
+
+    def _flush_index(self) -> None:
+        """Save the index now if it has unsaved changes."""
+        with self._lock:
+            pending = self._index_dirty
+        if pending:
+            self._save_index()
+
+    def _store(self, key: str, source: Path, etag: str | None, dirty: bool) -> None:
+        """Move a fully written temp file into the cache as ``key``."""
+        size = source.stat().st_size
+        path = self._object_path(key)
+        with self._lock:
+            os.replace(source, path)
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old["size"]
+            self._entries[key] = {
+                "etag": etag,
+                "size": size,
+                "dirty": dirty,
+                "gen": (old["gen"] + 1) if old else 0,
+            }
+            self._bytes += size
+            self._validated[key] = time.monotonic()
+            self._exists.clear()
+            self._evict_locked()
+        if dirty:
+            # Pending uploads must survive a crash
+            self._save_index()
+        else:
+            self._schedule_index_save()
+
+    def _temp_file(self, key: str) -> tuple[int, Path]:
+        path = self._object_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+        return fd, Path(tmp)
+
+    def _drop_locked(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        self._validated.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry["size"]
+            self._object_path(key).unlink(missing_ok=True)
+
+    def _evict_locked(self) -> None:
+        if self._bytes <= self.max_bytes:
+            return
+        for key in [k for k, e in self._entries.items() if not e["dirty"]]:
+            if self._bytes <= self.max_bytes:
+                break
+            self._drop_locked(key)
+            self._stats["evictions"] += 1
+
+    def _invalidate(self, key: str) -> None:
+        """Forget cached data for ``key`` and everything under it."""
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            for k in [k for k in self._entries if k == key or k.startswith(prefix)]:
+                self._drop_locked(k)
+            # Parent prefixes may have appeared or disappeared too
+            self._exists.clear()
+        self._schedule_index_save()
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str) -> Path | None:
+        """
+        Path of an up-to-date local copy of ``key``, fetching it on a miss.
+
+        Returns None if the object is too large to cache (callers read from the
+        backend directly). Backend errors, e.g. a missing object, propagate.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                fresh = entry["dirty"] or (
+                    time.monotonic() - self._validated.get(key, float("-inf")) < self.validate_ttl
+                )
+                if fresh:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return self._object_path(key)
+
+        if entry is not None:
+            with self._lock:
+                self._stats["revalidations"] += 1
+            try:
+                remote = self.backend.etag(key)
+            except Exception:
+                remote = None
+            with self._lock:
+                current = self._entries.get(key)
+                if current is not None and remote is not None and remote == current["etag"]:
+                    self._validated[key] = time.monotonic()
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return self._object_path(key)
+                self._stats["stale"] += 1
+                self._drop_locked(key)
+
+        return self._fetch(key)
+
+    def _fetch(self, key: str) -> Path | None:
+        info = self.backend.stat(key)
+        if info.size > self.max_object_bytes:
+            with self._lock:
+                self._stats["bypassed"] += 1
+            return None
+
+        with self._lock:
+            self._stats["misses"] += 1
+        fd, tmp = self._temp_file(key)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in self.backend.iter_chunks(key, end=info.size):
+                    f.write(chunk)
+            self._store(key, tmp, info.etag, dirty=False)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return self._object_path(key)
+
+    def exists(self, key: str) -> bool:
+        key = _normalize_key(key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry["dirty"] or now - self._validated.get(key, float("-inf")) < self.validate_ttl
+            ):
+                self._stats["exists_hits"] += 1
+                return True
+            prefix = key.rstrip("/") + "/"
+            if any(e["dirty"] and k.startswith(prefix) for k, e in self._entries.items()):
+                # Directory that so far only exists in pending write-back objects
+                return True
+            cached = self._exists.get(key)
+            if cached is not None and cached[1] > now:
+                self._stats["exists_hits" if cached[0] else "negative_hits"] += 1
+                return cached[0]
+
+        result = self.backend.exists(key)
+        ttl = self.validate_ttl if result else self.negative_ttl
+        with self._lock:
+            self._exists[key] = (result, now + ttl)
+        return result
+
+    def read_bytes(self, key: str) -> bytes:
+        key = _normalize_key(key)
+        path = self._lookup(key)
+        if path is not None:
+            try:
+                return path.read_bytes()
+            except FileNotFoundError:
+                pass  # evicted between lookup and read
+        return self.backend.read_bytes(key)
+
+    def size(self, key: str) -> int:
+        return self.stat(key).size
+
+    def etag(self, key: str) -> str | None:
+        return self.stat(key).etag
+
+    def stat(self, key: str) -> ObjectInfo:
+        key = _normalize_key(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry["dirty"]
+                or time.monotonic() - self._validated.get(key, float("-inf")) < self.validate_ttl
+            ):
+                return ObjectInfo(size=entry["size"], etag=entry["etag"])
+        return self.backend.stat(key)
+
+    def read_range(self, key: str, start: int, end: int | None = None) -> bytes:
+        key = _normalize_key(key)
+        path = self._lookup(key)
+        if path is None:
+            return self.backend.read_range(key, start, end)
+        with open(path, "rb") as f:
+            f.seek(start)
+            return f.read() if end is None else f.read(max(0, end - start))
+
+    def iter_chunks(
+        self,
+        key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[bytes]:
+        key = _normalize_key(key)
+        path = self._lookup(key)
+        if path is None:
+            yield from self.backend.iter_chunks(key, chunk_size, start, end)
+            return
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start
+            while remaining is None or remaining > 0:
+                chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        key = _normalize_key(key)
+        if self.write_mode == "back":
+            fd, tmp = self._temp_file(key)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            self._store(key, tmp, etag=None, dirty=True)
+            return
+
+        self._invalidate(key)
+        self.backend.write_bytes(key, data)
+        if len(data) <= self.max_object_bytes:
+            info = self.backend.stat(key)
+            fd, tmp = self._temp_file(key)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            self._store(key, tmp, info.etag, dirty=False)
+
+    @contextmanager
+    def open(self, key: str, mode: OpenMode = "rb") -> Generator[BinaryIO, None, None]:
+        if mode not in ("rb", "wb", "ab"):
+            raise ValueError(f"Unsupported mode: {mode}")
+        key = _normalize_key(key)
+
+        if mode == "rb":
+            path = self._lookup(key)
+            if path is None:
+                with self.backend.open(key, "rb") as f:
+                    yield f
+                return
+            with open(path, "rb") as f:
+                yield f
+            return
+
+        if mode == "wb" and self.write_mode == "back":
+            fd, tmp = self._temp_file(key)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    yield f
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+            self._store(key, tmp, etag=None, dirty=True)
+            return
+
+        # Write-through streams (and appends in either mode) go to the backend
+        self._flush_key(key)
+        self._invalidate(key)
+        try:
+            with self.backend.open(key, mode) as f:
+                yield f
+        finally:
+            self._invalidate(key)
+
+    def delete(self, key: str) -> None:
+        key = _normalize_key(key)
+        self._invalidate(key)
+        self.backend.delete(key)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = [_normalize_key(k) for k in keys]
+        with self._lock:
+            for key in keys:
+                self._drop_locked(key)
+            self._exists.clear()
+        self._schedule_index_save()
+        self.backend.delete_many(keys)
+
+    def list(self, prefix: str = "", recursive: bool = True) -> list[str]:
+        self.flush()
+        return self.backend.list(prefix, recursive)
+
+    def list_dir(self, prefix: str) -> DirListing:
+        self.flush()
+        return self.backend.list_dir(prefix)
+
+    def makedirs(self, prefix: str) -> None:
+        self.backend.makedirs(prefix)
+
+    # ------------------------------------------------------------------
+    # Write-back
+    # ------------------------------------------------------------------
+
+    def _flush_key(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry["dirty"]:
+                return False
+            gen = entry["gen"]
+            # Upload from a private copy so a concurrent rewrite cannot tear it
+            fd, tmp = self._temp_file(key)
+            os.close(fd)
+            shutil.copyfile(self._object_path(key), tmp)
+
+        try:
+            self.backend.upload_file(tmp, key)
+        finally:
+            tmp.unlink(missing_ok=True)
+        info = self.backend.stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["gen"] == gen:
+                entry["dirty"] = False
+                entry["etag"] = info.etag
+                self._validated[key] = time.monotonic()
+            self._stats["write_backs"] += 1
+            self._evict_locked()
+        return True
+
+    def flush(self) -> int:
+        """
+        Upload all dirty objects to the backend and save the index.
+
+        Returns:
+            Number of objects uploaded
+        """
+        with self._lock:
+            dirty = [k for k, e in self._entries.items() if e["dirty"]]
+        flushed = 0
+        for key in dirty:
+            try:
+                flushed += self._flush_key(key)
+            except Exception as e:
+                logger.warning(f"Storage cache write-back failed for {key}: {e}")
+        if flushed:
+            self._save_index()
+        else:
+            self._flush_index()
+        return flushed
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the write-back thread and upload anything still pending."""
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=self.flush_interval + 1)
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def clear(self) -> int:
+        """
+        Flush pending writes and drop every cached object.
+
+        Returns:
+            Number of entries removed
+        """
+        self.flush()
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if not e["dirty"]]
+            for key in keys:
+                self._drop_locked(key)
+            self._exists.clear()
+        self._schedule_index_save()
+        return len(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss metrics."""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            reads = stats["hits"] + stats["misses"] + stats["bypassed"]
+            stats["hit_rate"] = (stats["hits"] / reads) if reads else 0.0
+            stats["entries"] = len(self._entries)
+            stats["dirty"] = sum(1 for e in self._entries.values() if e["dirty"])
+            stats["bytes"] = self._bytes
+        stats["max_bytes"] = self.max_bytes
+        stats["write_mode"] = self.write_mode
+        stats["cache_dir"] = str(self.cache_dir)
+        return stats
@@ -4,9 +4,10 @@ import os
 from pathlib import Path
 from typing import Any
 
+from src.storage.cached import DEFAULT_CACHE_BYTES, CachedStorageProvider
 from src.storage.local import LocalFileSystemStorageProvider
 from src.storage.memory import InMemoryStorageProvider
-from src.storage.provider import StorageProvider
+from src.storage.provider import DEFAULT_PART_SIZE, StorageProvider
 from src.storage.s3 import S3StorageProvider
 
 
@@ -20,6 +21,9 @@ def create_storage_provider(
       1) `STORAGE_BACKEND` env var
       2) `config.storage.backend`
       3) default: local filesystem rooted at project_root
+
+    Remote backends (s3/minio) are wrapped in a CachedStorageProvider unless
+    `storage.cache.enabled` is false or `STORAGE_CACHE=0`.
     """
     storage_cfg = (config or {}).get("storage", {}) if isinstance(config, dict) else {}
 
@@ -47,7 +51,7 @@ def create_storage_provider(
         if not bucket:
             raise ValueError("S3 backend selected but bucket is not configured (S3_BUCKET)")
 
-        return S3StorageProvider(
+        provider = S3StorageProvider(
             bucket=bucket,
             endpoint_url=os.getenv("S3_ENDPOINT_URL") or s3_cfg.get("endpoint_url"),
             region_name=os.getenv("AWS_REGION") or s3_cfg.get("region"),
@@ -57,7 +61,39 @@ def create_storage_provider(
             ),
             session_token=os.getenv("AWS_SESSION_TOKEN") or s3_cfg.get("session_token"),
             prefix=os.getenv("S3_PREFIX") or s3_cfg.get("prefix", ""),
+            part_size=int(
+                os.getenv("S3_PART_SIZE") or s3_cfg.get("part_size") or DEFAULT_PART_SIZE
+            ),
         )
+        return _with_cache(provider, storage_cfg, project_root)
 
     raise ValueError(f"Unsupported storage backend: {backend}")
 
+
+
+def _with_cache(
+    provider: StorageProvider, storage_cfg: dict[str, Any], project_root: Path
+) -> StorageProvider:
+    cache_cfg = storage_cfg.get("cache", {}) if isinstance(storage_cfg, dict) else {}
+    enabled_env = os.getenv("STORAGE_CACHE")
+    if enabled_env is not None:
+        enabled = enabled_env.strip().lower() not in ("0", "false", "no", "off")
+    else:
+        enabled = bool(cache_cfg.get("enabled", True))
+    if not enabled:
+        return provider
+
+    cache_dir = (
+        os.getenv("STORAGE_CACHE_DIR")
+        or cache_cfg.get("dir")
+        or str(project_root / "data" / "user" / "storage_cache")
+    )
+    max_mb = os.getenv("STORAGE_CACHE_MAX_MB") or cache_cfg.get("max_mb")
+    return CachedStorageProvider(
+        provider,
+        cache_dir,
+        max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_CACHE_BYTES,
+        write_mode=os.getenv("STORAGE_CACHE_WRITE_MODE") or cache_cfg.get("write_mode", "through"),
+        validate_ttl=float(cache_cfg.get("validate_ttl", 30.0)),
+        negative_ttl=float(cache_cfg.get("negative_ttl", 30.0)),
+    )
@@ -2,9 +2,18 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from pathlib import Path
-from typing import BinaryIO, Generator
+import shutil
+from typing import BinaryIO, Generator, Iterator
 
-from src.storage.provider import DirListing, OpenMode, StorageProvider, _normalize_key, join_key
+from src.storage.provider import (
+    DEFAULT_CHUNK_SIZE,
+    DirListing,
+    ObjectInfo,
+    OpenMode,
+    StorageProvider,
+    _normalize_key,
+    join_key,
+)
 
 
 class LocalFileSystemStorageProvider(StorageProvider):
@@ -27,6 +36,45 @@ class LocalFileSystemStorageProvider(StorageProvider):
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(data)
 
+    def size(self, key: str) -> int:
+        return self._path_for(key).stat().st_size
+
+    def etag(self, key: str) -> str | None:
+        return self.stat(key).etag
+
+    def stat(self, key: str) -> ObjectInfo:
+        st = self._path_for(key).stat()
+        return ObjectInfo(size=st.st_size, etag=f"{st.st_mtime_ns:x}-{st.st_size:x}")
+
+    def read_range(self, key: str, start: int, end: int | None = None) -> bytes:
+        with self._path_for(key).open("rb") as f:
+            f.seek(start)
+            return f.read() if end is None else f.read(max(0, end - start))
+
+    def iter_chunks(
+        self,
+        key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[bytes]:
+        with self._path_for(key).open("rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start
+            while remaining is None or remaining > 0:
+                chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def upload_file(self, path: str | Path, key: str) -> int:
+        target = self._path_for(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, target)
+        return target.stat().st_size
+
     def delete(self, key: str) -> None:
         path = self._path_for(key)
         if path.is_dir():
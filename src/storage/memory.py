@@ -1,8 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import hashlib
+from io import BytesIO
+import threading
+from typing import Any, Iterable
+import uuid
 
-from src.storage.provider import DirListing, StorageProvider, _normalize_key, join_key
+from src.storage.provider import (
+    DEFAULT_PART_SIZE,
+    MIN_PART_SIZE,
+    DirListing,
+    StorageError,
+    StorageProvider,
+    _normalize_key,
+    join_key,
+)
 
 
 @dataclass
@@ -11,9 +24,15 @@ class InMemoryStorageProvider(StorageProvider):
     Simple in-memory provider for tests.
 
     Stores file objects as bytes by key. Directories are inferred from key prefixes.
+    Multipart writes are staged per upload and only become visible on completion;
+    set ``min_part_size`` to enforce S3's minimum size for non-final parts.
     """
 
     _objects: dict[str, bytes] = field(default_factory=dict)
+    part_size: int = DEFAULT_PART_SIZE
+    min_part_size: int = 0
+    _uploads: dict[str, dict[int, bytes]] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def exists(self, key: str) -> bool:
         normalized = _normalize_key(key)
@@ -21,7 +40,7 @@ class InMemoryStorageProvider(StorageProvider):
             return True
         # treat directories as prefixes
         prefix = normalized.rstrip("/") + "/"
-        return any(k.startswith(prefix) for k in self._objects.keys())
+        return any(k.startswith(prefix) for k in list(self._objects))
 
     def read_bytes(self, key: str) -> bytes:
         normalized = _normalize_key(key)
@@ -29,16 +48,63 @@ class InMemoryStorageProvider(StorageProvider):
 
     def write_bytes(self, key: str, data: bytes) -> None:
         normalized = _normalize_key(key)
-        self._objects[normalized] = data
+        self._objects[normalized] = bytes(data)
+
+    def size(self, key: str) -> int:
+        return len(self.read_bytes(key))
+
+    def etag(self, key: str) -> str | None:
+        return hashlib.md5(self.read_bytes(key)).hexdigest()
+
+    def read_range(self, key: str, start: int, end: int | None = None) -> bytes:
+        return self.read_bytes(key)[start:end]
 
     def delete(self, key: str) -> None:
         normalized = _normalize_key(key)
-        if normalized in self._objects:
-            del self._objects[normalized]
-            return
-        prefix = normalized.rstrip("/") + "/"
-        for k in [k for k in self._objects.keys() if k.startswith(prefix)]:
-            del self._objects[k]
+        with self._lock:
+            if normalized in self._objects:
+                del self._objects[normalized]
+                return
+            prefix = normalized.rstrip("/") + "/"
+            for k in [k for k in self._objects.keys() if k.startswith(prefix)]:
+                del self._objects[k]
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._objects.pop(_normalize_key(key), None)
+
+    def _multipart_begin(self, key: str) -> str:
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = {}
+        return upload_id
+
+    def _multipart_part(self, state: str, part_number: int, data: bytes) -> int:
+        with self._lock:
+            self._uploads[state][part_number] = bytes(data)
+        return part_number
+
+    def _multipart_copy_part(
+        self, state: str, part_number: int, src_key: str, start: int, end: int
+    ) -> int:
+        return self._multipart_part(state, part_number, self.read_range(src_key, start, end))
+
+    def _multipart_complete(self, key: str, state: str, parts: list[int]) -> None:
+        with self._lock:
+            staged = self._uploads.pop(state)
+        chunks = [staged[n] for n in sorted(parts)]
+        for chunk in chunks[:-1]:
+            if len(chunk) < self.min_part_size:
+                raise StorageError(
+                    f"Part of {len(chunk)} bytes is below the minimum part size "
+                    f"({self.min_part_size})"
+                )
+        self.write_bytes(key, b"".join(chunks))
+
+    def _multipart_abort(self, key: str, state: str) -> None:
+        with self._lock:
+            self._uploads.pop(state, None)
 
     def list(self, prefix: str = "", recursive: bool = True) -> list[str]:
         normalized = join_key(prefix)
@@ -46,7 +112,7 @@ class InMemoryStorageProvider(StorageProvider):
             keys = list(self._objects.keys())
         else:
             p = normalized.rstrip("/") + "/"
-            keys = [k for k in self._objects.keys() if k == normalized or k.startswith(p)]
+            keys = [k for k in list(self._objects) if k == normalized or k.startswith(p)]
         if recursive:
             return sorted(keys)
         listing = self.list_dir(normalized)
@@ -62,7 +128,7 @@ class InMemoryStorageProvider(StorageProvider):
         p = normalized.rstrip("/") + "/" if normalized else ""
         directories: set[str] = set()
         files: set[str] = set()
-        for key in self._objects.keys():
+        for key in list(self._objects):
             if p and not key.startswith(p):
                 continue
             remainder = key[len(p) :] if p else key
@@ -75,3 +141,207 @@ class InMemoryStorageProvider(StorageProvider):
                 directories.add(parts[0])
         return DirListing(directories=sorted(directories), files=sorted(files))
 
+
+class InMemoryS3Error(Exception):
+    """Mimics botocore's ClientError: the error code is in ``response["Error"]["Code"]``."""
+
+    def __init__(self, code: str, message: str = ""):
+        super().__init__(f"{code}: {message}" if message else code)
+        self.response = {"Error": {"Code": code, "Message": message}}
+
+
+class InMemoryS3Client:
+    """
+    Minio-style stand-in for a boto3 S3 client, for tests and local development.
+
+    Implements the subset of the client API used by ``S3StorageProvider`` (objects,
+    ranged GETs, listing with delimiters, batch delete and multipart uploads, including
+    part copies) with S3's rules: non-final parts must be at least ``min_part_size``
+    bytes, uploads are invisible until completed, and at most 1000 keys per batch
+    delete. Every call is recorded in ``calls`` as ``(operation, kwargs)``.
+
+    Example:
+        >>> provider = S3StorageProvider("bucket", client=InMemoryS3Client())
+    """
+
+    def __init__(self, min_part_size: int = MIN_PART_SIZE):
+        self.min_part_size = min_part_size
+        self.buckets: dict[str, dict[str, bytes]] = {}
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self._uploads: dict[str, tuple[str, str, dict[int, bytes]]] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, op: str, kwargs: dict[str, Any]) -> None:
+        with self._lock:
+            self.calls.append((op, kwargs))
+
+    def call_count(self, op: str) -> int:
+        return sum(1 for name, _ in self.calls if name == op)
+
+    def _bucket(self, name: str) -> dict[str, bytes]:
+        return self.buckets.setdefault(name, {})
+
+    def _get(self, bucket: str, key: str) -> bytes:
+        try:
+            return self._bucket(bucket)[key]
+        except KeyError:
+            raise InMemoryS3Error("NoSuchKey", key) from None
+
+    @staticmethod
+    def _etag(data: bytes) -> str:
+        return f'"{hashlib.md5(data).hexdigest()}"'
+
+    @staticmethod
+    def _parse_range(header: str, size: int) -> tuple[int, int]:
+        start_s, _, end_s = header.removeprefix("bytes=").partition("-")
+        start = int(start_s)
+        end = min(int(end_s) + 1, size) if end_s else size
+        if start >= size and size > 0:
+            raise InMemoryS3Error("InvalidRange", header)
+        return start, end
+
+    # -- objects -----------------------------------------------------------
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self._record("head_object", {"Key": Key})
+        data = self._get(Bucket, Key)
+        return {"ContentLength": len(data), "ETag": self._etag(data)}
+
+    def get_object(self, *, Bucket: str, Key: str, Range: str | None = None) -> dict[str, Any]:
+        self._record("get_object", {"Key": Key, "Range": Range})
+        data = self._get(Bucket, Key)
+        if Range:
+            start, end = self._parse_range(Range, len(data))
+            data = data[start:end]
+        return {"Body": BytesIO(data), "ContentLength": len(data)}
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes) -> dict[str, Any]:
+        self._record("put_object", {"Key": Key, "Size": len(Body)})
+        data = bytes(Body)
+        self._bucket(Bucket)[Key] = data
+        return {"ETag": self._etag(data)}
+
+    def delete_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self._record("delete_object", {"Key": Key})
+        self._bucket(Bucket).pop(Key, None)
+        return {}
+
+    def delete_objects(self, *, Bucket: str, Delete: dict[str, Any]) -> dict[str, Any]:
+        objects = Delete.get("Objects", [])
+        self._record("delete_objects", {"Count": len(objects)})
+        if len(objects) > 1000:
+            raise InMemoryS3Error("MalformedXML", "at most 1000 keys per request")
+        bucket = self._bucket(Bucket)
+        for obj in objects:
+            bucket.pop(obj["Key"], None)
+        return {"Deleted": [{"Key": obj["Key"]} for obj in objects]}
+
+    def list_objects_v2(
+        self,
+        *,
+        Bucket: str,
+        Prefix: str = "",
+        Delimiter: str | None = None,
+        MaxKeys: int = 1000,
+        ContinuationToken: str | None = None,
+    ) -> dict[str, Any]:
+        self._record("list_objects_v2", {"Prefix": Prefix, "Delimiter": Delimiter})
+        keys = sorted(k for k in list(self._bucket(Bucket)) if k.startswith(Prefix))
+        contents: list[dict[str, Any]] = []
+        common: set[str] = set()
+        for key in keys:
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                common.add(Prefix + rest.split(Delimiter, 1)[0] + Delimiter)
+            else:
+                contents.append({"Key": key, "Size": len(self._bucket(Bucket)[key])})
+
+        entries = [("c", c["Key"], c) for c in contents] + [("p", p, p) for p in common]
+        entries.sort(key=lambda e: e[1])
+        offset = int(ContinuationToken or 0)
+        page = entries[offset : offset + MaxKeys]
+        resp: dict[str, Any] = {
+            "Contents": [e[2] for e in page if e[0] == "c"],
+            "CommonPrefixes": [{"Prefix": e[2]} for e in page if e[0] == "p"],
+            "KeyCount": len(page),
+            "IsTruncated": offset + MaxKeys < len(entries),
+        }
+        if resp["IsTruncated"]:
+            resp["NextContinuationToken"] = str(offset + MaxKeys)
+        return resp
+
+    # -- multipart uploads -----------------------------------------------
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self._record("create_multipart_upload", {"Key": Key})
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = (Bucket, Key, {})
+        return {"UploadId": upload_id}
+
+    def _upload(self, upload_id: str) -> dict[int, bytes]:
+        try:
+            return self._uploads[upload_id][2]
+        except KeyError:
+            raise InMemoryS3Error("NoSuchUpload", upload_id) from None
+
+    def upload_part(
+        self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> dict[str, Any]:
+        self._record("upload_part", {"PartNumber": PartNumber, "Size": len(Body)})
+        data = bytes(Body)
+        self._upload(UploadId)[PartNumber] = data
+        return {"ETag": self._etag(data)}
+
+    def upload_part_copy(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        PartNumber: int,
+        CopySource: dict[str, str],
+        CopySourceRange: str | None = None,
+    ) -> dict[str, Any]:
+        self._record("upload_part_copy", {"PartNumber": PartNumber, "Range": CopySourceRange})
+        data = self._get(CopySource["Bucket"], CopySource["Key"])
+        if CopySourceRange:
+            start, end = self._parse_range(CopySourceRange, len(data))
+            data = data[start:end]
+        self._upload(UploadId)[PartNumber] = data
+        return {"CopyPartResult": {"ETag": self._etag(data)}}
+
+    def complete_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict[str, Any]
+    ) -> dict[str, Any]:
+        self._record("complete_multipart_upload", {"Key": Key})
+        staged = self._upload(UploadId)
+        parts = MultipartUpload["Parts"]
+        chunks = []
+        for part in parts:
+            data = staged.get(part["PartNumber"])
+            if data is None or self._etag(data) != part["ETag"]:
+                raise InMemoryS3Error("InvalidPart", str(part["PartNumber"]))
+            chunks.append(data)
+        for chunk in chunks[:-1]:
+            if len(chunk) < self.min_part_size:
+                raise InMemoryS3Error("EntityTooSmall", f"{len(chunk)} bytes")
+        with self._lock:
+            del self._uploads[UploadId]
+        data = b"".join(chunks)
+        self._bucket(Bucket)[Key] = data
+        return {"ETag": self._etag(data)}
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> dict[str, Any]:
+        self._record("abort_multipart_upload", {"Key": Key})
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+        return {}
+
+    def list_multipart_uploads(self, *, Bucket: str) -> dict[str, Any]:
+        uploads = [
+            {"Key": key, "UploadId": upload_id}
+            for upload_id, (bucket, key, _) in list(self._uploads.items())
+            if bucket == Bucket
+        ]
+        return {"Uploads": uploads}
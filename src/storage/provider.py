@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
-from io import BytesIO
-from typing import BinaryIO, Generator, Iterable, Literal
+import io
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Generator, Iterable, Iterator, Literal
+
+if TYPE_CHECKING:
+    from src.storage.aio import AsyncStorageProvider
 
 
 class StorageError(Exception):
@@ -13,6 +19,14 @@ class StorageError(Exception):
 
 OpenMode = Literal["rb", "wb", "ab"]
 
+# Streaming reads fetch this much per request
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Writes are split into parts of this size; smaller writes are a single put
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+# S3 limits: every part but the last must be >= 5 MiB, a copied range <= 5 GiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_COPY_PART_SIZE = 5 * 1024 * 1024 * 1024
+
 
 def _normalize_key(key: str) -> str:
     key = key.replace("\\", "/")
@@ -40,14 +54,156 @@ class DirListing:
     files: list[str]
 
 
+@dataclass(frozen=True)
+class ObjectInfo:
+    size: int
+    etag: str | None
+
+
+class _RangeReader(io.RawIOBase):
+    """Seekable raw reader that fetches byte ranges on demand via ``read_range``."""
+
+    def __init__(self, provider: "StorageProvider", key: str):
+        self._provider = provider
+        self._key = key
+        self._size = provider.size(key)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        end = min(self._pos + len(buffer), self._size)
+        if end <= self._pos:
+            return 0
+        data = self._provider.read_range(self._key, self._pos, end)
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+class _PartWriter:
+    """
+    Write side of ``StorageProvider.open``.
+
+    Data is buffered up to ``provider.part_size``; once a full part is available it is
+    sent through the provider's multipart hooks, so memory stays bounded by one part.
+    Small writes never start a multipart upload and end in a single ``write_bytes``.
+    Appending to a large object copies it into the upload server-side
+    (``_multipart_copy_part``) instead of downloading it.
+    """
+
+    def __init__(self, provider: "StorageProvider", key: str, append: bool = False):
+        self._provider = provider
+        self._key = key
+        self._part_size = provider.part_size
+        self._buffer = bytearray()
+        self._state: Any = None
+        self._parts: list[Any] = []
+        self._written = 0
+        self.closed = False
+
+        if append and provider.exists(key):
+            size = provider.size(key)
+            if size < self._part_size:
+                self._buffer += provider.read_bytes(key)
+            else:
+                self._begin()
+                pieces = math.ceil(size / MAX_COPY_PART_SIZE)
+                step = math.ceil(size / pieces)
+                for start in range(0, size, step):
+                    self._parts.append(
+                        provider._multipart_copy_part(
+                            self._state, len(self._parts) + 1, key, start, min(start + step, size)
+                        )
+                    )
+
+    def _begin(self) -> None:
+        self._state = self._provider._multipart_begin(self._key)
+
+    def _send_part(self, data: bytes) -> None:
+        if self._state is None:
+            self._begin()
+        self._parts.append(
+            self._provider._multipart_part(self._state, len(self._parts) + 1, data)
+        )
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._written
+
+    def flush(self) -> None:
+        pass
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed storage writer")
+        self._buffer += data
+        self._written += len(data)
+        while len(self._buffer) >= self._part_size:
+            self._send_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return len(data)
+
+    def close(self) -> None:
+        """Finish the object: a single put, or the final part plus multipart completion."""
+        if self.closed:
+            return
+        try:
+            if self._state is None:
+                self._provider.write_bytes(self._key, bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._send_part(bytes(self._buffer))
+                self._provider._multipart_complete(self._key, self._state, self._parts)
+                self._state = None
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self.closed = True
+
+    def abort(self) -> None:
+        """Discard everything written so far; the stored object is left untouched."""
+        if self._state is not None:
+            try:
+                self._provider._multipart_abort(self._key, self._state)
+            finally:
+                self._state = None
+        self._buffer = bytearray()
+        self.closed = True
+
+
 class StorageProvider(ABC):
     """
     Minimal storage abstraction for filesystem-like operations.
 
     Keys are POSIX-like paths (e.g., "data/user/solve/run_123/final_answer.md").
     Providers may treat directories as prefixes (e.g., S3).
+
+    Besides whole-object reads/writes, providers stream: ``read_range`` / ``iter_chunks``
+    / ``open(key, "rb")`` read ranges on demand and ``open(key, "wb")`` uploads in
+    ``part_size`` parts. Backends with native ranged GETs or multipart uploads override
+    ``read_range`` and the ``_multipart_*`` hooks; the defaults fall back to whole-object
+    operations. ``as_async()`` gives a non-blocking facade for use on the event loop.
     """
 
+    part_size: int = DEFAULT_PART_SIZE
+
     @abstractmethod
     def exists(self, key: str) -> bool:
         raise NotImplementedError
@@ -90,30 +246,158 @@ class StorageProvider(ABC):
         Object stores may treat this as a no-op.
         """
 
+    def size(self, key: str) -> int:
+        """Size of an object in bytes."""
+        return len(self.read_bytes(key))
+
+    def etag(self, key: str) -> str | None:
+        """
+        Opaque version tag that changes whenever the object's content changes.
+
+        Used by caches to revalidate entries cheaply. None means the provider cannot
+        tell versions apart.
+        """
+        return None
+
+    def stat(self, key: str) -> ObjectInfo:
+        """Size and etag of an object (one metadata request where the backend allows)."""
+        return ObjectInfo(size=self.size(key), etag=self.etag(key))
+
+    def read_range(self, key: str, start: int, end: int | None = None) -> bytes:
+        """Bytes ``[start, end)`` of an object (``end=None`` reads to the end)."""
+        return self.read_bytes(key)[start:end]
+
+    def iter_chunks(
+        self,
+        key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[bytes]:
+        """Yield an object (or the ``[start, end)`` range of it) in ``chunk_size`` pieces."""
+        if end is None:
+            end = self.size(key)
+        pos = start
+        while pos < end:
+            chunk = self.read_range(key, pos, min(pos + chunk_size, end))
+            if not chunk:
+                break
+            yield chunk
+            pos += len(chunk)
+
     @contextmanager
     def open(self, key: str, mode: OpenMode = "rb") -> Generator[BinaryIO, None, None]:
         """
-        A convenience for byte-oriented read/write.
-        Providers should override for streaming if needed.
+        Byte-oriented streaming read/write.
+
+        Reads fetch ranges on demand. Writes are uploaded in ``part_size`` parts and only
+        become visible when the block exits cleanly; on error the upload is aborted and
+        any existing object is left as it was.
         """
         if mode not in ("rb", "wb", "ab"):
             raise ValueError(f"Unsupported mode: {mode}")
 
         normalized_key = _normalize_key(key)
         if mode == "rb":
-            bio = BytesIO(self.read_bytes(normalized_key))
-            yield bio
+            with io.BufferedReader(
+                _RangeReader(self, normalized_key), buffer_size=DEFAULT_CHUNK_SIZE
+            ) as reader:
+                yield reader
             return
 
-        existing = b""
-        if mode == "ab" and self.exists(normalized_key):
-            existing = self.read_bytes(normalized_key)
-
-        bio = BytesIO(existing)
+        writer = _PartWriter(self, normalized_key, append=mode == "ab")
         try:
-            yield bio
-        finally:
-            self.write_bytes(normalized_key, bio.getvalue())
+            yield writer  # type: ignore[misc]
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close()
+
+    # -- multipart hooks --------------------------------------------------
+    # The defaults collect parts in memory and store them with one write_bytes.
+
+    def _multipart_begin(self, key: str) -> Any:
+        return []
+
+    def _multipart_part(self, state: Any, part_number: int, data: bytes) -> Any:
+        state.append(data)
+        return part_number
+
+    def _multipart_copy_part(
+        self, state: Any, part_number: int, src_key: str, start: int, end: int
+    ) -> Any:
+        return self._multipart_part(state, part_number, self.read_range(src_key, start, end))
+
+    def _multipart_complete(self, key: str, state: Any, parts: list[Any]) -> None:
+        self.write_bytes(key, b"".join(state))
+
+    def _multipart_abort(self, key: str, state: Any) -> None:
+        state.clear()
+
+    # -- bulk operations --------------------------------------------------
+
+    def upload_stream(
+        self, key: str, stream: BinaryIO | Iterable[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Store data from a file-like object or an iterable of byte chunks.
+
+        Returns:
+            Number of bytes written
+        """
+        if hasattr(stream, "read"):
+            chunks: Iterable[bytes] = iter(lambda: stream.read(chunk_size), b"")
+        else:
+            chunks = stream
+        with self.open(key, "wb") as out:
+            for chunk in chunks:
+                out.write(chunk)
+            return out.tell()
+
+    def upload_file(self, path: str | Path, key: str) -> int:
+        """Stream a local file into ``key``; returns the number of bytes written."""
+        with open(path, "rb") as f:
+            return self.upload_stream(key, f)
+
+    def upload_dir(self, local_dir: str | Path, prefix: str = "", max_workers: int = 8) -> list[str]:
+        """
+        Upload a local directory tree under ``prefix``, several files at a time.
+
+        Returns:
+            Uploaded keys, sorted
+
+        Raises:
+            StorageError: If any file failed to upload (the others are still uploaded)
+        """
+        root = Path(local_dir)
+        jobs = [
+            (path, join_key(prefix, path.relative_to(root).as_posix()))
+            for path in sorted(root.rglob("*"))
+            if path.is_file()
+        ]
+        failures: list[str] = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs) or 1))) as pool:
+            futures = {pool.submit(self.upload_file, path, key): key for path, key in jobs}
+            for future, key in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    failures.append(f"{key}: {e}")
+        if failures:
+            raise StorageError(f"Failed to upload {len(failures)} file(s): {'; '.join(failures)}")
+        return sorted(key for _, key in jobs)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several objects (exact keys, not prefixes); missing keys are ignored."""
+        for key in keys:
+            if self.exists(key):
+                self.delete(key)
+
+    def as_async(self, max_workers: int = 8) -> "AsyncStorageProvider":
+        """Wrap this provider in a non-blocking facade for use from async code."""
+        from src.storage.aio import AsyncStorageProvider
+
+        return AsyncStorageProvider(self, max_workers=max_workers)
 
     def is_prefix(self, prefix: str) -> bool:
         normalized = join_key(prefix)
@@ -1,17 +1,76 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from io import BytesIO
-from typing import Any, BinaryIO, Generator
+import io
+from typing import Any, BinaryIO, Generator, Iterable, Iterator
 
-from src.storage.provider import DirListing, OpenMode, StorageError, StorageProvider, _normalize_key
+from src.storage.provider import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PART_SIZE,
+    MIN_PART_SIZE,
+    DirListing,
+    ObjectInfo,
+    OpenMode,
+    StorageError,
+    StorageProvider,
+    _normalize_key,
+    _RangeReader,
+)
+
+# S3 DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
+
+class _S3BodyReader(_RangeReader):
+    """
+    Seekable reader that streams the body of one GET instead of issuing a request
+    per buffer fill; only a seek away from the streamed position starts a new
+    ranged GET.
+    """
+
+    def __init__(self, provider: "S3StorageProvider", key: str):
+        io.RawIOBase.__init__(self)
+        resp = provider._client.get_object(Bucket=provider.bucket, Key=provider._object_key(key))
+        self._provider = provider
+        self._key = key
+        self._size = int(resp["ContentLength"])
+        self._pos = 0
+        self._body: Any = resp["Body"]
+        self._body_pos = 0
+
+    def _close_body(self) -> None:
+        if self._body is not None:
+            self._body.close()
+            self._body = None
+
+    def readinto(self, buffer) -> int:
+        if self._pos >= self._size:
+            return 0
+        if self._body is None or self._body_pos != self._pos:
+            self._close_body()
+            self._body = self._provider._get_range(self._key, self._pos, None)["Body"]
+            self._body_pos = self._pos
+        data = self._body.read(min(len(buffer), self._size - self._pos))
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        self._body_pos = self._pos
+        return len(data)
+
+    def close(self) -> None:
+        self._close_body()
+        super().close()
 
 
 class S3StorageProvider(StorageProvider):
     """
     S3-compatible storage provider.
 
-    Requires boto3 at runtime when this backend is selected.
+    Requires boto3 at runtime when this backend is selected, unless a ready-made
+    ``client`` is passed (e.g. ``InMemoryS3Client`` in tests).
+
+    Reads use ranged GETs and stream the response body; writes larger than
+    ``part_size`` go through multipart uploads, and appends to large objects copy the
+    existing object into the upload server-side.
     """
 
     def __init__(
@@ -24,7 +83,18 @@ class S3StorageProvider(StorageProvider):
         secret_access_key: str | None = None,
         session_token: str | None = None,
         prefix: str = "",
+        part_size: int = DEFAULT_PART_SIZE,
+        client: Any | None = None,
     ):
+        if part_size < MIN_PART_SIZE and client is None:
+            raise StorageError(f"part_size must be at least {MIN_PART_SIZE} bytes for S3")
+        self.bucket = bucket
+        self.prefix = _normalize_key(prefix).rstrip("/")
+        self.part_size = part_size
+        if client is not None:
+            self._client = client
+            return
+
         try:
             import boto3  # type: ignore
         except Exception as e:  # pragma: no cover
@@ -32,8 +102,6 @@ class S3StorageProvider(StorageProvider):
                 "boto3 is required for S3StorageProvider. Install with: pip install boto3"
             ) from e
 
-        self.bucket = bucket
-        self.prefix = _normalize_key(prefix).rstrip("/")
         session = boto3.session.Session(
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key,
@@ -71,9 +139,102 @@ class S3StorageProvider(StorageProvider):
         return body
 
     def write_bytes(self, key: str, data: bytes) -> None:
+        if len(data) > self.part_size:
+            with self.open(key, "wb") as out:
+                view = memoryview(data)
+                for start in range(0, len(data), self.part_size):
+                    out.write(view[start : start + self.part_size])
+            return
         obj_key = self._object_key(key)
         self._client.put_object(Bucket=self.bucket, Key=obj_key, Body=data)
 
+    def stat(self, key: str) -> ObjectInfo:
+        resp = self._client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        return ObjectInfo(size=int(resp["ContentLength"]), etag=resp.get("ETag"))
+
+    def size(self, key: str) -> int:
+        return self.stat(key).size
+
+    def etag(self, key: str) -> str | None:
+        return self.stat(key).etag
+
+    def _get_range(self, key: str, start: int, end: int | None) -> dict[str, Any]:
+        byte_range = f"bytes={start}-" if end is None else f"bytes={start}-{end - 1}"
+        return self._client.get_object(
+            Bucket=self.bucket, Key=self._object_key(key), Range=byte_range
+        )
+
+    def read_range(self, key: str, start: int, end: int | None = None) -> bytes:
+        if end is not None and end <= start:
+            return b""
+        return self._get_range(key, start, end)["Body"].read()
+
+    def iter_chunks(
+        self,
+        key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[bytes]:
+        # One GET; the response body is consumed incrementally
+        if end is not None and end <= start:
+            return
+        body = self._get_range(key, start, end)["Body"]
+        try:
+            while chunk := body.read(chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        obj_keys = [self._object_key(k) for k in keys]
+        for i in range(0, len(obj_keys), DELETE_BATCH_SIZE):
+            batch = obj_keys[i : i + DELETE_BATCH_SIZE]
+            self._client.delete_objects(
+                Bucket=self.bucket, Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True}
+            )
+
+    def _multipart_begin(self, key: str) -> dict[str, str]:
+        obj_key = self._object_key(key)
+        resp = self._client.create_multipart_upload(Bucket=self.bucket, Key=obj_key)
+        return {"Key": obj_key, "UploadId": resp["UploadId"]}
+
+    def _multipart_part(self, state: dict[str, str], part_number: int, data: bytes) -> dict:
+        resp = self._client.upload_part(
+            Bucket=self.bucket,
+            Key=state["Key"],
+            UploadId=state["UploadId"],
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"ETag": resp["ETag"], "PartNumber": part_number}
+
+    def _multipart_copy_part(
+        self, state: dict[str, str], part_number: int, src_key: str, start: int, end: int
+    ) -> dict[str, Any]:
+        resp = self._client.upload_part_copy(
+            Bucket=self.bucket,
+            Key=state["Key"],
+            UploadId=state["UploadId"],
+            PartNumber=part_number,
+            CopySource={"Bucket": self.bucket, "Key": self._object_key(src_key)},
+            CopySourceRange=f"bytes={start}-{end - 1}",
+        )
+        return {"ETag": resp["CopyPartResult"]["ETag"], "PartNumber": part_number}
+
+    def _multipart_complete(self, key: str, state: dict[str, str], parts: list[Any]) -> None:
+        self._client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=state["Key"],
+            UploadId=state["UploadId"],
+            MultipartUpload={"Parts": parts},
+        )
+
+    def _multipart_abort(self, key: str, state: dict[str, str]) -> None:
+        self._client.abort_multipart_upload(
+            Bucket=self.bucket, Key=state["Key"], UploadId=state["UploadId"]
+        )
+
     def delete(self, key: str) -> None:
         obj_key = self._object_key(key)
         # delete object
@@ -156,13 +317,12 @@ class S3StorageProvider(StorageProvider):
 
     @contextmanager
     def open(self, key: str, mode: OpenMode = "rb") -> Generator[BinaryIO, None, None]:
-        normalized = _normalize_key(key)
-        if mode == "rb":
-            yield BytesIO(self.read_bytes(normalized))
+        if mode != "rb":
+            with super().open(key, mode) as writer:
+                yield writer
             return
-        bio = BytesIO()
-        try:
-            yield bio
-        finally:
-            self.write_bytes(normalized, bio.getvalue())
+        with io.BufferedReader(
+            _S3BodyReader(self, _normalize_key(key)), buffer_size=DEFAULT_CHUNK_SIZE
+        ) as reader:
+            yield reader
 
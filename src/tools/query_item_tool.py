@@ -54,10 +54,10 @@ def query_numbered_item(
     # Load configuration for max_results if not specified
     if max_results is None:
         try:
-            from src.services.config import load_config_with_main
+            from src.services.config import get_config_snapshot
 
             project_root = Path(__file__).parent.parent.parent
-            config = load_config_with_main("main.yaml", project_root)
+            config = get_config_snapshot("main.yaml", project_root)
             max_results = config.get("tools", {}).get("query_item", {}).get("max_results", 5)
         except Exception:
             max_results = 5  # Default value
@@ -0,0 +1,383 @@
+"""
+Resilience - Adaptive timeouts, jittered retries, hedging and circuit breaking.
+
+Wraps individual tool calls (RAG, web/paper search, code execution, ...):
+
+    resilience = get_resilience("research.tools")
+    result = await resilience.call("rag_search(hybrid)", rag_search, query=q, hedge=True)
+
+Per key (usually one per tool) it:
+
+- tracks recent latencies and derives the attempt timeout from the observed p99
+  (capped by the caller's timeout), so a hung call fails in seconds, not minutes
+- retries only errors classified as transient (``is_retryable``), sleeping with
+  decorrelated-jitter exponential backoff so parallel callers do not retry in
+  lockstep against a throttled provider
+- optionally hedges idempotent reads: if the call is slower than the observed
+  p95, a second identical call is started and the first result wins
+- keeps a per-key ``CircuitBreaker``; while it is open calls fail fast with
+  ``CircuitOpenError``
+
+Blocking functions run on a dedicated thread pool, so hung tool calls cannot
+starve the event loop's default executor.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import logging
+import math
+import random
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per key
+LATENCY_WINDOW = 200
+# Samples needed before timeouts/hedging adapt
+MIN_LATENCY_SAMPLES = 20
+# Adaptive timeout = p99 * multiplier, clamped to [min_timeout, caller timeout]
+TIMEOUT_P99_MULTIPLIER = 3.0
+MIN_ADAPTIVE_TIMEOUT = 5.0
+# Hedge once a call is slower than this latency percentile
+HEDGE_PERCENTILE = 95.0
+# Decorrelated jitter backoff bounds (seconds)
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 20.0
+# Thread pool for blocking tool functions
+TOOL_THREAD_POOL_SIZE = 16
+
+# HTTP statuses worth retrying (timeouts, throttling, server errors)
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Errors that will not go away by calling again
+NON_RETRYABLE_ERRORS = (
+    ValueError,
+    TypeError,
+    KeyError,
+    AttributeError,
+    NotImplementedError,
+    PermissionError,
+    FileNotFoundError,
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the key's circuit is open."""
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status of an exception (httpx, aiohttp, requests or custom)."""
+    for source in (exc, getattr(exc, "response", None)):
+        for attr in ("status_code", "status"):
+            value = getattr(source, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Classify an error as transient (worth retrying) or permanent.
+
+    Timeouts, connection errors and HTTP 408/425/429/5xx are transient; other 4xx
+    responses and programming/input errors (ValueError, KeyError, ...) are not.
+    Unknown errors are treated as transient.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    # json.JSONDecodeError and UnicodeDecodeError subclass ValueError but usually
+    # mean a truncated or garbled response
+    if isinstance(exc, UnicodeError) or type(exc).__name__ == "JSONDecodeError":
+        return True
+    return not isinstance(exc, NON_RETRYABLE_ERRORS)
+
+
+def decorrelated_jitter(
+    previous: float,
+    base: float = BACKOFF_BASE,
+    cap: float = BACKOFF_CAP,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """
+    Next backoff delay: ``min(cap, uniform(base, previous * 3))``.
+
+    Args:
+        previous: Previous delay (use ``base`` for the first retry)
+        base: Minimum delay
+        cap: Maximum delay
+        rng: Random source (for reproducible tests)
+    """
+    rng = rng or random
+    return min(cap, rng.uniform(base, max(base, previous * 3)))
+
+
+class LatencyTracker:
+    """Rolling window of call latencies per key."""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = MIN_LATENCY_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """Latency percentile ``q`` (0-100), or None until ``min_samples`` were seen."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(q / 100 * len(samples)) - 1))
+        return samples[index]
+
+    def count(self, key: str) -> int:
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+
+class ResilientCaller:
+    """
+    Adaptive timeout / retry / hedging / circuit breaker wrapper for tool calls.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: int = 30,
+        min_timeout: float = MIN_ADAPTIVE_TIMEOUT,
+        timeout_multiplier: float = TIMEOUT_P99_MULTIPLIER,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_cap: float = BACKOFF_CAP,
+        latency: Optional[LatencyTracker] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.name = name
+        self.min_timeout = min_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.latency = latency or LatencyTracker()
+        self.breaker = CircuitBreaker(
+            failure_threshold=failure_threshold, recovery_timeout=recovery_timeout
+        )
+        self._rng = rng or random.Random()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, key: str, name: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                key,
+                {
+                    "calls": 0,
+                    "failures": 0,
+                    "retries": 0,
+                    "timeouts": 0,
+                    "hedges": 0,
+                    "hedge_wins": 0,
+                    "rejected": 0,
+                },
+            )
+            stats[name] += 1
+
+    def timeout_for(self, key: str, timeout: float) -> float:
+        """Attempt timeout: observed p99 * multiplier, within [min_timeout, timeout]."""
+        p99 = self.latency.percentile(key, 99)
+        if p99 is None:
+            return timeout
+        return min(timeout, max(self.min_timeout, p99 * self.timeout_multiplier))
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """How long to wait before hedging, or None without enough samples."""
+        return self.latency.percentile(key, HEDGE_PERCENTILE)
+
+    async def call(
+        self,
+        key: str,
+        func: Callable[..., Any],
+        *args: Any,
+        max_retries: int = 2,
+        timeout: float = 60.0,
+        hedge: bool = False,
+        adaptive_timeout: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Call ``func(*args, **kwargs)`` (sync or async) with the resilience policy.
+
+        Args:
+            key: Latency/circuit identity, usually the tool name
+            func: Tool function
+            max_retries: Retries after the first attempt (transient errors only)
+            timeout: Upper bound for one attempt; the adaptive timeout can only lower it
+            hedge: Allow a hedged duplicate call (only for idempotent reads)
+            adaptive_timeout: Derive the attempt timeout from observed latency; turn off
+                for calls whose duration depends on their input (e.g. running code)
+
+        Returns:
+            The tool result
+
+        Raises:
+            CircuitOpenError: The key's circuit is open
+            Exception: The last error once retries are exhausted, or the first
+                non-retryable one
+        """
+        self._count(key, "calls")
+        delay = self.backoff_base
+        for attempt in range(max_retries + 1):
+            if not self.breaker.call(key):
+                self._count(key, "rejected")
+                raise CircuitOpenError(f"Circuit open for {key}, not calling")
+            try:
+                attempt_timeout = self.timeout_for(key, timeout) if adaptive_timeout else timeout
+                result = await self._attempt(key, func, args, kwargs, attempt_timeout, hedge)
+            except Exception as e:
+                retryable = is_retryable(e)
+                if retryable:
+                    # Only transient errors say something about the backend's health
+                    self.breaker.record_failure(key)
+                circuit_open = self.breaker.state.get(key) == "open"
+                if not retryable or attempt == max_retries or circuit_open:
+                    self._count(key, "failures")
+                    raise
+                delay = decorrelated_jitter(delay, self.backoff_base, self.backoff_cap, self._rng)
+                self._count(key, "retries")
+                logger.warning(
+                    f"{key} attempt {attempt + 1} failed ({type(e).__name__}: {e}), "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success(key)
+                with self.breaker.lock:
+                    # CircuitBreaker keeps counting across successes; this caller opens only on
+                    # consecutive ones, so a success clears the count
+                    self.breaker.failure_count[key] = 0
+                return result
+
+    async def _attempt(
+        self,
+        key: str,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+        attempt_timeout: float,
+        hedge: bool,
+    ) -> Any:
+        """One attempt, possibly hedged, bounded by ``attempt_timeout``."""
+        start = time.monotonic()
+        deadline = start + attempt_timeout
+        primary = asyncio.ensure_future(self._invoke(func, args, kwargs))
+        tasks = {primary}
+        error: Optional[BaseException] = None
+        try:
+            hedge_after = self.hedge_delay(key) if hedge else None
+            if hedge_after is not None and hedge_after < attempt_timeout:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+                if not done:
+                    self._count(key, "hedges")
+                    tasks.add(asyncio.ensure_future(self._invoke(func, args, kwargs)))
+
+            while tasks:
+                remaining = deadline - time.monotonic()
+                done, _ = await asyncio.wait(
+                    tasks, timeout=max(0.0, remaining), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Censored sample: the call took at least this long
+                    self.latency.record(key, attempt_timeout)
+                    self._count(key, "timeouts")
+                    raise asyncio.TimeoutError(f"{key} timed out after {attempt_timeout:.1f}s")
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None:
+                        self.latency.record(key, time.monotonic() - start)
+                        if task is not primary:
+                            self._count(key, "hedge_wins")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()  # Mark retrieved; a sibling already decided the attempt
+                else:
+                    task.cancel()
+
+    async def _invoke(self, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        # Also covers callable objects with an async __call__
+        if asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(
+            getattr(func, "__call__", None)
+        ):
+            return await func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=TOOL_THREAD_POOL_SIZE, thread_name_prefix=f"{self.name}-tool"
+                )
+            return self._executor
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-key counters, latency percentiles, current timeout and circuit state."""
+        with self._lock:
+            counters = {key: dict(stats) for key, stats in self._stats.items()}
+        stats: Dict[str, Any] = {}
+        for key, values in counters.items():
+            values["latency_samples"] = self.latency.count(key)
+            values["p50"] = self.latency.percentile(key, 50)
+            values["p99"] = self.latency.percentile(key, 99)
+            values["circuit"] = self.breaker.state.get(key, "closed")
+            stats[key] = values
+        return stats
+
+
+# Named instances shared across the process
+_callers: Dict[str, ResilientCaller] = {}
+_callers_lock = threading.Lock()
+
+
+def get_resilience(name: str) -> ResilientCaller:
+    """Get or create the shared ResilientCaller for ``name``."""
+    with _callers_lock:
+        caller = _callers.get(name)
+        if caller is None:
+            caller = ResilientCaller(name)
+            _callers[name] = caller
+        return caller
+
+
+def get_resilience_stats() -> Dict[str, Dict[str, Any]]:
+    """Get stats for every ResilientCaller, keyed by name."""
+    with _callers_lock:
+        callers = list(_callers.values())
+    return {caller.name: caller.get_stats() for caller in callers}
+
+
+def reset_resilience() -> None:
+    """Drop all shared instances (for tests)."""
+    with _callers_lock:
+        _callers.clear()
@@ -0,0 +1,200 @@
+"""
+Single Flight - Coalesce identical in-flight calls.
+
+Concurrent callers that issue the same request (same key) share one underlying
+call instead of each paying its full cost:
+
+    flight = get_single_flight("rag.search")
+    result = await flight.do(key, lambda: pipeline.search(...))
+
+The shared call runs as its own task, so a caller being cancelled only stops
+that caller from waiting; the call is cancelled only once every waiter is gone.
+Blocking functions (e.g. ``web_search``) use ``do_sync``, which coalesces
+across threads.
+"""
+
+import asyncio
+from concurrent.futures import Future
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def make_flight_key(*parts: Any, **named: Any) -> str:
+    """
+    Build a stable key from call arguments.
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON arguments
+    """
+    canonical = json.dumps(
+        {"args": parts, "kwargs": named},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _AsyncFlight:
+    """One shared async call and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters", "abandoned")
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+        self.abandoned = False
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        # Async flights are bound to their event loop
+        self._async_flights: Dict[Tuple[int, Hashable], _AsyncFlight] = {}
+        self._sync_flights: Dict[Hashable, Future] = {}
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0, "cancelled": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn()`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Request identity; callers with equal keys share one call
+            fn: Zero-argument coroutine factory, only invoked by the first caller
+
+        Returns:
+            The shared result (exceptions are re-raised to every waiter)
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        with self._lock:
+            self._stats["calls"] += 1
+            flight = self._async_flights.get(flight_key)
+            if flight is None or flight.abandoned or flight.task.done():
+                flight = _AsyncFlight(loop.create_task(fn()))
+                self._async_flights[flight_key] = flight
+                self._stats["executions"] += 1
+                flight.task.add_done_callback(
+                    lambda task, k=flight_key: self._finish_async(k, task)
+                )
+            else:
+                self._stats["coalesced"] += 1
+            flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                # Only this caller was cancelled; the shared call keeps running
+                self._count("cancelled")
+            raise
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                orphaned = flight.waiters == 0 and not flight.task.done()
+                if orphaned:
+                    flight.abandoned = True
+            if orphaned:
+                # Nobody is waiting any more; don't leave the call running
+                flight.task.cancel()
+
+    def _finish_async(self, flight_key: Tuple[int, Hashable], task: "asyncio.Task[Any]") -> None:
+        with self._lock:
+            current = self._async_flights.get(flight_key)
+            if current is not None and current.task is task:
+                del self._async_flights[flight_key]
+        if task.cancelled():
+            return
+        # Mark the exception retrieved even if every waiter has gone away
+        if task.exception() is not None:
+            self._count("errors")
+
+    def do_sync(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Blocking variant of ``do`` that coalesces callers across threads.
+
+        Args:
+            key: Request identity; callers with equal keys share one call
+            fn: Zero-argument callable, only invoked by the first caller
+
+        Returns:
+            The shared result (exceptions are re-raised to every waiter)
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            future = self._sync_flights.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._sync_flights[key] = future
+                self._stats["executions"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._count("errors")
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if self._sync_flights.get(key) is future:
+                    del self._sync_flights[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call/coalescing counters."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["in_flight"] = len(self._async_flights) + len(self._sync_flights)
+        stats["coalesce_rate"] = (stats["coalesced"] / stats["calls"]) if stats["calls"] else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        """Zero the counters (in-flight calls are unaffected)."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+# Named instances shared across the process
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Get or create the shared SingleFlight group for ``name``."""
+    with _flights_lock:
+        flight = _flights.get(name)
+        if flight is None:
+            flight = SingleFlight(name)
+            _flights[name] = flight
+        return flight
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Get counters for every SingleFlight group, keyed by name."""
+    with _flights_lock:
+        flights = list(_flights.values())
+    return {flight.name: flight.get_stats() for flight in flights}
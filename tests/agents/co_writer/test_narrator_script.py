@@ -0,0 +1,127 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.agents.co_writer import narrator_agent
+from src.agents.co_writer.narrator_agent import NarratorAgent
+from src.logging import get_logger
+
+PROMPTS = {
+    "style_friendly": "friendly",
+    "style_academic": "academic",
+    "style_concise": "concise",
+    "length_instruction_short": "short",
+    "generate_script_system_template": "script {style_prompt} {length_instruction}",
+    "generate_script_user_short": "{content}",
+    "narration_json_instruction": "json",
+    "extract_key_points_system": "key points",
+    "extract_key_points_user": "{content}",
+}
+
+
+class FakeLLM:
+    def __init__(self, delay=0.05, structured_response=None):
+        self.delay = delay
+        self.structured_response = structured_response
+        self.calls = []
+
+    async def __call__(self, user_prompt, system_prompt, response_format=None, stage=None, **kw):
+        self.calls.append((stage, response_format is not None))
+        await asyncio.sleep(self.delay)
+        if response_format is not None:
+            if self.structured_response is not None:
+                return self.structured_response
+            return json.dumps({"script": f"Narration of {user_prompt}", "key_points": ["a", "b"]})
+        if stage == "extract_key_points":
+            return '["x", "y", "z"]'
+        return f"  Plain narration of {user_prompt}  "
+
+
+@pytest.fixture(autouse=True)
+def _empty_script_cache():
+    narrator_agent.clear_script_cache()
+    yield
+    narrator_agent.clear_script_cache()
+
+
+def _make_narrator(llm, structured=True, language="en", model="gpt-4o", prompts=PROMPTS):
+    narrator = NarratorAgent.__new__(NarratorAgent)
+    narrator.logger = get_logger("NarratorTest")
+    narrator.language = language
+    narrator.prompts = prompts
+    narrator.get_model = lambda: model
+    narrator.call_llm = llm
+    narrator._supports_structured_output = lambda: structured
+    return narrator
+
+
+def test_structured_output_returns_script_and_key_points_in_one_call():
+    llm = FakeLLM()
+    narrator = _make_narrator(llm, structured=True)
+
+    result = asyncio.run(narrator.generate_script("Notes", style="academic"))
+
+    assert result["script"] == "Narration of Notes"
+    assert result["key_points"] == ["a", "b"]
+    assert result["script_length"] == len(result["script"])
+    assert llm.calls == [("generate_script", True)]
+
+
+def test_fallback_runs_script_and_key_points_concurrently():
+    llm = FakeLLM(delay=0.1)
+    narrator = _make_narrator(llm, structured=False)
+
+    start = time.perf_counter()
+    result = asyncio.run(narrator.generate_script("Notes"))
+    elapsed = time.perf_counter() - start
+
+    assert result["script"] == "Plain narration of Notes"
+    assert result["key_points"] == ["x", "y", "z"]
+    assert sorted(llm.calls) == [("extract_key_points", False), ("generate_script", False)]
+    assert elapsed < 0.18  # Two 0.1s calls overlapped
+
+
+def test_unusable_structured_output_falls_back_to_two_calls():
+    llm = FakeLLM(structured_response='{"key_points": ["only"]}')
+    narrator = _make_narrator(llm, structured=True)
+
+    result = asyncio.run(narrator.generate_script("Notes"))
+
+    assert result["script"] == "Plain narration of Notes"
+    assert result["key_points"] == ["x", "y", "z"]
+    assert len(llm.calls) == 3
+
+
+def test_scripts_are_cached_per_content_style_and_language():
+    llm = FakeLLM(delay=0)
+    narrator = _make_narrator(llm)
+
+    first = asyncio.run(narrator.generate_script("Notes", style="friendly"))
+    first["key_points"].append("mutated by caller")
+    again = asyncio.run(narrator.generate_script("Notes", style="friendly"))
+    assert again == {**first, "key_points": ["a", "b"]}
+    assert len(llm.calls) == 1
+
+    asyncio.run(narrator.generate_script("Notes", style="concise"))
+    asyncio.run(narrator.generate_script("Other notes", style="friendly"))
+    asyncio.run(_make_narrator(llm, language="zh").generate_script("Notes", style="friendly"))
+    assert len(llm.calls) == 4
+
+
+def test_script_cache_is_invalidated_by_model_prompt_and_config_changes():
+    llm = FakeLLM(delay=0)
+    asyncio.run(_make_narrator(llm).generate_script("Notes"))
+    asyncio.run(_make_narrator(llm).generate_script("Notes"))
+    assert len(llm.calls) == 1
+
+    asyncio.run(_make_narrator(llm, model="gpt-4o-mini").generate_script("Notes"))
+    assert len(llm.calls) == 2
+    edited = {**PROMPTS, "generate_script_system_template": "new {style_prompt}"}
+    asyncio.run(_make_narrator(llm, prompts=edited).generate_script("Notes"))
+    assert len(llm.calls) == 3
+
+    narrator_agent._clear_on_config_change([])
+    asyncio.run(_make_narrator(llm).generate_script("Notes"))
+    assert len(llm.calls) == 4
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import time
+
+from src.agents.guide.guide_manager import GuideManager
+from src.agents.guide.page_pregenerator import PagePregenerator
+from src.logging import get_logger
+
+POINTS = [
+    {"knowledge_title": f"KP {i}", "knowledge_summary": "", "user_difficulty": ""} for i in range(4)
+]
+
+
+class FakeInteractiveAgent:
+    def __init__(self, delay):
+        self.delay = delay
+        self.generated = []
+
+    async def process(self, knowledge, retry_with_bug=None):
+        await asyncio.sleep(self.delay)
+        self.generated.append(knowledge["knowledge_title"])
+        return {"success": True, "html": f"<div>{knowledge['knowledge_title']}</div>"}
+
+
+class FakeLocateAgent:
+    async def process(self, **kwargs):
+        return {"success": True, "knowledge_points": POINTS}
+
+
+class FakeSummaryAgent:
+    async def process(self, **kwargs):
+        return {"summary": "done"}
+
+
+def _make_manager(tmp_path, pregenerator, delay=0.05):
+    manager = GuideManager.__new__(GuideManager)
+    manager.output_dir = tmp_path
+    manager.logger = get_logger("GuideTest")
+    manager.locate_agent = FakeLocateAgent()
+    manager.interactive_agent = FakeInteractiveAgent(delay)
+    manager.summary_agent = FakeSummaryAgent()
+    manager._sessions = {}
+    manager.pregenerate_enabled = True
+    manager.pregenerator = pregenerator
+    return manager
+
+
+def test_next_knowledge_is_served_from_pregenerated_pages(tmp_path):
+    pregenerator = PagePregenerator(lookahead=2, max_pages=4)
+    manager = _make_manager(tmp_path, pregenerator, delay=0.05)
+
+    async def main():
+        session_id = (await manager.create_session("nb", "Notebook", []))["session_id"]
+        await asyncio.sleep(0.1)  # Learner reads the plan
+
+        start = time.perf_counter()
+        first = await manager.start_learning(session_id)
+        assert time.perf_counter() - start < 0.03
+        assert first["html"] == "<div>KP 0</div>"
+
+        await asyncio.sleep(0.1)  # Learner studies KP 0
+        pages_file = pregenerator.pages_file(tmp_path, session_id)
+        assert set(json.loads(pages_file.read_text())["pages"]) == {"1", "2"}
+
+        start = time.perf_counter()
+        second = await manager.next_knowledge(session_id)
+        assert time.perf_counter() - start < 0.03
+        assert second["html"] == "<div>KP 1</div>"
+        assert manager.get_current_html(session_id) == "<div>KP 1</div>"
+
+        # Advancing immediately waits only for the in-flight remainder
+        await manager.next_knowledge(session_id)
+        third = await manager.next_knowledge(session_id)
+        assert third["html"] == "<div>KP 3</div>"
+
+        done = await manager.next_knowledge(session_id)
+        assert done["status"] == "completed"
+        assert not pages_file.exists()
+        return session_id
+
+    asyncio.run(main())
+
+    # Every page generated exactly once, all in the background
+    assert sorted(manager.interactive_agent.generated) == ["KP 0", "KP 1", "KP 2", "KP 3"]
+    stats = pregenerator.get_stats()
+    assert stats["misses"] == 0 and stats["hit_rate"] == 1.0
+
+
+def test_window_moves_cancel_and_persisted_pages_survive_restart(tmp_path):
+    pregenerator = PagePregenerator(lookahead=2, max_pages=4)
+    agent = FakeInteractiveAgent(delay=0.05)
+
+    async def main():
+        pregenerator.schedule("s1", POINTS, 1, agent.process, tmp_path)
+        await asyncio.sleep(0.08)
+        # Jump back to the start: page 2 leaves the window and page 0 starts
+        assert pregenerator.schedule("s1", POINTS, 0, agent.process, tmp_path) == [0]
+        # Jump ahead: page 0 is cancelled mid-generation
+        assert pregenerator.schedule("s1", POINTS, 3, agent.process, tmp_path) == [3]
+        await asyncio.sleep(0.08)
+
+        # A fresh process finds the page on disk
+        restarted = PagePregenerator()
+        page = await restarted.take("s1", 3, POINTS[3], tmp_path)
+        assert page == {"html": "<div>KP 3</div>", "is_fallback": False}
+        # A changed knowledge point never gets a stale page
+        changed = {**POINTS[3], "knowledge_title": "new"}
+        assert await restarted.take("s1", 3, changed, tmp_path) is None
+
+        pregenerator.schedule("s2", POINTS, 0, agent.process, tmp_path)
+        pregenerator.cancel_session("s2", tmp_path)
+        await asyncio.sleep(0.08)
+        assert not pregenerator.pages_file(tmp_path, "s2").exists()
+
+    asyncio.run(main())
+
+    assert agent.generated == ["KP 1", "KP 2", "KP 3"]
+    assert pregenerator.get_stats()["cancelled"] == 3
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import time
+
+from src.agents.ideagen.idea_generation_workflow import IdeaGenerationWorkflow
+from src.logging import get_logger
+
+PROMPTS = {
+    "explore_ideas_system": "explore",
+    "explore_ideas_user_template": "{knowledge_point}",
+    "strict_filter_system": "filter",
+    "strict_filter_user_template": "{knowledge_point}",
+    "generate_statement_system": "statement",
+    "generate_statement_user_template": "{knowledge_point}",
+}
+
+
+class FakeLLM:
+    """Answers every stage; earlier points are slower, so they finish last"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, user_prompt, system_prompt, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(user_prompt, 0.01))
+        finally:
+            self.active -= 1
+        if system_prompt == "explore":
+            # KP 2 yields nothing and is skipped
+            count = 0 if user_prompt == "KP 2" else 3
+            return json.dumps({"research_ideas": [f"{user_prompt} idea {i}" for i in range(count)]})
+        if system_prompt == "filter":
+            return json.dumps(
+                {"kept_ideas": [f"{user_prompt} idea 0"], "rejected_ideas": ["a", "b"]}
+            )
+        return f"## {user_prompt}"
+
+
+def _make_workflow(tmp_path, llm, max_concurrent_points, events):
+    workflow = IdeaGenerationWorkflow.__new__(IdeaGenerationWorkflow)
+    workflow.logger = get_logger("IdeaGenTest")
+    workflow._prompts = PROMPTS
+    workflow.output_dir = tmp_path
+    workflow.max_concurrent_points = max_concurrent_points
+    workflow.progress_callback = lambda stage, data: events.append((stage, data))
+    workflow.call_llm = llm
+    return workflow
+
+
+def _points(n):
+    return [{"knowledge_point": f"KP {i}", "description": f"about {i}"} for i in range(n)]
+
+
+def test_points_run_concurrently_and_keep_input_order(tmp_path):
+    events = []
+    llm = FakeLLM({f"KP {i}": 0.05 * (4 - i) for i in range(4)})
+    workflow = _make_workflow(tmp_path, llm, max_concurrent_points=4, events=events)
+
+    start = time.perf_counter()
+    results = asyncio.run(workflow.process_points(_points(4)))
+    elapsed = time.perf_counter() - start
+
+    # Bounded by the slowest point (0.6s) rather than the sum over all points (1.3s)
+    assert elapsed < 1.0
+    assert llm.max_active == 4
+    statements = [r["statement"] if r else None for r in results]
+    assert statements == ["## KP 0", "## KP 1", None, "## KP 3"]
+    # Ideas are reported as points finish (fastest first), with their input index
+    ready = [data["index"] for stage, data in events if stage == "idea"]
+    assert ready == [4, 2, 1]
+    assert all(data["total"] == 4 for _, data in events)
+    # Every point, with or without an idea, advances the completed count
+    finished = [(data["index"], data["completed"]) for stage, data in events if stage == "point"]
+    assert [completed for _, completed in finished] == [1, 2, 3, 4]
+    assert sorted(index for index, _ in finished) == [1, 2, 3, 4]
+
+    # Intermediate artifacts are still written for every point
+    assert sorted(p.name for p in tmp_path.glob("03_ideas_*.json")) == [
+        f"03_ideas_KP_{i}.json" for i in range(4)
+    ]
+    assert len(list(tmp_path.glob("04_filtered_ideas_*.json"))) == 3
+
+
+def test_concurrency_is_bounded_and_process_summary_is_ordered(tmp_path):
+    llm = FakeLLM({f"KP {i}": 0.02 * (6 - i) for i in range(6)})
+    workflow = _make_workflow(tmp_path, llm, max_concurrent_points=2, events=[])
+
+    async def no_filter(points):
+        return points
+
+    workflow.loose_filter = no_filter
+    markdown = asyncio.run(workflow.process(_points(6)))
+
+    assert llm.max_active == 2
+    statements = [f"## KP {i}" for i in range(6) if i != 2]
+    assert markdown.endswith("\n\n---\n\n".join(statements))
+    with open(tmp_path / "06_workflow_summary.json", encoding="utf-8") as f:
+        summary = json.load(f)
+    assert [p["knowledge_point"] for p in summary["processed_points"]] == [
+        f"KP {i}" for i in range(6) if i != 2
+    ]
+
+
+def test_failing_point_cancels_the_others(tmp_path):
+    llm = FakeLLM({f"KP {i}": 0.5 for i in range(1, 4)})
+    workflow = _make_workflow(tmp_path, llm, max_concurrent_points=4, events=[])
+
+    async def failing_llm(user_prompt, system_prompt, **kwargs):
+        if user_prompt == "KP 0":
+            raise RuntimeError("LLM unavailable")
+        return await llm(user_prompt, system_prompt, **kwargs)
+
+    workflow.call_llm = failing_llm
+
+    async def main():
+        try:
+            await workflow.process_points(_points(4))
+        except RuntimeError as e:
+            error = e
+        # Nothing is left running in the background once the error surfaces
+        others = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return error, others
+
+    start = time.perf_counter()
+    error, others = asyncio.run(main())
+
+    assert str(error) == "LLM unavailable"
+    assert others == []
+    assert llm.active == 0
+    assert time.perf_counter() - start < 0.4
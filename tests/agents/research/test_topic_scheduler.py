@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+from src.agents.research.agents.manager_agent import ManagerAgent
+from src.agents.research.data_structures import DynamicTopicQueue, TopicStatus
+from src.agents.research.utils import TopicWorkerPool
+
+
+def _make_manager(queue):
+    manager = ManagerAgent(config={"system": {"language": "en"}}, api_key=None, base_url=None)
+    manager.set_queue(queue)
+    return manager
+
+
+def test_new_topics_are_picked_up_while_slow_topics_run():
+    queue = DynamicTopicQueue("research")
+    manager = _make_manager(queue)
+    queue.add_block("slow", "")
+    queue.add_block("spawner", "")
+    started = {}
+
+    async def run_block(block):
+        started[block.sub_topic] = time.perf_counter()
+        if block.sub_topic == "slow":
+            await asyncio.sleep(0.3)
+        else:
+            await asyncio.sleep(0.02)
+            if block.sub_topic == "spawner":
+                await manager.add_new_topic_async("follow-up", "")
+        await manager.complete_task_async(block.block_id)
+
+    async def main():
+        pool = TopicWorkerPool(queue, run_block, max_workers=2)
+        start = time.perf_counter()
+        stats = await pool.run()
+        return stats, start, time.perf_counter() - start
+
+    stats, start, elapsed = asyncio.run(main())
+
+    # The follow-up starts in the spawner's slot, not after the slow topic's "wave"
+    assert started["follow-up"] - start < 0.1
+    assert elapsed < 0.4
+    assert stats["completed"] == 3 and stats["max_active"] == 2
+    assert queue.get_statistics()["completed"] == 3
+
+
+def test_priority_order_and_failures():
+    queue = DynamicTopicQueue("research")
+    for name, priority in [("low", 0), ("high", 5), ("mid", 1), ("broken", 1)]:
+        queue.add_block(name, "", priority=priority)
+    order = []
+
+    async def run_block(block):
+        order.append(block.sub_topic)
+        if block.sub_topic == "broken":
+            raise RuntimeError("tool backend down")
+        queue.mark_completed(block.block_id)
+
+    stats = asyncio.run(TopicWorkerPool(queue, run_block, max_workers=1).run())
+
+    assert order == ["high", "mid", "broken", "low"]
+    assert stats["failed"] == 1 and stats["completed"] == 3
+    assert queue.get_block_by_id("block_4").status == TopicStatus.FAILED
+
+
+def test_cancel_pending_and_running_blocks():
+    queue = DynamicTopicQueue("research")
+    for name in ("running", "pending", "other"):
+        queue.add_block(name, "")
+
+    async def run_block(block):
+        await asyncio.sleep(0.05 if block.sub_topic == "other" else 10)
+        queue.mark_completed(block.block_id)
+
+    async def main():
+        pool = TopicWorkerPool(queue, run_block, max_workers=1)
+        runner = asyncio.create_task(pool.run())
+        await asyncio.sleep(0.02)
+        assert pool.cancel_block("block_2")  # pending
+        assert pool.cancel_block("block_1")  # in flight
+        assert not pool.cancel_block("block_1")
+        return await asyncio.wait_for(runner, 1)
+
+    stats = asyncio.run(main())
+
+    assert [b.status for b in queue.blocks] == [
+        TopicStatus.CANCELLED,
+        TopicStatus.CANCELLED,
+        TopicStatus.COMPLETED,
+    ]
+    assert stats["cancelled"] == 2 and stats["completed"] == 1
+
+
+def test_cancel_pool_stops_workers():
+    queue = DynamicTopicQueue("research")
+    for i in range(4):
+        queue.add_block(f"topic {i}", "")
+
+    async def run_block(block):
+        await asyncio.sleep(10)
+
+    async def main():
+        pool = TopicWorkerPool(queue, run_block, max_workers=2)
+        runner = asyncio.create_task(pool.run())
+        await asyncio.sleep(0.02)
+        await pool.cancel()
+        return await asyncio.wait_for(runner, 1)
+
+    stats = asyncio.run(main())
+    assert stats["cancelled"] == 4
+    assert queue.get_statistics()["cancelled"] == 4
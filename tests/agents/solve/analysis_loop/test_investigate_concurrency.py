@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from src.agents.solve.analysis_loop.investigate_agent import InvestigateAgent
+from src.agents.solve.memory import CitationMemory
+
+
+def _make_agent(monkeypatch, delays, fail=(), tool_concurrency=None):
+    agent = InvestigateAgent(
+        config={
+            "system": {"language": "en"},
+            "solve": {"agents": {"investigate_agent": {"tool_concurrency": tool_concurrency}}},
+        },
+        api_key=None,
+        base_url=None,
+    )
+    state = {"active": 0, "max_active": 0}
+
+    async def fake_rag(query, kb_name, output_dir):
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        try:
+            await asyncio.sleep(delays[query])
+            if query in fail:
+                raise RuntimeError(f"backend down for {query}")
+            return {"answer": f"answer to {query}"}
+        finally:
+            state["active"] -= 1
+
+    monkeypatch.setattr(agent, "_call_rag_naive", fake_rag)
+    monkeypatch.setattr(agent, "_call_rag_hybrid", fake_rag)
+    return agent, state
+
+
+def test_round_runs_concurrently_with_ordered_cite_ids(tmp_path, monkeypatch):
+    delays = {"slow": 0.3, "fast": 0.05, "broken": 0.1, "medium": 0.15}
+    agent, _ = _make_agent(monkeypatch, delays, fail={"broken"})
+    citations = CitationMemory(output_dir=str(tmp_path))
+    plans = [
+        {"tool": "rag_hybrid", "query": "slow"},
+        {"tool": "rag_naive", "query": "fast"},
+        {"tool": "none"},
+        {"tool": "rag_naive", "query": "broken"},
+        {"tool": "rag_hybrid", "query": "medium"},
+    ]
+
+    start = time.perf_counter()
+    results = asyncio.run(agent._execute_actions(plans, "kb", str(tmp_path), citations))
+    elapsed = time.perf_counter() - start
+
+    # Max of the latencies, not the sum (0.6s)
+    assert elapsed < 0.5
+    # cite_ids follow plan order even though "fast" finished first; the failure is isolated
+    assert [(plan["query"], item.cite_id if item else None) for plan, item in results] == [
+        ("slow", "[rag-1]"),
+        ("fast", "[rag-2]"),
+        ("broken", None),
+        ("medium", "[rag-3]"),
+    ]
+    assert [c.query for c in citations.citations] == ["slow", "fast", "medium"]
+    assert (tmp_path / "citation_memory.json").exists()
+
+
+def test_per_tool_concurrency_limit(tmp_path, monkeypatch):
+    delays = {f"q{i}": 0.05 for i in range(6)}
+    agent, state = _make_agent(monkeypatch, delays, tool_concurrency={"rag_hybrid": 2})
+    plans = [{"tool": "rag_hybrid", "query": f"q{i}"} for i in range(6)]
+
+    results = asyncio.run(agent._execute_actions(plans, "kb", None, CitationMemory()))
+
+    assert all(item is not None for _, item in results)
+    assert state["max_active"] == 2
@@ -0,0 +1,153 @@
+import asyncio
+import time
+
+import pytest
+
+from src.agents.solve.main_solver import MainSolver
+from src.agents.solve.memory import CitationMemory, InvestigateMemory, SolveChainStep, SolveMemory
+from src.agents.solve.solve_loop.manager_agent import ManagerAgent
+from src.agents.solve.utils import PerformanceMonitor, TokenTracker, get_logger, run_step_graph
+
+
+class FakeSolveAgent:
+    def __init__(self, delay, timeline):
+        self.delay = delay
+        self.timeline = timeline
+
+    async def process(self, question, current_step, **kwargs):
+        self.timeline.append(("solve", current_step.step_id))
+        await asyncio.sleep(self.delay)
+        return {"finish_requested": True}
+
+
+class FakeResponseAgent:
+    def __init__(self, delay, timeline):
+        self.delay = delay
+        self.timeline = timeline
+        self.contexts = {}
+
+    async def process(self, question, step, solve_memory, accumulated_response="", **kwargs):
+        self.contexts[step.step_id] = accumulated_response
+        await asyncio.sleep(self.delay)
+        self.timeline.append(("response", step.step_id))
+        solve_memory.submit_step_response(step.step_id, f"R-{step.step_id}")
+        return {"step_response": f"R-{step.step_id}", "raw_response": f"R-{step.step_id}"}
+
+
+def _make_solver(max_parallel_steps, delay, timeline):
+    solver = MainSolver.__new__(MainSolver)
+    solver.config = {"solve": {"max_parallel_steps": max_parallel_steps}}
+    solver.kb_name = "kb"
+    solver.logger = get_logger("SolveTest")
+    solver.monitor = PerformanceMonitor(enabled=False)
+    solver.token_tracker = TokenTracker(prefer_tiktoken=False)
+    solver.solve_agent = FakeSolveAgent(delay, timeline)
+    solver.response_agent = FakeResponseAgent(delay, timeline)
+    solver.progress = []
+    solver._send_progress_update = lambda stage, data: solver.progress.append(
+        (stage, data["step_id"])
+    )
+    return solver
+
+
+def _run_chain(tmp_path, solver, depends_on):
+    solve_memory = SolveMemory(output_dir=str(tmp_path))
+    solve_memory.create_chains(
+        [
+            SolveChainStep(step_id=sid, step_target=f"target {sid}", depends_on=deps)
+            for sid, deps in depends_on.items()
+        ]
+    )
+    start = time.perf_counter()
+    asyncio.run(
+        solver._execute_solve_chain(
+            question="q",
+            solve_memory=solve_memory,
+            investigate_memory=InvestigateMemory(output_dir=str(tmp_path)),
+            citation_memory=CitationMemory(output_dir=str(tmp_path)),
+            output_dir=str(tmp_path),
+        )
+    )
+    return solve_memory, time.perf_counter() - start
+
+
+def test_independent_steps_run_concurrently(tmp_path):
+    timeline = []
+    solver = _make_solver(max_parallel_steps=3, delay=0.1, timeline=timeline)
+    # S1, S2, S3 independent; S4 integrates S1 and S3
+    solve_memory, elapsed = _run_chain(
+        tmp_path, solver, {"S1": [], "S2": [], "S3": [], "S4": ["S1", "S3"]}
+    )
+
+    # Two levels of (solve + response) instead of four sequential steps
+    assert elapsed < 0.6
+    assert all(step.status == "done" for step in solve_memory.solve_chains)
+    # Every step announces its response when it starts responding, not in chain order
+    assert sorted(sid for stage, sid in solver.progress if stage == "response") == [
+        "S1",
+        "S2",
+        "S3",
+        "S4",
+    ]
+    assert [step.step_response for step in solve_memory.solve_chains] == [
+        "R-S1",
+        "R-S2",
+        "R-S3",
+        "R-S4",
+    ]
+    # S4 only starts once its dependencies responded, and sees only their responses
+    assert timeline.index(("solve", "S4")) > timeline.index(("response", "S3"))
+    assert solver.response_agent.contexts["S4"] == "R-S1\n\nR-S3\n\n"
+    assert solver.response_agent.contexts["S2"] == ""
+
+
+def test_plan_without_dependencies_stays_sequential(tmp_path):
+    timeline = []
+    solver = _make_solver(max_parallel_steps=3, delay=0.01, timeline=timeline)
+    _, _ = _run_chain(tmp_path, solver, {"S1": None, "S2": None, "S3": None})
+
+    assert timeline == [
+        ("solve", "S1"),
+        ("response", "S1"),
+        ("solve", "S2"),
+        ("response", "S2"),
+        ("solve", "S3"),
+        ("response", "S3"),
+    ]
+    assert solver.response_agent.contexts["S3"] == "R-S1\n\nR-S2\n\n"
+
+
+def test_step_graph_width_and_failure():
+    active = {"now": 0, "max": 0}
+
+    async def run(sid):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        if sid == "bad":
+            raise RuntimeError("step failed")
+
+    ids = [f"S{i}" for i in range(6)]
+    asyncio.run(run_step_graph(ids, {}, run, max_parallel=2))
+    assert active["max"] == 2
+
+    with pytest.raises(RuntimeError, match="step failed"):
+        asyncio.run(run_step_graph(["bad", "S1"], {"S1": ["bad"]}, run, max_parallel=2))
+
+    with pytest.raises(ValueError, match="Circular"):
+        asyncio.run(run_step_graph(["A", "B"], {"A": ["B"], "B": ["A"]}, run))
+
+
+def test_manager_parses_depends_on():
+    agent = ManagerAgent.__new__(ManagerAgent)
+    agent.logger = get_logger("SolveTest")
+    response = """{"steps": [
+        {"step_id": "S1", "role": "Analysis", "target": "a", "cite_ids": [], "depends_on": []},
+        {"step_id": "S2", "role": "Calculation", "target": "b", "cite_ids": []},
+        {"step_id": "S3", "role": "Integration", "target": "c", "cite_ids": [],
+         "depends_on": ["s1", "2", "S9", "S3"]}
+    ]}"""
+    steps = agent._parse_response(response, InvestigateMemory())
+
+    assert [step.depends_on for step in steps] == [[], None, ["S1", "S2"]]
@@ -0,0 +1,124 @@
+import json
+import time
+
+import pytest
+
+from src.api.utils import analytics_store
+from src.api.utils.analytics_store import AnalyticsStore
+from src.api.utils.history import ActivityType, HistoryManager
+
+
+def _entry(entry_type: str, title: str, age_hours: float, tokens: int = 0, cost: float = 0.0):
+    return {
+        "id": str(age_hours),
+        "timestamp": time.time() - age_hours * 3600,
+        "type": entry_type,
+        "title": title,
+        "summary": "",
+        "content": {"token_stats": {"tokens": tokens, "cost": cost}},
+    }
+
+
+def test_add_entry_updates_rollups(tmp_path):
+    manager = HistoryManager(base_dir=str(tmp_path))
+    manager.add_entry(
+        ActivityType.SOLVE, "Krebs cycle", {"token_stats": {"tokens": 100, "cost": 0.5}}
+    )
+    manager.add_entry(ActivityType.QUESTION, "Krebs cycle", {})
+
+    summary = manager.analytics.summarize(time.time() - 3600)
+    assert summary["total"] == 2
+    assert summary["types"] == {"solve": 1, "question": 1}
+    assert summary["tokens"] == 100
+    assert summary["cost"] == pytest.approx(0.5)
+    assert summary["topics"]["Krebs cycle"]["count"] == 2
+    assert len(summary["dates"]) == 1
+
+    # Persisted (writes are batched until flushed), and readable by a fresh store
+    manager.analytics.flush()
+    reloaded = AnalyticsStore(tmp_path).summarize(0)
+    assert reloaded["total"] == 2
+    assert json.loads((tmp_path / "analytics_rollups.json").read_text())["daily"]
+
+
+def test_first_entry_backfills_existing_history(tmp_path):
+    HistoryManager(base_dir=str(tmp_path))._save_history(
+        [_entry("solve", "Old", age_hours) for age_hours in (1, 2, 3)]
+    )
+    manager = HistoryManager(base_dir=str(tmp_path))
+    assert not manager.analytics.is_backfilled()
+
+    manager.add_entry(ActivityType.SOLVE, "New", {})
+
+    assert manager.analytics.is_backfilled()
+    assert AnalyticsStore(tmp_path).summarize(0)["total"] == 4
+    manager.add_entry(ActivityType.SOLVE, "Newer", {})
+    assert manager.analytics.summarize(0)["total"] == 5
+
+
+def test_backfill_and_time_ranges(tmp_path):
+    entries = [
+        _entry("solve", "A", 1, tokens=10),
+        _entry("solve", "A", 30, tokens=20),
+        _entry("research", "B", 24 * 10, tokens=40),
+        _entry("question", "  ", 24 * 60, tokens=80),
+    ]
+    store = AnalyticsStore(tmp_path)
+    assert store.backfill(entries) == 4
+
+    week = store.summarize(time.time() - 7 * 86400)
+    assert week["total"] == 2
+    assert week["tokens"] == 30
+    assert set(week["topics"]) == {"A"}
+
+    everything = store.summarize(0)
+    assert everything["total"] == 4
+    assert everything["types"] == {"solve": 2, "research": 1, "question": 1}
+    # Blank titles are not topics
+    assert set(everything["topics"]) == {"A", "B"}
+
+    # Merge only adds entries newer than the last recorded one
+    newer = _entry("chat", "C", 0)
+    assert store.backfill(entries + [newer], merge=True) == 1
+    assert store.summarize(0)["total"] == 5
+
+    # A rebuild starts over
+    assert store.backfill(entries) == 4
+    assert store.summarize(0)["total"] == 4
+
+
+def test_hourly_buckets_are_sorted_and_daily_used_for_all_time(tmp_path):
+    store = AnalyticsStore(tmp_path)
+    store.record_many([_entry("solve", "A", h) for h in (5, 1, 3)])
+
+    hourly = store.get_buckets(time.time() - 86400)
+    assert [b["start"] for _, b in hourly] == sorted(b["start"] for _, b in hourly)
+    assert all(len(key) == len("YYYY-MM-DD HH:00") for key, _ in hourly)
+    assert sum(b["total"] for _, b in hourly) == 3
+
+    daily = store.get_buckets(0)
+    assert all(len(key) == len("YYYY-MM-DD") for key, _ in daily)
+    assert sum(b["total"] for _, b in daily) == 3
+
+
+def test_records_are_batched_into_one_write(tmp_path):
+    store = AnalyticsStore(tmp_path, save_delay=60)
+    for h in range(5):
+        store.record(_entry("solve", "A", h))
+
+    assert not store.rollup_file.exists()
+    assert store.summarize(0)["total"] == 5
+    store.flush()
+    assert AnalyticsStore(tmp_path).summarize(0)["total"] == 5
+
+
+def test_topics_per_bucket_are_capped(tmp_path, monkeypatch):
+    monkeypatch.setattr(analytics_store, "MAX_TOPICS_PER_BUCKET", 3)
+    store = AnalyticsStore(tmp_path, save_delay=0)
+    store.record_many([_entry("solve", "busy", 0.01)] * 2)
+    store.record_many([_entry("solve", f"t{i}", 0.01) for i in range(5)])
+
+    topics = store.summarize(0)["topics"]
+    assert len(topics) == 3
+    assert topics["busy"]["count"] == 2
+    assert store.summarize(0)["total"] == 7
@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import pytest
+
+from src.api.utils.ws_batcher import WebSocketStreamBatcher, dumps_message
+
+
+class _FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.frames: list[dict] = []
+
+    async def send_text(self, text: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(text))
+
+
+class _BrokenWebSocket:
+    async def send_text(self, text: str) -> None:
+        raise ConnectionError("client went away")
+
+
+def test_stream_chunks_are_merged_into_one_frame() -> None:
+    ws = _FakeWebSocket()
+
+    async def main():
+        async with WebSocketStreamBatcher(ws, flush_interval=0.05) as batcher:
+            for token in ["Hel", "lo", ", ", "world"]:
+                await batcher.send({"type": "stream", "content": token})
+        return batcher.get_stats()
+
+    stats = asyncio.run(main())
+
+    assert ws.frames == [{"type": "stream", "content": "Hello, world"}]
+    assert stats["messages"] == 4
+    assert stats["frames"] == 1
+
+
+def test_size_threshold_flushes_without_waiting_for_window() -> None:
+    ws = _FakeWebSocket()
+
+    async def main():
+        batcher = WebSocketStreamBatcher(ws, flush_chars=8, flush_interval=10)
+        await batcher.send({"type": "stream", "content": "0123456789"})
+        await asyncio.wait_for(batcher.flush(), timeout=1)
+        await batcher.aclose()
+
+    asyncio.run(main())
+
+    assert ws.frames == [{"type": "stream", "content": "0123456789"}]
+
+
+def test_order_is_preserved_and_other_types_are_not_merged() -> None:
+    ws = _FakeWebSocket()
+
+    async def main():
+        async with WebSocketStreamBatcher(ws) as batcher:
+            await batcher.send({"type": "stream", "content": "a"})
+            await batcher.send({"type": "log", "content": "line 1"})
+            await batcher.send({"type": "log", "content": "line 2"})
+            await batcher.send({"type": "stream", "content": "b"})
+            await batcher.send_json({"type": "result", "content": "ab"})
+            assert len(ws.frames) == 5
+
+    asyncio.run(main())
+
+    assert [f["type"] for f in ws.frames] == ["stream", "log", "log", "stream", "result"]
+
+
+def test_slow_client_gets_merged_backlog_and_latest_status_only() -> None:
+    ws = _FakeWebSocket(delay=0.05)
+
+    async def main():
+        async with WebSocketStreamBatcher(ws, flush_interval=0) as batcher:
+            await batcher.send({"type": "stream", "content": "first"})
+            await asyncio.sleep(0.01)  # first frame is now being written
+            for i in range(50):
+                await batcher.send({"type": "stream", "content": str(i % 10)})
+                await batcher.send({"type": "token_stats", "stats": {"calls": i}})
+
+    asyncio.run(main())
+
+    assert ws.frames[0] == {"type": "stream", "content": "first"}
+    streamed = "".join(f["content"] for f in ws.frames if f["type"] == "stream")
+    assert streamed == "first" + "".join(str(i % 10) for i in range(50))
+    stats_frames = [f for f in ws.frames if f["type"] == "token_stats"]
+    assert stats_frames == [{"type": "token_stats", "stats": {"calls": 49}}]
+    assert len(ws.frames) < 10
+
+
+def test_research_progress_events_are_not_collapsed() -> None:
+    ws = _FakeWebSocket()
+    events = [
+        {"type": "progress", "stage": "researching", "status": status, "block_id": "block_1"}
+        for status in ("block_started", "block_completed")
+    ]
+
+    async def main():
+        async with WebSocketStreamBatcher(ws, flush_interval=0.05) as batcher:
+            await batcher.send({"type": "progress", "stage": "solve", "progress": {"step": 1}})
+            await batcher.send({"type": "progress", "stage": "solve", "progress": {"step": 2}})
+            for event in events:
+                await batcher.send(event)
+
+    asyncio.run(main())
+
+    assert ws.frames == [
+        {"type": "progress", "stage": "solve", "progress": {"step": 2}},
+        *events,
+    ]
+
+
+def test_send_error_is_raised_to_caller() -> None:
+    async def main():
+        batcher = WebSocketStreamBatcher(_BrokenWebSocket())
+        await batcher.send({"type": "stream", "content": "x"})
+        with pytest.raises(ConnectionError):
+            await batcher.flush()
+        with pytest.raises(ConnectionError):
+            await batcher.send({"type": "stream", "content": "y"})
+        await batcher.aclose()
+
+    asyncio.run(main())
+
+
+def test_dumps_matches_stdlib_schema() -> None:
+    message = {"type": "stream", "content": 'héllo "x"'}
+    assert json.loads(dumps_message(message)) == message
@@ -0,0 +1,75 @@
+import os
+
+from src.knowledge.document_tracker import DocumentStatus, DocumentTracker
+
+
+def _make_kb(tmp_path, count=5):
+    kb_dir = tmp_path / "kb"
+    raw = kb_dir / "raw"
+    raw.mkdir(parents=True)
+    for i in range(count):
+        (raw / f"doc{i}.txt").write_bytes(f"document {i}".encode() * 1000)
+    return kb_dir, raw
+
+
+def _track_all(tracker, raw):
+    for path in sorted(raw.iterdir()):
+        tracker.track_document(path)
+
+
+def test_unchanged_files_are_not_rehashed(tmp_path, monkeypatch):
+    kb_dir, raw = _make_kb(tmp_path)
+    tracker = DocumentTracker(kb_dir)
+    _track_all(tracker, raw)
+    assert tracker.get_document_info("doc0.txt").fingerprint is not None
+
+    calls = []
+    original = DocumentTracker.calculate_file_hash
+    monkeypatch.setattr(
+        DocumentTracker,
+        "calculate_file_hash",
+        staticmethod(lambda path, algorithm="sha256": calls.append(path) or original(path)),
+    )
+
+    # Fresh tracker reads fingerprints back from metadata.json
+    changes = DocumentTracker(kb_dir).detect_changes()
+    assert set(changes.values()) == {DocumentStatus.UNCHANGED}
+    assert calls == []
+
+
+def test_detects_new_modified_deleted_and_touched(tmp_path):
+    kb_dir, raw = _make_kb(tmp_path)
+    tracker = DocumentTracker(kb_dir)
+    _track_all(tracker, raw)
+
+    (raw / "doc0.txt").write_bytes(b"rewritten")
+    (raw / "doc1.txt").unlink()
+    (raw / "new.txt").write_bytes(b"fresh")
+    # Touch without changing content
+    st = (raw / "doc2.txt").stat()
+    os.utime(raw / "doc2.txt", ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+
+    changes = tracker.detect_changes()
+    assert changes["doc0.txt"] == DocumentStatus.MODIFIED
+    assert changes["doc1.txt"] == DocumentStatus.DELETED
+    assert changes["new.txt"] == DocumentStatus.NEW
+    assert changes["doc2.txt"] == DocumentStatus.UNCHANGED
+    assert changes["doc3.txt"] == DocumentStatus.UNCHANGED
+
+    # The touched file's fingerprint was refreshed and persisted
+    reloaded = DocumentTracker(kb_dir).get_document_info("doc2.txt")
+    assert reloaded.fingerprint == DocumentTracker.get_fingerprint((raw / "doc2.txt").stat())
+
+
+def test_legacy_entries_without_fingerprint_fall_back_to_hash(tmp_path):
+    kb_dir, raw = _make_kb(tmp_path, count=3)
+    tracker = DocumentTracker(kb_dir)
+    _track_all(tracker, raw)
+    for info in tracker._metadata[DocumentTracker.TRACKING_KEY].values():
+        del info["fingerprint"]
+
+    changes = tracker.detect_changes()
+    assert set(changes.values()) == {DocumentStatus.UNCHANGED}
+    assert all(
+        info.fingerprint is not None for info in tracker.get_all_tracked_documents().values()
+    )
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from src.knowledge import kb_stats
+from src.knowledge.kb_stats import KBStatsCache, count_json_entries
+from src.knowledge.manager import KnowledgeBaseManager
+
+
+def _make_kb(base_dir, name="kb", entities=3):
+    kb_dir = base_dir / name
+    for sub in ("raw", "images", "content_list", "rag_storage"):
+        (kb_dir / sub).mkdir(parents=True)
+    (kb_dir / "raw" / "a.pdf").write_bytes(b"a")
+    (kb_dir / "raw" / "b.md").write_bytes(b"b")
+    (kb_dir / "content_list" / "a.json").write_text("[]")
+    (kb_dir / "metadata.json").write_text(json.dumps({"rag_provider": "lightrag"}))
+    storage = kb_dir / "rag_storage"
+    (storage / "kv_store_full_entities.json").write_text(
+        json.dumps({f"ent-{i}": {"name": f'n"{i}', "desc": "x, {y} [z]"} for i in range(entities)})
+    )
+    (storage / "kv_store_text_chunks.json").write_text(json.dumps({}))
+    return kb_dir
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        [1],
+        [1, "two", None, {"a": [1, 2]}],
+        {"k": "v"},
+        {f"key {i}": {"text": 'he said "a, b" \\ [' * (i % 7), "n": [i, {}]} for i in range(500)},
+        "top-level string",
+        42,
+    ],
+)
+def test_count_json_entries_streams_across_chunks(tmp_path, value):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(value, indent=1))
+    expected = len(value) if isinstance(value, (list, dict)) else 0
+    # Tiny chunks split strings and escapes at every possible position
+    assert count_json_entries(path, chunk_size=7) == expected
+    assert count_json_entries(path) == expected
+
+
+def test_count_json_entries_rejects_truncated(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"a": 1, "b": [1, 2')
+    with pytest.raises(ValueError):
+        count_json_entries(path)
+
+
+def test_statistics_are_cached_until_sources_change(tmp_path, monkeypatch):
+    kb_dir = _make_kb(tmp_path)
+    cache = KBStatsCache()
+    stats = cache.get_statistics(kb_dir)
+    assert stats == {
+        "raw_documents": 2,
+        "images": 0,
+        "content_lists": 1,
+        "rag": {"entities": 3, "chunks": 0},
+    }
+
+    counted = []
+    original = kb_stats._count
+    monkeypatch.setattr(
+        kb_stats, "_count", lambda kb, name: counted.append(name) or original(kb, name)
+    )
+
+    # Unchanged: served from memory, and from .kb_stats.json after a "restart"
+    assert cache.get_statistics(kb_dir) == stats
+    assert KBStatsCache().get_statistics(kb_dir) == stats
+    assert counted == []
+
+    (kb_dir / "images" / "fig1.png").write_bytes(b"png")
+    (kb_dir / "rag_storage" / "kv_store_full_relations.json").write_text('{"r1": {}}')
+    stats = cache.get_statistics(kb_dir)
+    assert stats["images"] == 1
+    assert stats["rag"]["relations"] == 1
+    assert sorted(counted) == ["images", "relations"]
+    assert cache.get_stats()["hits"] > 0
+
+
+def test_record_adjusts_counter_without_rescan(tmp_path, monkeypatch):
+    kb_dir = _make_kb(tmp_path)
+    cache = KBStatsCache()
+    cache.get_statistics(kb_dir)
+
+    before = cache.snapshot(kb_dir)
+    (kb_dir / "raw" / "c.txt").write_bytes(b"c")
+    cache.record(kb_dir, before, raw_documents=1)
+
+    monkeypatch.setattr(kb_stats, "_count", lambda kb, name: pytest.fail(f"recounted {name}"))
+    assert cache.get_statistics(kb_dir)["raw_documents"] == 3
+
+
+def test_record_does_not_bake_in_outside_changes(tmp_path):
+    kb_dir = _make_kb(tmp_path)
+    cache = KBStatsCache()
+    assert cache.get_statistics(kb_dir)["raw_documents"] == 2
+
+    for name in ("x.md", "y.md", "z.md"):
+        (kb_dir / "raw" / name).write_bytes(b"copied by hand")
+    before = cache.snapshot(kb_dir)
+    (kb_dir / "raw" / "upload.pdf").write_bytes(b"uploaded")
+    cache.record(kb_dir, before, raw_documents=1)
+
+    assert cache.get_statistics(kb_dir)["raw_documents"] == 6
+    assert KBStatsCache().get_statistics(kb_dir)["raw_documents"] == 6
+
+
+def test_manager_info_uses_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(kb_stats, "_kb_stats_cache", None)
+    kb_dir = _make_kb(tmp_path, "course", entities=5)
+    manager = KnowledgeBaseManager(base_dir=str(tmp_path))
+    manager.register_knowledge_base("course")
+
+    statistics = manager.get_info("course")["statistics"]
+    assert statistics["raw_documents"] == 2
+    assert statistics["rag_initialized"] is True
+    assert statistics["rag_provider"] == "lightrag"
+    assert statistics["rag"] == {"entities": 5, "chunks": 0}
+
+    manager.clean_rag_storage("course", backup=False)
+    statistics = manager.get_info("course")["statistics"]
+    assert statistics["rag_initialized"] is True
+    assert "rag" not in statistics
+    assert (kb_dir / kb_stats.STATS_FILE).exists()
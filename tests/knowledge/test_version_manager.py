@@ -0,0 +1,91 @@
+import json
+import os
+
+from src.knowledge.version_manager import VersionManager
+
+
+def _make_kb(tmp_path):
+    kb_dir = tmp_path / "kb"
+    rag = kb_dir / "rag_storage"
+    (rag / "vdb").mkdir(parents=True)
+    (rag / "graph.graphml").write_text("graph-v1")
+    (rag / "vdb" / "chunks.json").write_text("chunks-v1" * 1000)
+    (kb_dir / "metadata.json").write_text(json.dumps({"name": "kb", "document_tracking": {}}))
+    return kb_dir, rag
+
+
+def test_snapshots_share_unchanged_objects(tmp_path):
+    kb_dir, rag = _make_kb(tmp_path)
+    manager = VersionManager(kb_dir)
+
+    first = manager.create_snapshot("first")
+    assert first.new_object_bytes == len("graph-v1") + len("chunks-v1" * 1000)
+    assert first.storage_size_bytes >= first.new_object_bytes
+
+    (rag / "graph.graphml").write_text("graph-v2")
+    second = manager.create_snapshot("second")
+    # Only the changed file was added to the store
+    assert second.new_object_bytes == len("graph-v2")
+    assert manager.get_object_store_size() == first.new_object_bytes + second.new_object_bytes
+
+    v1_chunks = manager.versions_dir / first.version_id / "rag_storage" / "vdb" / "chunks.json"
+    v2_chunks = manager.versions_dir / second.version_id / "rag_storage" / "vdb" / "chunks.json"
+    assert os.stat(v1_chunks).st_ino == os.stat(v2_chunks).st_ino
+    assert v1_chunks.read_text() == "chunks-v1" * 1000
+
+
+def test_rollback_restores_only_changed_files(tmp_path):
+    kb_dir, rag = _make_kb(tmp_path)
+    manager = VersionManager(kb_dir)
+    v1 = manager.create_snapshot("v1")
+
+    chunks_ino = os.stat(rag / "vdb" / "chunks.json").st_ino
+    (rag / "graph.graphml").write_text("graph-v2")
+    (rag / "extra").mkdir()
+    (rag / "extra" / "new.json").write_text("{}")
+
+    assert manager.rollback_to_version(v1.version_id, backup_current=False)
+
+    assert (rag / "graph.graphml").read_text() == "graph-v1"
+    assert not (rag / "extra").exists()
+    # Untouched file kept its inode (not rewritten)
+    assert os.stat(rag / "vdb" / "chunks.json").st_ino == chunks_ino
+    # Restored files are writable copies, not links to the read-only objects
+    assert os.stat(rag / "graph.graphml").st_nlink == 1
+    (rag / "graph.graphml").write_text("edited after rollback")
+    assert (
+        manager.versions_dir / v1.version_id / "rag_storage" / "graph.graphml"
+    ).read_text() == "graph-v1"
+
+
+def test_delete_version_collects_unreferenced_objects(tmp_path):
+    kb_dir, rag = _make_kb(tmp_path)
+    manager = VersionManager(kb_dir)
+    v1 = manager.create_snapshot("v1")
+    (rag / "graph.graphml").write_text("graph-v2")
+    v2 = manager.create_snapshot("v2")
+
+    def object_count():
+        return len(list(manager.objects_dir.glob("*/*")))
+
+    assert object_count() == 3
+    assert manager.delete_version(v1.version_id)
+    # graph-v1 is gone, shared chunks object survives
+    assert object_count() == 2
+    assert manager.get_object_store_size() == len("graph-v2") + len("chunks-v1" * 1000)
+
+    assert manager.delete_version(v2.version_id)
+    assert object_count() == 0
+    assert manager.get_object_store_size() == 0
+
+
+def test_legacy_full_copy_versions_still_roll_back(tmp_path):
+    kb_dir, rag = _make_kb(tmp_path)
+    manager = VersionManager(kb_dir)
+    version = manager.create_snapshot("v1")
+    # Simulate a version created before manifests existed
+    (manager.versions_dir / version.version_id / VersionManager.MANIFEST_FILE).unlink()
+
+    (rag / "graph.graphml").write_text("changed")
+    assert manager.rollback_to_version(version.version_id, backup_current=False)
+    assert (rag / "graph.graphml").read_text() == "graph-v1"
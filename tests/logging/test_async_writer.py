@@ -0,0 +1,107 @@
+import asyncio
+import json
+import logging
+import threading
+
+from src.logging.handlers.async_writer import AsyncLogWriter, get_log_writer, release_log_writer
+from src.logging.handlers.file import JSONFileHandler
+from src.logging.handlers.websocket import WebSocketLogHandler
+
+
+def _record(message: str, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("ai_tutor.Test", logging.INFO, __file__, 1, message, None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_writer_batches_lines_and_dicts(tmp_path) -> None:
+    path = tmp_path / "out.log"
+    writer = AsyncLogWriter(path, flush_interval=10)
+    writer.write("plain line")
+    for i in range(100):
+        writer.write({"i": i, "text": "é"})
+    assert writer.flush()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "plain line"
+    assert [json.loads(line)["i"] for line in lines[1:]] == list(range(100))
+    assert "é" in lines[1]
+
+    stats = writer.get_stats()
+    assert stats["written"] == 101
+    assert stats["batches"] < 101
+    writer.close()
+    assert writer.write("late") is False
+
+
+def test_drop_policy_counts_overflow(tmp_path) -> None:
+    writer = AsyncLogWriter(tmp_path / "out.log", queue_size=1)
+    # Hold the queue full without a consumer
+    writer._thread = threading.Thread()
+    assert writer.write("a") is True
+    assert writer.write("b") is False
+    assert writer.get_stats()["dropped"] == 1
+
+
+def test_rotation_by_size(tmp_path) -> None:
+    path = tmp_path / "rot.log"
+    writer = AsyncLogWriter(path, batch_size=1, max_bytes=100, backup_count=2)
+    for i in range(20):
+        writer.write("x" * 40)
+        writer.flush()
+    writer.close()
+
+    assert writer.get_stats()["rotations"] >= 2
+    assert (tmp_path / "rot.log.1").exists()
+    assert (tmp_path / "rot.log.2").exists()
+    assert not (tmp_path / "rot.log.3").exists()
+
+
+def test_json_handler_shares_writer_and_keeps_schema(tmp_path) -> None:
+    path = tmp_path / "llm.jsonl"
+    first = JSONFileHandler(str(path))
+    second = JSONFileHandler(str(path))
+    assert first.writer is second.writer
+
+    first.emit(_record("hello", tool_name="rag", tokens=12))
+    first.close()
+    assert not first.writer._closed
+    second.emit(_record("world"))
+    second.close()
+    assert second.writer._closed
+    # Closing doesn't block; the writer thread finishes the file
+    second.writer._thread.join(timeout=1)
+
+    entries = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [e["message"] for e in entries] == ["hello", "world"]
+    assert entries[0]["tool_name"] == "rag" and entries[0]["tokens"] == 12
+    assert entries[0]["level"] == "INFO"
+
+
+def test_release_closes_last_reference(tmp_path) -> None:
+    a = get_log_writer(tmp_path / "x.log")
+    b = get_log_writer(tmp_path / "x.log")
+    assert a is b
+    release_log_writer(a)
+    assert not a._closed
+    release_log_writer(b)
+    assert a._closed
+    assert get_log_writer(tmp_path / "x.log") is not a
+
+
+def test_websocket_handler_from_worker_thread() -> None:
+    async def run():
+        queue: asyncio.Queue = asyncio.Queue()
+        handler = WebSocketLogHandler(queue)
+
+        handler.emit(_record("on loop"))
+        thread = threading.Thread(target=lambda: handler.emit(_record("from thread")))
+        thread.start()
+        await asyncio.to_thread(thread.join)
+
+        first = await asyncio.wait_for(queue.get(), 1)
+        second = await asyncio.wait_for(queue.get(), 1)
+        return first["message"], second["message"]
+
+    assert asyncio.run(run()) == ("on loop", "from thread")
@@ -0,0 +1,79 @@
+import asyncio
+import os
+
+import pytest
+
+from src.services.config import loader
+from src.services.config.loader import (
+    check_config_changes,
+    get_config_snapshot,
+    load_config_with_main,
+    load_config_with_main_async,
+    subscribe_config_changes,
+    unsubscribe_config_changes,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "main.yaml").write_text("system:\n  language: en\ntools:\n  k: 1\n")
+    (config_dir / "solve.yaml").write_text("tools:\n  j: [1, 2]\n")
+    yield tmp_path
+    loader.clear_config_cache()
+
+
+def _bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+
+def test_cache_hit_returns_private_copies(project, monkeypatch):
+    first = load_config_with_main("solve.yaml", project)
+    assert first == {"system": {"language": "en"}, "tools": {"k": 1, "j": [1, 2]}}
+
+    parses = []
+    original = loader._load_yaml_file
+    monkeypatch.setattr(loader, "_load_yaml_file", lambda p: parses.append(p) or original(p))
+
+    first["tools"]["k"] = 99
+    second = load_config_with_main("solve.yaml", project)
+    assert second["tools"]["k"] == 1
+    assert parses == []
+
+    assert asyncio.run(load_config_with_main_async("solve.yaml", project)) == second
+    assert parses == []
+
+
+def test_snapshot_is_read_only(project):
+    snapshot = get_config_snapshot("solve.yaml", project)
+    assert snapshot["tools"]["j"] == (1, 2)
+    with pytest.raises(TypeError):
+        snapshot["tools"]["k"] = 2
+    assert get_config_snapshot("solve.yaml", project) is snapshot
+
+
+def test_edit_invalidates_and_notifies(project):
+    events = []
+    subscribe_config_changes(events.append)
+    try:
+        load_config_with_main("solve.yaml", project)
+        module_file = project / "config" / "solve.yaml"
+        module_file.write_text("tools:\n  k: 2\n")
+        _bump_mtime(module_file)
+
+        assert check_config_changes() == [module_file]
+        assert events == [[module_file]]
+        assert get_config_snapshot("solve.yaml", project)["tools"] == {"k": 2}
+        # Nothing new to report
+        assert check_config_changes() == []
+        assert len(events) == 1
+    finally:
+        unsubscribe_config_changes(events.append)
+
+
+def test_missing_module_file_appears_later(project):
+    assert load_config_with_main("later.yaml", project)["tools"] == {"k": 1}
+    (project / "config" / "later.yaml").write_text("tools:\n  k: 3\n")
+    assert load_config_with_main("later.yaml", project)["tools"] == {"k": 3}
@@ -0,0 +1,131 @@
+import random
+
+from src.services.guided_learning.v2.engine import MasteryEngine
+from src.services.guided_learning.v2.types import (
+    Activity,
+    Confidence,
+    LearnerModel,
+    MasteryState,
+    MCQBlock,
+    NodeStatus,
+    NodeType,
+    ObjectiveNode,
+    PlanGraph,
+    ResponseEvaluation,
+    Stage,
+)
+
+
+def _node(obj_id: str) -> ObjectiveNode:
+    return ObjectiveNode(objective_id=obj_id, title=obj_id, description="", node_type=NodeType.FACT)
+
+
+def _random_graph(rng: random.Random, n: int) -> PlanGraph:
+    nodes = [_node(f"o{i}") for i in range(n)]
+    edges = []
+    for i in range(1, n):
+        for j in rng.sample(range(i), min(i, rng.randint(0, 3))):
+            edges.append((f"o{j}", f"o{i}"))
+    return PlanGraph(nodes=nodes, edges=edges)
+
+
+def _activity(obj_id: str) -> Activity:
+    block = MCQBlock(stem="q", options=["a", "b"], correct_index=0)
+    return Activity(objective_id=obj_id, stage=Stage.PRACTICE, block=block)
+
+
+def _brute_force_available(engine, model, graph):
+    return [
+        node.objective_id
+        for node in graph.nodes
+        if node.status not in (NodeStatus.COMPLETED, NodeStatus.SKIPPED)
+        and all(
+            engine._is_objective_mastered(p, model, graph)
+            for p in graph.get_prerequisites(node.objective_id)
+        )
+    ]
+
+
+def test_index_lookups_and_topological_order():
+    graph = PlanGraph(nodes=[_node("c"), _node("a"), _node("b")], edges=[("a", "c"), ("b", "c")])
+    assert graph.get_node("a").objective_id == "a"
+    assert graph.get_node("missing") is None
+    assert graph.get_prerequisites("c") == ["a", "b"]
+    assert graph.get_dependents("a") == ["c"]
+    assert graph.topological_order() == ["a", "b", "c"]
+
+    version = graph.version
+    graph.add_node(_node("d"))
+    graph.add_edge("c", "d")
+    assert graph.version != version
+    assert graph.topological_order() == ["a", "b", "c", "d"]
+
+    # Direct list edits are picked up too
+    graph.edges.append(("d", "a"))
+    assert graph.get_dependents("d") == ["a"]
+    assert sorted(graph.topological_order()) == ["a", "b", "c", "d"]
+
+
+def test_frontier_matches_brute_force_through_updates():
+    rng = random.Random(3)
+    graph = _random_graph(rng, 120)
+    model = LearnerModel(user_id="u")
+    engine = MasteryEngine()
+
+    for step in range(600):
+        assert engine._get_available_objectives(model, graph) == _brute_force_available(
+            engine, model, graph
+        )
+        available = _brute_force_available(engine, model, graph)
+        expected = engine._select_next_objective(available, model, graph)
+        assert engine.select_next_objective(model, graph) == expected
+        if not available:
+            break
+
+        obj_id = rng.choice(available) if rng.random() < 0.3 else expected
+        if step % 37 == 0:
+            engine.set_node_status(graph, obj_id, NodeStatus.COMPLETED)
+            continue
+        evaluation = ResponseEvaluation(
+            is_correct=rng.random() < 0.8,
+            confidence=Confidence.HIGH,
+        )
+        engine.update_mastery(model, evaluation, _activity(obj_id))
+
+
+def test_select_prefers_unseen_then_struggling_objectives():
+    graph = PlanGraph(nodes=[_node("a"), _node("b"), _node("c")], edges=[("a", "c")])
+    model = LearnerModel(user_id="u")
+    engine = MasteryEngine()
+
+    assert engine.select_next_objective(model, graph) == "a"
+    model.get_mastery("a").mastery_state = MasteryState.SHAKY
+    engine.update_mastery(
+        model, ResponseEvaluation(is_correct=False, confidence=Confidence.LOW), _activity("a")
+    )
+    assert engine.select_next_objective(model, graph) == "b"
+    assert "c" not in engine._get_available_objectives(model, graph)
+
+    model.get_mastery("a").correct_streak = 1
+    model.get_mastery("a").mastery_state = MasteryState.SHAKY
+    engine.update_mastery(
+        model, ResponseEvaluation(is_correct=True, confidence=Confidence.HIGH), _activity("a")
+    )
+    assert model.get_mastery("a").mastery_state == MasteryState.COMPETENT
+    assert engine._get_available_objectives(model, graph) == ["a", "b", "c"]
+
+
+def test_direct_mutations_are_not_served_from_a_stale_frontier():
+    graph = PlanGraph(nodes=[_node("a"), _node("b")], edges=[("a", "b")])
+    model = LearnerModel(user_id="u")
+    engine = MasteryEngine()
+    assert engine.select_next_objective(model, graph) == "a"
+
+    graph.nodes[0].status = NodeStatus.COMPLETED
+    assert engine.select_next_objective(model, graph) == "b"
+    assert engine._get_available_objectives(model, graph) == ["b"]
+
+    other_graph = PlanGraph(nodes=[_node("a"), _node("b")], edges=[("a", "b")])
+    assert engine.select_next_objective(model, other_graph) == "a"
+    model.get_mastery("a").mastery_state = MasteryState.COMPETENT
+    assert engine.select_next_objective(model, other_graph) == "b"
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from src.services.llm import factory
+from src.services.llm import tokenizer as tokenizer_module
+from src.services.llm.capabilities import get_context_window
+
+
+@pytest.fixture(autouse=True)
+def _char_estimate_tokenizer(monkeypatch) -> None:
+    # Deterministic counts (~4 chars/token) regardless of tiktoken availability
+    service = tokenizer_module.TokenizerService()
+    service._tiktoken_failed = True
+    monkeypatch.setattr(tokenizer_module, "_tokenizer", service)
+
+
+def _history(n: int, size: int) -> list[dict]:
+    messages = []
+    for i in range(n):
+        messages.append({"role": "user", "content": f"u{i} " + "q" * size})
+        messages.append({"role": "assistant", "content": f"a{i} " + "r" * size})
+    return messages
+
+
+def test_context_window_lookup_prefers_most_specific_model() -> None:
+    assert get_context_window("openai", "gpt-4o-mini") == 128000
+    assert get_context_window("openai", "gpt-4") == 8192
+    assert get_context_window("openai", "unknown-model") is None
+
+
+def test_unknown_model_is_not_budgeted() -> None:
+    messages = [{"role": "system", "content": "sys"}] + _history(50, 4000)
+    assert factory._fit_messages_to_context_budget(messages, "unknown-model", "openai") is messages
+
+
+def test_budget_drops_oldest_history_before_rag(monkeypatch) -> None:
+    monkeypatch.setattr(factory, "get_context_window", lambda binding, model: 4000)
+
+    rag = {"role": "system", "content": "Reference context:\n" + "R" * 2000}
+    messages = [{"role": "system", "content": "sys"}, rag] + _history(10, 800)
+    messages.append({"role": "user", "content": "final question"})
+
+    fitted = factory._fit_messages_to_context_budget(messages, "m", "openai", 500)
+
+    assert fitted[1] is rag
+    assert fitted[-1]["content"] == "final question"
+    assert len(fitted) < len(messages)
+    # Newest history survives, oldest is gone
+    contents = [m["content"] for m in fitted]
+    assert any(c.startswith("a9 ") for c in contents)
+    assert not any(c.startswith("u0 ") for c in contents)
+
+
+def test_budget_trims_rag_when_history_is_not_enough(monkeypatch) -> None:
+    monkeypatch.setattr(factory, "get_context_window", lambda binding, model: 4000)
+
+    messages = [
+        {"role": "system", "content": "sys"},
+        {"role": "system", "content": "Reference context:\n" + "R" * 40000},
+        {"role": "user", "content": "question"},
+    ]
+
+    fitted = factory._fit_messages_to_context_budget(messages, "m", "openai", 500)
+
+    assert len(fitted) == 3
+    assert len(fitted[1]["content"]) < len(messages[1]["content"])
+    assert fitted[1]["content"].endswith("[truncated]")
+    assert fitted[2]["content"] == "question"
+
+
+def test_complete_fits_budget_without_provider_round_trip(monkeypatch) -> None:
+    calls: list[list[dict]] = []
+
+    async def fake_cloud_complete(**kwargs):
+        calls.append(list(kwargs.get("messages") or []))
+        return "ok"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_cloud_complete)
+    monkeypatch.setattr(factory, "get_context_window", lambda binding, model: 4000)
+
+    messages = [{"role": "system", "content": "sys"}] + _history(20, 800)
+    messages.append({"role": "user", "content": "now"})
+
+    result = asyncio.run(
+        factory.complete(
+            prompt="",
+            model="m",
+            api_key="",
+            base_url="https://example.com",
+            binding="openai",
+            messages=messages,
+            max_retries=0,
+            max_tokens=500,
+        )
+    )
+
+    assert result == "ok"
+    assert len(calls) == 1
+    assert len(calls[0]) < len(messages)
+    assert calls[0][-1]["content"] == "now"
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import pytest
+
+from src.services.llm import factory
+from src.services.llm import response_cache as response_cache_module
+from src.services.llm.response_cache import LLMResponseCache, LLMResponseCacheMiss, make_cache_key
+
+
+def _install_cache(monkeypatch, cache: LLMResponseCache) -> None:
+    monkeypatch.setattr(response_cache_module, "_response_cache", cache)
+
+
+def _fake_provider(monkeypatch) -> list[dict]:
+    calls: list[dict] = []
+
+    async def fake_cloud_complete(**kwargs):
+        calls.append(kwargs)
+        return f"answer-{len(calls)}"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_cloud_complete)
+    return calls
+
+
+def _complete(**overrides):
+    kwargs = {
+        "prompt": "Decompose topic X",
+        "system_prompt": "sys",
+        "model": "test-model",
+        "api_key": "",
+        "base_url": "https://example.com",
+        "binding": "openai",
+        "max_retries": 0,
+        "temperature": 0,
+    }
+    kwargs.update(overrides)
+    return asyncio.run(factory.complete(**kwargs))
+
+
+def test_cache_key_covers_request_fields() -> None:
+    messages = [{"role": "user", "content": "hi"}]
+    base = make_cache_key("m", "openai", messages, 0, None, 100)
+
+    assert base == make_cache_key("m", "OpenAI", list(messages), 0, None, 100)
+    assert base != make_cache_key("m2", "openai", messages, 0, None, 100)
+    assert base != make_cache_key("m", "openai", messages, 0.7, None, 100)
+    assert base != make_cache_key("m", "openai", messages, 0, {"type": "json_object"}, 100)
+    assert base != make_cache_key("m", "openai", messages, 0, None, 200)
+    assert base != make_cache_key("m", "openai", [{"role": "user", "content": "hey"}], 0, None, 100)
+
+
+def test_opt_in_call_is_served_from_cache(tmp_path, monkeypatch) -> None:
+    cache = LLMResponseCache(cache_dir=tmp_path)
+    _install_cache(monkeypatch, cache)
+    calls = _fake_provider(monkeypatch)
+
+    first = _complete(use_cache=True)
+    second = _complete(use_cache=True)
+
+    assert first == second == "answer-1"
+    assert len(calls) == 1
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["writes"] == 1
+
+
+def test_calls_without_opt_in_bypass_cache(tmp_path, monkeypatch) -> None:
+    cache = LLMResponseCache(cache_dir=tmp_path)
+    _install_cache(monkeypatch, cache)
+    calls = _fake_provider(monkeypatch)
+
+    _complete()
+    _complete()
+
+    assert len(calls) == 2
+    assert cache.get_stats()["writes"] == 0
+
+
+def test_expired_entries_are_refetched(tmp_path, monkeypatch) -> None:
+    cache = LLMResponseCache(cache_dir=tmp_path, ttl_seconds=60)
+    _install_cache(monkeypatch, cache)
+    calls = _fake_provider(monkeypatch)
+
+    _complete(use_cache=True)
+    cache._memory.clear()
+    real_time = time.time
+    monkeypatch.setattr(response_cache_module.time, "time", lambda: real_time() + 120)
+
+    assert _complete(use_cache=True) == "answer-2"
+    assert cache.get_stats()["expired"] == 1
+    assert len(calls) == 2
+
+
+def test_record_then_replay_fixtures(tmp_path, monkeypatch) -> None:
+    _install_cache(monkeypatch, LLMResponseCache(cache_dir=tmp_path, mode="record"))
+    _fake_provider(monkeypatch)
+    recorded = _complete()
+
+    _install_cache(monkeypatch, LLMResponseCache(cache_dir=tmp_path, mode="replay"))
+    calls = _fake_provider(monkeypatch)
+
+    assert _complete() == recorded
+    assert calls == []
+    with pytest.raises(LLMResponseCacheMiss):
+        _complete(prompt="never recorded")
@@ -0,0 +1,100 @@
+from src.services.llm import tokenizer as tokenizer_module
+from src.services.llm.tokenizer import FALLBACK_ENCODING, TokenizerService
+
+
+class _FakeEncoding:
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode_ordinary(self, text: str) -> list[str]:
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_ordinary_batch(self, texts: list[str], num_threads: int = 8) -> list[list[str]]:
+        return [self.encode_ordinary(t) for t in texts]
+
+
+def _service_with_fake() -> tuple[TokenizerService, _FakeEncoding]:
+    service = TokenizerService()
+    encoding = _FakeEncoding()
+    service._model_encodings["test-model"] = "fake"
+    service._encoders["fake"] = encoding
+    return service, encoding
+
+
+def test_count_is_memoized_by_content() -> None:
+    service, encoding = _service_with_fake()
+
+    assert service.count("a b c", "test-model") == 3
+    assert service.count("a b c", "test-model") == 3
+    assert encoding.encoded == ["a b c"]
+    assert service.get_stats()["hits"] == 1
+
+
+def test_count_batch_preserves_order_and_dedupes() -> None:
+    service, encoding = _service_with_fake()
+    service.count("one", "test-model")
+
+    counts = service.count_batch(["x y", "one", "", "x y", "p q r"], "test-model")
+
+    assert counts == [2, 1, 0, 2, 3]
+    assert encoding.encoded == ["one", "x y", "p q r"]
+
+
+def test_count_message_reuses_persisted_count_for_same_encoding() -> None:
+    service, encoding = _service_with_fake()
+
+    persisted = {"role": "user", "content": "a b c d", "token_count": 99, "token_encoding": "fake"}
+    stale = {"role": "user", "content": "a b c d", "token_count": 99, "token_encoding": "other"}
+
+    assert service.count_message(persisted, "test-model") == 99
+    assert encoding.encoded == []
+    assert service.count_message(stale, "test-model") == 4
+
+
+def test_annotate_message_records_count_and_encoding() -> None:
+    service, _ = _service_with_fake()
+
+    message = service.annotate_message({"role": "assistant", "content": "hi there"}, "test-model")
+
+    assert message["token_count"] == 2
+    assert message["token_encoding"] == "fake"
+
+
+def test_falls_back_to_estimate_when_encoding_unavailable(monkeypatch) -> None:
+    import tiktoken
+
+    def _fail(name):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(tiktoken, "get_encoding", _fail)
+    service = TokenizerService()
+
+    assert service.count("x" * 40, "gpt-4o-mini") == 10
+    assert service.encoding_name_for("gpt-4o-mini") == FALLBACK_ENCODING
+    assert service.count_batch(["x" * 8, ""]) == [2, 0]
+
+
+def test_session_manager_persists_token_counts(tmp_path, monkeypatch) -> None:
+    from src.agents.chat.session_manager import SessionManager
+
+    service, _ = _service_with_fake()
+    monkeypatch.setattr(tokenizer_module, "_tokenizer", service)
+
+    manager = SessionManager(base_dir=str(tmp_path))
+    session = manager.create_session()
+    manager.add_message(session["session_id"], "user", "how are you", model="test-model")
+    manager.add_message(
+        session["session_id"],
+        "assistant",
+        "verified",
+        model="test-model",
+        exclude_from_history=True,
+    )
+
+    messages = manager.get_session(session["session_id"])["messages"]
+    assert messages[0]["token_count"] == 3
+    assert messages[0]["token_encoding"] == "fake"
+    assert "token_count" not in messages[1]
@@ -0,0 +1,104 @@
+import random
+import time
+
+import pytest
+
+from src.services.metrics.service import MetricsService
+from src.services.metrics.sketch import QuantileSketch
+
+
+def _service(tmp_path, **kwargs) -> MetricsService:
+    return MetricsService(save_dir=str(tmp_path), **kwargs)
+
+
+def _record(service: MetricsService, agent: str, duration_ms: float, model: str = "gpt-4o"):
+    metrics = service.start_tracking(agent, "solve")
+    metrics.start_time = time.time() - duration_ms / 1000
+    metrics.add_tokens(prompt=10, completion=5, model=model)
+    service.end_tracking(metrics)
+    return metrics
+
+
+def test_sketch_quantiles_are_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(5, 1.2) for _ in range(20000))
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.03)
+    assert sketch.count == len(values)
+
+
+def test_sketch_merge_matches_single_sketch() -> None:
+    a, b, both = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i in range(1, 1000):
+        (a if i % 2 else b).add(float(i))
+        both.add(float(i))
+    a.merge(b)
+    assert a.quantile(0.95) == both.quantile(0.95)
+    assert a.count == both.count
+
+
+def test_end_tracking_removes_active_handle_and_keeps_ring_buffer(tmp_path) -> None:
+    service = _service(tmp_path, history_limit=5)
+    handles = [service.start_tracking(f"agent_{i}", "solve") for i in range(3)]
+    assert service.get_summary()["active_count"] == 3
+
+    service.end_tracking(handles[1])
+    assert [m["agent_name"] for m in service.get_active_metrics()] == ["agent_0", "agent_2"]
+
+    for i in range(10):
+        _record(service, f"r{i}", 10)
+    history = service.get_history(limit=100)
+    assert [m["agent_name"] for m in history] == ["r5", "r6", "r7", "r8", "r9"]
+    assert service.get_history(limit=2)[-1]["agent_name"] == "r9"
+    assert history[0]["timestamp"]
+
+
+def test_aggregated_stats_include_percentiles(tmp_path) -> None:
+    service = _service(tmp_path)
+    for ms in range(1, 101):
+        _record(service, "solver", float(ms))
+
+    stats = service.get_aggregated_stats()["solve:solver"]
+    assert stats["total_invocations"] == 100
+    assert stats["success_rate"] == 100.0
+    assert stats["p50_duration_ms"] == pytest.approx(50, rel=0.1)
+    assert stats["p99_duration_ms"] == pytest.approx(99, rel=0.1)
+
+    latency = service.get_latency_percentiles(module="solve")
+    assert latency[0]["model"] == "gpt-4o"
+    assert latency[0]["count"] == 100
+
+
+def test_prometheus_exposition(tmp_path) -> None:
+    service = _service(tmp_path)
+    _record(service, 'quote"agent', 20)
+    failed = service.start_tracking("solver", "solve")
+    service.end_tracking(failed, success=False)
+
+    text = service.render_prometheus()
+
+    assert "# TYPE pradeep_agent_duration_milliseconds summary" in text
+    assert 'agent="quote\\"agent"' in text
+    assert (
+        'pradeep_agent_invocations_total{module="solve",agent="solver",model="",status="failure"} 1'
+        in text
+    )
+    assert 'quantile="0.99"' in text
+    assert "pradeep_agent_active 0" in text
+    assert text.endswith("\n")
+
+
+def test_tracking_overhead_stays_low(tmp_path) -> None:
+    # Regression guard only; scripts/bench_metrics.py reports the real number (< 5µs)
+    service = _service(tmp_path)
+    calls = 20000
+    start = time.perf_counter()
+    for _ in range(calls):
+        service.end_tracking(service.start_tracking("agent", "solve"))
+    per_call_us = (time.perf_counter() - start) / calls * 1e6
+    assert per_call_us < 50
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+import sys
+
+import httpx
+from openai import AsyncOpenAI
+
+project_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(project_root))
+
+from src.services.tts import (  # noqa: E402
+    TTSAudioCache,
+    TTSSynthesizer,
+    make_audio_key,
+    split_tts_chunks,
+)
+
+TTS_CONFIG = {"model": "tts-1", "api_key": "sk-test", "base_url": "http://tts.local/v1"}
+
+
+class FakeTTSEndpoint:
+    """Local stand-in for POST /v1/audio/speech, served through httpx.MockTransport"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.inputs: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.clients_created = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/audio/speech"
+        body = json.loads(request.content)
+        self.inputs.append(body["input"])
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        audio = f"<{body['voice']}:{body['input']}>".encode()
+        return httpx.Response(200, content=audio, headers={"content-type": "audio/mpeg"})
+
+    def client_factory(self, cfg):
+        self.clients_created += 1
+        return AsyncOpenAI(
+            base_url=cfg["base_url"],
+            api_key=cfg["api_key"],
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self.handle)),
+        )
+
+
+def _script(sentences: int) -> str:
+    return " ".join(f"Sentence number {i} explains one more idea." for i in range(sentences))
+
+
+def test_split_tts_chunks_respects_limits_and_keeps_text():
+    text = _script(200) + "\n\n第一句话。第二句话！" + " " + "x" * 5000
+    chunks = split_tts_chunks(text, max_chars=600, first_chunk_chars=100)
+
+    assert len(chunks[0]) <= 100
+    assert all(len(chunk) <= 600 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "") == text.replace(" ", "").replace("\n", "")
+    assert split_tts_chunks("  \n ") == []
+
+
+def test_long_script_is_chunked_in_parallel_and_cached(tmp_path):
+    endpoint = FakeTTSEndpoint()
+    synthesizer = TTSSynthesizer(
+        cache=TTSAudioCache(cache_dir=tmp_path),
+        max_concurrency=3,
+        client_factory=endpoint.client_factory,
+    )
+    script = _script(150)  # Far beyond the 4096-character API limit
+    assert len(script) > 6000
+
+    async def main():
+        first = await synthesizer.synthesize(script, voice="onyx", tts_config=TTS_CONFIG)
+        requests = len(endpoint.inputs)
+        second = await synthesizer.synthesize(script, voice="onyx", tts_config=TTS_CONFIG)
+        return first, requests, second
+
+    first, requests, second = asyncio.run(main())
+
+    chunks = split_tts_chunks(script)
+    assert requests == len(chunks) > 1
+    assert endpoint.max_active == 3
+    assert endpoint.clients_created == 1
+    # Chunk audio is concatenated in reading order, without truncation
+    expected = b"".join(f"<onyx:{chunk}>".encode() for chunk in chunks)
+    assert Path(first["path"]).read_bytes() == expected
+    assert not first["cached"] and first["chunks"] == len(chunks)
+
+    assert second["cached"] and second["path"] == first["path"]
+    assert len(endpoint.inputs) == requests
+    # Formatting-only differences share the cache entry; another voice does not
+    assert second["key"] == make_audio_key("tts-1", "onyx", script.replace(" ", "\n  "))
+    assert second["key"] != make_audio_key("tts-1", "nova", script)
+
+
+def test_stream_yields_in_order_and_reuses_chunks(tmp_path):
+    endpoint = FakeTTSEndpoint()
+    synthesizer = TTSSynthesizer(
+        cache=TTSAudioCache(cache_dir=tmp_path),
+        max_concurrency=4,
+        first_chunk_chars=60,
+        client_factory=endpoint.client_factory,
+    )
+    script = _script(40)
+
+    async def collect(text):
+        return [part async for part in synthesizer.stream(text, "alloy", TTS_CONFIG)]
+
+    parts = asyncio.run(collect(script))
+    chunks = split_tts_chunks(script, first_chunk_chars=60)
+    assert parts == [f"<alloy:{chunk}>".encode() for chunk in chunks]
+    assert len(chunks[0]) <= 60
+
+    # The complete stream was cached as one entry
+    requests = len(endpoint.inputs)
+    assert asyncio.run(collect(script)) == [b"".join(parts)]
+    assert len(endpoint.inputs) == requests
+
+    # A revised script only synthesizes the chunks that changed
+    revised = script + " A closing remark."
+    revised_chunks = split_tts_chunks(revised, first_chunk_chars=60)
+    assert revised_chunks[:-1] == chunks[:-1]
+    result = asyncio.run(synthesizer.synthesize(revised, "alloy", TTS_CONFIG))
+    assert endpoint.inputs[requests:] == [revised_chunks[-1]]
+    assert result["chunks"] == len(revised_chunks)
+    assert synthesizer.get_stats()["chunk_hits"] == len(chunks) - 1
+
+
+def test_audio_cache_evicts_least_recently_used(tmp_path):
+    cache = TTSAudioCache(cache_dir=tmp_path, max_bytes=250)
+    for stamp, key in enumerate(("aa1", "bb2")):
+        cache.set(key, b"x" * 100)
+        os.utime(cache.path_for(key), (stamp, stamp))  # Older than anything written later
+    assert cache.get("aa1") == b"x" * 100  # A hit makes aa1 the most recently used
+    cache.set("cc3", b"x" * 100)
+
+    assert cache.get("bb2") is None  # Evicted when cc3 pushed the total over budget
+    assert cache.get("aa1") == b"x" * 100
+    assert cache.get("cc3") == b"x" * 100
+    stats = cache.get_stats()
+    assert stats["evicted"] == 1 and stats["size_bytes"] == 200
+
+
+def test_exported_audio_survives_eviction(tmp_path):
+    endpoint = FakeTTSEndpoint(delay=0)
+    cache = TTSAudioCache(cache_dir=tmp_path / "cache", max_bytes=1)
+    synthesizer = TTSSynthesizer(cache=cache, client_factory=endpoint.client_factory)
+    output_dir = tmp_path / "audio"
+
+    async def main():
+        first = await synthesizer.synthesize("First note.", "alloy", TTS_CONFIG, output_dir)
+        await synthesizer.synthesize("Second note.", "alloy", TTS_CONFIG, output_dir)
+        again = await synthesizer.synthesize("First note.", "alloy", TTS_CONFIG, output_dir)
+        return first, again
+
+    first, again = asyncio.run(main())
+
+    assert Path(first["path"]) == output_dir / f"{first['key']}.mp3"
+    assert cache.get_stats()["evicted"] > 0
+    assert Path(first["path"]).read_bytes() == b"<alloy:First note.>"
+    assert again["path"] == first["path"]
+    assert sorted(p.name for p in output_dir.iterdir()) == sorted(
+        f"{make_audio_key('tts-1', 'alloy', text)}.mp3" for text in ("First note.", "Second note.")
+    )
@@ -0,0 +1,155 @@
+import asyncio
+from contextlib import asynccontextmanager
+import json
+
+from aiohttp import web
+
+from src.services.webhooks import (
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+    WebhookCreateRequest,
+    WebhookDeliveryEngine,
+    WebhookDeliveryStatus,
+    WebhookStore,
+    verify_signature,
+)
+
+
+@asynccontextmanager
+async def stub_server(handler):
+    app = web.Application()
+    app.router.add_post("/hook", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/hook"
+    finally:
+        await runner.cleanup()
+
+
+def _register(store, url, **kwargs):
+    return store.create_webhook(WebhookCreateRequest(url=url, **kwargs))
+
+
+def test_delivers_signed_events_to_subscribers(tmp_path):
+    received = []
+
+    async def handler(request):
+        received.append((dict(request.headers), await request.read()))
+        return web.Response(status=204)
+
+    async def scenario():
+        store = WebhookStore(tmp_path / "webhooks.db")
+        async with stub_server(handler) as url:
+            hook = _register(store, url, events=["workflow.completed"], secret="s3cret")
+            _register(store, url, events=["knowledge_base.updated"])
+
+            engine = WebhookDeliveryEngine(store, poll_interval=0.05)
+            await engine.start()
+            store.enqueue("workflow.completed", {"workflow": "solve", "task_id": "t1"})
+            engine.notify()
+            await engine.wait_idle(timeout=5)
+            await engine.stop()
+        return store, hook
+
+    store, hook = asyncio.run(scenario())
+    assert len(received) == 1
+    headers, body = received[0]
+    assert verify_signature("s3cret", headers[TIMESTAMP_HEADER], body, headers[SIGNATURE_HEADER])
+    envelope = json.loads(body)
+    assert envelope["type"] == "workflow.completed"
+    assert envelope["data"] == {"workflow": "solve", "task_id": "t1"}
+
+    (delivery,) = store.list_deliveries(hook.id)
+    assert delivery.status == WebhookDeliveryStatus.SUCCESS
+    assert delivery.attempt_count == 1
+    assert delivery.last_status_code == 204
+
+
+def test_failed_attempts_back_off_then_succeed_or_give_up(tmp_path):
+    calls = {"flaky": 0, "down": 0}
+
+    async def handler(request):
+        name = request.query.get("name", "")
+        calls[name] += 1
+        if name == "flaky" and calls[name] >= 3:
+            return web.Response(status=200)
+        return web.Response(status=503)
+
+    async def scenario():
+        store = WebhookStore(tmp_path / "webhooks.db")
+        async with stub_server(handler) as url:
+            flaky = _register(store, url + "?name=flaky", max_attempts=5)
+            down = _register(store, url + "?name=down", max_attempts=2)
+            engine = WebhookDeliveryEngine(store, base_backoff=0.02, poll_interval=0.05)
+            await engine.start()
+            store.enqueue("session.milestone", {"n": 1})
+            engine.notify()
+            for _ in range(200):
+                counts = store.count_by_status()
+                if counts.get("success") == 1 and counts.get("failed") == 1:
+                    break
+                await asyncio.sleep(0.02)
+            await engine.stop()
+        return store, flaky, down
+
+    store, flaky, down = asyncio.run(scenario())
+    (ok,) = store.list_deliveries(flaky.id)
+    assert ok.status == WebhookDeliveryStatus.SUCCESS
+    assert ok.attempt_count == 3
+    (failed,) = store.list_deliveries(down.id)
+    assert failed.status == WebhookDeliveryStatus.FAILED
+    assert failed.attempt_count == 2
+    assert failed.last_status_code == 503
+    assert calls["down"] == 2
+
+
+def test_per_endpoint_concurrency_limit(tmp_path):
+    active = {"now": 0, "max": 0}
+
+    async def handler(request):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.02)
+        active["now"] -= 1
+        return web.Response(status=200)
+
+    async def scenario():
+        store = WebhookStore(tmp_path / "webhooks.db")
+        async with stub_server(handler) as url:
+            _register(store, url)
+            engine = WebhookDeliveryEngine(store, concurrency=16, per_endpoint_limit=3)
+            await engine.start()
+            for i in range(20):
+                store.enqueue("workflow.completed", {"i": i})
+            engine.notify()
+            await engine.wait_idle(timeout=10)
+            await engine.stop()
+        return store
+
+    store = asyncio.run(scenario())
+    assert store.count_by_status() == {"success": 20}
+    assert active["max"] == 3
+
+
+def test_outbox_survives_restart(tmp_path):
+    db = tmp_path / "webhooks.db"
+    store = WebhookStore(db)
+    hook = _register(store, "http://127.0.0.1:9/hook")
+    store.enqueue("workflow.completed", {"a": 1})
+    store.enqueue("workflow.completed", {"a": 2})
+    # Simulate a crash mid-delivery
+    assert len(store.claim_due(limit=1)) == 1
+    store.close()
+
+    reopened = WebhookStore(db)
+    assert reopened.count_by_status() == {"pending": 1, "delivering": 1}
+    assert reopened.recover_inflight() == 1
+    assert {d.status for d in reopened.list_deliveries(hook.id)} == {
+        WebhookDeliveryStatus.PENDING,
+        WebhookDeliveryStatus.RETRYING,
+    }
+    assert len(reopened.claim_due(limit=10)) == 2
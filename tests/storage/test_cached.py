@@ -0,0 +1,125 @@
+import pytest
+
+from src.storage import CachedStorageProvider, InMemoryS3Client, S3StorageProvider
+
+
+def _remote():
+    client = InMemoryS3Client(min_part_size=1024)
+    return S3StorageProvider("bucket", client=client, part_size=1024), client
+
+
+def test_repeated_reads_are_served_locally_and_revalidated_by_etag(tmp_path):
+    remote, client = _remote()
+    remote.write_bytes("kb/metadata.json", b'{"v": 1}')
+    cached = CachedStorageProvider(remote, tmp_path, validate_ttl=60)
+    client.calls.clear()
+
+    for _ in range(5):
+        assert cached.read_bytes("kb/metadata.json") == b'{"v": 1}'
+    # One HEAD + one GET for the miss, nothing afterwards
+    assert len(client.calls) == 2
+    stats = cached.get_stats()
+    assert (stats["hits"], stats["misses"]) == (4, 1)
+
+    # After the TTL, an unchanged object costs one HEAD; a changed one is refetched
+    cached.validate_ttl = 0
+    client.calls.clear()
+    assert cached.read_bytes("kb/metadata.json") == b'{"v": 1}'
+    assert [op for op, _ in client.calls] == ["head_object"]
+
+    remote.write_bytes("kb/metadata.json", b'{"v": 2}')
+    assert cached.read_bytes("kb/metadata.json") == b'{"v": 2}'
+    assert cached.get_stats()["stale"] == 1
+
+    # A fresh provider reuses the persisted cache after revalidating
+    cached.flush()
+    client.calls.clear()
+    reopened = CachedStorageProvider(remote, tmp_path, validate_ttl=0)
+    assert reopened.read_bytes("kb/metadata.json") == b'{"v": 2}'
+    assert client.call_count("get_object") == 0
+
+
+def test_negative_exists_lookups_are_cached(tmp_path):
+    remote, client = _remote()
+    cached = CachedStorageProvider(remote, tmp_path, negative_ttl=60)
+
+    assert not cached.exists("prompts/missing.yaml")
+    calls = len(client.calls)
+    assert not cached.exists("prompts/missing.yaml")
+    assert len(client.calls) == calls
+    assert cached.get_stats()["negative_hits"] == 1
+
+    # Writes through the cache invalidate negative entries
+    cached.write_bytes("prompts/missing.yaml", b"x")
+    assert cached.exists("prompts/missing.yaml")
+    assert cached.exists("prompts")
+
+
+def test_lru_eviction_respects_max_bytes(tmp_path):
+    remote, _ = _remote()
+    for i in range(4):
+        remote.write_bytes(f"obj{i}", bytes([i]) * 100)
+    cached = CachedStorageProvider(remote, tmp_path, max_bytes=250, max_object_bytes=200)
+
+    cached.read_bytes("obj0")
+    cached.read_bytes("obj1")
+    cached.read_bytes("obj0")  # obj1 is now least recently used
+    cached.read_bytes("obj2")
+
+    stats = cached.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 250
+    assert set(cached._entries) == {"obj0", "obj2"}
+
+    remote.write_bytes("huge", b"x" * 500)
+    assert cached.read_bytes("huge") == b"x" * 500
+    assert cached.get_stats()["bypassed"] == 1
+
+
+def test_write_back_defers_upload_until_flush(tmp_path):
+    remote, client = _remote()
+    cached = CachedStorageProvider(remote, tmp_path, write_mode="back", flush_interval=3600)
+    try:
+        cached.write_bytes("council/run.json", b"{}")
+        with cached.open("council/audio.bin", "wb") as out:
+            out.write(b"a" * 3000)
+        assert client.call_count("put_object") == 0
+        assert cached.read_bytes("council/run.json") == b"{}"
+        assert cached.exists("council")
+        assert cached.get_stats()["dirty"] == 2
+
+        # Listings see pending writes
+        assert cached.list("council") == ["council/audio.bin", "council/run.json"]
+        assert remote.read_bytes("council/audio.bin") == b"a" * 3000
+        assert cached.get_stats()["dirty"] == 0
+    finally:
+        cached.close()
+
+
+def test_index_saves_are_batched_except_for_pending_uploads(tmp_path):
+    remote, _ = _remote()
+    for i in range(3):
+        remote.write_bytes(f"obj{i}", b"x")
+    cached = CachedStorageProvider(remote, tmp_path, index_save_delay=3600)
+    for i in range(3):
+        cached.read_bytes(f"obj{i}")
+    cached.delete("obj2")
+    assert not cached.index_file.exists()
+
+    cached.flush()
+    assert CachedStorageProvider(remote, tmp_path).get_stats()["entries"] == 2
+
+    back = CachedStorageProvider(
+        remote, tmp_path / "back", write_mode="back", flush_interval=3600, index_save_delay=3600
+    )
+    try:
+        back.write_bytes("pending.json", b"{}")
+        assert back.index_file.exists()
+    finally:
+        back.close()
+
+
+def test_rejects_unknown_write_mode(tmp_path):
+    remote, _ = _remote()
+    with pytest.raises(ValueError):
+        CachedStorageProvider(remote, tmp_path, write_mode="around")
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.storage import (
+    InMemoryS3Client,
+    InMemoryStorageProvider,
+    LocalFileSystemStorageProvider,
+    S3StorageProvider,
+)
+
+PART = 1024
+
+
+def _s3(**kwargs):
+    client = InMemoryS3Client(min_part_size=PART)
+    return S3StorageProvider("bucket", client=client, part_size=PART, **kwargs), client
+
+
+def test_s3_streaming_write_uses_multipart_and_bounded_parts():
+    provider, client = _s3(prefix="root")
+    payload = os.urandom(PART * 3 + 100)
+
+    with provider.open("kb/big.bin", "wb") as out:
+        for i in range(0, len(payload), 300):
+            out.write(payload[i : i + 300])
+
+    assert client.call_count("put_object") == 0
+    sizes = [kw["Size"] for op, kw in client.calls if op == "upload_part"]
+    assert sizes == [PART, PART, PART, 100]
+    assert client.buckets["bucket"]["root/kb/big.bin"] == payload
+
+    # Small writes stay a single PUT
+    provider.write_bytes("kb/small.txt", b"hi")
+    assert client.call_count("create_multipart_upload") == 1
+
+
+def test_s3_ranged_reads_and_single_get_iteration():
+    provider, client = _s3()
+    payload = os.urandom(5000)
+    provider.write_bytes("a.bin", payload)
+
+    assert provider.read_range("a.bin", 10, 20) == payload[10:20]
+    assert provider.read_range("a.bin", 4990) == payload[4990:]
+    assert provider.size("a.bin") == 5000
+
+    before = client.call_count("get_object")
+    chunks = list(provider.iter_chunks("a.bin", chunk_size=700, start=100))
+    assert client.call_count("get_object") == before + 1
+    assert b"".join(chunks) == payload[100:]
+    assert max(len(c) for c in chunks) == 700
+
+    # open() streams one GET, stays seekable, and only re-requests after a seek
+    before = client.call_count("get_object")
+    with provider.open("a.bin") as f:
+        assert f.read(3) == payload[:3]
+        assert f.read() == payload[3:]
+        assert client.call_count("get_object") == before + 1
+        f.seek(100)
+        assert f.read(10) == payload[100:110]
+        f.seek(-5, os.SEEK_END)
+        assert f.read() == payload[-5:]
+    assert client.call_count("get_object") == before + 3
+
+
+def test_s3_append_copies_large_object_server_side():
+    provider, client = _s3()
+    original = os.urandom(PART * 2)
+    provider.write_bytes("log.bin", original)
+    client.calls.clear()
+
+    with provider.open("log.bin", "ab") as out:
+        out.write(b"tail")
+
+    assert client.call_count("get_object") == 0
+    assert client.call_count("upload_part_copy") == 1
+    assert provider.read_bytes("log.bin") == original + b"tail"
+
+
+def test_failed_write_aborts_and_keeps_existing_object():
+    provider, client = _s3()
+    provider.write_bytes("f.bin", b"old")
+
+    with pytest.raises(RuntimeError):
+        with provider.open("f.bin", "wb") as out:
+            out.write(os.urandom(PART * 2))
+            raise RuntimeError("boom")
+
+    assert provider.read_bytes("f.bin") == b"old"
+    assert client.list_multipart_uploads(Bucket="bucket")["Uploads"] == []
+
+
+def test_delete_many_batches_requests():
+    provider, client = _s3()
+    keys = [f"k/{i}" for i in range(2500)]
+    for key in keys:
+        client.buckets.setdefault("bucket", {})[key] = b"x"
+
+    provider.delete_many(keys)
+    assert client.call_count("delete_objects") == 3
+    assert provider.list("k") == []
+
+
+def test_memory_provider_enforces_min_part_size_and_uploads_dir(tmp_path):
+    provider = InMemoryStorageProvider(part_size=PART, min_part_size=PART)
+    with provider.open("x.bin", "wb") as out:
+        out.write(b"a" * (PART * 2 + 1))
+    assert provider.size("x.bin") == PART * 2 + 1
+
+    src = tmp_path / "tree"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.txt").write_text("a")
+    (src / "sub" / "b.txt").write_text("b")
+    assert provider.upload_dir(src, "kb") == ["kb/a.txt", "kb/sub/b.txt"]
+    assert provider.read_text("kb/sub/b.txt") == "b"
+
+
+def test_local_provider_ranges(tmp_path):
+    provider = LocalFileSystemStorageProvider(tmp_path)
+    provider.write_bytes("d/f.bin", bytes(range(256)))
+    assert provider.read_range("d/f.bin", 250) == bytes(range(250, 256))
+    assert b"".join(provider.iter_chunks("d/f.bin", chunk_size=100, end=150)) == bytes(range(150))
+
+
+class _SlowProvider(InMemoryStorageProvider):
+    def read_range(self, key, start, end=None):
+        time.sleep(0.05)
+        return super().read_range(key, start, end)
+
+
+def test_async_facade_streams_without_blocking_loop():
+    provider = _SlowProvider()
+    provider.write_bytes("audio.mp3", os.urandom(4000))
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        async with provider.as_async() as storage:
+            task = asyncio.create_task(ticker())
+            chunks = [c async for c in storage.iter_chunks("audio.mp3", chunk_size=1000)]
+            task.cancel()
+
+            async def produce():
+                for i in range(3):
+                    yield bytes([i]) * 10
+
+            written = await storage.upload_stream("out.bin", produce())
+            return chunks, ticks, written
+
+    chunks, ticks, written = asyncio.run(scenario())
+    assert b"".join(chunks) == provider.read_bytes("audio.mp3")
+    assert len(chunks) == 4
+    # The loop kept running while four 50 ms reads were in flight
+    assert ticks >= 10
+    assert written == 30
+    assert provider.read_bytes("out.bin") == b"\x00" * 10 + b"\x01" * 10 + b"\x02" * 10
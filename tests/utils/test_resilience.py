@@ -0,0 +1,164 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from src.utils.network.resilience import (
+    CircuitOpenError,
+    ResilientCaller,
+    decorrelated_jitter,
+    is_retryable,
+)
+
+
+class FaultyTool:
+    """Fake tool that plays a script of behaviours: seconds to sleep or an exception."""
+
+    def __init__(self, script, default=0.0):
+        self.script = list(script)
+        self.default = default
+        self.calls = 0
+
+    async def __call__(self, query):
+        self.calls += 1
+        step = self.script.pop(0) if self.script else self.default
+        if isinstance(step, BaseException):
+            raise step
+        await asyncio.sleep(step)
+        return f"result for {query}"
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _caller(**kwargs):
+    kwargs.setdefault("backoff_base", 0.001)
+    kwargs.setdefault("backoff_cap", 0.002)
+    return ResilientCaller("test", rng=random.Random(0), **kwargs)
+
+
+def _warm_up(caller, key, seconds=0.01, samples=20):
+    for _ in range(samples):
+        caller.latency.record(key, seconds)
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (asyncio.TimeoutError(), True),
+        (ConnectionResetError(), True),
+        (HTTPError(429), True),
+        (HTTPError(503), True),
+        (HTTPError(404), False),
+        (ValueError("bad query"), False),
+        (KeyError("kb_name"), False),
+        (RuntimeError("backend hiccup"), True),
+        (CircuitOpenError("open"), False),
+    ],
+)
+def test_is_retryable(error, retryable):
+    assert is_retryable(error) is retryable
+
+
+def test_decorrelated_jitter_bounds():
+    rng = random.Random(1)
+    delay = 0.5
+    delays = []
+    for _ in range(50):
+        delay = decorrelated_jitter(delay, base=0.5, cap=10.0, rng=rng)
+        delays.append(delay)
+    assert all(0.5 <= d <= 10.0 for d in delays)
+    assert len(set(delays)) > 40  # Not synchronized
+    assert max(delays) == 10.0  # Grows until capped
+
+
+def test_retries_transient_errors_only():
+    caller = _caller()
+    tool = FaultyTool([HTTPError(503), ConnectionResetError()])
+    assert asyncio.run(caller.call("rag", tool, "q", max_retries=2)) == "result for q"
+    assert tool.calls == 3
+    assert caller.get_stats()["rag"]["retries"] == 2
+
+    tool = FaultyTool([ValueError("bad query")])
+    with pytest.raises(ValueError):
+        asyncio.run(caller.call("rag", tool, "q", max_retries=2))
+    assert tool.calls == 1
+
+
+def test_adaptive_timeout_cuts_hung_calls():
+    caller = _caller(min_timeout=0.05)
+    _warm_up(caller, "rag", seconds=0.01)
+    tool = FaultyTool([5.0])
+
+    start = time.perf_counter()
+    assert asyncio.run(caller.call("rag", tool, "q", timeout=10, max_retries=1)) == "result for q"
+    # p99 (0.01s) * 3 is below the floor, so the hung attempt is cut at 0.05s, not 10s
+    assert time.perf_counter() - start < 0.5
+    assert caller.get_stats()["rag"]["timeouts"] == 1
+
+
+def test_hedged_request_wins_over_slow_primary():
+    caller = _caller()
+    _warm_up(caller, "paper_search", seconds=0.02)
+    tool = FaultyTool([1.0, 0.01])
+
+    start = time.perf_counter()
+    result = asyncio.run(caller.call("paper_search", tool, "q", hedge=True))
+    assert result == "result for q"
+    assert time.perf_counter() - start < 0.5
+    assert tool.calls == 2
+    stats = caller.get_stats()["paper_search"]
+    assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+
+    # Without enough latency history there is nothing to hedge against
+    tool = FaultyTool([0.05])
+    asyncio.run(caller.call("web_search", tool, "q", hedge=True))
+    assert tool.calls == 1
+
+
+def test_circuit_opens_and_fails_fast():
+    caller = _caller(failure_threshold=3)
+    tool = FaultyTool([], default=ConnectionRefusedError("down"))
+    with pytest.raises(ConnectionRefusedError):
+        asyncio.run(caller.call("web_search", tool, "q", max_retries=5))
+    # The breaker opened after 3 failures and stopped the retry loop
+    assert tool.calls == 3
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(caller.call("web_search", tool, "q"))
+    assert tool.calls == 3
+    assert caller.get_stats()["web_search"]["circuit"] == "open"
+    # Other tools are unaffected
+    assert asyncio.run(caller.call("rag", FaultyTool([]), "q")) == "result for q"
+
+
+def test_intermittent_failures_do_not_open_the_circuit():
+    caller = _caller(failure_threshold=3)
+    # One request in ten fails once and succeeds on retry
+    tool = FaultyTool(([ConnectionResetError()] + [0.0] * 9) * 10)
+
+    async def main():
+        for _ in range(90):
+            await caller.call("rag", tool, "q", max_retries=1)
+
+    asyncio.run(main())
+    stats = caller.get_stats()["rag"]
+    assert stats["retries"] == 10 and stats["failures"] == 0
+    assert stats["circuit"] == "closed"
+
+
+def test_sync_tools_run_on_tool_threads():
+    caller = _caller()
+    threads = []
+
+    def blocking_tool(query):
+        threads.append(threading.current_thread().name)
+        return query.upper()
+
+    assert asyncio.run(caller.call("query_item", blocking_tool, "eq. 1")) == "EQ. 1"
+    assert threads[0].startswith("test-tool")
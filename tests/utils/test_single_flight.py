@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.llm import factory
+from src.utils.network.single_flight import SingleFlight, make_flight_key
+
+
+def test_concurrent_identical_calls_share_one_execution() -> None:
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 42}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert calls == 1
+    assert all(r == {"value": 42} for r in results)
+    stats = flight.get_stats()
+    assert stats["calls"] == 5
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_different_keys_and_sequential_calls_are_not_coalesced() -> None:
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    async def main():
+        await asyncio.gather(flight.do("a", work), flight.do("b", work))
+        await flight.do("a", work)
+
+    asyncio.run(main())
+
+    assert calls == 3
+    assert flight.get_stats()["coalesced"] == 0
+
+
+def test_errors_propagate_to_every_waiter() -> None:
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.get_stats()["errors"] == 1
+
+
+def test_cancelling_one_caller_does_not_cancel_shared_call() -> None:
+    flight = SingleFlight("test")
+
+    async def main():
+        done = asyncio.Event()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            done.set()
+            return "ok"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == "ok"
+        assert done.is_set()
+
+    asyncio.run(main())
+    assert flight.get_stats()["cancelled"] == 1
+
+
+def test_shared_call_is_cancelled_when_every_waiter_leaves() -> None:
+    flight = SingleFlight("test")
+    started = []
+    cancelled = []
+
+    async def main():
+        async def work():
+            started.append(True)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        waiter = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+        # A new caller starts a fresh call instead of joining the abandoned one
+        async def quick():
+            return "fresh"
+
+        assert await flight.do("k", quick) == "fresh"
+
+    asyncio.run(main())
+    assert started and cancelled
+
+
+def test_do_sync_coalesces_across_threads() -> None:
+    flight = SingleFlight("test")
+    calls = 0
+    release = threading.Event()
+    results: list[str] = []
+
+    def work():
+        nonlocal calls
+        calls += 1
+        release.wait(1)
+        return "shared"
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do_sync("k", work))) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert calls == 1
+    assert results == ["shared"] * 4
+    assert flight.get_stats()["coalesced"] == 3
+
+
+def test_flight_key_is_order_insensitive_for_keywords() -> None:
+    assert make_flight_key("q", mode="a", top_k=3) == make_flight_key("q", top_k=3, mode="a")
+    assert make_flight_key("q", mode="a") != make_flight_key("q", mode="b")
+
+
+def test_factory_complete_coalesces_identical_requests(monkeypatch) -> None:
+    calls: list[dict] = []
+
+    async def fake_cloud_complete(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_cloud_complete)
+
+    def _complete(prompt: str, **overrides):
+        options = {
+            "model": "test-model",
+            "api_key": "",
+            "base_url": "https://example.com",
+            "binding": "openai",
+            "max_retries": 0,
+        }
+        return factory.complete(prompt=prompt, **{**options, **overrides})
+
+    async def main():
+        return await asyncio.gather(
+            _complete("same"),
+            _complete("same"),
+            _complete("other"),
+            _complete("same", single_flight=False),
+            _complete("same", temperature=0.7),
+            _complete("same", api_key="sk-other"),
+        )
+
+    results = asyncio.run(main())
+
+    assert results == ["answer"] * 6
+    # Opted out, sampled (temperature > 0) and other-key requests each make their own call
+    assert len(calls) == 5
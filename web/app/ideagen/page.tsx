@@ -78,6 +78,9 @@ const getRecordTitle = (record: NotebookRecord) =>
 
 const clamp01 = (value: number) => Math.max(0, Math.min(1, value))
 
+// Ideas carry ids of the form idea-<knowledge point index>
+const ideaOrder = (id: string) => Number(id.split('-').pop()) || 0
+
 const fadeInUp: Variants = {
   hidden: { opacity: 0, y: 14 },
   visible: {
@@ -250,6 +253,15 @@ export default function IdeaGenPage() {
       )
     }
 
+    // Parallel knowledge points report a completed count; other stages report an index
+    type ProgressData = { index?: unknown; completed?: unknown; total?: unknown }
+    const updateProgress = (payload?: ProgressData) => {
+      const current = typeof payload?.completed === 'number' ? payload.completed : payload?.index
+      if (typeof current === 'number' && typeof payload?.total === 'number') {
+        setProgress({ current, total: payload.total })
+      }
+    }
+
     ws.onmessage = event => {
       const data = JSON.parse(event.data)
 
@@ -257,24 +269,23 @@ export default function IdeaGenPage() {
         case 'status':
           setGenerationStatus(data.message)
           if (data.stage === 'complete') setIsGenerating(false)
-          if (typeof data.data?.index === 'number' && typeof data.data?.total === 'number') {
-            setProgress({ current: data.data.index, total: data.data.total })
-          }
+          updateProgress(data.data)
           break
         case 'progress':
-          if (typeof data.data?.index === 'number' && typeof data.data?.total === 'number') {
-            setProgress({ current: data.data.index, total: data.data.total })
-          }
+          updateProgress(data.data)
           break
         case 'idea':
-          setGeneratedIdeas(prev => [
-            ...prev,
-            {
-              ...(data.data as Partial<ResearchIdea>),
-              expanded: false,
-              selected: false,
-            } as ResearchIdea,
-          ])
+          // Knowledge points finish out of order; keep ideas in knowledge point order
+          setGeneratedIdeas(prev =>
+            [
+              ...prev,
+              {
+                ...(data.data as Partial<ResearchIdea>),
+                expanded: false,
+                selected: false,
+              } as ResearchIdea,
+            ].sort((a, b) => ideaOrder(a.id) - ideaOrder(b.id))
+          )
           break
         case 'complete':
           setGenerationStatus('Completed!')